@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Compare ``BangumiMatcher`` against the linear ``match_bangumi_in_list`` scan.
+
+Run from ``backend`` with::
+
+    uv run python scripts/benchmark_bangumi_matcher.py --bangumi 1500 --torrents 3000
+
+The library and torrent names are synthetic but shaped like a real Mikan
+subscription (several groups per title, a few aliases each).  Both paths see
+the same warmed parse cache, so the numbers isolate the matching cost.  Timing
+is informational only and never changes the exit status, except when the two
+implementations disagree on a match.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_ROOT / "src"))
+
+from module.database.bangumi import (  # noqa: E402
+    BangumiMatcher,
+    match_bangumi_in_list,
+)
+from module.models import Bangumi  # noqa: E402
+
+_GROUPS = ("LoliHouse", "SweetSub", "ANi", "Nekomoe kissaten", "Lilith-Raws")
+_WORDS = (
+    "Kusuriya",
+    "Hitorigoto",
+    "Frieren",
+    "Sousou",
+    "Dandadan",
+    "Kaiju",
+    "Shikanoko",
+    "Mushoku",
+    "Tensei",
+    "Oshi",
+    "Ko",
+    "Yofukashi",
+    "Uta",
+)
+
+
+def _title(rng: random.Random, index: int) -> str:
+    words = rng.sample(_WORDS, k=3)
+    return f"{' '.join(words)} {index}"
+
+
+def build_library(count: int, seed: int) -> list[Bangumi]:
+    rng = random.Random(seed)
+    library = []
+    for index in range(count):
+        title = _title(rng, index)
+        aliases = [f"{title} Season {n}" for n in range(rng.randint(0, 3))]
+        library.append(
+            Bangumi(
+                id=index + 1,
+                official_title=title,
+                title_raw=title,
+                title_aliases=json.dumps(aliases) if aliases else None,
+                group_name=rng.choice(_GROUPS),
+                rss_link="bench",
+                season=1,
+            )
+        )
+    return library
+
+
+def build_torrents(library: list[Bangumi], count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    names = []
+    for index in range(count):
+        if rng.random() < 0.7:
+            title = rng.choice(library).title_raw
+        else:
+            title = f"Unsubscribed Show {index}"
+        names.append(
+            f"[{rng.choice(_GROUPS)}] {title} - {rng.randint(1, 24):02d} [1080p]"
+        )
+    return names
+
+
+def _time(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bangumi", type=int, default=1500)
+    parser.add_argument("--torrents", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    library = build_library(args.bangumi, args.seed)
+    torrents = build_torrents(library, args.torrents, args.seed)
+
+    # Warm the shared parse cache so neither side pays for tokenizing.
+    for name in torrents:
+        match_bangumi_in_list(name, [])
+
+    linear: list[Bangumi | None] = []
+    indexed: list[Bangumi | None] = []
+    matcher: BangumiMatcher | None = None
+
+    def run_linear():
+        linear.extend(match_bangumi_in_list(name, library) for name in torrents)
+
+    def build():
+        nonlocal matcher
+        matcher = BangumiMatcher(library)
+
+    def run_indexed():
+        assert matcher is not None
+        indexed.extend(matcher.match(name) for name in torrents)
+
+    linear_s = _time(run_linear)
+    build_s = _time(build)
+    indexed_s = _time(run_indexed)
+
+    mismatches = sum(1 for a, b in zip(linear, indexed) if a is not b)
+    matched = sum(1 for item in indexed if item is not None)
+    print(f"bangumi={args.bangumi} torrents={args.torrents} matched={matched}")
+    print(f"linear scan      : {linear_s * 1000:9.1f} ms")
+    print(f"matcher build    : {build_s * 1000:9.1f} ms")
+    print(f"matcher lookups  : {indexed_s * 1000:9.1f} ms")
+    total = build_s + indexed_s
+    print(f"speedup (w/build): {linear_s / total if total else float('inf'):9.1f}x")
+    if mismatches:
+        print(f"MISMATCH: {mismatches} torrents matched differently", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Measure how long the backend takes to boot.
+
+Run from ``backend`` with::
+
+    uv run python scripts/benchmark_boot.py --runs 3
+
+Two numbers are reported, each from fresh interpreters in a scratch working
+directory so the real ``config``/``data`` folders are never touched:
+
+- ``import main`` wall time plus the slowest modules by cumulative import
+  time, taken from ``python -X importtime``;
+- time from spawning ``uvicorn main:app`` until ``/health`` first answers
+  200, for a first boot on an empty data directory and for warm restarts
+  against the database that first boot created.
+
+Timing is informational only and never changes the exit status.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+_SRC_ROOT = _BACKEND_ROOT / "src"
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=_positive_int, default=3)
+    parser.add_argument(
+        "--top", type=_positive_int, default=15, help="modules listed by import time"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds to wait for /health"
+    )
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--output", type=Path, help="write the report to this path")
+    return parser.parse_args(argv)
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(_SRC_ROOT), env.get("PYTHONPATH")])
+    )
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """``module -> cumulative microseconds`` from ``-X importtime`` output."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        cumulative[name] = max(cumulative.get(name, 0), int(parts[1]))
+    return cumulative
+
+
+def measure_import(workdir: Path) -> tuple[float, dict[str, int]]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=workdir,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - started, parse_importtime(result.stderr)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _healthy(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def measure_boot(workdir: Path, timeout: float) -> float:
+    """Seconds from process spawn to the first 200 from ``/health``."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=workdir,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}")
+            if _healthy(url):
+                return time.perf_counter() - started
+            time.sleep(0.02)
+        raise RuntimeError(f"/health did not answer within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def run_benchmark(runs: int, top: int, timeout: float) -> dict:
+    with tempfile.TemporaryDirectory(prefix="ab-boot-") as scratch:
+        workdir = Path(scratch)
+        imports = [measure_import(workdir) for _ in range(runs)]
+        first_boot = measure_boot(workdir, timeout)
+        warm_boots = [measure_boot(workdir, timeout) for _ in range(runs)]
+
+    # Per-module numbers from the fastest run, the least noisy one
+    _, modules = min(imports, key=lambda item: item[0])
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "runs": runs,
+        "import_main": _summary([elapsed for elapsed, _ in imports]),
+        "first_boot_ms": first_boot * 1000,
+        "warm_boot": _summary(warm_boots),
+        "modules": [
+            {"module": name, "cumulative_ms": micros / 1000}
+            for name, micros in slowest[:top]
+        ],
+    }
+
+
+def render_text(report: dict) -> str:
+    imports = report["import_main"]
+    warm = report["warm_boot"]
+    lines = [
+        f"runs={report['runs']}",
+        f"import main      : {imports['median_ms']:9.1f} ms median "
+        f"({imports['min_ms']:.1f}-{imports['max_ms']:.1f})",
+        f"first boot       : {report['first_boot_ms']:9.1f} ms to /health",
+        f"warm boot        : {warm['median_ms']:9.1f} ms median "
+        f"({warm['min_ms']:.1f}-{warm['max_ms']:.1f})",
+        "",
+        "slowest imports (cumulative):",
+    ]
+    lines.extend(
+        f"  {entry['cumulative_ms']:9.1f} ms  {entry['module']}"
+        for entry in report["modules"]
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = run_benchmark(args.runs, args.top, args.timeout)
+    output = (
+        json.dumps(report, indent=2, ensure_ascii=False)
+        if args.format == "json"
+        else render_text(report)
+    )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output + "\n", encoding="utf-8")
+        print(f"wrote benchmark report to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
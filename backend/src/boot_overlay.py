@@ -18,6 +18,12 @@ staged ``.venv`` 是 apply 时由应用（ab 身份）按已验签 lockfile 预
 被 CI 签名；boot 只做复制、从不执行其内容，运行期由 ab 加载——被篡改最多
 维持 ab 级持久化（攻击者本就具备），不构成提权面。
 
+已验签 manifest 带逐文件 sha256（``files``）时，先把 /app/module、/app/dist
+现有文件与之比对：完全一致的树不再解包替换，venv 标记与 lockfile 一致时也
+不再复制 staged venv——正常重启只做一次验签和哈希。比对忽略
+``__pycache__``：那是 ab 运行期自己写的字节码缓存，与 staged venv 同理，
+被篡改也只是 ab 级持久化。
+
 关键约束：本脚本位于 ``/app/boot_overlay.py``，**不在** 覆盖层会替换的
 ``/app/module`` 里，因此始终是镜像自带的稳定版本在做决策；这里的验签才是
 安全边界（apply 时的验签跑在可能已被覆盖的 module 代码里，只是尽早失败的
@@ -314,17 +320,66 @@ def _read_zip_manifest(bundle: Path) -> dict | None:
         return None
 
 
-def _safe_extract_zip(bundle: Path, dest: Path) -> None:
-    """解压已验签 zip 到 dest，拒绝绝对路径/`..` 越界成员（防 zip-slip）。"""
+def _safe_extract_zip(
+    bundle: Path, dest: Path, prefixes: tuple[str, ...] | None = None
+) -> None:
+    """解压已验签 zip 到 dest，拒绝绝对路径/`..` 越界成员（防 zip-slip）。
+
+    给出 ``prefixes`` 时只解压以其开头的成员。
+    """
     import zipfile
 
     dest_resolved = dest.resolve()
     with zipfile.ZipFile(bundle) as zf:
-        for member in zf.namelist():
+        members = zf.namelist()
+        for member in members:
             target = (dest / member).resolve()
             if not target.is_relative_to(dest_resolved):
                 raise ValueError(f"Unsafe path in bundle: {member}")
-        zf.extractall(dest)
+        if prefixes is not None:
+            members = [m for m in members if m.startswith(prefixes)]
+        zf.extractall(dest, members)
+
+
+def _read_zip_member(bundle: Path, name: str) -> bytes | None:
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(bundle) as zf:
+            return zf.read(name)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+# bundle 内的树 → /app 下的落地目录
+_MODULE_PREFIX = "backend/src/module/"
+_DIST_PREFIX = "webui-dist/"
+
+
+def _tree_matches(dst: Path, prefix: str, files: dict) -> bool:
+    """dst 的文件集合与内容是否与 manifest 中 ``prefix`` 下的条目完全一致。"""
+    expected = {
+        name[len(prefix) :]: digest
+        for name, digest in files.items()
+        if isinstance(name, str)
+        and name.startswith(prefix)
+        and "__pycache__" not in name.split("/")
+    }
+    if not expected or not dst.is_dir() or dst.is_symlink():
+        return False
+    seen = 0
+    for path in dst.rglob("*"):
+        rel = path.relative_to(dst)
+        if "__pycache__" in rel.parts:
+            continue
+        if path.is_symlink():
+            return False
+        if path.is_dir():
+            continue
+        if expected.get(rel.as_posix()) != _sha256_file(path):
+            return False
+        seen += 1
+    return seen == len(expected)
 
 
 def apply_overlay(
@@ -334,7 +389,8 @@ def apply_overlay(
     baseline_lock: Path | None = None,
     pubkey_path: Path = PUBKEY_PATH,
 ) -> bool:
-    """验签并应用覆盖层。返回是否实际把覆盖层落地（供测试断言）。"""
+    """验签并应用覆盖层。返回覆盖层是否生效（供测试断言）。"""
+    import hashlib
     import tempfile
 
     applied = _read_applied(updates_root)
@@ -380,35 +436,65 @@ def apply_overlay(
         _clear_overlay(updates_root)
         return False
 
+    files = manifest.get("files")
+    files = files if isinstance(files, dict) else {}
+    stale_module = not _tree_matches(app_root / "module", _MODULE_PREFIX, files)
+    stale_dist = not _tree_matches(app_root / "dist", _DIST_PREFIX, files)
+    lock_bytes = _read_zip_member(bundle, "backend/uv.lock")
+    lock_sha = hashlib.sha256(lock_bytes).hexdigest() if lock_bytes else None
+    src_venv = updates_root / "current" / ".venv"
+    venv_marker = _read_text(app_root / ".venv" / _VENV_LOCK_MARKER)
+    if src_venv.exists():
+        stale_venv = lock_sha is None or venv_marker != lock_sha
+    else:
+        # 与 _sync_venv_to_lock 的判断一致：缺标记时 venv 对应镜像 lock
+        image_lock = (
+            baseline_lock if baseline_lock is not None else app_root / "uv.lock"
+        )
+        stale_venv = lock_sha is not None and lock_sha != (
+            venv_marker or _sha256_file(image_lock)
+        )
+    if not (stale_module or stale_dist or stale_venv):
+        logger.info(
+            "Overlay %s already installed; nothing to extract.", overlay_version
+        )
+        return True
+
     logger.info(
         "Applying overlay version %s over image %s (signature verified).",
         overlay_version,
         image_version,
     )
     # module 树与前端 dist 直接从已验签 zip 解包到 root 私有临时目录，
-    # 不从 ab 可写的 current/ 复制。
+    # 不从 ab 可写的 current/ 复制；只解包需要替换的树。
+    prefixes = ["backend/uv.lock", "backend/pyproject.toml"]
+    if stale_module:
+        prefixes.append(_MODULE_PREFIX)
+    if stale_dist:
+        prefixes.append(_DIST_PREFIX)
     tmp = Path(tempfile.mkdtemp(prefix="ab-overlay-"))
     try:
         try:
-            _safe_extract_zip(bundle, tmp)
+            _safe_extract_zip(bundle, tmp, tuple(prefixes))
         except Exception as exc:
             logger.error("Failed to unpack verified bundle: %s", exc)
             return False
 
-        src_module = tmp / "backend" / "src" / "module"
-        if not src_module.exists():
-            logger.warning("Verified bundle has no module tree; skipping.")
-            return False
+        if stale_module:
+            src_module = tmp / "backend" / "src" / "module"
+            if not src_module.exists():
+                logger.warning("Verified bundle has no module tree; skipping.")
+                return False
 
-        try:
-            _replace_tree(src_module, app_root / "module")
-        except Exception as exc:
-            logger.error("Failed to overlay module tree: %s", exc)
-            return False
-        _chown_app_tree(app_root / "module")
+            try:
+                _replace_tree(src_module, app_root / "module")
+            except Exception as exc:
+                logger.error("Failed to overlay module tree: %s", exc)
+                return False
+            _chown_app_tree(app_root / "module")
 
         src_dist = tmp / "webui-dist"
-        if src_dist.exists():
+        if stale_dist and src_dist.exists():
             try:
                 _replace_tree(src_dist, app_root / "dist")
                 _chown_app_tree(app_root / "dist")
@@ -416,11 +502,9 @@ def apply_overlay(
                 logger.error("Failed to overlay webui dist: %s", exc)
 
         # staged venv 见模块 docstring：只复制、从不以 root 执行其内容。
-        src_venv = updates_root / "current" / ".venv"
-        if src_venv.exists():
+        if stale_venv and src_venv.exists():
             try:
                 _replace_tree(src_venv, app_root / ".venv")
-                lock_sha = _sha256_file(tmp / "backend" / "uv.lock")
                 if lock_sha:
                     (app_root / ".venv" / _VENV_LOCK_MARKER).write_text(
                         lock_sha, encoding="utf-8"
@@ -428,7 +512,7 @@ def apply_overlay(
                 _chown_app_tree(app_root / ".venv")
             except Exception as exc:
                 logger.error("Failed to overlay staged venv: %s", exc)
-        else:
+        elif stale_venv:
             try:
                 _sync_venv_to_lock(tmp, app_root, baseline_lock)
             except Exception as exc:
@@ -1,20 +1,21 @@
 import logging
 import os
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from module.api import v1
 from module.api.health import router as health_router
+from module.api.posters import router as posters_router
+from module.composition import auth_service
 from module.conf import VERSION, settings, setup_logger
 from module.core import AppContext
-from module.mcp import create_mcp_app
+from module.mcp import LazyMcpApp
 
 setup_logger(reset=True)
 logger = logging.getLogger(__name__)
@@ -48,6 +49,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     await ctx.stop()
+    # 写回尚在缓冲区里的 API token last_used_at
+    await auth_service.flush_token_usage()
 
 
 def create_app() -> FastAPI:
@@ -69,9 +72,12 @@ def create_app() -> FastAPI:
     # unauthenticated liveness probe, mounted at the app root (not /api) so
     # it stays reachable without auth for container/orchestrator health checks
     app.include_router(health_router)
+    # 海报同样无鉴权：<img> 请求不带 Authorization 头
+    app.include_router(posters_router)
 
-    # mount MCP server (SSE transport for LLM tool integration)
-    app.mount("/mcp", create_mcp_app(ctx))
+    # mount MCP server (SSE transport for LLM tool integration); the SDK is
+    # imported on the first /mcp request, not at boot
+    app.mount("/mcp", LazyMcpApp(ctx))
 
     return app
 
@@ -79,17 +85,6 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-_POSTERS_BASE = Path("data/posters").resolve()
-
-
-@app.get("/posters/{path:path}", tags=["posters"])
-def posters(path: str):
-    resolved = (_POSTERS_BASE / path).resolve()
-    if not str(resolved).startswith(str(_POSTERS_BASE)):
-        return HTMLResponse(status_code=403)
-    return FileResponse(str(resolved))
-
-
 if VERSION != "DEV_VERSION":
     app.mount("/assets", StaticFiles(directory="dist/assets"), name="assets")
     app.mount("/images", StaticFiles(directory="dist/images"), name="images")
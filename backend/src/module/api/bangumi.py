@@ -1,6 +1,6 @@
 from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -15,7 +15,17 @@ from module.parser.analyser.offset_detector import (
 from module.parser.analyser.offset_detector import detect_offset_mismatch
 from module.parser.analyser.tmdb_parser import tmdb_parser
 from module.security.api import get_current_user
-
+from module.utils.pipeline import get_progress
+
+from .listing import (
+    ListParams,
+    check_params,
+    list_params,
+    list_response,
+    not_modified,
+    output_fields,
+    table_etag,
+)
 from .response import u_response
 
 
@@ -57,6 +67,20 @@ class DetectOffsetRequest(BaseModel):
     parsed_episode: int
 
 
+class TorrentStats(BaseModel):
+    """Torrent history size and retention state."""
+
+    total: int
+    downloaded: int
+    orphans: int
+    fingerprints: int
+    per_feed: dict[int, int]
+    db_bytes: int
+    free_bytes: int
+    retention_days: int
+    retention_count: int
+
+
 class DetectOffsetResponse(BaseModel):
     """Response for detect-offset endpoint."""
 
@@ -67,12 +91,41 @@ class DetectOffsetResponse(BaseModel):
 
 router = APIRouter(prefix="/bangumi", tags=["bangumi"])
 
+_BANGUMI_SORTABLE = {"id", "official_title"}
+
 
 @router.get(
     "/get/all", response_model=list[Bangumi], dependencies=[Depends(get_current_user)]
 )
-async def get_all_data(db: Database = Depends(get_db)):
-    return await db.bangumi.search_all()
+async def get_all_data(
+    request: Request,
+    deleted: bool | None = None,
+    archived: bool | None = None,
+    needs_review: bool | None = None,
+    q: str | None = Query(None, description="Search official/raw title"),
+    params: ListParams = Depends(list_params),
+    db: Database = Depends(get_db),
+):
+    check_params(params, _BANGUMI_SORTABLE, output_fields(Bangumi))
+    etag = table_etag(request, "bangumi")
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+    rows, next_cursor = await db.bangumi.search_page(
+        deleted=deleted,
+        archived=archived,
+        needs_review=needs_review,
+        query=q,
+        sort=params.sort,
+        descending=params.descending,
+        after=params.after,
+        limit=params.limit,
+    )
+    return list_response(
+        [row.model_dump(mode="json", by_alias=True) for row in rows],
+        etag,
+        params.fields,
+        next_cursor,
+    )
 
 
 @router.get(
@@ -279,6 +332,15 @@ async def refresh_metadata(db: Database = Depends(get_db)):
     return u_response(resp)
 
 
+@router.get(
+    path="/refresh/progress",
+    dependencies=[Depends(get_current_user)],
+)
+async def refresh_progress():
+    """Progress of the latest metadata refresh, poster refresh and offset scan."""
+    return [progress.to_dict() for progress in get_progress()]
+
+
 @router.get(
     path="/suggest-offset/{bangumi_id}",
     response_model=OffsetSuggestion,
@@ -502,6 +564,40 @@ async def set_weekday(bangumi_id: int, request: SetWeekdayRequest):
 # ---------------------------------------------------------------------------
 
 
+@router.get(
+    path="/torrents/stats",
+    response_model=TorrentStats,
+    dependencies=[Depends(get_current_user)],
+)
+async def get_torrent_stats(db: Database = Depends(get_db)):
+    """Torrent table row counts, DB file size and the retention limits."""
+    manage = settings.bangumi_manage
+    return TorrentStats(
+        **await db.torrent.stats(),
+        **await db.storage_stats(),
+        retention_days=manage.torrent_retention_days,
+        retention_count=manage.torrent_retention_count,
+    )
+
+
+@router.post(
+    path="/torrents/episode-index/rebuild",
+    response_model=APIResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def rebuild_episode_index(db: Database = Depends(get_db)):
+    """Re-parse every bangumi torrent into the episode index."""
+    count = await db.episode_index.rebuild()
+    return u_response(
+        ResponseModel(
+            status=True,
+            status_code=200,
+            msg_en=f"Rebuilt episode index from {count} torrents.",
+            msg_zh=f"已根据 {count} 条种子重建剧集索引。",
+        )
+    )
+
+
 @router.get(
     path="/torrents/orphans",
     response_model=list[Torrent],
@@ -1,22 +1,43 @@
 import logging
 import re
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 
+from module.core import AppContext
+from module.core.loops import notify_renames
 from module.database import Database
 from module.database.bangumi import (
+    BangumiMatcher,
     build_save_path_index,
-    match_bangumi_in_list,
     normalize_save_path,
 )
-from module.downloader import DownloadClient
+from module.downloader import DownloadClient, MutationBatch
+from module.manager import Renamer
 from module.security.api import get_current_user
 
+from .deps import get_context
+from .listing import (
+    ListParams,
+    content_etag,
+    list_params,
+    list_response,
+    not_modified,
+)
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/downloader", tags=["downloader"])
 
+# qB 的 v1/v2 infohash（40/64 位）与 aria2 的 gid（16 位）都是十六进制
+_COMPLETION_HASH_RE = re.compile(r"^[0-9a-fA-F]{16,64}$")
+# 可排序字段 -> (torrents_info 里的键, 缺省值)
+_TORRENT_SORT_FIELDS = {
+    "id": ("hash", ""),
+    "name": ("name", ""),
+    "added_on": ("added_on", 0),
+}
+
 
 class TorrentHashesRequest(BaseModel):
     hashes: list[str]
@@ -34,10 +55,65 @@ class TorrentTagRequest(BaseModel):
     bangumi_id: int
 
 
+def _cursor_fits(after: list, default: object) -> bool:
+    """Whether a ``(sort value, hash)`` cursor compares with this sort field."""
+    value, key = after
+    if isinstance(default, str):
+        fits = isinstance(value, str)
+    else:
+        fits = isinstance(value, (int, float)) and not isinstance(value, bool)
+    return fits and isinstance(key, str)
+
+
 @router.get("/torrents", dependencies=[Depends(get_current_user)])
-async def get_torrents():
+async def get_torrents(
+    request: Request,
+    status_filter: str | None = Query(
+        None, description="qBittorrent filter, e.g. completed / downloading"
+    ),
+    q: str | None = Query(None, description="Search torrent name"),
+    params: ListParams = Depends(list_params),
+):
+    """Bangumi torrents in the downloader.
+
+    The list lives in the downloader, so there is no revision counter: the
+    ETag hashes the result and a 304 only saves the transfer and the
+    client-side re-render.
+    """
+    if params.sort not in _TORRENT_SORT_FIELDS:
+        raise HTTPException(status_code=422, detail=f"Cannot sort by {params.sort!r}")
     async with DownloadClient() as client:
-        return await client.get_torrent_info(category="Bangumi", status_filter=None)
+        torrents = await client.get_torrent_info(
+            category="Bangumi", status_filter=status_filter
+        )
+    if q:
+        needle = q.casefold()
+        torrents = [t for t in torrents if needle in t.get("name", "").casefold()]
+    next_cursor = None
+    if params.limit is not None or params.after is not None or params.sort != "id":
+        # 下载器里的 "id" 就是 hash；游标是 (排序值, hash)
+        field, default = _TORRENT_SORT_FIELDS[params.sort]
+
+        def sort_key(t: dict) -> tuple:
+            return (t.get(field) or default, t["hash"])
+
+        torrents.sort(key=sort_key, reverse=params.descending)
+        if params.after is not None:
+            if not _cursor_fits(params.after, default):
+                # 换了排序字段却沿用旧游标，比较时会 str/int 混比
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            after = tuple(params.after)
+            if params.descending:
+                torrents = [t for t in torrents if sort_key(t) < after]
+            else:
+                torrents = [t for t in torrents if sort_key(t) > after]
+        if params.limit is not None and len(torrents) > params.limit:
+            torrents = torrents[: params.limit]
+            next_cursor = list(sort_key(torrents[-1]))
+    etag = content_etag(request, torrents)
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+    return list_response(torrents, etag, params.fields, next_cursor)
 
 
 @router.get("/rename-conflicts", dependencies=[Depends(get_current_user)])
@@ -76,6 +152,44 @@ async def retry_rename_conflict(operation_id: int):
     }
 
 
+@router.post("/completed", dependencies=[Depends(get_current_user)])
+async def torrent_completed(
+    hash: str = Query(..., description="Info hash of the finished torrent"),
+    ctx: AppContext = Depends(get_context),
+):
+    """Completion hook: queue a rename for a torrent that just finished.
+
+    Meant for qBittorrent's "Run external program on torrent finished", e.g.
+    ``curl -X POST -H "Authorization: Bearer <token>"
+    "http://<host>:7892/api/v1/downloader/completed?hash=%I"``.
+    """
+    if not _COMPLETION_HASH_RE.match(hash):
+        raise HTTPException(
+            status_code=400,
+            detail={"msg_en": "Invalid torrent hash", "msg_zh": "种子 hash 无效"},
+        )
+    ctx.completions.put(hash, "hook")
+    return {"status": True, "msg_en": "Rename queued", "msg_zh": "已加入重命名队列"}
+
+
+@router.post("/torrents/rename", dependencies=[Depends(get_current_user)])
+async def rename_torrents(
+    req: TorrentHashesRequest, ctx: AppContext = Depends(get_context)
+):
+    """Rename the given completed torrents now instead of on the next cycle."""
+    async with DownloadClient() as client:
+        renamer = Renamer(client)
+        renamed = await renamer.rename_hashes(req.hashes)
+        events = list(renamer.events)
+    await notify_renames(ctx.notifier, events, renamed)
+    return {
+        "status": True,
+        "renamed": len(renamed),
+        "msg_en": f"Renamed {len(renamed)} file(s)",
+        "msg_zh": f"已重命名 {len(renamed)} 个文件",
+    }
+
+
 @router.post("/torrents/pause", dependencies=[Depends(get_current_user)])
 async def pause_torrents(req: TorrentHashesRequest):
     hashes = "|".join(req.hashes)
@@ -148,8 +262,11 @@ async def auto_tag_torrents():
     # two DB queries (plus save_path fallback variations) per torrent.
     async with Database() as db:
         bangumi_list = await db.bangumi.search_all()
+    matcher = BangumiMatcher(bangumi_list)
     save_path_index = build_save_path_index(bangumi_list)
 
+    # 按标签分组，整批一次打上，而不是每个种子一个请求
+    batch = MutationBatch()
     async with DownloadClient() as client:
         # Get all Bangumi torrents
         torrents = await client.get_torrent_info(category="Bangumi", status_filter=None)
@@ -166,16 +283,16 @@ async def auto_tag_torrents():
                 continue
 
             # First try by torrent name, then fall back to save_path
-            bangumi = match_bangumi_in_list(torrent_name, bangumi_list)
+            bangumi = matcher.match(torrent_name)
             if not bangumi:
                 bangumi = save_path_index.get(normalize_save_path(save_path))
 
             if bangumi and not bangumi.deleted:
                 tag = f"ab:{bangumi.id}"
-                await client.add_tag(torrent_hash, tag)
+                batch.add_tag(torrent_hash, tag)
                 tagged_count += 1
                 logger.info(
-                    f"Tagged '{torrent_name[:50]}...' with {tag} "
+                    f"Tagging '{torrent_name[:50]}...' with {tag} "
                     f"(matched: {bangumi.official_title})"
                 )
             else:
@@ -187,8 +304,10 @@ async def auto_tag_torrents():
                     }
                 )
 
+        ok = await client.apply_mutations(batch)
+
     return {
-        "status": True,
+        "status": ok,
         "tagged_count": tagged_count,
         "unmatched_count": len(unmatched),
         "unmatched": unmatched[:10],  # Return first 10 unmatched for debugging
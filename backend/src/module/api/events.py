@@ -1,8 +1,8 @@
 """SSE 端点：合并推送 status/downloader/log 更新，取代前端的三个轮询循环
 (hooks/useAppInfo.ts:24、pages/index/downloader.vue:28、store/log.ts:25)。
 
-单个连接按 tick 节拍分别推送三种事件，节拍与原轮询间隔保持一致，
-前端订阅失败时回退到原有轮询逻辑。
+各事件由共享的 ``EventHub`` 按 tick 节拍统一生产、扇出到所有连接，节拍与
+原轮询间隔保持一致；前端订阅失败时回退到原有轮询逻辑。
 """
 
 import asyncio
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, Request
 from sse_starlette.sse import EventSourceResponse
 
 from module.api.deps import get_context
-from module.api.log import _read_log_tail
+from module.api.log import _TAIL_BYTES, LogChunk, _read_log_since
 from module.conf import LOG_PATH, VERSION
 from module.core import AppContext
 from module.database import Database
@@ -79,65 +79,213 @@ async def _notification_payload() -> dict:
         }
 
 
-async def _log_payload() -> str | None:
-    """读取日志尾部；日志文件不存在时返回 None（跳过本次推送）。"""
+async def _log_payload(cursor: str | None = None) -> LogChunk | None:
+    """读取 cursor 之后新增的日志；日志文件不存在时返回 None（跳过本次推送）。"""
     if not LOG_PATH.exists():
         return None
-    data = await asyncio.to_thread(_read_log_tail)
-    return data.decode("utf-8", errors="replace")
+    return await asyncio.to_thread(_read_log_since, cursor)
 
 
-async def _event_generator(request: Request, ctx: AppContext):
-    """按各自节拍推送 status/downloader/log 事件的核心循环。"""
-    tick = 0
-    last_update: str | None = None
-    last_inbox_rev: int | None = None
-    while True:
-        if await request.is_disconnected():
-            break
+def _trim_log(text: str) -> str:
+    """把累积的日志截到与 GET /log 相当的尾部长度（从行首开始）。"""
+    if len(text) <= _TAIL_BYTES:
+        return text
+    text = text[-_TAIL_BYTES:]
+    return text[text.find("\n") + 1 :]
+
+
+# 每个订阅者的帧队列上限。消费跟不上（标签页被挂起、网络慢）时丢弃最旧的
+# 帧：各事件都是完整的状态快照，只有最新一帧有意义；唯一的例外 log_append
+# 被丢弃后，该订阅者下一帧改发完整日志尾部。
+_SUBSCRIBER_QUEUE_SIZE = 32
+
+
+class EventHub:
+    """全部 SSE 连接共享的事件广播中心。
+
+    每种事件只有一个后台生产者按原节拍计算负载，结果扇出到各订阅者的队列；
+    打开多少个仪表盘，下载器 / 日志 / 数据库的查询次数都不变。生产者在第一
+    个订阅者到来时启动、最后一个离开时停止。新订阅者先收到各事件的最近一帧，
+    不必等到下一个节拍。
+    """
+
+    def __init__(self):
+        self._subscribers: set[asyncio.Queue] = set()
+        self._latest: dict[str, dict] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._ctx: AppContext | None = None
+        self._last_update: str | None = None
+        self._last_inbox_rev: int | None = None
+        self._log_cursor: str | None = None
+        self._log_text = ""
+        self._log_resync: set[asyncio.Queue] = set()
+        self.dropped_frames = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, ctx: AppContext) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        for frame in self._latest.values():
+            queue.put_nowait(frame)
+        self._subscribers.add(queue)
+        self._ctx = ctx
+        if not self._tasks:
+            self._start()
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        self._log_resync.discard(queue)
+        if not self._subscribers:
+            await self.stop()
+
+    def publish(self, event: str, data: str, *, replay: bool = True) -> None:
+        """把一帧推给所有订阅者；``replay`` 为假时不作为新订阅者的初始帧。"""
+        frame = {"event": event, "data": data}
+        if replay:
+            self._latest[event] = frame
+        for queue in self._subscribers:
+            self._put(queue, frame)
+        if event == "log":
+            self._log_resync.clear()
+
+    def _put(self, queue: asyncio.Queue, frame: dict) -> None:
+        if queue.full():
+            dropped = queue.get_nowait()
+            self.dropped_frames += 1
+            if dropped["event"] in ("log", "log_append"):
+                # 丢了快照或增量，这个订阅者拼出来的日志就有缺口：下次改发完整尾部
+                self._log_resync.add(queue)
+        queue.put_nowait(frame)
+
+    def _publish_log_append(self, text: str) -> None:
+        snapshot = {"event": "log", "data": self._log_text}
+        self._latest["log"] = snapshot
+        delta = {"event": "log_append", "data": text}
+        for queue in self._subscribers:
+            if queue in self._log_resync:
+                self._log_resync.discard(queue)
+                self._put(queue, snapshot)
+            else:
+                self._put(queue, delta)
+
+    def _start(self) -> None:
+        producers = (
+            (_TICK_SECONDS, self._produce_update),
+            (_TICK_SECONDS * _STATUS_EVERY, self._produce_status),
+            (_TICK_SECONDS * _DOWNLOADER_EVERY, self._produce_downloader),
+            (_TICK_SECONDS * _LOG_EVERY, self._produce_log),
+            (_TICK_SECONDS * _NOTIFICATION_EVERY, self._produce_notification),
+        )
+        self._last_update = None
+        self._last_inbox_rev = None
+        self._log_cursor = None
+        self._log_text = ""
+        self._tasks = [
+            asyncio.create_task(self._run(interval, produce))
+            for interval, produce in producers
+        ]
 
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        self._latest.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _run(interval: float, produce) -> None:
+        """按固定间隔驱动一个生产者；单次失败只记日志，不终止循环。"""
+        while True:
+            try:
+                await produce()
+            except Exception:
+                logger.debug("SSE: event producer failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    async def _produce_update(self) -> None:
         # 更新进度：仅在有进行中的更新（phase != idle）且负载变化时推送，
         # 避免重复帧刷屏；每 tick 检查一次以保证下载进度足够实时。
         progress = get_update_progress()
-        if progress.get("phase") != "idle":
-            payload = json.dumps(progress)
-            if payload != last_update:
-                last_update = payload
-                yield {"event": "update", "data": payload}
-
-        if tick % _STATUS_EVERY == 0:
-            yield {"event": "status", "data": json.dumps(_status_payload(ctx))}
-
-        if tick % _DOWNLOADER_EVERY == 0:
-            # 不可用时推送 null 而非跳过，前端据此感知下载器降级状态
-            # （store/downloader.ts 对 null 保留旧数据，不会崩溃）。
-            torrents = await _downloader_payload()
-            yield {"event": "downloader", "data": json.dumps(torrents)}
-
-        if tick % _LOG_EVERY == 0:
-            log_text = await _log_payload()
-            if log_text is not None:
-                yield {"event": "log", "data": log_text}
+        if progress.get("phase") == "idle":
+            self._last_update = None
+            self._latest.pop("update", None)
+            return
+        payload = json.dumps(progress)
+        if payload != self._last_update:
+            self._last_update = payload
+            self.publish("update", payload)
+
+    async def _produce_status(self) -> None:
+        if self._ctx is not None:
+            self.publish("status", json.dumps(_status_payload(self._ctx)))
+
+    async def _produce_downloader(self) -> None:
+        # 不可用时推送 null 而非跳过，前端据此感知下载器降级状态
+        # （store/downloader.ts 对 null 保留旧数据，不会崩溃）。
+        self.publish("downloader", json.dumps(await _downloader_payload()))
 
+    async def _produce_log(self) -> None:
+        # 只推送上次游标之后新增的行（log_append）；首轮或游标失效（轮转链
+        # 断开、日志被清空）时推送完整尾部（log）。新订阅者的初始帧是服务端
+        # 累积的完整尾部，不必再读盘。
+        chunk = await _log_payload(self._log_cursor)
+        if chunk is None:
+            return
+        self._log_cursor = chunk.cursor
+        # 游标总落在换行符之后，不会切开多字节字符
+        text = chunk.data.decode("utf-8", errors="replace")
+        if chunk.reset:
+            self._log_text = text
+            self.publish("log", text)
+        elif text:
+            self._log_text = _trim_log(self._log_text + text)
+            self._publish_log_append(text)
+
+    async def _produce_notification(self) -> None:
         # 通知中心：只在修订号变化时查库推送（写入/已读/删除都会 bump），
         # 平时每 3 tick 只做一次整数比较，不产生数据库查询。
-        if tick % _NOTIFICATION_EVERY == 0:
-            rev = inbox_revision()
-            if rev != last_inbox_rev:
-                try:
-                    notif_payload = await _notification_payload()
-                except Exception:
-                    logger.debug("SSE: notification payload unavailable", exc_info=True)
-                else:
-                    last_inbox_rev = rev
-                    notif_payload["revision"] = rev
-                    yield {"event": "notification", "data": json.dumps(notif_payload)}
-
-        await asyncio.sleep(_TICK_SECONDS)
-        tick += _TICK_SECONDS
+        rev = inbox_revision()
+        if rev == self._last_inbox_rev:
+            return
+        try:
+            payload = await _notification_payload()
+        except Exception:
+            logger.debug("SSE: notification payload unavailable", exc_info=True)
+            return
+        self._last_inbox_rev = rev
+        payload["revision"] = rev
+        self.publish("notification", json.dumps(payload))
+
+
+_hub = EventHub()
+
+
+async def _event_generator(request: Request, ctx: AppContext):
+    """从共享广播中心取帧推给单个连接，直到客户端断开。"""
+    queue = _hub.subscribe(ctx)
+    try:
+        while not await request.is_disconnected():
+            try:
+                yield await asyncio.wait_for(queue.get(), _TICK_SECONDS)
+            except asyncio.TimeoutError:
+                continue
+    finally:
+        await _hub.unsubscribe(queue)
 
 
 @router.get("/stream", dependencies=[Depends(get_current_user)])
 async def event_stream(request: Request, ctx: AppContext = Depends(get_context)):
     """单一 SSE 连接，按各自节拍推送 status/downloader/log 事件。"""
     return EventSourceResponse(_event_generator(request, ctx))
+
+
+@router.get("/stats", dependencies=[Depends(get_current_user)])
+async def event_stats() -> dict:
+    """当前 SSE 订阅者数，以及因消费过慢被丢弃的帧数。"""
+    return {
+        "subscribers": _hub.subscriber_count,
+        "dropped_frames": _hub.dropped_frames,
+    }
@@ -0,0 +1,129 @@
+"""列表接口共用的分页、字段投影和 ETag 处理。
+
+不带参数时接口行为不变（返回完整数组）；带 ``limit`` 时按游标分页，
+下一页游标放在 ``X-Next-Cursor`` 响应头里，响应体仍是数组，旧客户端不受
+影响。ETag 由表修订号 + 查询参数得出：数据和查询都没变时直接回 304，
+不查库也不序列化。
+"""
+
+import base64
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+from module.database.revision import BOOT_ID, table_revision
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ListParams:
+    limit: int | None
+    after: list | None
+    fields: list[str] | None
+    sort: str
+    descending: bool
+
+
+def list_params(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated field names"),
+    sort: str = Query("id", description="Sort field; prefix with - for descending"),
+) -> ListParams:
+    descending = sort.startswith("-")
+    return ListParams(
+        limit=limit,
+        after=decode_cursor(cursor) if cursor else None,
+        fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+        sort=sort.lstrip("-"),
+        descending=descending,
+    )
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    if not isinstance(values, list) or len(values) != 2:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def output_fields(model) -> list[str]:
+    """JSON keys a model serializes to (aliases, as FastAPI emits them)."""
+    return [f.alias or name for name, f in model.model_fields.items()]
+
+
+def check_params(params: ListParams, sortable: Iterable[str], fields: Iterable[str]):
+    """Reject sort keys and projected fields the endpoint does not offer."""
+    if params.sort not in sortable:
+        raise HTTPException(status_code=422, detail=f"Cannot sort by {params.sort!r}")
+    if params.fields:
+        unknown = set(params.fields) - set(fields)
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+
+
+def table_etag(request: Request, *tables: str) -> str:
+    """Strong ETag for a DB-backed list: table revisions + query string."""
+    revisions = ".".join(str(table_revision(t)) for t in tables)
+    return f'"{BOOT_ID}-{revisions}-{_query_digest(request)}"'
+
+
+def content_etag(request: Request, content: Any) -> str:
+    """Strong ETag for a list that has no revision counter (downloader)."""
+    raw = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha1(raw.encode()).hexdigest()[:16]
+    return f'"{digest}-{_query_digest(request)}"'
+
+
+def _query_digest(request: Request) -> str:
+    items = sorted(request.query_params.multi_items())
+    return hashlib.sha1(json.dumps(items).encode()).hexdigest()[:12]
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """A 304 response if the client's If-None-Match covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return None
+
+
+def list_response(
+    items: list[dict],
+    etag: str,
+    fields: list[str] | None = None,
+    next_cursor: list | None = None,
+) -> JSONResponse:
+    if fields:
+        items = [{k: item.get(k) for k in fields} for item in items]
+    headers = _cache_headers(etag)
+    if next_cursor is not None:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
+    return JSONResponse(content=items, headers=headers)
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    # no-cache：浏览器可以缓存，但每次都要带 If-None-Match 回来验证
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
@@ -1,5 +1,8 @@
 import asyncio
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import JSONResponse
@@ -14,6 +17,20 @@ router = APIRouter(prefix="/log", tags=["log"])
 _TAIL_BYTES = 512 * 1024  # 512 KB
 
 
+def _tail_of(f: BinaryIO, size: int, budget: int) -> tuple[bytes, bool]:
+    """读取已打开文件 [0, size) 的最后 budget 字节（掐掉开头的半行）。"""
+    if size > budget:
+        f.seek(size - budget)
+        data = f.read(budget)
+        # Drop first partial line
+        idx = data.find(b"\n")
+        if idx != -1:
+            data = data[idx + 1 :]
+        return data, True
+    f.seek(0)
+    return f.read(size), False
+
+
 def _read_file_tail(path: Path, budget: int) -> tuple[bytes, bool]:
     """同步读取单个文件的最后 budget 字节（掐掉开头的半行）。
 
@@ -22,50 +39,120 @@ def _read_file_tail(path: Path, budget: int) -> tuple[bytes, bool]:
     """
     try:
         with open(path, "rb") as f:
-            f.seek(0, 2)
-            size = f.tell()
-            if size > budget:
-                f.seek(-budget, 2)
-                data = f.read()
-                # Drop first partial line
-                idx = data.find(b"\n")
-                if idx != -1:
-                    data = data[idx + 1 :]
-                return data, True
-            f.seek(0)
-            return f.read(), False
+            return _tail_of(f, os.fstat(f.fileno()).st_size, budget)
     except FileNotFoundError:
         return b"", False
 
 
-def _read_log_tail() -> bytes:
-    """读取日志尾部，供 asyncio.to_thread 在线程池中执行。
+def _backup_path() -> Path:
+    return LOG_PATH.with_name(f"{LOG_PATH.name}.1")
+
+
+@dataclass(frozen=True)
+class LogChunk:
+    """一次增量读取的结果。
 
-    轮转（RotatingFileHandler / 启动轮转）刚发生后 log.txt 近乎为空；
-    仅当 log.txt 完整读入（未截断）且预算有剩时，把 log.txt.1 的尾部
-    拼在前面，UI 不出现"日志突然清空"的断崖。截断读取时绝不拼接：
-    中间内容已缺失，再贴更旧的备份会造成时间倒跳的假象。
+    cursor 形如 ``"<inode>:<offset>"``，指向已读内容之后的下一个字节，
+    且总落在行边界上（写了一半的行留到下次再读）。reset 为真时 data 是
+    完整的日志尾部，调用方应替换已有内容而不是追加。
     """
-    data, truncated = _read_file_tail(LOG_PATH, _TAIL_BYTES)
-    if truncated:
-        return data
-    remaining = _TAIL_BYTES - len(data)
-    if remaining > 0:
-        backup_data, _ = _read_file_tail(
-            LOG_PATH.with_name(f"{LOG_PATH.name}.1"), remaining
-        )
+
+    data: bytes
+    cursor: str
+    reset: bool
+
+
+def _parse_cursor(cursor: str | None) -> tuple[int, int] | None:
+    if not cursor:
+        return None
+    inode, sep, offset = cursor.partition(":")
+    if not sep or not inode.isdigit() or not offset.isdigit():
+        return None
+    return int(inode), int(offset)
+
+
+def _complete_lines(data: bytes) -> bytes:
+    return data[: data.rfind(b"\n") + 1]
+
+
+def _read_rotated_rest(inode: int, offset: int) -> bytes | None:
+    """游标所在的文件已轮转成 log.txt.1 时，读出它在 offset 之后的内容。
+
+    备份不是那个 inode（连续轮转了多次、或日志被清空）时返回 None。
+    """
+    try:
+        with open(_backup_path(), "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != inode or offset > st.st_size:
+                return None
+            if st.st_size - offset > _TAIL_BYTES:
+                return None
+            f.seek(offset)
+            return f.read(st.st_size - offset)
+    except FileNotFoundError:
+        return None
+
+
+def _read_log_since(cursor: str | None) -> LogChunk | None:
+    """读取 cursor 之后新追加的完整行；日志文件不存在时返回 None。
+
+    按 inode 识别轮转：游标指向的文件已变成 log.txt.1 时，先补完它剩下的
+    部分再接上新文件。游标缺失、无效、文件被清空（offset 超过文件长度）、
+    落后超过 ``_TAIL_BYTES`` 或轮转链断开时，退回完整尾部并置 reset。
+    供 asyncio.to_thread 在线程池中执行。
+    """
+    position = _parse_cursor(cursor)
+    try:
+        f = open(LOG_PATH, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        st = os.fstat(f.fileno())
+        inode, size = st.st_ino, st.st_size
+        if position is not None:
+            old_inode, offset = position
+            prefix: bytes | None = None
+            start = 0
+            if old_inode == inode and offset <= size:
+                prefix, start = b"", offset
+            elif old_inode != inode:
+                prefix = _read_rotated_rest(old_inode, offset)
+            if prefix is not None and len(prefix) + size - start <= _TAIL_BYTES:
+                f.seek(start)
+                data = _complete_lines(f.read(size - start))
+                return LogChunk(
+                    prefix + data, f"{inode}:{start + len(data)}", reset=False
+                )
+        data, truncated = _tail_of(f, size, _TAIL_BYTES)
+        # 尾部以写了一半的行结尾时，游标停在该行开头，下次完整送出
+        partial = len(data) - len(_complete_lines(data))
+        data = data[: len(data) - partial]
+        cursor_out = f"{inode}:{size - partial}"
+    if not truncated and len(data) < _TAIL_BYTES:
+        backup_data, _ = _read_file_tail(_backup_path(), _TAIL_BYTES - len(data))
         data = backup_data + data
-    return data
+    return LogChunk(data, cursor_out, reset=True)
 
 
 @router.get("", response_model=str, dependencies=[Depends(get_current_user)])
-async def get_log():
-    if LOG_PATH.exists():
-        # Up to 512 KB of sync file I/O; keep it off the event loop.
-        data = await asyncio.to_thread(_read_log_tail)
-        return Response(data, media_type="text/plain")
-    else:
+async def get_log(since: str | None = None):
+    """返回日志尾部；带上次响应的 ``X-Log-Cursor`` 作为 since 时只返回新增行。
+
+    ``X-Log-Reset: 1`` 表示响应体是完整尾部（首次请求、游标失效或日志被
+    清空），前端应替换而非追加。
+    """
+    # Up to 512 KB of sync file I/O; keep it off the event loop.
+    chunk = await asyncio.to_thread(_read_log_since, since)
+    if chunk is None:
         return Response("Log file not found", status_code=404)
+    return Response(
+        chunk.data,
+        media_type="text/plain",
+        headers={
+            "X-Log-Cursor": chunk.cursor,
+            "X-Log-Reset": "1" if chunk.reset else "0",
+        },
+    )
 
 
 def _clear_log_files() -> None:
@@ -30,7 +30,6 @@ from module.security.api import (
     require_session_principal,
 )
 from module.security.auth_strategy import PasskeyAuthStrategy
-from module.security.webauthn import get_webauthn_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/passkey", tags=["passkey"])
@@ -56,6 +55,9 @@ def _get_webauthn_from_request(request: Request):
     """
     from urllib.parse import urlparse
 
+    # py_webauthn 只在真正用到 Passkey 时才加载，不拖慢启动
+    from module.security.webauthn import get_webauthn_service
+
     origin = settings.security.webauthn_origin
     if not origin:
         origin = request.headers.get("origin", "")
@@ -0,0 +1,77 @@
+"""本地海报的静态服务（无鉴权，挂在根路径 ``/posters``）。
+
+- ``?size=thumb`` 返回宽 320 的 WebP 缩略图，供海报墙使用；
+- 浏览器 ``Accept`` 含 ``image/webp`` 时返回全尺寸 WebP，否则返回原图；
+- 按内容哈希命名的海报带 ``immutable`` 缓存头，旧的短哈希海报每天重新验证；
+- 带 ``If-None-Match`` 的重复请求回 304。
+
+变体缺失时（旧海报、Pillow 不可用）回退到原图，生成放在线程池里。
+"""
+
+import asyncio
+import mimetypes
+from pathlib import Path
+from typing import Literal
+
+from fastapi import APIRouter, Request
+from fastapi.responses import FileResponse, Response
+
+from module.utils.cache_image import POSTER_DIR, ensure_variant, is_content_addressed
+
+router = APIRouter(tags=["posters"])
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+LEGACY_CACHE = "public, max-age=86400"
+
+
+def _etag(path: Path) -> str:
+    if is_content_addressed(path.name):
+        return f'"{path.name}"'
+    stat = path.stat()
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+@router.get("/posters/{path:path}")
+async def posters(
+    request: Request, path: str, size: Literal["thumb"] | None = None
+) -> Response:
+    base = Path(POSTER_DIR).resolve()
+    resolved = (base / path).resolve()
+    if not resolved.is_relative_to(base):
+        return Response(status_code=403)
+    if not resolved.is_file():
+        return Response(status_code=404)
+
+    headers = {
+        "Cache-Control": (
+            IMMUTABLE_CACHE if is_content_addressed(resolved.name) else LEGACY_CACHE
+        )
+    }
+    variant = None
+    if size == "thumb":
+        variant = "thumb"
+    else:
+        # 同一个 URL 按 Accept 返回不同格式，缓存必须区分
+        headers["Vary"] = "Accept"
+        if "image/webp" in request.headers.get("accept", ""):
+            variant = "webp"
+    served = resolved
+    if variant is not None:
+        built = await asyncio.to_thread(ensure_variant, resolved, variant)
+        if built is not None:
+            served = built
+
+    etag = _etag(served)
+    headers["ETag"] = etag
+    if _matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    media_type = mimetypes.guess_type(served.name)[0]
+    return FileResponse(served, headers=headers, media_type=media_type)
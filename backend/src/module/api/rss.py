@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import JSONResponse
 
 from module.conf.search_provider import get_provider
@@ -9,6 +9,15 @@ from module.models import APIResponse, Bangumi, Movie, RSSItem, RSSUpdate, Torre
 from module.rss import RSSAnalyser, RSSEngine
 from module.security.api import get_current_user
 
+from .listing import (
+    ListParams,
+    check_params,
+    list_params,
+    list_response,
+    not_modified,
+    output_fields,
+    table_etag,
+)
 from .response import u_response
 
 router = APIRouter(prefix="/rss", tags=["rss"])
@@ -16,6 +25,7 @@ router = APIRouter(prefix="/rss", tags=["rss"])
 # RSSItem.parser 的合法取值（与 webui ab-add-rss 的选项一致）；
 # 这些值即便与搜索站点同名（mikan）也不做站点名映射
 PARSER_TYPES = {"mikan", "tmdb", "parser"}
+_TORRENT_SORTABLE = {"id", "name"}
 
 
 @router.get(
@@ -174,10 +184,35 @@ async def refresh_rss(rss_id: int, db: Database = Depends(get_db)):
 )
 async def get_torrent(
     rss_id: int,
+    request: Request,
+    downloaded: bool | None = None,
+    q: str | None = Query(None, description="Search torrent name"),
+    params: ListParams = Depends(list_params),
     db: Database = Depends(get_db),
 ):
-    engine = RSSEngine(db)
-    return await engine.get_rss_torrents(rss_id)
+    check_params(params, _TORRENT_SORTABLE, output_fields(Torrent))
+    etag = table_etag(request, "torrent", "rssitem")
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+    if await db.rss.search_id(rss_id) is None:
+        rows: list[Torrent] = []
+        next_cursor: list | None = None
+    else:
+        rows, next_cursor = await db.torrent.search_rss_page(
+            rss_id,
+            downloaded=downloaded,
+            query=q,
+            sort=params.sort,
+            descending=params.descending,
+            after=params.after,
+            limit=params.limit,
+        )
+    return list_response(
+        [row.model_dump(mode="json", by_alias=True) for row in rows],
+        etag,
+        params.fields,
+        next_cursor,
+    )
 
 
 # Old API
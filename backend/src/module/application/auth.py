@@ -2,12 +2,14 @@
 
 import logging
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from module.models.auth import ApiToken
 from module.models.user import User, UserCreate, UserUpdate
 from module.ports import AuthUnitOfWork
 
+from .auth_cache import PrincipalCache, TokenUsageBuffer, principal_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +29,17 @@ class AuthenticationService:
     def __init__(
         self,
         database_factory: Callable[[], AuthUnitOfWork],
+        *,
+        principals: PrincipalCache | None = None,
+        token_usage: TokenUsageBuffer | None = None,
     ) -> None:
         self._database_factory = database_factory
+        self._principals = PrincipalCache() if principals is None else principals
+        self._token_usage = TokenUsageBuffer() if token_usage is None else token_usage
+
+    def revoke_cached_principals(self) -> None:
+        """Stop serving cached principals; call after any credential change."""
+        self._principals.revoke()
 
     @staticmethod
     def _user_id(user: User) -> int:
@@ -45,25 +56,52 @@ class AuthenticationService:
             return user, await db.auth.create_session(self._user_id(user))
 
     async def authenticate_session(self, token: str) -> User | None:
+        if not token:
+            return None
+        key = principal_key("session", token)
+        cached = self._principals.get(key)
+        if cached is not None:
+            return cached.user
+        generation = self._principals.generation
         async with self._database_factory() as db:
-            return await db.auth.authenticate_session(token)
+            user = await db.auth.authenticate_session(token)
+        if user is not None:
+            self._principals.put(key, user, None, generation)
+        return user
 
     async def authenticate_api_token(
         self, token: str, *, scope: str = "api"
     ) -> User | None:
-        async with self._database_factory() as db:
-            authenticated = await db.auth.authenticate_api_token(token, scope=scope)
-        if authenticated is None:
+        if not token:
             return None
-        user, token_id = authenticated
+        key = principal_key(f"api_token:{scope}", token)
+        cached = self._principals.get(key)
+        if cached is not None and cached.token_id is not None:
+            user, token_id = cached.user, cached.token_id
+        else:
+            generation = self._principals.generation
+            async with self._database_factory() as db:
+                authenticated = await db.auth.authenticate_api_token(token, scope=scope)
+            if authenticated is None:
+                return None
+            user, token_id = authenticated
+            self._principals.put(key, user, token_id, generation)
+        if self._token_usage.record(token_id, datetime.now(timezone.utc)):
+            await self.flush_token_usage()
+        return user
+
+    async def flush_token_usage(self) -> None:
+        """Write buffered ``last_used_at`` values in one transaction."""
+        usage = self._token_usage.drain()
+        if not usage:
+            return
         try:
             async with self._database_factory() as db:
-                await db.auth.touch_api_token(token_id)
+                await db.auth.touch_api_tokens(usage)
         except Exception:
             # last_used_at is audit metadata. A contended or unavailable audit
             # write must never turn otherwise-valid authentication into a 500.
             logger.warning("Failed to update API token usage", exc_info=True)
-        return user
 
     async def refresh_session(
         self, token: str, *, ttl: timedelta = timedelta(days=1)
@@ -73,9 +111,12 @@ class AuthenticationService:
             return await db.auth.refresh_session(token, ttl=ttl)
 
     async def logout(self, token: str) -> bool:
-        async with self._database_factory() as db:
-            await db.begin_write()
-            return await db.auth.revoke_session(token)
+        try:
+            async with self._database_factory() as db:
+                await db.begin_write()
+                return await db.auth.revoke_session(token)
+        finally:
+            self._principals.revoke()
 
     async def issue_session_for_verified_passkey(
         self, user_id: int, credential_id: str
@@ -122,28 +163,33 @@ class AuthenticationService:
             if str(exc) == "User not found":
                 raise NotFoundError(str(exc)) from exc
             raise ConflictError(str(exc)) from exc
+        finally:
+            self._principals.revoke()
 
     async def update_current_user(
         self, user_id: int, data: UserUpdate
     ) -> tuple[User, str]:
         if data.enabled is not None:
             raise ConflictError("Current-user update cannot change enabled state")
-        async with self._database_factory() as db:
-            await db.begin_write()
-            current = await db.user.get_user_by_id(user_id)
-            if current is None:
-                raise NotFoundError("User not found")
-            if not current.enabled:
-                raise AuthenticationError("User is not available")
-            try:
-                user = await db.user.update_user_by_id(user_id, data, commit=False)
-            except ValueError as exc:
-                raise ConflictError(str(exc)) from exc
-            user_id = self._user_id(user)
-            await db.auth.revoke_user_sessions(user_id, commit=False)
-            token = await db.auth.create_session(user_id, commit=False)
-            await db.commit()
-            return user, token
+        try:
+            async with self._database_factory() as db:
+                await db.begin_write()
+                current = await db.user.get_user_by_id(user_id)
+                if current is None:
+                    raise NotFoundError("User not found")
+                if not current.enabled:
+                    raise AuthenticationError("User is not available")
+                try:
+                    user = await db.user.update_user_by_id(user_id, data, commit=False)
+                except ValueError as exc:
+                    raise ConflictError(str(exc)) from exc
+                user_id = self._user_id(user)
+                await db.auth.revoke_user_sessions(user_id, commit=False)
+                token = await db.auth.create_session(user_id, commit=False)
+                await db.commit()
+                return user, token
+        finally:
+            self._principals.revoke()
 
     async def delete_user(self, user_id: int) -> None:
         try:
@@ -160,6 +206,8 @@ class AuthenticationService:
                 await db.commit()
         except ValueError as exc:
             raise ConflictError(str(exc)) from exc
+        finally:
+            self._principals.revoke()
 
     async def create_api_token_for_user_id(
         self,
@@ -186,7 +234,10 @@ class AuthenticationService:
             return await db.auth.list_api_tokens()
 
     async def revoke_api_token(self, token_id: int) -> None:
-        async with self._database_factory() as db:
-            await db.begin_write()
-            if not await db.auth.revoke_api_token(token_id):
-                raise NotFoundError("API token not found")
+        try:
+            async with self._database_factory() as db:
+                await db.begin_write()
+                if not await db.auth.revoke_api_token(token_id):
+                    raise NotFoundError("API token not found")
+        finally:
+            self._principals.revoke()
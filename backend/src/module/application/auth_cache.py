@@ -0,0 +1,126 @@
+"""In-process caches in front of credential lookups.
+
+Home Assistant and SSE clients authenticate hundreds of requests a minute;
+without these caches each one is a database round-trip, and every API-token
+request also writes ``last_used_at`` while the RSS and rename loops compete
+for the SQLite writer. AB runs as a single process, so plain process memory
+is the source of truth here.
+"""
+
+import hashlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from module.models.user import User
+
+PRINCIPAL_CACHE_TTL = 30.0
+PRINCIPAL_CACHE_MAX_ENTRIES = 1024
+TOKEN_USAGE_FLUSH_INTERVAL = 60.0
+
+
+def principal_key(kind: str, token: str) -> str:
+    """Cache key for a raw credential; the raw token is never kept."""
+    return hashlib.sha256(f"{kind}:{token}".encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPrincipal:
+    user: User
+    token_id: int | None
+    generation: int
+    expires: float
+
+
+class PrincipalCache:
+    """Short-TTL map of credential hash -> authenticated user.
+
+    Only successful lookups are cached. Every revocation (logout, session
+    revocation, user update or deletion, token revocation) bumps
+    ``generation``; entries from an older generation are never served. A
+    lookup captures the generation *before* reading the database, so a
+    result that raced with a revocation is stored already stale. Expiry
+    of the credential itself is noticed at most ``ttl`` seconds late.
+    """
+
+    def __init__(
+        self,
+        ttl: float = PRINCIPAL_CACHE_TTL,
+        max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._generation = 0
+        self._entries: dict[str, CachedPrincipal] = {}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def revoke(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def get(self, key: str) -> CachedPrincipal | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.generation != self._generation or entry.expires <= self._clock():
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    def put(self, key: str, user: User, token_id: int | None, generation: int) -> None:
+        if self._ttl <= 0 or generation != self._generation:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            # dict 保持插入顺序，最早写入的先淘汰
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = CachedPrincipal(
+            user=user,
+            token_id=token_id,
+            generation=generation,
+            expires=self._clock() + self._ttl,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TokenUsageBuffer:
+    """Write-behind buffer that coalesces API-token ``last_used_at`` updates."""
+
+    def __init__(
+        self,
+        interval: float = TOKEN_USAGE_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = interval
+        self._clock = clock
+        self._pending: dict[int, datetime] = {}
+        self._last_flush = clock()
+
+    def record(self, token_id: int, used_at: datetime) -> bool:
+        """Remember a use; True when the caller should flush now.
+
+        Only one caller per interval is told to flush.
+        """
+        previous = self._pending.get(token_id)
+        if previous is None or used_at > previous:
+            self._pending[token_id] = used_at
+        now = self._clock()
+        if now - self._last_flush < self._interval:
+            return False
+        self._last_flush = now
+        return True
+
+    def drain(self) -> dict[int, datetime]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
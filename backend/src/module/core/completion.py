@@ -0,0 +1,100 @@
+"""下载完成事件队列。
+
+aria2 的 WebSocket 通知和 qBittorrent「torrent 完成时运行外部程序」钩子都把
+完成的种子 hash 放进 :class:`CompletionQueue`，再唤醒 rename 任务，只对这些
+种子做一次定向重命名，不必等满一个 ``program.rename_time``。有事件源在工作时，
+全量轮询退化为较慢的兜底。
+"""
+
+import logging
+import time
+
+from .scheduler import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+# 事件源在线时，rename 轮询的最短间隔（秒）：只用来兜住丢失的事件。
+RENAME_SAFETY_NET_INTERVAL = 15 * 60
+# qBittorrent 钩子多久没有调用就不再视为在线。一天没有下载完成很常见，
+# 窗口太短会让轮询在空闲期来回切换。
+HOOK_ACTIVE_WINDOW = 24 * 60 * 60
+
+
+class CompletionQueue:
+    """Pending completed-torrent hashes waiting for a targeted rename."""
+
+    def __init__(self) -> None:
+        # dict 保持到达顺序，同一个 hash 重复上报只保留一份
+        self._pending: dict[str, str] = {}
+        self._task: PeriodicTask | None = None
+        self._listeners = 0
+        self._last_hook_at: float | None = None
+        self._last_sweep_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def bind(self, task: PeriodicTask) -> None:
+        """Attach the rename task that ``put`` wakes up."""
+        self._task = task
+
+    def put(self, torrent_hash: str, source: str) -> bool:
+        """Queue one completed torrent and wake the rename task.
+
+        Returns False for an empty hash. ``source`` only appears in logs.
+        """
+        torrent_hash = torrent_hash.strip().lower()
+        if not torrent_hash:
+            return False
+        if source == "hook":
+            self._last_hook_at = time.monotonic()
+        self._pending.setdefault(torrent_hash, source)
+        logger.debug("[Completion] %s finished (via %s)", torrent_hash, source)
+        if self._task is not None:
+            self._task.wake()
+        return True
+
+    def drain(self) -> list[str]:
+        """Take every pending hash, oldest first."""
+        hashes = list(self._pending)
+        self._pending.clear()
+        return hashes
+
+    def sweep_due(self, interval: float) -> bool:
+        """Whether the next rename tick should be a full pass.
+
+        Ticks woken early by an event only rename the queued torrents; once
+        ``interval`` has passed since the last full pass, the tick sweeps
+        everything again (which also covers whatever is queued).
+        """
+        if self._last_sweep_at is None:
+            return True
+        return time.monotonic() - self._last_sweep_at >= interval
+
+    def mark_swept(self) -> None:
+        self._last_sweep_at = time.monotonic()
+
+    def listener_connected(self) -> None:
+        self._listeners += 1
+
+    def listener_disconnected(self) -> None:
+        self._listeners = max(0, self._listeners - 1)
+
+    @property
+    def event_driven(self) -> bool:
+        """True while an event source is known to be delivering completions.
+
+        A connected aria2 listener counts immediately; the qBittorrent hook
+        counts if it called in within ``HOOK_ACTIVE_WINDOW``.
+        """
+        if self._listeners:
+            return True
+        if self._last_hook_at is None:
+            return False
+        return time.monotonic() - self._last_hook_at < HOOK_ACTIVE_WINDOW
+
+    def rename_interval(self, base: float) -> float:
+        """Polling interval for the rename task given ``program.rename_time``."""
+        if self.event_driven:
+            return max(base, RENAME_SAFETY_NET_INTERVAL)
+        return base
@@ -18,7 +18,9 @@ from module.models import ResponseModel
 from module.network.request_url import reset_shared_client
 from module.notification import DownloaderUnavailableEvent, NotificationManager
 from module.parser.analyser.mikan_parser import reset_cache as reset_mikan_cache
+from module.parser.analyser.selector import reset_cache as reset_parse_cache
 from module.parser.analyser.tmdb_parser import reset_cache as reset_tmdb_cache
+from module.parser.analyser.tmdb_parser import warm_response_cache
 from module.parser.title_parser import reset_cache as reset_llm_parser
 from module.rss import RSSAnalyser
 from module.searcher.searcher import reset_cache as reset_poster_cache
@@ -32,10 +34,14 @@ from module.update import (
     run_migrations,
 )
 
+from .completion import CompletionQueue
 from .loops import (
+    aria2_event_tick,
     calendar_tick,
+    notify_tick,
     offset_scan_tick,
     rename_tick,
+    retention_tick,
     rss_tick,
     update_check_tick,
 )
@@ -50,9 +56,13 @@ DOWNLOADER_STATUS_TTL = 60
 OFFSET_SCAN_INTERVAL = 6 * 60 * 60
 CALENDAR_REFRESH_INTERVAL = 24 * 60 * 60
 UPDATE_CHECK_INTERVAL = 24 * 60 * 60
+RETENTION_INTERVAL = 24 * 60 * 60
 OFFSET_SCAN_INITIAL_DELAY = 60
 CALENDAR_INITIAL_DELAY = 120
 UPDATE_CHECK_INITIAL_DELAY = 300
+RETENTION_INITIAL_DELAY = 600
+# aria2 WebSocket 断开后的重连间隔
+ARIA2_EVENT_RECONNECT_INTERVAL = 30
 
 # Downloader wait-retry loop on startup.
 _DOWNLOADER_MAX_RETRIES = 10
@@ -79,11 +89,13 @@ class AppContext:
         notifier: NotificationManager,
         scheduler: Scheduler,
         analyser: RSSAnalyser,
+        completions: CompletionQueue | None = None,
     ) -> None:
         self.settings = settings_obj
         self.notifier = notifier
         self.scheduler = scheduler
         self.analyser = analyser
+        self.completions = completions if completions is not None else CompletionQueue()
         # Downloader-status TTL cache (was ProgramStatus.check_downloader_status).
         self._downloader_status = False
         self._downloader_reason: str | None = None
@@ -111,6 +123,23 @@ class AppContext:
         """
         analyser = RSSAnalyser()
         notifier = NotificationManager()
+        completions = CompletionQueue()
+        rename_task = PeriodicTask(
+            name="rename",
+            run=lambda: rename_tick(notifier, completions),
+            interval=lambda: completions.rename_interval(
+                settings_obj.program.rename_time
+            ),
+            enabled=Checker.check_renamer,
+        )
+        completions.bind(rename_task)
+        notify_task = PeriodicTask(
+            name="notify",
+            run=lambda: notify_tick(notifier),
+            interval=notifier.next_delivery_in,
+            enabled=lambda: settings_obj.notification.enable,
+        )
+        notifier.bind(notify_task)
         scheduler = Scheduler(
             [
                 PeriodicTask(
@@ -119,11 +148,14 @@ class AppContext:
                     interval=lambda: settings_obj.program.rss_time,
                     enabled=Checker.check_analyser,
                 ),
+                rename_task,
+                notify_task,
                 PeriodicTask(
-                    name="rename",
-                    run=lambda: rename_tick(notifier),
-                    interval=lambda: settings_obj.program.rename_time,
-                    enabled=Checker.check_renamer,
+                    name="aria2_events",
+                    run=lambda: aria2_event_tick(completions),
+                    interval=lambda: ARIA2_EVENT_RECONNECT_INTERVAL,
+                    enabled=lambda: Checker.check_renamer()
+                    and settings_obj.downloader.type == "aria2",
                 ),
                 PeriodicTask(
                     name="offset_scan",
@@ -137,6 +169,12 @@ class AppContext:
                     interval=lambda: CALENDAR_REFRESH_INTERVAL,
                     initial_delay=CALENDAR_INITIAL_DELAY,
                 ),
+                PeriodicTask(
+                    name="retention",
+                    run=retention_tick,
+                    interval=lambda: RETENTION_INTERVAL,
+                    initial_delay=RETENTION_INITIAL_DELAY,
+                ),
                 PeriodicTask(
                     name="update_check",
                     run=lambda: update_check_tick(notifier),
@@ -146,7 +184,7 @@ class AppContext:
                 ),
             ]
         )
-        return cls(settings_obj, notifier, scheduler, analyser)
+        return cls(settings_obj, notifier, scheduler, analyser, completions)
 
     # ------------------------------------------------------------------ status
 
@@ -233,8 +271,20 @@ class AppContext:
         if not Checker.check_img_cache():
             logger.info("No image cache exists, create image cache.")
             await cache_image()
+        await self._warm_tmdb_cache()
         self._startup_done = True
 
+    @staticmethod
+    async def _warm_tmdb_cache() -> None:
+        """从磁盘预热 TMDB 响应缓存；失败不影响启动，只是回到冷缓存。"""
+        try:
+            loaded = await warm_response_cache()
+        except Exception as e:
+            logger.warning(f"Failed to warm TMDB cache: {e}")
+            return
+        if loaded:
+            logger.debug("Warmed %s TMDB responses from disk.", loaded)
+
     # ------------------------------------------------------------------ tasks
 
     async def _wait_for_downloader(self) -> None:
@@ -424,6 +474,8 @@ class AppContext:
         reset_mikan_cache()
         reset_poster_cache()
         reset_llm_parser()
+        # 解析引擎可能随配置切换；旧引擎的解析结果不再有用
+        reset_parse_cache()
         # 用户保存了设置即视为已处理凭据问题：解除下载器的凭据失败闩锁，
         # 允许重试（哪怕保存的值没变——qB 侧密码可能被改回来了）。
         clear_credential_latch()
@@ -10,11 +10,22 @@ import logging
 from module.conf import settings
 from module.database import Database
 from module.downloader import DownloadClient
+from module.downloader.client import aria2_events
 from module.manager import Renamer, TorrentManager, eps_complete
-from module.notification import NotificationManager, UpdateAvailableEvent
-from module.rss import RSSAnalyser, RSSEngine
+from module.models import Notification
+from module.notification import (
+    NotificationManager,
+    RenameConflictEvent,
+    UpdateAvailableEvent,
+)
+from module.parser.analyser.mikan_parser import cached_posters as mikan_posters
+from module.parser.analyser.tmdb_parser import cached_posters as tmdb_posters
+from module.rss import FeedSnapshot, RSSAnalyser, RSSEngine
+from module.searcher.searcher import cached_posters as preview_posters
 from module.update import updater
+from module.utils.cache_image import collect_posters
 
+from .completion import CompletionQueue
 from .offset_scanner import OffsetScanner
 
 logger = logging.getLogger(__name__)
@@ -25,12 +36,16 @@ async def rss_tick(analyser: RSSAnalyser, notifier: NotificationManager) -> None
     async with DownloadClient() as client:
         async with Database() as db:
             engine = RSSEngine(db)
+            # 聚合源在分析与下载两个阶段共用一次拉取
+            snapshot = FeedSnapshot()
             # Analyse RSS
             rss_list = await db.rss.search_aggregate()
             for rss in rss_list:
                 try:
-                    await analyser.rss_to_data(rss, engine)
+                    await analyser.rss_to_data(rss, engine, snapshot=snapshot)
                 except Exception:
+                    # 本轮没分析完：不记录条件请求校验值，下一轮重新完整拉取
+                    snapshot.mark_incomplete(rss.url)
                     # 仅当该 RSS 确实已在遍历期间被 API 删除时才视为预期情况；
                     # 其余异常可能是真实 bug，需在 WARNING 级别带完整堆栈。
                     if await db.rss.search_id(rss.id) is None:
@@ -46,7 +61,7 @@ async def rss_tick(analyser: RSSAnalyser, notifier: NotificationManager) -> None
                             exc_info=True,
                         )
             # Run RSS Engine
-            events = await engine.refresh_rss(client)
+            events = await engine.refresh_rss(client, snapshot=snapshot)
     if events:
         # 站内通知中心要求事件总是送达 notifier（send_event 内部先落库，
         # 再按 settings.notification.enable 决定是否外发）。
@@ -60,20 +75,71 @@ async def rss_tick(analyser: RSSAnalyser, notifier: NotificationManager) -> None
         await eps_complete()
 
 
-async def rename_tick(notifier: NotificationManager) -> None:
-    """Rename completed downloads and notify via the shared notifier."""
+async def rename_tick(
+    notifier: NotificationManager, completions: CompletionQueue | None = None
+) -> None:
+    """Rename completed downloads and notify via the shared notifier.
+
+    A tick woken by completion events renames just the queued torrents.
+    Otherwise (and at least once per polling interval) it sweeps every
+    completed torrent, the safety net for events that never arrived.
+    """
+    hashes: list[str] = []
+    full_pass = True
+    if completions is not None:
+        hashes = completions.drain()
+        interval = completions.rename_interval(settings.program.rename_time)
+        full_pass = completions.sweep_due(interval)
+        if full_pass:
+            completions.mark_swept()
+        elif not hashes:
+            return
     async with DownloadClient() as client:
         renamer = Renamer(client)
-        renamed_info = await renamer.rename()
+        if full_pass:
+            renamed_info = await renamer.rename()
+        else:
+            renamed_info = await renamer.rename_hashes(hashes)
         rename_events = list(renamer.events)
-    if rename_events:
-        await asyncio.gather(*[notifier.send_event(event) for event in rename_events])
+    await notify_renames(notifier, rename_events, renamed_info)
+
+
+async def notify_renames(
+    notifier: NotificationManager,
+    events: list[RenameConflictEvent],
+    renamed_info: list[Notification],
+) -> None:
+    """Report one rename pass: conflicts to the notice center, episodes queued.
+
+    Shared by the periodic tick and the on-demand rename paths (API / MCP) so
+    a manual rename is announced exactly like a scheduled one.
+    """
+    if events:
+        await asyncio.gather(*[notifier.send_event(event) for event in events])
     if settings.notification.enable and renamed_info:
-        # Gather across renamed items so a batch rename (e.g. first import of
-        # a season) doesn't serialize N notification round-trips.
+        # send_all 只是入队，真正的推送由 notify 任务完成
         await asyncio.gather(*[notifier.send_all(info) for info in renamed_info])
 
 
+async def notify_tick(notifier: NotificationManager) -> None:
+    """Deliver queued episode notifications that are due."""
+    await notifier.deliver_due()
+
+
+async def aria2_event_tick(completions: CompletionQueue) -> None:
+    """Hold one aria2 WebSocket session open, queueing finished downloads.
+
+    Returns when the connection drops; the task's interval is the reconnect
+    delay.
+    """
+    await aria2_events.listen(
+        settings.downloader.host,
+        on_complete=lambda gid: completions.put(gid, "aria2"),
+        on_connect=completions.listener_connected,
+        on_disconnect=completions.listener_disconnected,
+    )
+
+
 async def offset_scan_tick(notifier: NotificationManager) -> None:
     """Scan all bangumi for season/episode offset mismatches."""
     # 扫描结果由 OffsetScanner.scan_all 自己记录，这里不再重复记一行
@@ -105,6 +171,24 @@ async def update_check_tick(notifier: NotificationManager) -> None:
     )
 
 
+async def retention_tick() -> None:
+    """Prune torrent history and unreferenced posters, then compact the DB."""
+    manage = settings.bangumi_manage
+    async with Database() as db:
+        pruned = await db.torrent.prune(
+            manage.torrent_retention_days, manage.torrent_retention_count
+        )
+        if pruned:
+            logger.info("Pruned %s old torrent records.", pruned)
+        poster_links = await db.poster_links()
+        await db.compact()
+    # 进程内的查询缓存还会把这些海报交给新建的番剧，不能当作无主文件回收
+    poster_links |= mikan_posters() | tmdb_posters() | preview_posters()
+    removed = await asyncio.to_thread(collect_posters, poster_links)
+    if removed:
+        logger.info("Removed %s unreferenced poster files.", removed)
+
+
 async def calendar_tick() -> None:
     """Refresh bangumi calendar metadata."""
     async with Database() as db:
@@ -7,9 +7,8 @@ from module.database import Database
 from module.models import Bangumi
 from module.notification.events import OffsetReviewEvent
 from module.parser.analyser.offset_detector import detect_offset_mismatch
-from module.parser.analyser.selector import parse_configured_release_title
 from module.parser.analyser.tmdb_parser import tmdb_parser
-from module.parser.release_policy import is_offset_signal
+from module.utils.pipeline import run_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -25,30 +24,39 @@ class OffsetScanner:
         """
         logger.info("Starting offset scan...")
 
+        # 所有番剧的最新集数一次从剧集索引查出，避免逐部开会话查询
         async with Database() as db:
             bangumi_list = await db.bangumi.get_active_for_scan()
+            latest_episodes = await db.episode_index.latest_episodes(
+                [bangumi.id for bangumi in bangumi_list if bangumi.id is not None]
+            )
 
         if not bangumi_list:
             logger.debug("No active bangumi to scan.")
             return []
 
-        events: list[OffsetReviewEvent] = []
-        for bangumi in bangumi_list:
+        async def check(bangumi: Bangumi) -> OffsetReviewEvent | None:
             try:
-                event = await self._check_bangumi(bangumi)
-                if event is not None:
-                    events.append(event)
+                return await self._check_bangumi(bangumi, latest_episodes)
             except Exception as e:
                 logger.warning(f"Error checking {bangumi.official_title}: {e}")
+                return None
+
+        results = await run_pipeline("offset_scan", bangumi_list, check)
+        events = [event for event in results if event is not None]
 
         logger.info(f"Scan complete. Flagged {len(events)} bangumi for review.")
         return events
 
-    async def _check_bangumi(self, bangumi: Bangumi) -> OffsetReviewEvent | None:
+    async def _check_bangumi(
+        self, bangumi: Bangumi, latest_episodes: dict[int, int] | None = None
+    ) -> OffsetReviewEvent | None:
         """Check a single bangumi for offset mismatch.
 
         Args:
             bangumi: The bangumi to check.
+            latest_episodes: Latest parsed episode per bangumi id when already
+                loaded in batch; queried from the database when omitted.
 
         Returns:
             An event describing the flag if the bangumi was flagged for
@@ -74,6 +82,17 @@ class OffsetScanner:
             logger.debug(f"Skipping {bangumi.official_title}: has configured offsets")
             return None
 
+        # Get the real latest parsed episode from this bangumi's torrent records,
+        # instead of guessing. No torrents parsed yet means no signal to act on,
+        # so check it before spending a TMDB lookup.
+        if latest_episodes is None:
+            parsed_episode = await self._get_latest_parsed_episode(bangumi.id)
+        else:
+            parsed_episode = latest_episodes.get(bangumi.id)
+        if parsed_episode is None:
+            logger.debug(f"Skipping {bangumi.official_title}: no parsed episode data")
+            return None
+
         # Get TMDB info
         language = settings.rss_parser.language
         tmdb_info = await tmdb_parser(bangumi.official_title, language)
@@ -82,13 +101,6 @@ class OffsetScanner:
             logger.debug(f"Skipping {bangumi.official_title}: no TMDB info")
             return None
 
-        # Get the real latest parsed episode from this bangumi's torrent records,
-        # instead of guessing. No torrents parsed yet means no signal to act on.
-        parsed_episode = await self._get_latest_parsed_episode(bangumi.id)
-        if parsed_episode is None:
-            logger.debug(f"Skipping {bangumi.official_title}: no parsed episode data")
-            return None
-
         # Detect mismatch
         suggestion = detect_offset_mismatch(
             parsed_season=bangumi.season,
@@ -115,27 +127,14 @@ class OffsetScanner:
         return None
 
     async def _get_latest_parsed_episode(self, bangumi_id: int) -> int | None:
-        """从 Torrent 表解析该番剧已知的最新集数，作为真实信号使用。
+        """从剧集索引查该番剧已知的最新集数，作为真实信号使用。
 
         Returns:
             解析到的最大集数；若没有种子记录或均无法解析出集数则返回 None。
         """
         async with Database() as db:
-            torrents = await db.torrent.search_by_bangumi_id(bangumi_id)
-
-        latest: int | None = None
-        for torrent in torrents:
-            release = parse_configured_release_title(torrent.name)
-            if release is None or not is_offset_signal(release):
-                continue
-            episode = release.episode
-            # ``is_offset_signal`` guarantees this at runtime; retain the local
-            # guard so static type checking can narrow ``int | float | None``.
-            if type(episode) is not int:
-                continue
-            if latest is None or episode > latest:
-                latest = episode
-        return latest
+            latest = await db.episode_index.latest_episodes([bangumi_id])
+        return latest.get(bangumi_id)
 
     async def check_single(self, bangumi_id: int) -> bool:
         """Check a single bangumi by ID.
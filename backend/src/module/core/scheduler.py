@@ -21,6 +21,8 @@ class PeriodicTask:
     * ``interval`` and ``enabled`` are callables read live each time, so a
       settings change is picked up without rebuilding the task.
     * an exception raised inside a tick is logged and the loop continues.
+    * ``wake()`` cuts the current wait short so the next tick runs now
+      (event sources such as download-complete hooks use it).
     """
 
     def __init__(
@@ -38,6 +40,7 @@ class PeriodicTask:
         self._enabled = enabled
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
 
     @property
     def name(self) -> str:
@@ -56,6 +59,7 @@ class PeriodicTask:
         if self.running:
             return
         self._stop_event.clear()
+        self._wake_event.clear()
         self._task = asyncio.create_task(self._loop(), name=f"periodic:{self._name}")
 
     async def _loop(self) -> None:
@@ -76,18 +80,33 @@ class PeriodicTask:
             pass
 
     async def _wait(self, timeout: float) -> bool:
-        """Sleep up to ``timeout`` seconds. Return True if a stop was requested."""
-        try:
-            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
-            return True
-        except asyncio.TimeoutError:
-            return False
+        """Sleep up to ``timeout`` seconds. Return True if a stop was requested.
+
+        A ``wake()`` ends the sleep early without stopping the loop.
+        """
+        if not self._wake_event.is_set():
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._wake_event.clear()
+        return self._stop_event.is_set()
+
+    def wake(self) -> None:
+        """Run the next tick now instead of after the remaining interval.
+
+        Wakes arriving while a tick is running are not lost: the following
+        wait returns immediately. No-op when the task is not running.
+        """
+        if self.running:
+            self._wake_event.set()
 
     async def stop(self) -> None:
         """Signal, cancel, and await the task. Idempotent."""
         if self._task is None:
             return
         self._stop_event.set()
+        self._wake_event.set()
         self._task.cancel()
         try:
             await self._task
@@ -111,6 +130,9 @@ class Scheduler:
     def running(self) -> bool:
         return self._running
 
+    def get(self, name: str) -> PeriodicTask | None:
+        return next((task for task in self._tasks if task.name == name), None)
+
     def start_all(self) -> None:
         """Start every task whose ``enabled()`` currently returns True."""
         for task in self._tasks:
@@ -87,6 +87,27 @@ class Aria2GidDatabase:
             self.session.add(existing)
         await self.session.commit()
 
+    async def upsert_many(
+        self,
+        gids: list[str],
+        bangumi_id: int | None = None,
+        category: str | None = None,
+    ) -> None:
+        """批量版 :meth:`upsert`：同样的字段写到多条 gid 上，只提交一次。"""
+        if not gids:
+            return
+        existing = await self.get_many(gids)
+        for gid in dict.fromkeys(gids):
+            record = existing.get(gid)
+            if record is None:
+                record = Aria2Gid(gid=gid)
+            if bangumi_id is not None:
+                record.bangumi_id = bangumi_id
+            if category is not None:
+                record.category = category
+            self.session.add(record)
+        await self.session.commit()
+
     async def get(self, gid: str) -> Aria2Gid | None:
         return await self.session.get(Aria2Gid, gid)
 
@@ -144,19 +165,32 @@ class Aria2GidDatabase:
         await self.session.delete(old)
         await self.session.commit()
 
-    async def get_renamed_paths(self, gid: str) -> dict[str, str]:
-        record = await self.session.get(Aria2Gid, gid)
+    @staticmethod
+    def _decode_renamed_paths(record: Aria2Gid | None) -> dict[str, str]:
         if record is None or not record.renamed_paths:
             return {}
         try:
             data = json.loads(record.renamed_paths)
         except json.JSONDecodeError:
-            logger.warning("Ignoring invalid renamed_paths for gid %s", gid)
+            logger.warning("Ignoring invalid renamed_paths for gid %s", record.gid)
             return {}
         if not isinstance(data, dict):
             return {}
         return {str(k): str(v) for k, v in data.items()}
 
+    async def get_renamed_paths(self, gid: str) -> dict[str, str]:
+        record = await self.session.get(Aria2Gid, gid)
+        return self._decode_renamed_paths(record)
+
+    async def get_renamed_paths_many(
+        self, gids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        """批量版 ``get_renamed_paths``：一次查询；没有记录的 gid 不出现在结果里。"""
+        records = await self.get_many(gids)
+        return {
+            gid: self._decode_renamed_paths(record) for gid, record in records.items()
+        }
+
     async def set_renamed_path(self, gid: str, old_path: str, new_path: str) -> None:
         mapping = await self.get_renamed_paths(gid)
         for original_path, renamed_path in list(mapping.items()):
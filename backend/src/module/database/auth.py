@@ -4,7 +4,7 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import update
+from sqlalchemy import bindparam, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, delete, select
@@ -240,15 +240,23 @@ class AuthDatabase:
             raise RuntimeError("Persisted API token has no primary key")
         return user, token.id
 
-    async def touch_api_token(
-        self, token_id: int, *, now: datetime | None = None
-    ) -> None:
-        """Update best-effort usage metadata with a direct write transaction."""
-        current = _utc(now or datetime.now(timezone.utc))
+    async def touch_api_tokens(self, usage: dict[int, datetime]) -> None:
+        """Write buffered ``last_used_at`` values in a single transaction.
+
+        A Core executemany: it does not refresh ``ApiToken`` objects already
+        loaded into this session.
+        """
+        if not usage:
+            return
+        table = ApiToken.__table__  # type: ignore[attr-defined]
         await self.session.execute(
-            update(ApiToken)
-            .where(col(ApiToken.id) == token_id)
-            .values(last_used_at=current)
+            update(table)
+            .where(table.c.id == bindparam("token_id"))
+            .values(last_used_at=bindparam("used_at")),
+            [
+                {"token_id": token_id, "used_at": _utc(used_at)}
+                for token_id, used_at in usage.items()
+            ],
         )
         await self.session.commit()
 
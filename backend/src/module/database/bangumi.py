@@ -1,13 +1,20 @@
 import json
 import logging
 import re
+from collections import defaultdict, deque
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import get_history
 from sqlalchemy.sql import func
-from sqlmodel import and_, delete, false, or_, select
+from sqlmodel import and_, col, delete, false, or_, select
 
-from module.models import Bangumi, BangumiUpdate
+from module.models import Bangumi, BangumiRSS, BangumiUpdate
+from module.models.bangumi import split_rss_link
+
+from .paging import apply_keyset, split_page
 
 if TYPE_CHECKING:
     from module.parser.analyser.tokenizer.result import ParsedRelease
@@ -148,16 +155,8 @@ def _inherit_year(data: Bangumi, candidates: list[Bangumi]) -> None:
             return
 
 
-def match_bangumi_in_list(
-    torrent_name: str, bangumi_list: list[Bangumi]
-) -> Optional[Bangumi]:
-    """Match a torrent name against an already-loaded list of bangumi.
-
-    Pure/in-memory: the RSS refresh cycle loads the active bangumi once and
-    matches every torrent against it here, instead of querying per torrent
-    (the job the old module-level TTL cache used to do). Returns the bangumi
-    with the longest matching pattern for specificity.
-    """
+def _match_release(torrent_name: str) -> tuple[bool, "ParsedRelease | None"]:
+    """Parse *torrent_name* for matching; ``False`` means it can never match."""
     # Lazy import avoids the database -> parser -> database import cycle during
     # application startup while still giving matching the typed parser result.
     from module.parser.analyser.selector import parse_configured_release_title_outcome
@@ -174,7 +173,37 @@ def match_bangumi_in_list(
             release is None
             or persistence_target(release) is not PersistenceTarget.BANGUMI
         ):
-            return None
+            return False, release
+    return True, release
+
+
+def _match_rank(
+    release: "ParsedRelease | None", bangumi: Bangumi, pattern: str
+) -> tuple[int, int, int]:
+    """Ranking among matching patterns: longest, then same group, then season."""
+    group_match = int(
+        release is not None and _groups_are_similar(release.group, bangumi.group_name)
+    )
+    return (len(pattern), group_match, bangumi.season)
+
+
+def match_bangumi_in_list(
+    torrent_name: str, bangumi_list: list[Bangumi]
+) -> Optional[Bangumi]:
+    """Match a torrent name against an already-loaded list of bangumi.
+
+    Pure/in-memory: the RSS refresh cycle loads the active bangumi once and
+    matches every torrent against it here, instead of querying per torrent
+    (the job the old module-level TTL cache used to do). Returns the bangumi
+    with the longest matching pattern for specificity.
+
+    This is a linear scan over every bangumi and alias; callers matching many
+    torrents against the same list should build a :class:`BangumiMatcher`
+    once instead.
+    """
+    matchable, release = _match_release(torrent_name)
+    if not matchable:
+        return None
     best_match: Optional[Bangumi] = None
     best_rank = (-1, -1, -1)
     for bangumi in bangumi_list:
@@ -183,17 +212,96 @@ def match_bangumi_in_list(
         for pattern in _all_title_patterns(bangumi):
             if pattern not in torrent_name:
                 continue
-            group_match = int(
-                release is not None
-                and _groups_are_similar(release.group, bangumi.group_name)
-            )
-            rank = (len(pattern), group_match, bangumi.season)
+            rank = _match_rank(release, bangumi, pattern)
             if rank > best_rank:
                 best_match = bangumi
                 best_rank = rank
     return best_match
 
 
+class _PatternAutomaton:
+    """Aho–Corasick automaton finding every literal pattern in one text pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for pattern in patterns:
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = child
+            self._out[node] += (pattern,)
+        # Breadth-first so every fail target is final before its dependents.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def find(self, text: str) -> set[str]:
+        found: set[str] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class BangumiMatcher:
+    """Prebuilt matcher over an already-loaded bangumi list.
+
+    Equivalent to calling :func:`match_bangumi_in_list` with the same list,
+    but aliases are decoded once and every title pattern is found with a
+    single Aho–Corasick pass over the torrent name, so one lookup no longer
+    costs O(bangumi × aliases). Build it once per batch (an RSS refresh, a
+    rename sweep) and reuse it for every torrent in that batch.
+    """
+
+    def __init__(self, bangumi_list: list[Bangumi]):
+        # pattern -> [(list position, bangumi)]; the position reproduces the
+        # linear scan's "first bangumi wins a tie" ordering.
+        self._owners: dict[str, list[tuple[int, Bangumi]]] = defaultdict(list)
+        for position, bangumi in enumerate(bangumi_list):
+            if bangumi.deleted:
+                continue
+            for pattern in dict.fromkeys(_all_title_patterns(bangumi)):
+                self._owners[pattern].append((position, bangumi))
+        self._automaton = _PatternAutomaton(self._owners)
+
+    def match(self, torrent_name: str) -> Optional[Bangumi]:
+        matchable, release = _match_release(torrent_name)
+        if not matchable:
+            return None
+        best_match: Optional[Bangumi] = None
+        best_key: tuple[tuple[int, int, int], int] | None = None
+        for pattern in self._automaton.find(torrent_name):
+            for position, bangumi in self._owners[pattern]:
+                if not _release_matches_bangumi(release, bangumi):
+                    continue
+                key = (_match_rank(release, bangumi, pattern), -position)
+                if best_key is None or key > best_key:
+                    best_match = bangumi
+                    best_key = key
+        return best_match
+
+
 def _release_matches_bangumi(release: "ParsedRelease | None", bangumi: Bangumi) -> bool:
     if release is None:
         return True
@@ -217,6 +325,42 @@ def _release_matches_bangumi(release: "ParsedRelease | None", bangumi: Bangumi)
     return release.season is None or bangumi.season == release.season
 
 
+# bangumi_rss 跟随 Bangumi.rss_link 的每次 ORM 写入同步（映射事件在同一个
+# flush 的连接上执行），调用方继续只改 rss_link 字符串即可。
+_links_table = BangumiRSS.__table__  # type: ignore[attr-defined]
+
+
+def _replace_links(connection, bangumi: Bangumi) -> None:
+    connection.execute(
+        _links_table.delete().where(_links_table.c.bangumi_id == bangumi.id)
+    )
+    urls = split_rss_link(bangumi.rss_link)
+    if urls:
+        connection.execute(
+            _links_table.insert(),
+            [{"bangumi_id": bangumi.id, "url": url} for url in urls],
+        )
+
+
+@event.listens_for(Bangumi, "after_insert")
+def _link_inserted(mapper, connection, target: Bangumi) -> None:
+    _replace_links(connection, target)
+
+
+@event.listens_for(Bangumi, "after_update")
+def _link_updated(mapper, connection, target: Bangumi) -> None:
+    if get_history(target, "rss_link").has_changes():
+        _replace_links(connection, target)
+
+
+@event.listens_for(Bangumi, "before_delete")
+def _unlink_deleted(mapper, connection, target: Bangumi) -> None:
+    # 在删除 bangumi 行之前清理，避免外键约束报错
+    connection.execute(
+        _links_table.delete().where(_links_table.c.bangumi_id == target.id)
+    )
+
+
 class BangumiDatabase:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -559,6 +703,8 @@ class BangumiDatabase:
             logger.debug("Delete bangumi id: %s.", _id)
 
     async def delete_all(self):
+        # 批量 delete() 不触发映射事件，关联表需要手动清
+        await self.session.execute(delete(BangumiRSS))
         statement = delete(Bangumi)
         await self.session.execute(statement)
         await self.session.commit()
@@ -568,6 +714,37 @@ class BangumiDatabase:
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def search_page(
+        self,
+        *,
+        deleted: bool | None = None,
+        archived: bool | None = None,
+        needs_review: bool | None = None,
+        query: str | None = None,
+        sort: str = "id",
+        descending: bool = False,
+        after: list | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[Bangumi], list | None]:
+        """Filtered, keyset-paginated listing; returns (rows, next cursor)."""
+        statement = select(Bangumi)
+        if deleted is not None:
+            statement = statement.where(Bangumi.deleted == deleted)
+        if archived is not None:
+            statement = statement.where(Bangumi.archived == archived)
+        if needs_review is not None:
+            statement = statement.where(Bangumi.needs_review == needs_review)
+        if query:
+            statement = statement.where(
+                or_(
+                    Bangumi.official_title.contains(query, autoescape=True),  # type: ignore[attr-defined]
+                    Bangumi.title_raw.contains(query, autoescape=True),  # type: ignore[attr-defined]
+                )
+            )
+        statement = apply_keyset(statement, Bangumi, sort, descending, after, limit)
+        result = await self.session.execute(statement)
+        return split_page(list(result.scalars().all()), sort, limit)
+
     async def search_id(self, _id: int) -> Optional[Bangumi]:
         statement = select(Bangumi).where(Bangumi.id == _id)
         result = await self.session.execute(statement)
@@ -612,19 +789,24 @@ class BangumiDatabase:
         if not match_datas:
             return torrent_list
 
+        matcher = BangumiMatcher(match_datas)
         unmatched = []
+        # 已订阅该链接的番剧不再追加；按整条链接比较，而不是子串
+        linked = await self.linked_ids(rss_link)
         rss_updated: set[int | tuple[str, int, str]] = set()
         for torrent in torrent_list:
-            match_data = match_bangumi_in_list(torrent.name, match_datas)
+            match_data = matcher.match(torrent.name)
             if match_data is not None:
                 match_key: int | tuple[str, int, str] = match_data.id or (
                     match_data.title_raw,
                     match_data.season,
                     match_data.episode_type,
                 )
-                if rss_link not in match_data.rss_link and match_key not in rss_updated:
+                if match_data.id not in linked and match_key not in rss_updated:
                     match_data = await self.session.merge(match_data)
-                    match_data.rss_link += f",{rss_link}"
+                    match_data.rss_link = ",".join(
+                        [*split_rss_link(match_data.rss_link), rss_link]
+                    )
                     match_data.added = False
                     rss_updated.add(match_key)
             else:
@@ -678,10 +860,32 @@ class BangumiDatabase:
             logger.debug("Disable rule %s.", bangumi.title_raw)
 
     async def search_rss(self, rss_link: str) -> list[Bangumi]:
-        statement = select(Bangumi).where(func.instr(rss_link, Bangumi.rss_link) > 0)
+        """Bangumi subscribed to ``rss_link`` (one of its comma-joined links)."""
+        statement = (
+            select(Bangumi)
+            .join(BangumiRSS, col(BangumiRSS.bangumi_id) == col(Bangumi.id))
+            .where(BangumiRSS.url == rss_link)
+        )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def linked_ids(self, rss_link: str) -> set[int]:
+        """Ids of bangumi subscribed to ``rss_link``."""
+        result = await self.session.execute(
+            select(BangumiRSS.bangumi_id).where(BangumiRSS.url == rss_link)
+        )
+        return set(result.scalars().all())
+
+    async def referenced_rss(self, urls: Iterable[str]) -> set[str]:
+        """The subset of ``urls`` still linked to any bangumi (deleted included)."""
+        urls = list(urls)
+        if not urls:
+            return set()
+        result = await self.session.execute(
+            select(BangumiRSS.url).where(col(BangumiRSS.url).in_(urls)).distinct()
+        )
+        return set(result.scalars().all())
+
     async def archive_one(self, _id: int) -> bool:
         """Set archived=True for the given bangumi."""
         bangumi = await self.session.get(Bangumi, _id)
@@ -1,15 +1,17 @@
 import logging
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlmodel import SQLModel, select
 
-from module.models import Bangumi, User
+from module.models import Bangumi, Movie, QueuedNotification, User
 
+from . import revision  # noqa: F401  (registers per-table revision tracking)
 from .aria2 import Aria2GidDatabase
 from .auth import AuthDatabase
 from .bangumi import BangumiDatabase
 from .engine import async_engine, async_session_factory
+from .episode_index import EpisodeIndexDatabase
 from .inbox import InboxDatabase
 from .llm_credential import LLMCredentialDatabase
 from .migrations import (  # noqa: F401  (re-exported for existing importers)
@@ -20,13 +22,19 @@ from .migrations import (  # noqa: F401  (re-exported for existing importers)
     run_migrations_async,
 )
 from .movie import MovieDatabase
+from .notification_queue import NotificationQueueDatabase
 from .rename_operation import RenameOperationDatabase
 from .rss import RSSDatabase
+from .tmdb_cache import TmdbCacheDatabase
 from .torrent import TorrentDatabase
 from .user import UserDatabase
 
 logger = logging.getLogger(__name__)
 
+# 空闲页至少占文件的这一比例、且不少于这么多字节时才 VACUUM
+COMPACT_FREE_RATIO = 0.2
+COMPACT_MIN_FREE_BYTES = 16 * 1024 * 1024
+
 
 class Database:
     """Async, session-per-operation database facade.
@@ -53,6 +61,9 @@ class Database:
         self.inbox = InboxDatabase(self.session)
         self.llm_credential = LLMCredentialDatabase(self.session)
         self.rename_operation = RenameOperationDatabase(self.session)
+        self.tmdb_cache = TmdbCacheDatabase(self.session)
+        self.episode_index = EpisodeIndexDatabase(self.session)
+        self.notification_queue = NotificationQueueDatabase(self.session)
 
     async def __aenter__(self):
         return self
@@ -90,6 +101,48 @@ class Database:
     async def close(self):
         await self.session.close()
 
+    async def storage_stats(self) -> dict:
+        """SQLite file size and the part of it held by free pages."""
+        page_size = (await self.session.execute(text("PRAGMA page_size"))).scalar_one()
+        pages = (await self.session.execute(text("PRAGMA page_count"))).scalar_one()
+        free = (await self.session.execute(text("PRAGMA freelist_count"))).scalar_one()
+        return {"db_bytes": pages * page_size, "free_bytes": free * page_size}
+
+    async def compact(self) -> bool:
+        """Refresh planner statistics; VACUUM when enough pages are free.
+
+        VACUUM rewrites the whole file, so it only runs once free pages make
+        up ``COMPACT_FREE_RATIO`` of it. Returns True if it ran.
+        """
+        stats = await self.storage_stats()
+        # VACUUM 不能在事务里执行，改用独立的 autocommit 连接
+        await self.session.commit()
+        bind = self.session.bind
+        assert isinstance(bind, AsyncEngine), "Database sessions bind an engine"
+        async with bind.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("ANALYZE"))
+            if (
+                stats["free_bytes"] < COMPACT_MIN_FREE_BYTES
+                or stats["free_bytes"] < stats["db_bytes"] * COMPACT_FREE_RATIO
+            ):
+                return False
+            await conn.execute(text("VACUUM"))
+        logger.info(
+            "Database compacted, reclaimed about %s MB.",
+            stats["free_bytes"] // (1024 * 1024),
+        )
+        return True
+
+    async def poster_links(self) -> set[str]:
+        """Every poster link still referenced by a bangumi, movie or queued notice."""
+        result = await self.session.execute(
+            select(Bangumi.poster_link).union(
+                select(Movie.poster_link), select(QueuedNotification.poster_path)
+            )
+        )
+        return {link for link in result.scalars().all() if link}
+
     async def create_table(self):
         await create_tables_async(async_engine)
 
@@ -0,0 +1,187 @@
+"""按种子物化的剧集解析索引。
+
+偏好去重要知道番剧已下载的每一集是哪个版本，offset 扫描要知道解析到的
+最新集数；两者原来每轮都把番剧的全部种子名重新解析一遍。解析结果存进
+``episode_index`` 后，每次查询前只解析还没有索引行（或由另一个解析引擎
+生成）的种子，历史种子不再重复解析。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, func, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import and_, col, select, true
+
+from module.models import EpisodeIndex, Torrent
+
+if TYPE_CHECKING:
+    from module.parser.analyser.tokenizer import MediaType
+    from module.parser.analyser.tokenizer.result import ParsedRelease
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 500
+
+
+def index_release(
+    torrent_id: int, engine: str, release: ParsedRelease | None
+) -> EpisodeIndex:
+    """The index row for a torrent whose name parsed to ``release``."""
+    from module.parser.analyser.tokenizer import MediaType
+    from module.parser.release_policy import (
+        is_offset_signal,
+        preference_identity,
+        preference_revision,
+    )
+
+    entry = EpisodeIndex(torrent_id=torrent_id, parser=engine)
+    if release is None:
+        return entry
+    entry.group_name = release.group
+    entry.resolution = release.resolution
+    entry.revision = preference_revision(release)
+    entry.offset_signal = is_offset_signal(release)
+    identity = preference_identity(release, default_season=0)
+    if identity is not None:
+        media_type, season, episode = identity
+        entry.media_type = media_type.value
+        # 正片名称里没有季度时存 None，查询时按番剧当前季度补；特典固定为 0
+        if release.season is None and media_type is MediaType.EPISODE:
+            entry.season = None
+        else:
+            entry.season = season
+        entry.episode = float(episode)
+    return entry
+
+
+def entry_identity(
+    entry: EpisodeIndex, default_season: int
+) -> tuple[MediaType, int, int | float] | None:
+    """``preference_identity`` rebuilt from an index row."""
+    from module.parser.analyser.tokenizer import MediaType
+
+    if entry.media_type is None or entry.episode is None:
+        return None
+    season = entry.season if entry.season is not None else default_season
+    episode = entry.episode
+    return (
+        MediaType(entry.media_type),
+        season,
+        int(episode) if episode.is_integer() else episode,
+    )
+
+
+class EpisodeIndexDatabase:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def sync(self, bangumi_ids: list[int] | None = None) -> int:
+        """Index torrents of ``bangumi_ids`` (None: every bangumi) not yet parsed.
+
+        Rows produced by a different parser engine count as missing, so an
+        engine switch re-parses lazily. Returns the number of rows written.
+        """
+        from module.parser.analyser.selector import (
+            parse_configured_release_title,
+            parser_engine_snapshot,
+        )
+
+        if bangumi_ids is not None and not bangumi_ids:
+            return 0
+        owned = (
+            col(Torrent.bangumi_id).in_(bangumi_ids)
+            if bangumi_ids is not None
+            else col(Torrent.bangumi_id).is_not(None)
+        )
+        written = 0
+        with parser_engine_snapshot() as engine:
+            stale = and_(
+                owned,
+                or_(
+                    col(EpisodeIndex.torrent_id).is_(None),
+                    col(EpisodeIndex.parser) != engine,
+                ),
+            )
+            while True:
+                result = await self.session.execute(
+                    select(Torrent.id, Torrent.name)
+                    .outerjoin(
+                        EpisodeIndex, col(EpisodeIndex.torrent_id) == col(Torrent.id)
+                    )
+                    .where(stale)
+                    .limit(SYNC_BATCH_SIZE)
+                )
+                rows = result.all()
+                if not rows:
+                    break
+                values = [
+                    index_release(
+                        row.id, engine, parse_configured_release_title(row.name)
+                    ).model_dump()
+                    for row in rows
+                ]
+                statement = sqlite_insert(EpisodeIndex).values(values)
+                statement = statement.on_conflict_do_update(
+                    index_elements=["torrent_id"],
+                    set_={
+                        column: statement.excluded[column]
+                        for column in values[0]
+                        if column != "torrent_id"
+                    },
+                )
+                await self.session.execute(statement)
+                await self.session.commit()
+                written += len(rows)
+                if len(rows) < SYNC_BATCH_SIZE:
+                    break
+        if written:
+            logger.debug("Indexed episodes of %s torrent(s).", written)
+        return written
+
+    async def downloaded(self, bangumi_ids: list[int]) -> dict[int, list[EpisodeIndex]]:
+        """Index rows of downloaded single-episode torrents, grouped by bangumi."""
+        if not bangumi_ids:
+            return {}
+        await self.sync(bangumi_ids)
+        result = await self.session.execute(
+            select(EpisodeIndex, Torrent.bangumi_id)
+            .join(Torrent, col(EpisodeIndex.torrent_id) == col(Torrent.id))
+            .where(
+                col(Torrent.bangumi_id).in_(bangumi_ids),
+                col(Torrent.downloaded) == true(),
+                col(EpisodeIndex.media_type).is_not(None),
+            )
+        )
+        grouped: dict[int, list[EpisodeIndex]] = defaultdict(list)
+        for entry, bangumi_id in result.all():
+            grouped[bangumi_id].append(entry)
+        return dict(grouped)
+
+    async def latest_episodes(self, bangumi_ids: list[int]) -> dict[int, int]:
+        """Highest offset-signal episode per bangumi; ids without one are absent."""
+        if not bangumi_ids:
+            return {}
+        await self.sync(bangumi_ids)
+        result = await self.session.execute(
+            select(Torrent.bangumi_id, func.max(EpisodeIndex.episode))
+            .join(Torrent, col(EpisodeIndex.torrent_id) == col(Torrent.id))
+            .where(
+                col(Torrent.bangumi_id).in_(bangumi_ids),
+                col(EpisodeIndex.offset_signal) == true(),
+            )
+            .group_by(col(Torrent.bangumi_id))
+        )
+        return {bangumi_id: int(episode) for bangumi_id, episode in result.all()}
+
+    async def rebuild(self) -> int:
+        """Drop every index row and re-parse all bangumi torrents."""
+        await self.session.execute(delete(EpisodeIndex))
+        await self.session.commit()
+        indexed = await self.sync()
+        logger.info("Episode index rebuilt from %s torrent(s).", indexed)
+        return indexed
@@ -22,6 +22,7 @@ from module.models.inbox import InboxMessage
 from module.models.llm_credential import LLMCredential
 from module.models.passkey import Passkey
 from module.models.rss import RSSItem
+from module.models.tmdb_cache import TmdbCache
 from module.models.torrent import Torrent
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ TABLE_MODELS: list[type[SQLModel]] = [
     AuthSession,
     ApiToken,
     RenameOperation,
+    TmdbCache,
 ]
 
 # already_applied 守卫：接收 inspector，返回该迁移是否已生效
@@ -55,6 +57,17 @@ def column_exists(table: str, column: str) -> AppliedCheck:
     return check
 
 
+def column_exists_or_no_table(table: str, column: str) -> AppliedCheck:
+    """表不存在时视为已应用：之后 create_all 会按当前模型直接建出该列。"""
+
+    def check(inspector) -> bool:
+        if table not in inspector.get_table_names():
+            return True
+        return column in {col["name"] for col in inspector.get_columns(table)}
+
+    return check
+
+
 def table_exists(table: str) -> AppliedCheck:
     def check(inspector) -> bool:
         return table in inspector.get_table_names()
@@ -98,6 +111,58 @@ class Migration:
         return self.statements
 
 
+_BANGUMI_RSS_TABLE = """CREATE TABLE IF NOT EXISTS bangumi_rss (
+    bangumi_id INTEGER NOT NULL REFERENCES bangumi(id),
+    url VARCHAR NOT NULL,
+    PRIMARY KEY (bangumi_id, url)
+)"""
+_BANGUMI_RSS_INDEX = "CREATE INDEX IF NOT EXISTS ix_bangumi_rss_url ON bangumi_rss(url)"
+# 用递归 CTE 按逗号拆分 rss_link，每个非空链接一行
+_BANGUMI_RSS_BACKFILL = """WITH RECURSIVE split(bangumi_id, url, rest) AS (
+    SELECT id, '', rss_link || ',' FROM bangumi
+    WHERE rss_link IS NOT NULL AND rss_link != ''
+    UNION ALL
+    SELECT bangumi_id,
+           trim(substr(rest, 1, instr(rest, ',') - 1)),
+           substr(rest, instr(rest, ',') + 1)
+    FROM split WHERE rest != ''
+)
+INSERT OR IGNORE INTO bangumi_rss (bangumi_id, url)
+SELECT bangumi_id, url FROM split WHERE url != ''"""
+# 索引行在首次查询时按需解析生成，迁移只建空表
+_EPISODE_INDEX_TABLE = """CREATE TABLE IF NOT EXISTS episode_index (
+    torrent_id INTEGER NOT NULL PRIMARY KEY
+        REFERENCES torrent(id) ON DELETE CASCADE,
+    parser VARCHAR NOT NULL,
+    media_type VARCHAR,
+    season INTEGER,
+    episode FLOAT,
+    revision INTEGER NOT NULL DEFAULT 1,
+    group_name VARCHAR,
+    resolution VARCHAR,
+    offset_signal BOOLEAN NOT NULL DEFAULT 0
+)"""
+
+_NOTIFICATION_QUEUE_TABLE = """CREATE TABLE IF NOT EXISTS notification_queue (
+    id INTEGER NOT NULL PRIMARY KEY,
+    provider VARCHAR NOT NULL DEFAULT '',
+    official_title VARCHAR NOT NULL DEFAULT '',
+    season INTEGER NOT NULL DEFAULT 1,
+    episode FLOAT NOT NULL DEFAULT 0,
+    poster_path VARCHAR,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before FLOAT NOT NULL DEFAULT 0,
+    created_at FLOAT NOT NULL DEFAULT 0,
+    last_error VARCHAR
+)"""
+
+_NOTIFICATION_MEDIA_TABLE = """CREATE TABLE IF NOT EXISTS notification_media (
+    provider VARCHAR NOT NULL,
+    media_key VARCHAR NOT NULL,
+    ref VARCHAR NOT NULL DEFAULT '',
+    PRIMARY KEY (provider, media_key)
+)"""
+
 # 迁移按版本顺序执行；版本号与 3.2.x 的历史保持一致，旧数据库照常升级。
 MIGRATIONS: tuple[Migration, ...] = (
     Migration(
@@ -781,6 +846,147 @@ MIGRATIONS: tuple[Migration, ...] = (
             ),
         ),
     ),
+    Migration(
+        25,
+        "add conditional-GET validator columns to rssitem",
+        (
+            "ALTER TABLE rssitem ADD COLUMN etag TEXT",
+            "ALTER TABLE rssitem ADD COLUMN last_modified TEXT",
+            "ALTER TABLE rssitem ADD COLUMN content_hash TEXT",
+        ),
+        all_checks(
+            column_exists_or_no_table("rssitem", "etag"),
+            column_exists_or_no_table("rssitem", "last_modified"),
+            column_exists_or_no_table("rssitem", "content_hash"),
+        ),
+        (
+            (
+                "ALTER TABLE rssitem ADD COLUMN etag TEXT",
+                column_exists_or_no_table("rssitem", "etag"),
+            ),
+            (
+                "ALTER TABLE rssitem ADD COLUMN last_modified TEXT",
+                column_exists_or_no_table("rssitem", "last_modified"),
+            ),
+            (
+                "ALTER TABLE rssitem ADD COLUMN content_hash TEXT",
+                column_exists_or_no_table("rssitem", "content_hash"),
+            ),
+        ),
+    ),
+    Migration(
+        26,
+        "create tmdb_cache table for persisted TMDB responses",
+        (
+            """CREATE TABLE IF NOT EXISTS tmdb_cache (
+                kind VARCHAR NOT NULL,
+                query VARCHAR NOT NULL,
+                language VARCHAR NOT NULL,
+                payload VARCHAR NOT NULL DEFAULT '',
+                expires_at FLOAT NOT NULL DEFAULT 0,
+                PRIMARY KEY (kind, query, language)
+            )""",
+            "CREATE INDEX IF NOT EXISTS ix_tmdb_cache_expires_at "
+            "ON tmdb_cache(expires_at)",
+        ),
+        all_checks(
+            table_exists("tmdb_cache"),
+            index_exists("tmdb_cache", "ix_tmdb_cache_expires_at"),
+        ),
+    ),
+    Migration(
+        27,
+        "add torrent.created_at and torrent_seen fingerprints for retention",
+        (
+            "ALTER TABLE torrent ADD COLUMN created_at TIMESTAMP",
+            "UPDATE torrent SET created_at = CURRENT_TIMESTAMP "
+            "WHERE created_at IS NULL",
+            """CREATE TABLE IF NOT EXISTS torrent_seen (
+                url_hash VARCHAR NOT NULL PRIMARY KEY,
+                rss_id INTEGER,
+                first_seen TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )""",
+            "CREATE INDEX IF NOT EXISTS ix_torrent_seen_rss_id "
+            "ON torrent_seen(rss_id)",
+        ),
+        all_checks(
+            column_exists_or_no_table("torrent", "created_at"),
+            table_exists("torrent_seen"),
+            index_exists("torrent_seen", "ix_torrent_seen_rss_id"),
+        ),
+        (
+            (
+                "ALTER TABLE torrent ADD COLUMN created_at TIMESTAMP",
+                column_exists_or_no_table("torrent", "created_at"),
+            ),
+            # 旧行没有入库时间：从升级这一刻开始计算年龄，不会一升级就被清理
+            (
+                "UPDATE torrent SET created_at = CURRENT_TIMESTAMP "
+                "WHERE created_at IS NULL",
+                lambda inspector: "torrent" not in inspector.get_table_names(),
+            ),
+            (
+                """CREATE TABLE IF NOT EXISTS torrent_seen (
+                    url_hash VARCHAR NOT NULL PRIMARY KEY,
+                    rss_id INTEGER,
+                    first_seen TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )""",
+                table_exists("torrent_seen"),
+            ),
+            (
+                "CREATE INDEX IF NOT EXISTS ix_torrent_seen_rss_id "
+                "ON torrent_seen(rss_id)",
+                index_exists("torrent_seen", "ix_torrent_seen_rss_id"),
+            ),
+        ),
+    ),
+    Migration(
+        28,
+        "create bangumi_rss link table from comma-joined bangumi.rss_link",
+        (
+            _BANGUMI_RSS_TABLE,
+            _BANGUMI_RSS_INDEX,
+            _BANGUMI_RSS_BACKFILL,
+        ),
+        all_checks(
+            table_exists("bangumi_rss"),
+            index_exists("bangumi_rss", "ix_bangumi_rss_url"),
+        ),
+        (
+            (_BANGUMI_RSS_TABLE, table_exists("bangumi_rss")),
+            (_BANGUMI_RSS_INDEX, index_exists("bangumi_rss", "ix_bangumi_rss_url")),
+            # 升级时 create_all 可能已建好空表，拆分回填不能以表存在为准；
+            # INSERT OR IGNORE 重复执行也无害
+            (
+                _BANGUMI_RSS_BACKFILL,
+                lambda inspector: not column_exists("bangumi", "rss_link")(inspector),
+            ),
+        ),
+    ),
+    Migration(
+        29,
+        "create episode_index for preference dedup and offset scanning",
+        (_EPISODE_INDEX_TABLE,),
+        table_exists("episode_index"),
+    ),
+    Migration(
+        30,
+        "create notification_queue and notification_media for queued delivery",
+        (
+            _NOTIFICATION_QUEUE_TABLE,
+            "CREATE INDEX IF NOT EXISTS ix_notification_queue_provider "
+            "ON notification_queue(provider)",
+            "CREATE INDEX IF NOT EXISTS ix_notification_queue_not_before "
+            "ON notification_queue(not_before)",
+            _NOTIFICATION_MEDIA_TABLE,
+        ),
+        all_checks(
+            table_exists("notification_queue"),
+            index_exists("notification_queue", "ix_notification_queue_provider"),
+            index_exists("notification_queue", "ix_notification_queue_not_before"),
+            table_exists("notification_media"),
+        ),
+    ),
 )
 
 # 由迁移列表派生，新增迁移时无需手动同步
@@ -822,11 +1028,14 @@ def run_migrations_conn(conn: Connection) -> None:
     每个迁移包在 SAVEPOINT 中执行：失败即回滚该迁移并重新抛出异常，使外层
     事务整体回滚、启动失败并高声中止 —— 不允许应用在半迁移的 schema 上继续
     提供服务。
+
+    已是最新版本时只读一次版本号就返回，不做任何写入；``fill_null`` 也只在
+    确实应用了迁移之后才跑，正常重启不会扫表。
     """
-    ensure_schema_version_table(conn)
     current = get_schema_version(conn)
     if current >= CURRENT_SCHEMA_VERSION:
         return
+    ensure_schema_version_table(conn)
     for migration in MIGRATIONS:
         if migration.version <= current:
             continue
@@ -863,9 +1072,16 @@ def run_migrations(engine: Engine) -> None:
 
 
 def create_tables_conn(conn: Connection) -> None:
-    """Sync-Connection body for table creation, usable via ``conn.run_sync``."""
-    SQLModel.metadata.create_all(conn)
-    ensure_schema_version_table(conn)
+    """Sync-Connection body for table creation, usable via ``conn.run_sync``.
+
+    ``create_all`` probes every table one query at a time; on an existing
+    install all of them are already there, so one table listing settles it.
+    """
+    existing = set(inspect(conn).get_table_names())
+    if not existing.issuperset(SQLModel.metadata.tables):
+        SQLModel.metadata.create_all(conn)
+    if "schema_version" not in existing:
+        ensure_schema_version_table(conn)
 
 
 def create_tables(engine: Engine) -> None:
@@ -0,0 +1,101 @@
+"""外部通知发送队列与已上传媒体引用的仓储。"""
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
+
+from module.models import NotificationMedia, QueuedNotification
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationQueueDatabase:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, rows: list[QueuedNotification]) -> None:
+        if not rows:
+            return
+        self.session.add_all(rows)
+        await self.session.commit()
+
+    async def pending(self) -> list[QueuedNotification]:
+        """Every queued row, oldest first."""
+        result = await self.session.execute(
+            select(QueuedNotification).order_by(col(QueuedNotification.id))
+        )
+        return list(result.scalars().all())
+
+    async def discard_except(self, providers: Iterable[str]) -> int:
+        """Drop rows queued for providers that are no longer configured."""
+        result = await self.session.execute(
+            delete(QueuedNotification).where(
+                col(QueuedNotification.provider).not_in(list(providers))
+            )
+        )
+        await self.session.commit()
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    async def delete(self, ids: list[int]) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            delete(QueuedNotification).where(col(QueuedNotification.id).in_(ids))
+        )
+        await self.session.commit()
+
+    async def retry(self, ids: list[int], not_before: float, error: str) -> None:
+        """Record a failed attempt and push the rows back to ``not_before``."""
+        if not ids:
+            return
+        await self.session.execute(
+            update(QueuedNotification)
+            .where(col(QueuedNotification.id).in_(ids))
+            .values(
+                attempts=col(QueuedNotification.attempts) + 1,
+                not_before=not_before,
+                last_error=error,
+            )
+        )
+        await self.session.commit()
+
+    async def media(self, providers: Iterable[str]) -> dict[str, dict[str, str]]:
+        """Uploaded-media references per provider key."""
+        result = await self.session.execute(
+            select(NotificationMedia).where(
+                col(NotificationMedia.provider).in_(list(providers))
+            )
+        )
+        refs: dict[str, dict[str, str]] = {}
+        for row in result.scalars().all():
+            refs.setdefault(row.provider, {})[row.media_key] = row.ref
+        return refs
+
+    async def save_media(self, provider: str, refs: dict[str, str | None]) -> None:
+        """Upsert references; a None value forgets a reference the provider rejected."""
+        stale = [key for key, ref in refs.items() if ref is None]
+        fresh = [
+            {"provider": provider, "media_key": key, "ref": ref}
+            for key, ref in refs.items()
+            if ref is not None
+        ]
+        if stale:
+            await self.session.execute(
+                delete(NotificationMedia).where(
+                    col(NotificationMedia.provider) == provider,
+                    col(NotificationMedia.media_key).in_(stale),
+                )
+            )
+        if fresh:
+            statement = sqlite_insert(NotificationMedia).values(fresh)
+            statement = statement.on_conflict_do_update(
+                index_elements=["provider", "media_key"],
+                set_={"ref": statement.excluded.ref},
+            )
+            await self.session.execute(statement)
+        if stale or fresh:
+            await self.session.commit()
@@ -0,0 +1,68 @@
+"""按表的进程内修订号。
+
+每次提交的事务里只要某张表有行被新增/修改/删除（ORM 单元工作或
+``update()``/``delete()`` 语句），提交后该表的修订号 +1。列表接口用它生成
+ETag：修订号没变，同样的查询就一定得到同样的结果，可以直接回 304，
+不用再查库和序列化。与 ``inbox_revision`` 一样只在进程内计数——AB 为单进程
+部署；``BOOT_ID`` 让重启后的旧 ETag 全部失效。
+"""
+
+import secrets
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+BOOT_ID = secrets.token_hex(4)
+
+_revisions: dict[str, int] = {}
+_PENDING_KEY = "ab_changed_tables"
+
+
+def table_revision(table: str) -> int:
+    return _revisions.get(table, 0)
+
+
+def bump_table_revision(*tables: str) -> None:
+    for table in tables:
+        _revisions[table] = _revisions.get(table, 0) + 1
+
+
+def _pending(session: Session) -> set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _table_name(obj) -> str | None:
+    table = getattr(obj, "__table__", None)
+    return getattr(table, "name", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    changed = _pending(session)
+    for obj in (*session.new, *session.deleted):
+        if name := _table_name(obj):
+            changed.add(name)
+    for obj in session.dirty:
+        if session.is_modified(obj) and (name := _table_name(obj)):
+            changed.add(name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(state: ORMExecuteState) -> None:
+    if not (state.is_update or state.is_delete or state.is_insert):
+        return
+    table = getattr(state.statement, "table", None)
+    if name := getattr(table, "name", None):
+        _pending(state.session).add(name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed(session: Session) -> None:
+    changed = session.info.pop(_PENDING_KEY, None)
+    if changed:
+        bump_table_revision(*changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -3,7 +3,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import and_, delete, select
 
-from module.models import RSSItem, RSSUpdate, Torrent
+from module.models import RSSItem, RSSUpdate, Torrent, TorrentSeen
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +48,11 @@ class RSSDatabase:
         if not db_data:
             return False
         dict_data = data.dict(exclude_unset=True)
+        if dict_data.get("url", db_data.url) != db_data.url:
+            # 换了地址，旧地址的条件请求校验值不再适用
+            db_data.etag = None
+            db_data.last_modified = None
+            db_data.content_hash = None
         for key, value in dict_data.items():
             setattr(db_data, key, value)
         self.session.add(db_data)
@@ -122,6 +127,9 @@ class RSSDatabase:
             await self.session.execute(
                 delete(Torrent).where(Torrent.rss_id == _id)  # type: ignore[arg-type]
             )
+            await self.session.execute(
+                delete(TorrentSeen).where(TorrentSeen.rss_id == _id)  # type: ignore[arg-type]
+            )
             await self.session.execute(
                 delete(RSSItem).where(RSSItem.id == _id)  # type: ignore[arg-type]
             )
@@ -139,6 +147,9 @@ class RSSDatabase:
             await self.session.execute(
                 delete(Torrent).where(rss_id_not_null)  # type: ignore[arg-type]
             )
+            await self.session.execute(
+                delete(TorrentSeen).where(TorrentSeen.rss_id != None)  # type: ignore[arg-type]  # noqa: E711
+            )
             await self.session.execute(delete(RSSItem))
             await self.session.commit()
         except Exception as e:
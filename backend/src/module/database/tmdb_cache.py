@@ -0,0 +1,46 @@
+"""TMDB 响应磁盘缓存的仓储。"""
+
+import time
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, delete, select
+
+from module.models.tmdb_cache import TmdbCache
+
+
+class TmdbCacheDatabase:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def load_fresh(self, limit: int) -> list[TmdbCache]:
+        """未过期的条目，最晚过期的优先（预热内存缓存时保留最有用的部分）。"""
+        statement = (
+            select(TmdbCache)
+            .where(col(TmdbCache.expires_at) > time.time())
+            .order_by(col(TmdbCache.expires_at).desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
+    async def upsert_many(self, rows: list[dict]) -> None:
+        if not rows:
+            return
+        statement = sqlite_insert(TmdbCache).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["kind", "query", "language"],
+            set_={
+                "payload": statement.excluded.payload,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    async def purge_expired(self) -> int:
+        result = await self.session.execute(
+            delete(TmdbCache).where(col(TmdbCache.expires_at) <= time.time())
+        )
+        await self.session.commit()
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
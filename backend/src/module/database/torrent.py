@@ -1,11 +1,15 @@
 import logging
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, func
+from sqlalchemy import delete, false, func, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import and_, select, true
+from sqlmodel import and_, col, select, true
 
-from module.models import Torrent
+from module.models import Torrent, TorrentSeen
+from module.models.torrent import url_fingerprint
+
+from .paging import apply_keyset, split_page
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,29 @@ class TorrentDatabase:
         )
         return list(result.scalars().all())
 
+    async def search_rss_page(
+        self,
+        rss_id: int,
+        *,
+        downloaded: bool | None = None,
+        query: str | None = None,
+        sort: str = "id",
+        descending: bool = False,
+        after: list | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[Torrent], list | None]:
+        """Filtered, keyset-paginated torrents of one feed; (rows, next cursor)."""
+        statement = select(Torrent).where(Torrent.rss_id == rss_id)
+        if downloaded is not None:
+            statement = statement.where(Torrent.downloaded == downloaded)
+        if query:
+            statement = statement.where(
+                Torrent.name.contains(query, autoescape=True)  # type: ignore[attr-defined]
+            )
+        statement = apply_keyset(statement, Torrent, sort, descending, after, limit)
+        result = await self.session.execute(statement)
+        return split_page(list(result.scalars().all()), sort, limit)
+
     async def check_new(self, torrents_list: list[Torrent]) -> list[Torrent]:
         if not torrents_list:
             return []
@@ -61,8 +88,123 @@ class TorrentDatabase:
         statement = select(Torrent.url).where(Torrent.url.in_(urls))  # type: ignore[attr-defined]
         result = await self.session.execute(statement)
         existing_urls = set(result.scalars().all())
+        unknown = {
+            url_fingerprint(url): url for url in urls if url not in existing_urls
+        }
+        if unknown:
+            # 已被保留策略清理的行只剩指纹
+            result = await self.session.execute(
+                select(TorrentSeen.url_hash).where(
+                    TorrentSeen.url_hash.in_(list(unknown))  # type: ignore[attr-defined]
+                )
+            )
+            existing_urls.update(unknown[h] for h in result.scalars().all())
         return [t for t in torrents_list if t.url not in existing_urls]
 
+    async def prune(
+        self, max_age_days: int, max_per_feed: int, batch_size: int = 500
+    ) -> int:
+        """Delete old, never-downloaded rows; keep their URL fingerprints.
+
+        A row is pruned when it is older than ``max_age_days`` or not among
+        the newest ``max_per_feed`` rows of its feed (0 disables a limit).
+        Downloaded rows are the download history the renamer, preference
+        dedup and offset scanner rely on, so they are never pruned.
+        Returns the number of deleted rows.
+        """
+        conditions = []
+        if max_age_days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            conditions.append(col(Torrent.created_at) < cutoff)
+        if max_per_feed > 0:
+            result = await self.session.execute(
+                select(Torrent.rss_id)
+                .where(col(Torrent.rss_id).is_not(None))
+                .group_by(col(Torrent.rss_id))
+                .having(func.count() > max_per_feed)
+            )
+            for rss_id in result.scalars().all():
+                # 该源第 max_per_feed 新的行，比它更旧的都超出了条数上限
+                threshold = await self.session.execute(
+                    select(Torrent.id)
+                    .where(col(Torrent.rss_id) == rss_id)
+                    .order_by(col(Torrent.id).desc())
+                    .offset(max_per_feed - 1)
+                    .limit(1)
+                )
+                conditions.append(
+                    and_(
+                        col(Torrent.rss_id) == rss_id,
+                        col(Torrent.id) < threshold.scalar_one(),
+                    )
+                )
+        if not conditions:
+            return 0
+        condition = and_(col(Torrent.downloaded) == false(), or_(*conditions))
+        pruned = 0
+        while True:
+            result = await self.session.execute(
+                select(Torrent.id, Torrent.url, Torrent.rss_id, Torrent.created_at)
+                .where(condition)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            now = datetime.now(timezone.utc)
+            await self.session.execute(
+                sqlite_insert(TorrentSeen)
+                .values(
+                    [
+                        {
+                            "url_hash": url_fingerprint(row.url),
+                            "rss_id": row.rss_id,
+                            "first_seen": row.created_at or now,
+                        }
+                        for row in rows
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["url_hash"])
+            )
+            await self.session.execute(
+                delete(Torrent).where(col(Torrent.id).in_([row.id for row in rows]))
+            )
+            # 分批提交：写锁不会被一次大清理长时间占住
+            await self.session.commit()
+            pruned += len(rows)
+            if len(rows) < batch_size:
+                break
+        if pruned:
+            logger.debug("Pruned %s torrent records.", pruned)
+        return pruned
+
+    async def stats(self) -> dict:
+        """Row counts for the torrent history and its fingerprint table."""
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.count().filter(col(Torrent.downloaded) == true()),
+                func.count().filter(col(Torrent.bangumi_id).is_(None)),
+            ).select_from(Torrent)
+        )
+        total, downloaded, orphans = result.one()
+        result = await self.session.execute(
+            select(Torrent.rss_id, func.count())
+            .where(col(Torrent.rss_id).is_not(None))
+            .group_by(col(Torrent.rss_id))
+        )
+        per_feed = {rss_id: count for rss_id, count in result.all()}
+        result = await self.session.execute(
+            select(func.count()).select_from(TorrentSeen)
+        )
+        return {
+            "total": total,
+            "downloaded": downloaded,
+            "orphans": orphans,
+            "fingerprints": result.scalar_one(),
+            "per_feed": per_feed,
+        }
+
     async def search_by_qb_hash(self, qb_hash: str) -> Torrent | None:
         """Find torrent by qBittorrent hash."""
         result = await self.session.execute(
@@ -86,31 +228,6 @@ class TorrentDatabase:
         )
         return list(result.scalars().all())
 
-    async def search_downloaded_by_bangumi_ids(
-        self, bangumi_ids: list[int]
-    ) -> dict[int, list[Torrent]]:
-        """Batch lookup already-downloaded torrents for the given bangumi ids.
-
-        Used by the release-preference dedup path to compare an incoming
-        candidate against what has already been downloaded for that episode,
-        without a query per bangumi.
-        """
-        if not bangumi_ids:
-            return {}
-        result = await self.session.execute(
-            select(Torrent).where(
-                and_(
-                    Torrent.bangumi_id.in_(bangumi_ids),  # type: ignore[union-attr]
-                    Torrent.downloaded == true(),
-                )
-            )
-        )
-        grouped: dict[int, list[Torrent]] = defaultdict(list)
-        for torrent in result.scalars().all():
-            if torrent.bangumi_id is not None:
-                grouped[torrent.bangumi_id].append(torrent)
-        return dict(grouped)
-
     async def delete_by_bangumi_id(self, bangumi_id: int) -> int:
         """Delete all torrent records associated with a bangumi.
 
@@ -3,6 +3,7 @@ from .base import (
     CoreDownloaderClient,
     DownloaderCapabilities,
     DownloaderClient,
+    MutationBatch,
     RenameOutcome,
     RenameResult,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "DownloadClient",
     "DownloaderCapabilities",
     "DownloaderClient",
+    "MutationBatch",
     "RenameOutcome",
     "RenameResult",
     "shutdown",
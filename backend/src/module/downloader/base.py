@@ -7,7 +7,7 @@ via a `DownloaderCapabilities` class attribute; the facade consults it and skips
 unsupported operations instead of blowing up on a missing method.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, ClassVar, Protocol, runtime_checkable
 
@@ -52,11 +52,42 @@ class RenameResult:
         return self.succeeded
 
 
+@dataclass
+class MutationBatch:
+    """Tag / category changes collected during one loop tick.
+
+    Hashes are grouped by tag and by category so the facade can apply each
+    group with a single multi-hash call (qBittorrent's ``torrents/addTags``
+    and ``torrents/setCategory`` take a ``|``-joined hash list) instead of
+    one request per torrent. See :meth:`DownloadClient.apply_mutations`.
+    """
+
+    tags: dict[str, list[str]] = field(default_factory=dict)
+    categories: dict[str, list[str]] = field(default_factory=dict)
+
+    def add_tag(self, torrent_hash: str, tag: str) -> None:
+        hashes = self.tags.setdefault(tag, [])
+        if torrent_hash not in hashes:
+            hashes.append(torrent_hash)
+
+    def set_category(self, torrent_hash: str, category: str) -> None:
+        # 同一种子后设置的分类覆盖先前的
+        for hashes in self.categories.values():
+            if torrent_hash in hashes:
+                hashes.remove(torrent_hash)
+        self.categories.setdefault(category, []).append(torrent_hash)
+
+    def __len__(self) -> int:
+        return sum(len(h) for h in self.tags.values()) + sum(
+            len(h) for h in self.categories.values()
+        )
+
+
 @dataclass(frozen=True)
 class DownloaderCapabilities:
     """What a concrete download client can do.
 
-    can_query     -- torrents_info / torrents_files / get_torrents_by_tag
+    can_query     -- torrents_info / torrents_files(_many) / get_torrents_by_tag
     can_rename    -- torrents_rename_file
     can_manage    -- delete / pause / resume / move / category / tags
     can_rss_rules -- qB-native RSS feeds + auto-download rules + prefs
@@ -119,6 +150,10 @@ class DownloaderClient(Protocol):
 
     async def torrents_files(self, torrent_hash: str) -> list[dict]: ...
 
+    async def torrents_files_many(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, list[dict]]: ...
+
     async def torrents_delete(self, hash, delete_files: bool = True) -> bool: ...
 
     async def torrents_pause(self, hashes: str) -> None: ...
@@ -131,10 +166,12 @@ class DownloaderClient(Protocol):
 
     async def move_torrent(self, hashes, new_location) -> None: ...
 
-    async def set_category(self, _hash, category) -> None: ...
+    # ``_hash`` may be a single hash or a list; backends apply a list in as
+    # few requests as they can.
+    async def set_category(self, _hash: str | list[str], category) -> None: ...
 
     # Tagging
-    async def add_tag(self, _hash, tag) -> None: ...
+    async def add_tag(self, _hash: str | list[str], tag) -> None: ...
 
     # RSS auto-download rules
     async def rss_set_rule(self, rule_name, rule_def) -> None: ...
@@ -21,6 +21,23 @@ logger = logging.getLogger(__name__)
 # 每次 JSON-RPC 调用的默认超时（秒），auth() 期间的探测调用会传入更短的值。
 _DEFAULT_CALL_TIMEOUT = 10.0
 
+# torrents_info 只取用得到的字段；不带 keys 时 aria2 会把 bittorrent（含
+# announceList）等大字段全部序列化返回，任务一多单次响应就是几 MB。显示名
+# 由 files 推出，见 _extract_name。
+_INFO_KEYS = [
+    "gid",
+    "status",
+    "dir",
+    "files",
+    "followedBy",
+    "totalLength",
+    "completedLength",
+    "downloadSpeed",
+    "uploadSpeed",
+    "numSeeders",
+    "connections",
+]
+
 # qBittorrent 风格 status_filter -> aria2 status 集合的映射。None（不过滤）
 # 之外的未知取值一律当作"不过滤"处理，而不是返回空列表。
 _STATUS_FILTER_MAP: dict[str, set[str]] = {
@@ -72,54 +89,106 @@ class Aria2Downloader:
         can_rss_rules=False,
     )
 
-    def __init__(self, host: str, username: str, password: str):
+    def __init__(
+        self, host: str, username: str, password: str, max_concurrency: int = 10
+    ):
         self.host = host
         self.secret = password
+        self.max_concurrency = max(1, max_concurrency)
         self._client: httpx.AsyncClient | None = None
         self._authed = False
         self._rpc_url = f"{host}/jsonrpc"
         self._id = 0
 
-    async def _call(
-        self,
-        method: str,
-        params: list | None = None,
-        timeout: float = _DEFAULT_CALL_TIMEOUT,
-    ):
+    async def _post(self, payload: dict, label: str, timeout: float):
         assert self._client is not None, "Aria2Downloader.auth() must run first"
-        self._id += 1
-        full_params = [f"token:{self.secret}"] + (params or [])
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._id,
-            "method": f"aria2.{method}",
-            "params": full_params,
-        }
         try:
             resp = await self._client.post(self._rpc_url, json=payload, timeout=timeout)
         except httpx.TimeoutException as e:
-            raise Aria2ConnectionError(f"aria2 RPC '{method}' timed out: {e}") from e
+            raise Aria2ConnectionError(f"aria2 RPC '{label}' timed out: {e}") from e
         except httpx.RequestError as e:
             raise Aria2ConnectionError(
-                f"aria2 RPC '{method}' request failed: {e}"
+                f"aria2 RPC '{label}' request failed: {e}"
             ) from e
         try:
             result = resp.json()
         except ValueError as e:
             raise Aria2ConnectionError(
-                f"aria2 RPC '{method}' returned invalid JSON: {e}"
+                f"aria2 RPC '{label}' returned invalid JSON: {e}"
             ) from e
         if "error" in result:
             err = result["error"] or {}
             raise Aria2RpcError(err.get("code"), err.get("message", str(err)))
         return result.get("result")
 
+    async def _call(
+        self,
+        method: str,
+        params: list | None = None,
+        timeout: float = _DEFAULT_CALL_TIMEOUT,
+    ):
+        assert self._client is not None, "Aria2Downloader.auth() must run first"
+        self._id += 1
+        full_params = [f"token:{self.secret}"] + (params or [])
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._id,
+            "method": f"aria2.{method}",
+            "params": full_params,
+        }
+        return await self._post(payload, method, timeout)
+
+    async def _multicall(
+        self,
+        calls: list[tuple[str, list]],
+        timeout: float = _DEFAULT_CALL_TIMEOUT,
+    ) -> list:
+        """用 ``system.multicall`` 在一次 HTTP 请求里执行多个 aria2 方法。
+
+        按顺序返回每个调用的结果；单个调用被 aria2 拒绝时对应位置是
+        ``Aria2RpcError`` 实例而不是抛出，调用方逐项判断。请求本身失败
+        （网络/超时/整体报错）照常抛出。
+        """
+        if not calls:
+            return []
+        assert self._client is not None, "Aria2Downloader.auth() must run first"
+        self._id += 1
+        token = f"token:{self.secret}"
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._id,
+            "method": "system.multicall",
+            "params": [
+                [
+                    {"methodName": f"aria2.{method}", "params": [token, *params]}
+                    for method, params in calls
+                ]
+            ],
+        }
+        raw = await self._post(payload, "system.multicall", timeout) or []
+        results: list = []
+        for index in range(len(calls)):
+            item = raw[index] if index < len(raw) else None
+            # 成功项是只含结果的单元素数组，失败项是 {"code", "message"} 结构
+            if isinstance(item, list) and item:
+                results.append(item[0])
+            elif isinstance(item, dict):
+                results.append(
+                    Aria2RpcError(item.get("code"), item.get("message", str(item)))
+                )
+            else:
+                results.append(
+                    Aria2RpcError(None, f"no multicall result for {calls[index][0]}")
+                )
+        return results
+
     async def auth(self, retry: int = 3) -> bool:
         if self._client is not None and self._authed:
             return True
         if self._client is None:
             self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(connect=3.1, read=10.0, write=10.0, pool=10.0)
+                timeout=httpx.Timeout(connect=3.1, read=10.0, write=10.0, pool=10.0),
+                limits=httpx.Limits(max_connections=self.max_concurrency),
             )
         times = 0
         while times < retry:
@@ -181,13 +250,20 @@ class Aria2Downloader:
 
     @staticmethod
     def _extract_name(download: dict) -> str:
-        bt_info = (download.get("bittorrent") or {}).get("info") or {}
-        if bt_info.get("name"):
-            return bt_info["name"]
+        """Torrent name: the first path component under ``dir``.
+
+        aria2 saves a torrent at ``dir/<info.name>`` (single file) or under
+        ``dir/<info.name>/`` (multi-file), so this equals ``bittorrent.info.name``
+        without requesting the ``bittorrent`` struct.
+        """
         files = download.get("files") or []
-        if files and files[0].get("path"):
-            return os.path.basename(files[0]["path"])
-        return download.get("gid", "")
+        path = files[0].get("path") if files else None
+        if not path:
+            return download.get("gid", "")
+        base = (download.get("dir") or "").rstrip("/")
+        if base and path.startswith(base + "/"):
+            return path[len(base) + 1 :].split("/", 1)[0]
+        return os.path.basename(path)
 
     @staticmethod
     def _extract_followed_by_gid(status: dict | None) -> str | None:
@@ -455,13 +531,20 @@ class Aria2Downloader:
 
     async def torrents_info(self, status_filter, category, tag=None) -> list[dict]:
         try:
-            active = await self._call("tellActive") or []
-            waiting = await self._call("tellWaiting", [0, 1000]) or []
-            stopped = await self._call("tellStopped", [0, 1000]) or []
+            replies = await self._multicall(
+                [
+                    ("tellActive", [_INFO_KEYS]),
+                    ("tellWaiting", [0, 1000, _INFO_KEYS]),
+                    ("tellStopped", [0, 1000, _INFO_KEYS]),
+                ]
+            )
+            for reply in replies:
+                if isinstance(reply, Aria2RpcError):
+                    raise reply
         except (Aria2RpcError, Aria2ConnectionError) as e:
             logger.error("Failed to query downloads: %s", e)
             raise
-        raw = [*active, *waiting, *stopped]
+        raw = [d for reply in replies for d in reply or []]
         followed_by: dict[str, str] = {}
         for d in raw:
             gid = d.get("gid")
@@ -552,25 +635,49 @@ class Aria2Downloader:
         return True
 
     async def torrents_files(self, torrent_hash: str) -> list[dict]:
+        return (await self.torrents_files_many([torrent_hash]))[torrent_hash]
+
+    async def torrents_files_many(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, list[dict]]:
+        """一次 multicall 取回所有 gid 的文件与目录，一次查询取回重命名记录。
+
+        某个 gid 的 ``getFiles`` 失败时它的文件列表为空；只是 ``dir`` 取不到
+        时退化为 aria2 给出的原始路径。
+        """
+        if not torrent_hashes:
+            return {}
+        calls: list[tuple[str, list]] = []
+        for gid in torrent_hashes:
+            calls.append(("getFiles", [gid]))
+            calls.append(("tellStatus", [gid, ["dir"]]))
         try:
-            files = await self._call("getFiles", [torrent_hash])
-        except (Aria2RpcError, Aria2ConnectionError) as e:
-            logger.error("Failed to get files for %s: %s", torrent_hash, e)
-            return []
-        save_dir = ""
-        try:
-            status = await self._call("tellStatus", [torrent_hash, ["dir"]])
-            save_dir = (status or {}).get("dir", "")
+            replies = await self._multicall(calls)
         except (Aria2RpcError, Aria2ConnectionError) as e:
-            logger.debug("Could not resolve dir for %s: %s", torrent_hash, e)
+            logger.error("Failed to get files for %d downloads: %s", len(calls) // 2, e)
+            return {gid: [] for gid in torrent_hashes}
         async with Database() as db:
-            renamed_paths = await db.aria2.get_renamed_paths(torrent_hash)
-        result = []
-        for f in files or []:
-            path = f.get("path", "")
-            rel = os.path.relpath(path, save_dir) if save_dir and path else path
-            rel = self._translate_renamed_path(rel, renamed_paths)
-            result.append({"name": rel, "size": int(f.get("length", 0) or 0)})
+            renamed = await db.aria2.get_renamed_paths_many(torrent_hashes)
+        result: dict[str, list[dict]] = {}
+        for index, gid in enumerate(torrent_hashes):
+            files, status = replies[2 * index], replies[2 * index + 1]
+            if isinstance(files, Aria2RpcError):
+                logger.error("Failed to get files for %s: %s", gid, files)
+                result[gid] = []
+                continue
+            save_dir = ""
+            if isinstance(status, Aria2RpcError):
+                logger.debug("Could not resolve dir for %s: %s", gid, status)
+            else:
+                save_dir = (status or {}).get("dir", "")
+            renamed_paths = renamed.get(gid, {})
+            entries = []
+            for f in files or []:
+                path = f.get("path", "")
+                rel = os.path.relpath(path, save_dir) if save_dir and path else path
+                rel = self._translate_renamed_path(rel, renamed_paths)
+                entries.append({"name": rel, "size": int(f.get("length", 0) or 0)})
+            result[gid] = entries
         return result
 
     # ------------------------------------------------------------------
@@ -849,14 +956,15 @@ class Aria2Downloader:
 
     async def set_category(self, _hash, category) -> None:
         async with Database() as db:
-            for gid in self._normalize_hashes(_hash):
-                await db.aria2.set_category(gid, category)
+            await db.aria2.upsert_many(self._normalize_hashes(_hash), category=category)
 
-    async def add_tag(self, _hash: str, tag: str) -> None:
+    async def add_tag(self, _hash: str | list[str], tag: str) -> None:
         """只认识 'ab:<bangumi_id>' 格式的 tag（用于 offset 关联），其余忽略。"""
         bangumi_id = self._parse_bangumi_id_from_tag(tag)
         if bangumi_id is None:
             logger.debug("Ignoring unsupported tag: %s", tag)
             return
         async with Database() as db:
-            await db.aria2.upsert(_hash, bangumi_id=bangumi_id)
+            await db.aria2.upsert_many(
+                self._normalize_hashes(_hash), bangumi_id=bangumi_id
+            )
@@ -0,0 +1,89 @@
+"""aria2 WebSocket 通知订阅。
+
+aria2 在 ``/jsonrpc`` 的 WebSocket 连接上主动推送 ``aria2.onDownloadComplete``
+等通知，推送本身不需要 RPC secret。普通下载完成时发 ``onDownloadComplete``；
+BT 任务在数据下完、开始做种时发 ``onBtDownloadComplete``（做种结束才会再发
+``onDownloadComplete``）。两者的 gid 就是本项目里 aria2 任务的 "hash"。
+"""
+
+import json
+import logging
+from collections.abc import Callable
+from urllib.parse import urlsplit, urlunsplit
+
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+logger = logging.getLogger(__name__)
+
+COMPLETE_METHODS = frozenset({"aria2.onDownloadComplete", "aria2.onBtDownloadComplete"})
+
+# 已报过不可用的地址：只开 RPC 的部署会一直连不上，重连失败不再每次都告警
+_unavailable: set[str] = set()
+
+
+def ws_url(host: str) -> str:
+    """Map the configured aria2 RPC host to its WebSocket endpoint.
+
+    Mirrors the RPC client, which posts to ``f"{host}/jsonrpc"``: a path
+    prefix on the host (reverse proxy) is kept.
+    """
+    if "://" not in host:
+        host = f"http://{host}"
+    parts = urlsplit(host)
+    scheme = "wss" if parts.scheme in ("https", "wss") else "ws"
+    path = parts.path.rstrip("/") + "/jsonrpc"
+    return urlunsplit((scheme, parts.netloc, path, "", ""))
+
+
+def parse_completion(message: str | bytes) -> list[str]:
+    """Return the gids a notification reports as finished ([] for anything else)."""
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return []
+    # RPC 响应（带 id）和其它通知一律忽略
+    if not isinstance(data, dict) or data.get("method") not in COMPLETE_METHODS:
+        return []
+    params = data.get("params")
+    if not isinstance(params, list):
+        return []
+    return [
+        event["gid"]
+        for event in params
+        if isinstance(event, dict) and isinstance(event.get("gid"), str)
+    ]
+
+
+async def listen(
+    host: str,
+    on_complete: Callable[[str], object],
+    on_connect: Callable[[], None] | None = None,
+    on_disconnect: Callable[[], None] | None = None,
+) -> None:
+    """Consume completion notifications until the connection drops.
+
+    Returns (instead of raising) on connection failures so the caller's
+    reconnect loop keeps retrying. Only the first failure for a URL is a
+    warning; repeats log at debug until a connection succeeds again.
+    """
+    url = ws_url(host)
+    try:
+        async with connect(url, proxy=None, max_size=2**20) as ws:
+            _unavailable.discard(url)
+            logger.info("[Aria2] Listening for download events on %s", url)
+            if on_connect is not None:
+                on_connect()
+            try:
+                async for message in ws:
+                    for gid in parse_completion(message):
+                        on_complete(gid)
+            finally:
+                if on_disconnect is not None:
+                    on_disconnect()
+    except (OSError, WebSocketException, TimeoutError) as e:
+        if url in _unavailable:
+            logger.debug("[Aria2] Event stream still unavailable (%s): %s", url, e)
+        else:
+            _unavailable.add(url)
+            logger.warning("[Aria2] Event stream unavailable (%s): %s", url, e)
@@ -106,6 +106,12 @@ class MockDownloader:
         torrent = self._torrents.get(torrent_hash, {})
         return torrent.get("files", [])
 
+    async def torrents_files_many(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, list[dict]]:
+        """Return files for several torrents, keyed by hash."""
+        return {h: await self.torrents_files(h) for h in torrent_hashes}
+
     async def add_torrents(
         self,
         torrent_urls: str | list | None,
@@ -213,11 +219,12 @@ class MockDownloader:
         self._rules.pop(rule_name, None)
         logger.debug("remove_rule(%s)", rule_name)
 
-    async def add_tag(self, _hash: str, tag: str):
-        if _hash in self._torrents:
-            tags = self._torrents[_hash].setdefault("tags", [])
-            if tag not in tags:
-                tags.append(tag)
+    async def add_tag(self, _hash: str | list, tag: str):
+        for h in self._normalize_hashes(_hash):
+            if h in self._torrents:
+                tags = self._torrents[h].setdefault("tags", [])
+                if tag not in tags:
+                    tags.append(tag)
         logger.debug("add_tag(%s, %s)", _hash, tag)
 
     async def check_connection(self) -> str:
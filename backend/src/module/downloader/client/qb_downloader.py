@@ -19,6 +19,57 @@ logger = logging.getLogger(__name__)
 
 _MAGNET_BTIH_RE = re.compile(r"xt=urn:btih:([0-9A-Fa-f]{40}|[A-Za-z2-7]{32})")
 
+# sync/maindata 镜像的新鲜期（秒）。同一轮里 Renamer.rename 连查两次、多个
+# SSE 连接同时刷新下载器列表时共用一次增量同步；本客户端发出的 torrents/*
+# 写操作会立刻让镜像过期，所以不会读到自己刚改过的旧状态。
+_SYNC_FRESH_SECONDS = 1.0
+
+# 与 qB TorrentFilter 一致的本地判定：isCompleted() / isDownloading()。
+# paused/stopped 两套命名（qB 5.0 改名）都列上。
+_COMPLETED_STATES = frozenset(
+    {
+        "uploading",
+        "stalledUP",
+        "checkingUP",
+        "pausedUP",
+        "stoppedUP",
+        "queuedUP",
+        "forcedUP",
+    }
+)
+_DOWNLOADING_STATES = frozenset(
+    {
+        "downloading",
+        "metaDL",
+        "forcedMetaDL",
+        "stalledDL",
+        "checkingDL",
+        "pausedDL",
+        "stoppedDL",
+        "queuedDL",
+        "forcedDL",
+    }
+)
+_PAUSED_FILTERS = ("paused", "stopped")
+_MIRROR_FILTERS = frozenset({None, "", "all", "completed", "downloading"}) | set(
+    _PAUSED_FILTERS
+)
+
+
+def _state_matches(state: str, status_filter: str | None) -> bool:
+    if status_filter == "completed":
+        return state in _COMPLETED_STATES
+    if status_filter == "downloading":
+        return state in _DOWNLOADING_STATES
+    if status_filter in _PAUSED_FILTERS:
+        return state.startswith(("paused", "stopped"))
+    return True
+
+
+def _has_tag(torrent: dict, tag: str) -> bool:
+    # qB 返回的 tags 是 ", " 分隔的字符串
+    return tag in (t.strip() for t in torrent.get("tags", "").split(","))
+
 
 def _torrent_infohash(data: bytes) -> str | None:
     """从 .torrent 字节中提取 v1 infohash（bencoded ``info`` 字典的 SHA-1）。
@@ -69,7 +120,14 @@ class QbDownloader:
         can_rss_rules=True,
     )
 
-    def __init__(self, host: str, username: str, password: str, ssl: bool):
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        ssl: bool,
+        max_concurrency: int = 10,
+    ):
         if "://" not in host:
             scheme = "https" if ssl else "http"
             self.host = f"{scheme}://{host}"
@@ -78,6 +136,7 @@ class QbDownloader:
         self.username = username
         self.password = password
         self.ssl = ssl
+        self.max_concurrency = max(1, max_concurrency)
         self._client: httpx.AsyncClient | None = None
         self._authed = False
         # 最近一次 auth 失败的原因（unreachable | credentials | banned），
@@ -93,6 +152,15 @@ class QbDownloader:
         # qB 5.0 把 torrents/pause|resume 改名为 stop|start 且无别名（旧名
         # 404），4.x 则没有新名。记住哪套命名有效；None = 还没探测过。
         self._uses_stop_start: bool | None = None
+        # sync/maindata 增量镜像：hash -> torrents/info 同结构的字典。
+        # _sync_rid 是上次应答的 rid，0 表示下次请求全量；_synced_at 为
+        # None 表示镜像已过期，下次查询必须先同步。
+        self._torrents: dict[str, dict] = {}
+        self._sync_rid = 0
+        self._synced_at: float | None = None
+        self._sync_lock = asyncio.Lock()
+        # 老版本 / 反代不支持 sync/maindata（404）时记住，之后直接走 torrents/info。
+        self._sync_supported = True
 
     def _url(self, endpoint: str) -> str:
         return f"{self.host}/api/v2/{endpoint}"
@@ -105,8 +173,8 @@ class QbDownloader:
         # renamer cycle reuses the pool (#984). max_connections caps parallel
         # load on the downloader and anything fronting it.
         limits = httpx.Limits(
-            max_keepalive_connections=5,
-            max_connections=10,
+            max_keepalive_connections=min(5, self.max_concurrency),
+            max_connections=self.max_concurrency,
             keepalive_expiry=30.0,
         )
         # Never verify certificates - self-signed certs are the norm for
@@ -228,6 +296,8 @@ class QbDownloader:
         qBittorrent). Only retry the original request if re-auth succeeded.
         """
         assert self._client is not None, "QbDownloader.auth() must run first"
+        if method == "POST" and endpoint.startswith("torrents/"):
+            self._synced_at = None
         resp = await self._client.request(method, self._url(endpoint), **kwargs)
         if resp.status_code == 403:
             self._authed = False
@@ -263,6 +333,7 @@ class QbDownloader:
             await self._client.aclose()
             self._client = None
         self._authed = False
+        self._reset_mirror()
 
     async def check_host(self):
         try:
@@ -293,13 +364,75 @@ class QbDownloader:
             data={"category": category, "savePath": ""},
         )
 
+    def _reset_mirror(self) -> None:
+        self._torrents = {}
+        self._sync_rid = 0
+        self._synced_at = None
+
+    def _apply_maindata(self, data: dict) -> None:
+        """把一次 sync/maindata 应答合并进镜像。
+
+        增量应答里已有种子只带变化的字段，新种子带全部字段；
+        ``full_update`` 为真时（首轮、rid 失配、qB 重启后）整体替换。
+        """
+        if data.get("full_update"):
+            self._torrents = {}
+        for torrent_hash, fields in (data.get("torrents") or {}).items():
+            entry = self._torrents.get(torrent_hash)
+            if entry is None:
+                entry = self._torrents[torrent_hash] = {"hash": torrent_hash}
+            entry.update(fields)
+        for torrent_hash in data.get("torrents_removed") or ():
+            self._torrents.pop(torrent_hash, None)
+        self._sync_rid = data.get("rid", 0)
+
+    async def _sync_torrents(self) -> bool:
+        """增量同步本地镜像；镜像不可用时返回 False，由调用方回退到 torrents/info。"""
+        if not self._sync_supported:
+            return False
+        async with self._sync_lock:
+            loop = asyncio.get_running_loop()
+            if (
+                self._synced_at is not None
+                and loop.time() - self._synced_at < _SYNC_FRESH_SECONDS
+            ):
+                return True
+            resp = await self._get("sync/maindata", params={"rid": self._sync_rid})
+            if resp.status_code == 404:
+                logger.debug("sync/maindata unavailable; using torrents/info")
+                self._sync_supported = False
+                self._reset_mirror()
+                return False
+            try:
+                data = resp.json() if resp.status_code == 200 else None
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                # 应答异常（反代错误页等）：丢掉镜像，下次从全量重来
+                self._reset_mirror()
+                return False
+            self._apply_maindata(data)
+            self._synced_at = loop.time()
+            return True
+
     @qb_connect_failed_wait
     async def torrents_info(self, status_filter, category, tag=None):
+        # 优先从 sync/maindata 镜像本地过滤：几千个种子时 torrents/info 每次
+        # 都是几 MB 的全量 JSON，增量同步通常只有几 KB。镜像无法等价表达的
+        # filter（active/stalled 等）仍交给服务端。
+        if status_filter in _MIRROR_FILTERS and await self._sync_torrents():
+            return [
+                dict(t)
+                for t in self._torrents.values()
+                if (not category or t.get("category") == category)
+                and (not tag or _has_tag(t, tag))
+                and _state_matches(t.get("state", ""), status_filter)
+            ]
         params = {}
         # qB 5.0 把 filter=paused 改名为 stopped，且未知 filter 值会静默
         # 退化成 All（返回全部种子）——服务端过滤无法跨版本，改为不带
         # filter 拉取后按 state 本地过滤。其余值（completed 等）未改名。
-        paused_filter = status_filter in ("paused", "stopped")
+        paused_filter = status_filter in _PAUSED_FILTERS
         if status_filter and not paused_filter:
             params["filter"] = status_filter
         if category:
@@ -310,9 +443,7 @@ class QbDownloader:
         torrents = resp.json()
         if paused_filter:
             torrents = [
-                t
-                for t in torrents
-                if t.get("state", "").startswith(("paused", "stopped"))
+                t for t in torrents if _state_matches(t.get("state", ""), "paused")
             ]
         return torrents
 
@@ -343,6 +474,20 @@ class QbDownloader:
         resp = await self._get("torrents/files", params={"hash": torrent_hash})
         return resp.json()
 
+    async def torrents_files_many(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, list[dict]]:
+        # qB 的 torrents/files 一次只接受一个 hash，只能并发逐个请求。并发数
+        # 限制在连接池大小以内：几百个请求同时排队会撞上连接池的 pool 超时
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(torrent_hash: str) -> list[dict]:
+            async with slots:
+                return await self.torrents_files(torrent_hash)
+
+        files = await asyncio.gather(*(fetch(h) for h in torrent_hashes))
+        return dict(zip(torrent_hashes, files))
+
     async def _urls_already_added(self, torrent_urls) -> bool:
         """尽力确认"Fails."是否因为任务已存在：从磁力链提取 btih 并查询 qB。
 
@@ -701,5 +846,5 @@ class QbDownloader:
     async def add_tag(self, _hash, tag):
         await self._post(
             "torrents/addTags",
-            data={"hashes": _hash, "tags": tag},
+            data={"hashes": self._normalize_hashes(_hash), "tags": tag},
         )
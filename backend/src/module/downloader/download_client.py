@@ -7,31 +7,61 @@ from module.conf import settings
 from module.models import Bangumi, Torrent
 from module.network import RequestContent
 
-from .base import AddResult, DownloaderClient, RenameOutcome, RenameResult
+from .base import (
+    AddResult,
+    DownloaderClient,
+    MutationBatch,
+    RenameOutcome,
+    RenameResult,
+)
 from .path import gen_save_path
+from .torrent_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
 # 同一主机批量抓取 .torrent 文件的请求间隔（#1052）。批量收集整季时并发抓取
-# 会触发 nyaa 等站点的 429 限流；与 rss/engine.py 的 RSS_PER_HOST_DELAY 同思路，
+# 会触发 nyaa 等站点的 429 限流；与 rss/snapshot.py 的 RSS_PER_HOST_DELAY 同思路，
 # 但这里是收集接口内的一次性批量抓取，取 1s 以控制接口延迟（24 集约 +23s）。
 TORRENT_FETCH_PER_HOST_DELAY = 1.0
 
 
+async def _get_torrent_file(req: RequestContent, url: str) -> bytes | None:
+    """Download one .torrent file, going through the local cache."""
+    cache = get_cache()
+    content = await asyncio.to_thread(cache.get, url)
+    if content is not None:
+        logger.debug("Torrent file cache hit: %s", url)
+        return content
+    content = await req.get_content(url)
+    if content is not None:
+        await asyncio.to_thread(cache.put, url, content)
+    return content
+
+
 async def _fetch_torrent_files(
     req: RequestContent, torrents: list[Torrent]
 ) -> list[bytes]:
-    """抓取种子文件内容：同主机串行加延时，不同主机并行，失败项丢弃（#1052）。"""
+    """抓取种子文件内容：同主机串行加延时，不同主机并行，失败项丢弃（#1052）。
+
+    已在本地缓存里的直接读取，不占用同主机的请求间隔。
+    """
+    cache = get_cache()
     by_host: dict[str, list[Torrent]] = defaultdict(list)
     for t in torrents:
         by_host[urlparse(t.url).netloc].append(t)
 
     async def _fetch_host_group(items: list[Torrent]) -> list[bytes]:
         files: list[bytes] = []
-        for i, t in enumerate(items):
-            if i and TORRENT_FETCH_PER_HOST_DELAY:
-                await asyncio.sleep(TORRENT_FETCH_PER_HOST_DELAY)
-            content = await req.get_content(t.url)
+        fetched = 0
+        for t in items:
+            content = await asyncio.to_thread(cache.get, t.url)
+            if content is None:
+                if fetched and TORRENT_FETCH_PER_HOST_DELAY:
+                    await asyncio.sleep(TORRENT_FETCH_PER_HOST_DELAY)
+                fetched += 1
+                content = await req.get_content(t.url)
+                if content is not None:
+                    await asyncio.to_thread(cache.put, t.url, content)
             if content is not None:
                 files.append(content)
         return files
@@ -78,7 +108,7 @@ _warned_unsupported: set[tuple[str, str]] = set()
 
 def _settings_key() -> tuple:
     d = settings.downloader
-    return (d.type, d.host, d.username, d.password, d.ssl)
+    return (d.type, d.host, d.username, d.password, d.ssl, d.max_concurrency)
 
 
 def _reset_client_cache() -> None:
@@ -154,10 +184,11 @@ class DownloadClient:
         username = settings.downloader.username
         password = settings.downloader.password
         ssl = settings.downloader.ssl
+        max_concurrency = settings.downloader.max_concurrency
         if downloader_type == "qbittorrent":
             from .client.qb_downloader import QbDownloader
 
-            return QbDownloader(host, username, password, ssl)
+            return QbDownloader(host, username, password, ssl, max_concurrency)
         elif downloader_type == "aria2":
             from .client.aria2_downloader import Aria2Downloader
 
@@ -166,7 +197,9 @@ class DownloadClient:
             # (can_rss_rules=False), so it stays structurally narrower than
             # the full `DownloaderClient` protocol -- the facade skips the
             # rss/prefs methods it never calls on this backend.
-            return Aria2Downloader(host, username, password)  # type: ignore[return-value]
+            return Aria2Downloader(  # type: ignore[return-value]
+                host, username, password, max_concurrency
+            )
         elif downloader_type == "mock":
             from .client.mock_downloader import MockDownloader
 
@@ -312,6 +345,21 @@ class DownloadClient:
             return []
         return await self.client.torrents_files(torrent_hash=torrent_hash)
 
+    async def get_torrent_files_many(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, list[dict]]:
+        """File lists for several torrents at once, keyed by hash.
+
+        Backends batch this where they can (aria2 answers it with a single
+        ``system.multicall``), so prefer it over fanning out
+        ``get_torrent_files``.
+        """
+        if not torrent_hashes or not self._supports(
+            "can_query", "get_torrent_files_many"
+        ):
+            return {}
+        return await self.client.torrents_files_many(torrent_hashes=torrent_hashes)
+
     async def torrent_exists(self, torrent_hash: str) -> bool | None:
         """Return task existence, or ``None`` when the backend cannot prove it.
 
@@ -392,6 +440,7 @@ class DownloadClient:
         if not bangumi.save_path:
             bangumi.save_path = gen_save_path(bangumi)
         torrent_url: str | list[str] | None
+        torrent_file: bytes | list[bytes] | None
         async with RequestContent() as req:
             if isinstance(torrent, list):
                 if len(torrent) == 0:
@@ -413,12 +462,13 @@ class DownloadClient:
                     torrent_url = torrent.url
                     torrent_file = None
                 else:
-                    torrent_file = await req.get_content(torrent.url)
-                    if torrent_file is None:
+                    single_file = await _get_torrent_file(req, torrent.url)
+                    if single_file is None:
                         logger.warning(
                             f"Failed to fetch torrent file for: {bangumi.official_title}"
                         )
                         return AddResult.FAILED
+                    torrent_file = single_file
                     torrent_url = None
         # Create tag with bangumi_id for offset lookup during rename
         tags = f"ab:{bangumi.id}" if bangumi.id else None
@@ -457,3 +507,35 @@ class DownloadClient:
             return
         await self.client.add_tag(torrent_hash, tag)
         logger.debug("Added tag '%s' to torrent %s...", tag, torrent_hash[:8])
+
+    async def apply_mutations(self, batch: MutationBatch) -> bool:
+        """Apply a batch of tag/category changes, one call per tag or category.
+
+        A failing group is logged and skipped so the rest still land; callers
+        re-queue nothing because the next tick recomputes what is missing.
+        Returns False if any group failed.
+        """
+        if not batch or not self._supports("can_manage", "apply_mutations"):
+            return True
+        ok = True
+        for tag, hashes in batch.tags.items():
+            try:
+                await self.client.add_tag(hashes, tag)
+            except Exception as e:
+                ok = False
+                logger.warning(
+                    "Failed to tag %s torrent(s) %s: %s", len(hashes), tag, e
+                )
+            else:
+                logger.debug("Added tag '%s' to %s torrent(s)", tag, len(hashes))
+        for category, hashes in batch.categories.items():
+            if not hashes:
+                continue
+            try:
+                await self.client.set_category(hashes, category)
+            except Exception as e:
+                ok = False
+                logger.warning(
+                    "Failed to move %s torrent(s) to %s: %s", len(hashes), category, e
+                )
+        return ok
@@ -0,0 +1,192 @@
+""".torrent 文件本地缓存。
+
+收集整季、下一轮重试 ``AddResult.FAILED``、多个订阅源里的同一个种子，都会
+重新下载同样的 .torrent 文件，而且同主机之间还要等
+``TORRENT_FETCH_PER_HOST_DELAY``。这里按 infohash 内容寻址地存到
+``data/torrents/<infohash>.torrent``，另有 URL -> infohash 索引；再次 add 时
+直接读本地文件，不再访问网络。
+
+总大小超过上限时按最近使用时间淘汰（文件 mtime 记录访问顺序，重启后依然
+有效）。只缓存能算出 infohash 的合法种子，站点返回的 HTML 错误页不会进缓存。
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from .client.qb_downloader import _torrent_infohash
+
+logger = logging.getLogger(__name__)
+
+TORRENT_CACHE_DIR = Path("data/torrents")
+# 普通番剧种子 10~100 KB，256 MB 足够放下几千个
+TORRENT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_INDEX_FILE = "index.json"
+_SUFFIX = ".torrent"
+
+
+class TorrentCache:
+    """Size-bounded LRU of .torrent files keyed by infohash, looked up by URL.
+
+    Methods do blocking file I/O; async callers run them via
+    ``asyncio.to_thread``, so state changes are serialized by a lock.
+    """
+
+    def __init__(
+        self, root: Path = TORRENT_CACHE_DIR, max_bytes: int = TORRENT_CACHE_MAX_BYTES
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._urls: dict[str, str] | None = None
+        # infohash -> 文件大小，按最近使用排序（最旧在前）
+        self._entries: OrderedDict[str, int] | None = None
+        self._total = 0
+        self._lock = threading.RLock()
+
+    def _path(self, infohash: str) -> Path:
+        return self.root / f"{infohash}{_SUFFIX}"
+
+    def _load(self) -> None:
+        if self._entries is not None:
+            return
+        self._entries = OrderedDict()
+        self._urls = {}
+        self._total = 0
+        if not self.root.is_dir():
+            return
+        files = []
+        for path in self.root.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, infohash, size in sorted(files):
+            self._entries[infohash] = size
+            self._total += size
+        try:
+            urls = json.loads((self.root / _INDEX_FILE).read_text())
+        except (OSError, ValueError):
+            urls = {}
+        if isinstance(urls, dict):
+            self._urls = {
+                url: infohash
+                for url, infohash in urls.items()
+                if isinstance(infohash, str) and infohash in self._entries
+            }
+
+    def _save_index(self) -> None:
+        assert self._urls is not None
+        tmp = self.root / f"{_INDEX_FILE}.tmp"
+        try:
+            tmp.write_text(json.dumps(self._urls, separators=(",", ":")))
+            tmp.replace(self.root / _INDEX_FILE)
+        except OSError as e:
+            logger.debug("[TorrentCache] Failed to write index: %s", e)
+
+    def _touch(self, infohash: str) -> None:
+        assert self._entries is not None
+        self._entries.move_to_end(infohash)
+        try:
+            os.utime(self._path(infohash))
+        except OSError:
+            pass
+
+    def get(self, url: str) -> bytes | None:
+        """Cached bytes for ``url``, or None on a miss."""
+        with self._lock:
+            return self._get(url)
+
+    def _get(self, url: str) -> bytes | None:
+        self._load()
+        assert self._urls is not None
+        infohash = self._urls.get(url)
+        if infohash is None:
+            return None
+        data = self._get_by_infohash(infohash)
+        if data is None:
+            self._urls.pop(url, None)
+        return data
+
+    def get_by_infohash(self, infohash: str) -> bytes | None:
+        with self._lock:
+            return self._get_by_infohash(infohash)
+
+    def _get_by_infohash(self, infohash: str) -> bytes | None:
+        self._load()
+        assert self._entries is not None
+        infohash = infohash.lower()
+        if infohash not in self._entries:
+            return None
+        try:
+            data = self._path(infohash).read_bytes()
+        except OSError:
+            self._total -= self._entries.pop(infohash)
+            return None
+        self._touch(infohash)
+        return data
+
+    def put(self, url: str, data: bytes) -> str | None:
+        """Store ``data`` fetched from ``url``; returns its infohash.
+
+        Returns None (and stores nothing) when ``data`` is not a torrent.
+        """
+        infohash = _torrent_infohash(data)
+        if infohash is None:
+            return None
+        with self._lock:
+            self._put(url, infohash, data)
+        return infohash
+
+    def _put(self, url: str, infohash: str, data: bytes) -> None:
+        self._load()
+        assert self._entries is not None and self._urls is not None
+        if infohash in self._entries:
+            self._touch(infohash)
+        else:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp = self._path(infohash).with_suffix(".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(self._path(infohash))
+            except OSError as e:
+                logger.warning("[TorrentCache] Failed to store %s: %s", infohash, e)
+                return
+            self._entries[infohash] = len(data)
+            self._total += len(data)
+            self._evict()
+        self._urls[url] = infohash
+        self._save_index()
+
+    def _evict(self) -> None:
+        assert self._entries is not None and self._urls is not None
+        evicted: set[str] = set()
+        # 至少保留刚写入的那一个
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            infohash, size = self._entries.popitem(last=False)
+            self._total -= size
+            evicted.add(infohash)
+            try:
+                self._path(infohash).unlink()
+            except OSError:
+                pass
+        if evicted:
+            self._urls = {u: h for u, h in self._urls.items() if h not in evicted}
+            logger.debug("[TorrentCache] Evicted %s torrent file(s)", len(evicted))
+
+    def reset(self) -> None:
+        """Forget in-memory state; the next call rescans the directory."""
+        with self._lock:
+            self._entries = None
+            self._urls = None
+            self._total = 0
+
+
+_cache = TorrentCache()
+
+
+def get_cache() -> TorrentCache:
+    return _cache
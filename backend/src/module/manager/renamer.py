@@ -2,7 +2,10 @@ import asyncio
 import hashlib
 import json
 import logging
+import time
 import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import PurePath
@@ -12,15 +15,21 @@ from sqlalchemy.exc import IntegrityError
 from module.conf import settings
 from module.database import Database
 from module.database.bangumi import (
+    BangumiMatcher,
     build_save_path_index,
-    match_bangumi_in_list,
     normalize_save_path,
 )
-from module.downloader import DownloadClient, RenameOutcome, RenameResult
+from module.downloader import (
+    DownloadClient,
+    MutationBatch,
+    RenameOutcome,
+    RenameResult,
+)
 from module.downloader.path import check_files, is_ep, path_to_bangumi
 from module.models import EpisodeFile, Notification, RenameOperation, SubtitleFile
 from module.notification import RenameConflictEvent
 from module.parser import TitleParser
+from module.utils.pipeline import run_pipeline
 
 from .revision_policy import (
     RevisionIdentity,
@@ -67,6 +76,27 @@ class Renamer:
         self._parser = TitleParser()
         self._offset_cache: dict[str, tuple[int, int]] = {}
         self.events: list[RenameConflictEvent] = []
+        # 最近一次整理各阶段累计耗时（秒），见 _rename_pending
+        self.timings: dict[str, float] = {}
+        # 一轮整理期间累积的打标/分类变更，结束时一次性提交
+        self._mutations: MutationBatch | None = None
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[stage] = self.timings.get(stage, 0.0) + elapsed
+
+    @staticmethod
+    def _worker_count() -> int:
+        workers = min(
+            settings.bangumi_manage.rename_concurrency,
+            settings.downloader.max_concurrency,
+        )
+        return max(1, workers)
 
     @staticmethod
     def print_result(torrent_count, rename_count):
@@ -174,11 +204,26 @@ class Renamer:
         """
         if _RENAMED_TAG in (t.strip() for t in (existing_tags or "").split(",")):
             return
+        if self._mutations is not None:
+            self._mutations.add_tag(_hash, _RENAMED_TAG)
+            return
         try:
             await self.client.add_tag(_hash, _RENAMED_TAG)
         except Exception as e:
             logger.warning("Failed to tag %s as renamed: %s", _hash[:8], e)
 
+    async def _set_category(self, _hash: str, category: str) -> None:
+        if self._mutations is not None:
+            self._mutations.set_category(_hash, category)
+            return
+        await self.client.set_category(_hash, category)
+
+    async def _flush_mutations(self) -> None:
+        batch, self._mutations = self._mutations, None
+        if batch:
+            with self._timed("tag"):
+                await self.client.apply_mutations(batch)
+
     async def rename_file(
         self,
         torrent_name: str,
@@ -562,9 +607,10 @@ class Renamer:
         if not candidates:
             return incoming_identity, []
 
-        candidate_files = await asyncio.gather(
-            *[self.client.get_torrent_files(info["hash"]) for info in candidates]
+        files_by_hash = await self.client.get_torrent_files_many(
+            [info["hash"] for info in candidates]
         )
+        candidate_files = [files_by_hash.get(info["hash"], []) for info in candidates]
         owners: list[RevisionOwner] = []
         normalized_target = target_path.replace("\\", "/")
         for info, files in zip(candidates, candidate_files):
@@ -1612,13 +1658,14 @@ class Renamer:
                 # up to 2 match_by_save_path() calls).
                 if unresolved:
                     bangumi_list = await db.bangumi.search_all()
+                    matcher = BangumiMatcher(bangumi_list)
                     save_path_index = build_save_path_index(bangumi_list)
                     for info in unresolved:
                         torrent_hash = info["hash"]
                         torrent_name = info["name"]
                         save_path = info["save_path"]
 
-                        bangumi = match_bangumi_in_list(torrent_name, bangumi_list)
+                        bangumi = matcher.match(torrent_name)
                         if not bangumi:
                             # normalize_save_path() already folds "\\" -> "/"
                             # and strips trailing slashes, so a single lookup
@@ -1733,19 +1780,84 @@ class Renamer:
 
     async def rename(self) -> list[Notification]:
         logger.debug("Start rename process.")
+        renamed_info = await self._rename_pending()
+        async with Database() as db:
+            await db.rename_operation.prune_done(
+                datetime.now(timezone.utc) - timedelta(days=30)
+            )
+        logger.debug("Rename process finished.")
+        return renamed_info
+
+    async def rename_hashes(self, hashes: Iterable[str]) -> list[Notification]:
+        """Rename only the given torrents (completion hooks, API, MCP).
+
+        Runs the same per-torrent logic as :meth:`rename` -- offsets,
+        collection vs. single file, subtitles, the replacement saga -- but
+        files and offsets are fetched for these torrents only. Hashes that
+        are not completed Bangumi tasks (and not the incoming side of an
+        active replacement) are ignored; the next full pass still sees them.
+        """
+        wanted = {h.lower() for h in hashes if h}
+        if not wanted:
+            return []
+        logger.debug("Start targeted rename of %s torrent(s).", len(wanted))
+        renamed_info = await self._rename_pending(wanted)
+        logger.debug("Targeted rename finished.")
+        return renamed_info
+
+    async def _rename_pending(
+        self, wanted: set[str] | None = None
+    ) -> list[Notification]:
+        """Rename completed torrents, restricted to ``wanted`` hashes if given.
+
+        Torrents are grouped by save path; groups run on a bounded worker
+        pool (``bangumi_manage.rename_concurrency``, never above
+        ``downloader.max_concurrency``) while each group stays in order.
+        Per-stage wall time accumulates in ``self.timings`` and is published
+        with the pipeline progress. Tag and category changes are collected
+        and flushed in one batch at the end.
+        """
+        self.timings.clear()
+        self._mutations = MutationBatch()
+        try:
+            return await self._rename_batch(wanted)
+        finally:
+            await self._flush_mutations()
+            logger.debug(
+                "Rename stage timings: %s",
+                ", ".join(f"{k}={v:.2f}s" for k, v in self.timings.items()),
+            )
+
+    async def _rename_batch(self, wanted: set[str] | None) -> list[Notification]:
         rename_method = settings.bangumi_manage.rename_method
-        pending_infos = await self.client.get_torrent_info()
+        with self._timed("list"):
+            pending_infos = await self.client.get_torrent_info()
+            async with Database() as db:
+                active_replacements = (
+                    await db.rename_operation.list_active_replacements()
+                )
+        if wanted is not None:
+            pending_infos = [
+                info for info in pending_infos if info["hash"].lower() in wanted
+            ]
+            active_replacements = [
+                operation
+                for operation in active_replacements
+                if operation.new_task_id.lower() in wanted
+            ]
+            if not pending_infos and not active_replacements:
+                logger.debug("Targeted rename: no completed torrent to process")
+                return []
         # Owner counting and Saga recovery must see tasks outside the normal
         # Bangumi/completed filter (collections, paused tasks, changed category).
-        all_infos = await self.client.get_torrent_info(
-            category=None, status_filter=None
-        )
+        with self._timed("list"):
+            all_infos = await self.client.get_torrent_info(
+                category=None, status_filter=None
+            )
         info_by_hash = {info["hash"]: info for info in all_infos}
         for info in pending_infos:
             info_by_hash.setdefault(info["hash"], info)
         all_infos = list(info_by_hash.values())
-        async with Database() as db:
-            active_replacements = await db.rename_operation.list_active_replacements()
         active_replacement_ids = {
             operation.new_task_id for operation in active_replacements
         }
@@ -1772,43 +1884,86 @@ class Renamer:
             if info.get("hash") in active_replacement_ids
             or not self._has_tag(info.get("tags"), _RENAMED_TAG)
         ]
-        renamed_info: list[Notification] = []
         if not torrents_info:
-            logger.debug("Rename process finished: no pending torrents")
-            return renamed_info
+            logger.debug("No pending torrents to rename")
+            return []
 
-        all_files = await asyncio.gather(
-            *[self.client.get_torrent_files(info["hash"]) for info in torrents_info]
-        )
-        offset_map = await self._batch_lookup_offsets(torrents_info)
-        for info, files in zip(torrents_info, all_files):
-            torrent_hash = info["hash"]
-            torrent_name = info["name"]
-            save_path = info["save_path"]
-            if torrent_hash not in offset_map:
-                # Offset lookup failed for this torrent this cycle (see
-                # _batch_lookup_offsets) -- skip renaming rather than
-                # guessing offset (0, 0), which could misname episodes.
-                logger.warning(
-                    "Skipping %s: offset lookup failed this cycle",
-                    torrent_name,
+        with self._timed("files"):
+            files_by_hash = await self.client.get_torrent_files_many(
+                [info["hash"] for info in torrents_info]
+            )
+        with self._timed("offsets"):
+            offset_map = await self._batch_lookup_offsets(torrents_info)
+
+        # 同一保存目录的种子可能指向同一集的目标路径（多字幕组、V2 替换），
+        # 组内严格按顺序处理；不同目录之间并行。
+        groups: dict[str, list[dict]] = {}
+        for info in torrents_info:
+            key = normalize_save_path(info.get("save_path", ""))
+            groups.setdefault(key, []).append(info)
+
+        async def rename_group(infos: list[dict]) -> list[Notification]:
+            notifications: list[Notification] = []
+            for info in infos:
+                notifications += await self._rename_torrent(
+                    info=info,
+                    files=files_by_hash.get(info["hash"], []),
+                    offsets=offset_map.get(info["hash"]),
+                    all_infos=all_infos,
+                    rename_method=rename_method,
                 )
-                continue
-            media_list, subtitle_list = check_files(files)
-            bangumi_name, season = path_to_bangumi(save_path, torrent_name)
-            episode_offset, season_offset, episode_type = offset_map[torrent_hash]
-            kwargs = {
-                "torrent_name": torrent_name,
-                "bangumi_name": bangumi_name,
-                "method": rename_method,
-                "season": season,
-                "_hash": torrent_hash,
-                "episode_offset": episode_offset,
-                "season_offset": season_offset,
-                "episode_type": episode_type,
-                "existing_tags": info.get("tags"),
-            }
-            if len(media_list) == 1:
+            return notifications
+
+        results = await run_pipeline(
+            "rename",
+            list(groups.values()),
+            rename_group,
+            concurrency=self._worker_count(),
+            host_rate=0,
+            stages=self.timings,
+            verbose=False,
+        )
+        return [n for group in results if group for n in group]
+
+    async def _rename_torrent(
+        self,
+        *,
+        info: dict,
+        files: list[dict],
+        offsets: tuple[int, int, str] | None,
+        all_infos: list[dict],
+        rename_method: str,
+    ) -> list[Notification]:
+        """Rename one torrent's media and subtitles, then tag/categorise it."""
+        torrent_hash = info["hash"]
+        torrent_name = info["name"]
+        save_path = info["save_path"]
+        if offsets is None:
+            # Offset lookup failed for this torrent this cycle (see
+            # _batch_lookup_offsets) -- skip renaming rather than
+            # guessing offset (0, 0), which could misname episodes.
+            logger.warning(
+                "Skipping %s: offset lookup failed this cycle",
+                torrent_name,
+            )
+            return []
+        media_list, subtitle_list = check_files(files)
+        bangumi_name, season = path_to_bangumi(save_path, torrent_name)
+        episode_offset, season_offset, episode_type = offsets
+        kwargs = {
+            "torrent_name": torrent_name,
+            "bangumi_name": bangumi_name,
+            "method": rename_method,
+            "season": season,
+            "_hash": torrent_hash,
+            "episode_offset": episode_offset,
+            "season_offset": season_offset,
+            "episode_type": episode_type,
+            "existing_tags": info.get("tags"),
+        }
+        renamed_info: list[Notification] = []
+        if len(media_list) == 1:
+            with self._timed("media"):
                 report = await self._process_single_torrent(
                     info=info,
                     files=files,
@@ -1821,18 +1976,20 @@ class Renamer:
                     season_offset=season_offset,
                     episode_type=episode_type,
                 )
-                if report.notification:
-                    renamed_info.append(report.notification)
-                if report.result.succeeded:
-                    if subtitle_list:
+            if report.notification:
+                renamed_info.append(report.notification)
+            if report.result.succeeded:
+                if subtitle_list:
+                    with self._timed("subtitles"):
                         await self.rename_subtitles(
                             subtitle_list=subtitle_list, **kwargs
                         )
-                    if rename_method not in ("none", "normal"):
-                        await self._mark_renamed(torrent_hash, info.get("tags"))
-            elif len(media_list) > 1:
-                logger.info("Start rename collection")
-                file_sizes = {f["name"]: f.get("size") or 0 for f in files}
+                if rename_method not in ("none", "normal"):
+                    await self._mark_renamed(torrent_hash, info.get("tags"))
+        elif len(media_list) > 1:
+            logger.info("Start rename collection")
+            file_sizes = {f["name"]: f.get("size") or 0 for f in files}
+            with self._timed("media"):
                 collection_complete = await self.rename_collection(
                     media_list=media_list,
                     file_sizes=file_sizes,
@@ -1840,17 +1997,13 @@ class Renamer:
                     torrent_info=info,
                     **kwargs,
                 )
-                if collection_complete and subtitle_list:
+            if collection_complete and subtitle_list:
+                with self._timed("subtitles"):
                     await self.rename_subtitles(subtitle_list=subtitle_list, **kwargs)
-                if collection_complete:
-                    if rename_method not in ("none", "normal"):
-                        await self._mark_renamed(torrent_hash, info.get("tags"))
-                    await self.client.set_category(torrent_hash, "BangumiCollection")
-            else:
-                logger.warning(f"{torrent_name} has no media file")
-        async with Database() as db:
-            await db.rename_operation.prune_done(
-                datetime.now(timezone.utc) - timedelta(days=30)
-            )
-        logger.debug("Rename process finished.")
+            if collection_complete:
+                if rename_method not in ("none", "normal"):
+                    await self._mark_renamed(torrent_hash, info.get("tags"))
+                await self._set_category(torrent_hash, "BangumiCollection")
+        else:
+            logger.warning(f"{torrent_name} has no media file")
         return renamed_info
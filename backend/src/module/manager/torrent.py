@@ -7,9 +7,11 @@ from module.downloader import DownloadClient
 from module.downloader.path import gen_save_path
 from module.downloader.rules import build_rss_rule
 from module.models import Bangumi, BangumiUpdate, ResponseModel
+from module.models.bangumi import split_rss_link
 from module.parser import TitleParser
 from module.parser.analyser.bgm_calendar import fetch_bgm_calendar, match_weekday
 from module.parser.analyser.tmdb_parser import tmdb_parser
+from module.utils.pipeline import run_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +64,11 @@ class TorrentManager:
         番剧共享，永不在此处停用；rss_link 可能是逗号拼接的多个链接
         （见 BangumiDatabase.match_list），逐个拆分精确匹配。
         """
-        urls = {u.strip() for u in (data.rss_link or "").split(",") if u.strip()}
+        urls = set(split_rss_link(data.rss_link))
         if not urls:
             return
         # 含软删除（deleted=True）的番剧：其订阅需保留以便重新启用
-        still_referenced: set[str] = set()
-        for bangumi in await self.db.bangumi.search_all():
-            still_referenced.update(
-                u.strip() for u in (bangumi.rss_link or "").split(",") if u.strip()
-            )
+        still_referenced = await self.db.bangumi.referenced_rss(urls)
         orphan_ids: list[int] = []
         for url in urls - still_referenced:
             rss_item = await self.db.rss.search_url(url)
@@ -204,9 +202,8 @@ class TorrentManager:
 
     async def refresh_poster(self):
         bangumis = await self.db.bangumi.search_all()
-        for bangumi in bangumis:
-            if not bangumi.poster_link:
-                await TitleParser().tmdb_poster_parser(bangumi)
+        missing = [bangumi for bangumi in bangumis if not bangumi.poster_link]
+        await run_pipeline("refresh_poster", missing, TitleParser.tmdb_poster_parser)
         await self.db.bangumi.update_all(bangumis)
         return ResponseModel(
             status_code=200,
@@ -340,9 +337,8 @@ class TorrentManager:
         archived_count = 0
         poster_count = 0
 
-        for bangumi in bangumis:
-            if bangumi.deleted:
-                continue
+        async def refresh(bangumi: Bangumi) -> None:
+            nonlocal archived_count, poster_count
             tmdb_info = await tmdb_parser(bangumi.official_title, language)
             if tmdb_info:
                 # Update poster if missing
@@ -355,6 +351,12 @@ class TorrentManager:
                     archived_count += 1
                     logger.info(f"Auto-archived ended series: {bangumi.official_title}")
 
+        await run_pipeline(
+            "refresh_metadata",
+            [bangumi for bangumi in bangumis if not bangumi.deleted],
+            refresh,
+        )
+
         if archived_count > 0 or poster_count > 0:
             await self.db.bangumi.update_all(bangumis)
 
@@ -8,6 +8,37 @@ Usage::
     from module.mcp import create_mcp_app
 
     app = create_mcp_app(ctx)  # returns a Starlette ASGI app, mount at /mcp
+
+The ``mcp`` SDK takes a noticeable share of boot time and most installs
+never connect an MCP client, so ``main`` mounts :class:`LazyMcpApp`, which
+imports and builds the server on the first request to ``/mcp``.
 """
 
-from .server import create_mcp_starlette_app as create_mcp_app
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+
+
+def create_mcp_app(ctx=None):
+    from .server import create_mcp_starlette_app
+
+    return create_mcp_starlette_app(ctx)
+
+
+class LazyMcpApp:
+    """ASGI app that builds the MCP sub-application on its first request."""
+
+    def __init__(self, ctx=None) -> None:
+        self._ctx = ctx
+        self._app: "ASGIApp | None" = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._app is not None
+
+    async def __call__(self, scope, receive, send) -> None:
+        app = self._app
+        if app is None:
+            app = self._app = create_mcp_app(self._ctx)
+        await app(scope, receive, send)
@@ -4,9 +4,10 @@ import logging
 from mcp import types
 
 from module.conf import VERSION
+from module.core.loops import notify_renames
 from module.database import Database
 from module.downloader import DownloadClient
-from module.manager import SeasonCollector, TorrentManager
+from module.manager import Renamer, SeasonCollector, TorrentManager
 from module.models import Bangumi, BangumiUpdate, RSSItem
 from module.rss import RSSAnalyser, RSSEngine
 from module.searcher import SearchTorrent
@@ -118,6 +119,21 @@ TOOLS = [
             },
         },
     ),
+    types.Tool(
+        name="rename_downloads",
+        description="Rename the files of specific completed downloads now, instead of waiting for the next rename cycle.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hashes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Torrent hashes to rename (see list_downloads)",
+                },
+            },
+            "required": ["hashes"],
+        },
+    ),
     types.Tool(
         name="list_rss_feeds",
         description="List all configured RSS feeds with their connection status and health information.",
@@ -226,6 +242,8 @@ async def _dispatch(name: str, args: dict) -> dict | list:
         return await _unsubscribe_anime(args["id"], args.get("delete", False))
     elif name == "list_downloads":
         return await _list_downloads(args.get("status", "all"))
+    elif name == "rename_downloads":
+        return await _rename_downloads(args["hashes"])
     elif name == "list_rss_feeds":
         return await _list_rss_feeds()
     elif name == "get_program_status":
@@ -296,6 +314,7 @@ async def _list_downloads(status: str) -> list[dict]:
         )
     return [
         {
+            "hash": t.get("hash", ""),
             "name": t.get("name", ""),
             "size": t.get("size", 0),
             "progress": t.get("progress", 0),
@@ -308,6 +327,27 @@ async def _list_downloads(status: str) -> list[dict]:
     ]
 
 
+async def _rename_downloads(hashes: list[str]) -> dict:
+    async with DownloadClient() as client:
+        renamer = Renamer(client)
+        renamed = await renamer.rename_hashes(hashes)
+        events = list(renamer.events)
+    ctx = get_context()
+    if ctx is not None:
+        await notify_renames(ctx.notifier, events, renamed)
+    return {
+        "status": True,
+        "renamed": [
+            {
+                "official_title": n.official_title,
+                "season": n.season,
+                "episode": n.episode,
+            }
+            for n in renamed
+        ],
+    }
+
+
 async def _list_rss_feeds() -> list[dict]:
     async with Database() as db:
         feeds = await db.rss.search_all()
@@ -1,9 +1,10 @@
 from .auth import ApiToken, AuthSession
-from .bangumi import Bangumi, BangumiUpdate, Episode, Notification
+from .bangumi import Bangumi, BangumiRSS, BangumiUpdate, Episode, Notification
 from .config import Config
 from .inbox import InboxMessage
 from .llm_credential import LLMCredential
 from .movie import Movie, MovieUpdate
+from .notification import NotificationMedia, QueuedNotification
 from .passkey import Passkey, PasskeyCreate, PasskeyDelete, PasskeyList
 from .rename_operation import (
     RENAME_OPERATION_STATES,
@@ -12,5 +13,13 @@ from .rename_operation import (
 )
 from .response import APIResponse, ResponseModel
 from .rss import RSSItem, RSSUpdate
-from .torrent import EpisodeFile, SubtitleFile, Torrent, TorrentUpdate
+from .tmdb_cache import TmdbCache
+from .torrent import (
+    EpisodeFile,
+    EpisodeIndex,
+    SubtitleFile,
+    Torrent,
+    TorrentSeen,
+    TorrentUpdate,
+)
 from .user import User, UserLogin, UserUpdate
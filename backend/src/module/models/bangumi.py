@@ -63,6 +63,26 @@ class Bangumi(SQLModel, table=True):
     )  # "episode" | "movie" | "special"
 
 
+class BangumiRSS(SQLModel, table=True):
+    """番剧与 RSS 链接的多对多关联。
+
+    ``Bangumi.rss_link`` 仍是对外的逗号拼接字符串；本表由
+    ``module.database.bangumi`` 的映射事件随其写入同步维护，供按链接查找订阅
+    番剧时走索引。
+    """
+
+    __tablename__ = "bangumi_rss"
+
+    bangumi_id: int = Field(foreign_key="bangumi.id", primary_key=True)
+    url: str = Field(primary_key=True, index=True)
+
+
+def split_rss_link(rss_link: str | None) -> list[str]:
+    """Individual URLs of a comma-joined ``rss_link``, deduplicated in order."""
+    urls = (u.strip() for u in (rss_link or "").split(","))
+    return list(dict.fromkeys(u for u in urls if u))
+
+
 class BangumiUpdate(SQLModel):
     official_title: str = Field(
         default="official_title", alias="official_title", title="番剧中文名"
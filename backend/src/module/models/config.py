@@ -37,6 +37,9 @@ class Downloader(BaseModel):
     )
     path: str = Field(default="/downloads/Bangumi", description="Downloader path")
     ssl: bool = Field(default=False, description="Downloader ssl")
+    max_concurrency: int = Field(
+        default=10, ge=1, description="Max parallel requests to the downloader"
+    )
 
     @property
     def host(self):
@@ -80,6 +83,17 @@ class BangumiManage(BaseModel):
     track_orphans: bool = Field(
         default=True, description="Persist unmatched (orphan) torrents"
     )
+    # 不同保存目录的种子并行整理；同一目录内仍按顺序，避免争抢同一集的目标路径
+    rename_concurrency: int = Field(
+        default=4, ge=1, description="Save paths renamed in parallel"
+    )
+    # 种子历史保留策略（0 关闭该项）；只清理未下载的行，指纹保留用于去重
+    torrent_retention_days: int = Field(
+        default=90, ge=0, description="Prune undownloaded torrents older than N days"
+    )
+    torrent_retention_count: int = Field(
+        default=1000, ge=0, description="Keep at most N torrents per RSS feed"
+    )
 
 
 class Log(BaseModel):
@@ -103,6 +117,25 @@ class Network(BaseModel):
     bgm_base_url: str = Field(
         default="https://api.bgm.tv", description="Bangumi (bgm.tv) API base URL"
     )
+    # TMDB 响应的磁盘缓存有效期：完结番的数据基本不会再变；连载中的按小时
+    # 刷新以跟上新集；查无结果只短暂缓存，新番刚上 TMDB 时不会长期查不到。
+    tmdb_cache_ended_days: int = Field(
+        default=30, description="TMDB cache TTL for ended series (days)"
+    )
+    tmdb_cache_airing_hours: int = Field(
+        default=24, description="TMDB cache TTL for airing series (hours)"
+    )
+    tmdb_cache_negative_minutes: int = Field(
+        default=60, description="TMDB cache TTL for empty search results (minutes)"
+    )
+    # 批量刷新元数据 / 海报 / 偏移扫描时的并发数与单主机每秒请求上限；
+    # 共享 TMDB key 有限流，调高并发时请求速率仍受后者约束。
+    metadata_concurrency: int = Field(
+        default=4, ge=1, description="Concurrent bangumi in metadata refresh"
+    )
+    metadata_host_rate: float = Field(
+        default=8.0, ge=0, description="Max requests per second per host (0 = off)"
+    )
 
 
 class Proxy(BaseModel):
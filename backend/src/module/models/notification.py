@@ -0,0 +1,37 @@
+"""外部通知的发送队列。
+
+``notification_queue`` 一行 = 待发往某个 provider 的一条单集通知；按 provider
+分行，各自限流、各自重试。``provider`` 是 ``provider_key`` 得出的配置指纹，
+配置改动或删除后旧行不再匹配任何 provider，投递时丢弃。时间戳为 Unix 时间
+（``time.time()``），进程重启后依然有效。
+
+``notification_media`` 记住 provider 侧已上传过的媒体（如 Telegram 海报的
+``file_id``），同一张海报不再重复上传。
+"""
+
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class QueuedNotification(SQLModel, table=True):
+    __tablename__ = "notification_queue"
+
+    id: int = Field(default=None, primary_key=True)
+    provider: str = Field("", index=True)
+    official_title: str = Field("")
+    season: int = Field(1)
+    episode: float = Field(0)
+    poster_path: Optional[str] = Field(None)
+    attempts: int = Field(0)
+    not_before: float = Field(0, index=True)
+    created_at: float = Field(0)
+    last_error: Optional[str] = Field(None)
+
+
+class NotificationMedia(SQLModel, table=True):
+    __tablename__ = "notification_media"
+
+    provider: str = Field(primary_key=True)
+    media_key: str = Field(primary_key=True)  # 本地海报路径
+    ref: str = Field("")  # provider 侧的引用，如 Telegram file_id
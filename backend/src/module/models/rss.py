@@ -13,6 +13,11 @@ class RSSItem(SQLModel, table=True):
     connection_status: Optional[str] = Field(None, alias="connection_status")
     last_checked_at: Optional[str] = Field(None, alias="last_checked_at")
     last_error: Optional[str] = Field(None, alias="last_error")
+    # 条件请求校验值：上一轮完整处理过的响应的 ETag / Last-Modified 与正文
+    # 哈希，命中 304 或正文未变时 refresh_rss 直接跳过该源
+    etag: Optional[str] = Field(None, alias="etag")
+    last_modified: Optional[str] = Field(None, alias="last_modified")
+    content_hash: Optional[str] = Field(None, alias="content_hash")
 
 
 class RSSUpdate(SQLModel):
@@ -0,0 +1,17 @@
+"""TMDB 原始响应的磁盘缓存。
+
+一行 = 一次 search/info/season 请求的 JSON 响应，按 (kind, query, language)
+定位；``expires_at`` 为 Unix 时间戳，过期行在启动预热时清理。
+"""
+
+from sqlmodel import Field, SQLModel
+
+
+class TmdbCache(SQLModel, table=True):
+    __tablename__ = "tmdb_cache"
+
+    kind: str = Field(primary_key=True)  # search_tv | search_movie | info | season
+    query: str = Field(primary_key=True)  # 标题 / tv_id / "tv_id/season"
+    language: str = Field(primary_key=True)
+    payload: str = Field("")  # JSON 字符串
+    expires_at: float = Field(0, index=True)
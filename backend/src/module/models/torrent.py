@@ -1,3 +1,5 @@
+import hashlib
+from datetime import datetime, timezone
 from typing import Optional
 
 from pydantic import BaseModel
@@ -17,6 +19,56 @@ class Torrent(SQLModel, table=True):
     homepage: Optional[str] = Field(None, alias="homepage")
     downloaded: bool = Field(False, alias="downloaded")
     qb_hash: Optional[str] = Field(None, alias="qb_hash", index=True)
+    # 入库时间，保留策略按它判断年龄；v27 之前的行在迁移时补为迁移时刻
+    created_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc), alias="created_at"
+    )
+
+
+def url_fingerprint(url: str) -> str:
+    """Compact, stable fingerprint of a torrent URL (16 hex chars)."""
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+
+class TorrentSeen(SQLModel, table=True):
+    """已被保留策略清理的种子 URL 指纹。
+
+    ``torrent`` 表的行被清理后，``check_new`` 仍靠这里认出源里的旧条目，
+    不会把它们当作新种子重新处理。
+    """
+
+    __tablename__ = "torrent_seen"
+
+    url_hash: str = Field(primary_key=True)
+    rss_id: Optional[int] = Field(default=None, index=True)
+    first_seen: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class EpisodeIndex(SQLModel, table=True):
+    """种子名称的剧集解析结果，按种子物化。
+
+    偏好去重和 offset 扫描原来每轮都要把番剧的全部种子名重新解析一遍；
+    这里只解析一次，之后按索引查。番剧归属和下载状态不冗余存储，查询时与
+    ``torrent`` 表关联；删除种子时由外键级联清掉对应行。``parser`` 记录
+    解析所用的引擎，切换引擎后旧行会被重新解析。
+    """
+
+    __tablename__ = "episode_index"
+
+    torrent_id: int = Field(
+        primary_key=True, foreign_key="torrent.id", ondelete="CASCADE"
+    )
+    parser: str
+    # 为 None 表示不是可安全去重的单集资源（合集、PV、解析失败等）
+    media_type: Optional[str] = None
+    # 特典固定为 0；None 表示名称里没有季度，查询时按番剧季度补
+    season: Optional[int] = None
+    episode: Optional[float] = None
+    revision: int = 1
+    group_name: Optional[str] = None
+    resolution: Optional[str] = None
+    # 是否可作为 offset 扫描的周更单集信号（见 ``is_offset_signal``）
+    offset_signal: bool = False
 
 
 class TorrentUpdate(SQLModel):
@@ -1 +1,3 @@
-from .request_contents import RequestContent
+from .rate_limit import HostRateLimiter, host_rate_limit
+from .request_contents import FeedFetch, RequestContent
+from .single_flight import SingleFlight
@@ -0,0 +1,50 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """按主机限速：同一主机相邻两次请求的发起时间至少间隔 ``1 / rate`` 秒。
+
+    每个请求在进入时预订下一个空闲时间片再睡到该时刻，并发的 worker 因此
+    按到达顺序排队，不需要锁。``rate <= 0`` 表示不限速。
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, url: str) -> None:
+        if not self._interval:
+            return
+        host = urlparse(url).netloc
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# 只对显式开启限速的调用链生效（批量刷新元数据等），RSS 拉取有自己的
+# 按站点间隔（见 rss/snapshot.py），不受影响。
+_active_limiter: ContextVar[HostRateLimiter | None] = ContextVar(
+    "host_rate_limiter", default=None
+)
+
+
+@contextmanager
+def host_rate_limit(limiter: HostRateLimiter) -> Iterator[HostRateLimiter]:
+    """在当前上下文（及其中创建的任务）内对所有 GET 请求启用 ``limiter``。"""
+    token = _active_limiter.set(limiter)
+    try:
+        yield limiter
+    finally:
+        _active_limiter.reset(token)
+
+
+async def throttle(url: str) -> None:
+    limiter = _active_limiter.get()
+    if limiter is not None:
+        await limiter.acquire(url)
@@ -1,15 +1,58 @@
+import hashlib
 import logging
 import re
 import xml.etree.ElementTree
+from dataclasses import dataclass, field
 
 from module.conf import settings
 from module.models import Torrent
+from module.utils import save_image
 
 from .request_url import RequestURL
+from .single_flight import SingleFlight
 from .site import rss_parser
 
 logger = logging.getLogger(__name__)
 
+# 同一海报地址的并发下载只发一次请求、写一次文件
+_poster_flight: SingleFlight[str | None] = SingleFlight()
+
+
+@dataclass
+class FeedFetch:
+    """一次条件 RSS 拉取的结果。
+
+    ``not_modified`` 为真时（服务端 304，或正文哈希与上次一致）``torrents``
+    为空，调用方应跳过解析与匹配；``etag``/``last_modified``/``content_hash``
+    是本次响应的校验值，供调用方在处理成功后持久化。
+    """
+
+    torrents: list[Torrent] = field(default_factory=list)
+    not_modified: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+def _parse_torrents(
+    soup: xml.etree.ElementTree.Element,
+    _filter: str | None = None,
+    limit: int | None = None,
+) -> list[Torrent]:
+    parsed_items = rss_parser(soup)
+    torrents: list[Torrent] = []
+    if _filter is None:
+        _filter = "|".join(settings.rss_parser.filter)
+    for _title, torrent_url, homepage in parsed_items:
+        # A blank filter means "exclude nothing" — re.search("", x) matches
+        # every string, which would otherwise exclude everything.
+        if not _filter or re.search(_filter, _title) is None:
+            torrents.append(Torrent(name=_title, url=torrent_url, homepage=homepage))
+        if isinstance(limit, int):
+            if len(torrents) >= limit:
+                break
+    return torrents
+
 
 class RequestContent(RequestURL):
     async def get_torrents(
@@ -21,25 +64,55 @@ class RequestContent(RequestURL):
     ) -> list[Torrent]:
         soup = await self.get_xml(_url, retry)
         if soup:
-            parsed_items = rss_parser(soup)
-            torrents: list[Torrent] = []
-            if _filter is None:
-                _filter = "|".join(settings.rss_parser.filter)
-            for _title, torrent_url, homepage in parsed_items:
-                # A blank filter means "exclude nothing" — re.search("", x) matches
-                # every string, which would otherwise exclude everything.
-                if not _filter or re.search(_filter, _title) is None:
-                    torrents.append(
-                        Torrent(name=_title, url=torrent_url, homepage=homepage)
-                    )
-                if isinstance(limit, int):
-                    if len(torrents) >= limit:
-                        break
-            return torrents
+            return _parse_torrents(soup, _filter, limit)
         else:
             logger.warning(f"Failed to get torrents: {_url}")
             return []
 
+    async def get_feed(
+        self,
+        _url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
+        retry: int = 3,
+    ) -> FeedFetch:
+        """Conditional feed fetch: send the stored validators and skip the XML
+        parse when the server answers 304 or the body hash is unchanged."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        req = await self.get_url(_url, retry, headers=headers)
+        if not req:
+            logger.warning(f"Failed to get torrents: {_url}")
+            return FeedFetch()
+        if req.status_code == 304:
+            logger.debug("RSS %s not modified (304).", _url)
+            return FeedFetch(
+                not_modified=True,
+                etag=req.headers.get("ETag") or etag,
+                last_modified=req.headers.get("Last-Modified") or last_modified,
+                content_hash=content_hash,
+            )
+        fetched = FeedFetch(
+            etag=req.headers.get("ETag"),
+            last_modified=req.headers.get("Last-Modified"),
+            content_hash=hashlib.sha256(req.content).hexdigest(),
+        )
+        if content_hash and fetched.content_hash == content_hash:
+            logger.debug("RSS %s body unchanged, skip parsing.", _url)
+            fetched.not_modified = True
+            return fetched
+        try:
+            soup = xml.etree.ElementTree.fromstring(req.text)
+        except xml.etree.ElementTree.ParseError as e:
+            logger.warning(f"Failed to parse XML from {_url}: {e}")
+            return FeedFetch()
+        fetched.torrents = _parse_torrents(soup)
+        return fetched
+
     async def get_xml(
         self, _url, retry: int = 3
     ) -> xml.etree.ElementTree.Element | None:
@@ -86,6 +159,19 @@ class RequestContent(RequestURL):
         logger.warning(f"Failed to get content from {_url}")
         return None
 
+    async def get_poster(self, _url: str, suffix: str) -> str | None:
+        """Download a poster into the local image cache and return its path.
+
+        Concurrent calls for the same URL share one download; ``None`` when the
+        download failed.
+        """
+
+        async def download() -> str | None:
+            img = await self.get_content(_url)
+            return await save_image(img, suffix) if img else None
+
+        return await _poster_flight.do(_url, download)
+
     async def check_connection(self, _url):
         return await self.check_url(_url)
 
@@ -8,6 +8,8 @@ from httpx_socks import AsyncProxyTransport
 
 from module.conf import settings
 
+from .rate_limit import throttle
+
 logger = logging.getLogger(__name__)
 
 # Module-level shared client for connection reuse
@@ -122,20 +124,31 @@ class RequestURL:
             base_headers["Accept"] = "application/xml, text/xml, */*"
         return base_headers
 
-    async def get_url(self, url, retry=3):
+    async def get_url(self, url, retry=3, headers: dict | None = None):
+        """GET ``url`` with retry; ``headers`` are merged over the defaults.
+
+        Conditional callers pass ``If-None-Match``/``If-Modified-Since`` here;
+        a ``304 Not Modified`` answer is returned as-is instead of being
+        treated as a redirect error.
+        """
         assert (
             self._client is not None
         ), "RequestURL must be used as an async context manager"
         try_time = 0
-        headers = self._get_headers(url)
+        request_headers = self._get_headers(url)
+        if headers:
+            request_headers.update(headers)
         while True:
             try:
-                req = await self._client.get(url=url, headers=headers)
+                await throttle(url)
+                req = await self._client.get(url=url, headers=request_headers)
                 logger.debug(
                     "Successfully connected to %s. Status: %s",
                     url,
                     req.status_code,
                 )
+                if req.status_code == 304:
+                    return req
                 req.raise_for_status()
                 return req
             except httpx.HTTPStatusError as e:
@@ -0,0 +1,42 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """合并同一 key 的并发调用：第一个调用者真正执行，其余等待同一结果。
+
+    RSS 分析一批种子时，同一部番的多个种子会在第一个结果写入缓存之前并发
+    查询 TMDB / Mikan 主页；经过这里后每个 key 同时只有一个请求在路上。
+    结果不在这里缓存，调用方照旧写自己的缓存；异常会同样抛给所有等待者。
+
+    调用以独立任务执行并用 ``shield`` 等待：某个等待者被取消时不会取消
+    其他人共享的那次请求。
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        # 事件循环已换（测试、重启）时旧任务不可再等待
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 所有等待者都已取消时没人取结果，避免 "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self) -> None:
+        self._inflight.clear()
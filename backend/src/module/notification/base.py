@@ -7,6 +7,7 @@ from module.conf import settings
 from module.models.bangumi import Notification
 from module.network import RequestContent
 from module.notification.events import SystemEvent
+from module.notification.queue import provider_key
 
 if TYPE_CHECKING:
     from module.models.config import NotificationProvider as ProviderConfig
@@ -19,13 +20,26 @@ class NotificationProvider(ABC):
     the send() and test() methods. HTTP delivery is composed via a
     ``RequestContent`` instance (``self._http``) rather than inherited -- a
     provider IS-A notification channel, not an HTTP client.
+
+    ``RATE_LIMIT`` (messages per second) and ``RATE_BURST`` size the token
+    bucket the notification queue applies to each provider. ``DIGEST = False``
+    makes the queue send (and retry) every episode on its own instead of
+    coalescing a season into one message.
     """
 
+    RATE_LIMIT: float = 1.0
+    RATE_BURST: int = 5
+    DIGEST: bool = True
+
     def __init__(self, config: "ProviderConfig") -> None:
         self._http = RequestContent()
         # 单集通知模板（{{title}}/{{season}}/{{episode}}/{{poster_url}}）；
         # 未设置时 ``_format_message`` 回退到默认中文文案。
         self.template = config.template
+        self.key = provider_key(config)
+        # 已上传媒体的引用（本地海报路径 -> provider 侧 id），由 manager 在
+        # 投递前载入、投递后落库；值为 None 表示该引用已失效
+        self.media: dict[str, str | None] = {}
 
     async def __aenter__(self) -> "NotificationProvider":
         await self._http.__aenter__()
@@ -56,6 +70,37 @@ class NotificationProvider(ABC):
         """
         pass
 
+    async def send_batch(self, notifications: list[Notification]) -> bool:
+        """Send queued episodes of one bangumi season as a single message.
+
+        One episode goes through :meth:`send` unchanged; several are
+        coalesced into a digest (:meth:`_send_digest`).
+
+        Args:
+            notifications: Episodes of the same title and season, in order.
+
+        Returns:
+            True if the message was delivered successfully, False otherwise.
+        """
+        if len(notifications) == 1:
+            return await self.send(notifications[0])
+        return await self._send_digest(notifications)
+
+    async def _send_digest(self, notifications: list[Notification]) -> bool:
+        """Deliver a multi-episode digest; defaults to :meth:`_deliver_text`."""
+        title, body = self._format_digest(notifications)
+        return await self._deliver_text(title, body)
+
+    @staticmethod
+    def _format_digest(notifications: list[Notification]) -> tuple[str, str]:
+        """Title and body of a digest covering several episodes."""
+        first = notifications[0]
+        episodes = "、".join(f"第{n.episode}集" for n in notifications)
+        return (
+            f"{first.official_title} 更新了 {len(notifications)} 集",
+            f"季度： 第{first.season}季\n更新集数： {episodes}",
+        )
+
     async def send_event(self, event: SystemEvent) -> bool:
         """Send a system event (RSS failure, download failure, offset review).
 
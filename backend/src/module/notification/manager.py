@@ -2,26 +2,77 @@
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Awaitable, Callable
 
 from module.conf import settings
 from module.database import Database
+from module.models import QueuedNotification
 from module.models.bangumi import Notification
 from module.notification.events import SystemEvent
 from module.notification.inbox import record_event
+from module.notification.queue import (
+    DIGEST_WINDOW,
+    IDLE_INTERVAL,
+    MAX_ATTEMPTS,
+    MIN_INTERVAL,
+    TokenBucket,
+    retry_delay,
+)
 
 if TYPE_CHECKING:
+    from module.core.scheduler import PeriodicTask
     from module.models.config import NotificationProvider as ProviderConfig
     from module.notification.base import NotificationProvider
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _Outcome:
+    """What one provider's delivery pass did to its queued rows.
+
+    ``done`` rows are removed from the queue: sent, or given up on.
+    """
+
+    sent: int = 0
+    done: list[int] = field(default_factory=list)
+    retries: list[tuple[list[int], float, str]] = field(default_factory=list)
+    media: dict[str, str | None] = field(default_factory=dict)
+    next_due: float | None = None
+
+    def wait_until(self, when: float) -> None:
+        if self.next_due is None or when < self.next_due:
+            self.next_due = when
+
+
+def _as_notification(row: QueuedNotification) -> Notification:
+    episode = row.episode
+    return Notification(
+        official_title=row.official_title,
+        season=row.season,
+        episode=int(episode) if float(episode).is_integer() else episode,
+        poster_path=row.poster_path,
+    )
+
+
 class NotificationManager:
-    """Manager for handling notifications across multiple providers."""
+    """Manager for handling notifications across multiple providers.
 
-    def __init__(self):
+    Episode notifications are queued in the database and delivered by the
+    ``notify`` task (see :meth:`bind`), so the rename loop never waits on a
+    chat API. System events are rare and still broadcast immediately.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
         self.providers: list["NotificationProvider"] = []
+        self._clock = clock
+        # 按 provider_key 保存，rebuild 后配置没变的 provider 沿用原来的令牌桶
+        self._buckets: dict[str, TokenBucket] = {}
+        self._task: "PeriodicTask | None" = None
+        self._next_due: float | None = None
+        self._delivery_lock = asyncio.Lock()
         self._load_providers()
 
     def rebuild(self):
@@ -67,8 +118,8 @@ class NotificationManager:
     ):
         """Run ``send_one`` against every provider in parallel, logging failures.
 
-        Shared by :meth:`send_all` and :meth:`send_event` so both broadcast
-        the same way: one provider's exception never blocks the others.
+        Used by :meth:`send_event`: one provider's exception never blocks
+        the others.
 
         Args:
             label: Short description used in warning logs on failure.
@@ -92,8 +143,16 @@ class NotificationManager:
             return_exceptions=True,
         )
 
+    def bind(self, task: "PeriodicTask") -> None:
+        """Attach the task that delivers the queue; ``send_all`` wakes it."""
+        self._task = task
+
     async def send_all(self, notification: Notification):
-        """Send notification to all enabled providers.
+        """Queue a notification for every enabled provider.
+
+        The bound ``notify`` task delivers it once ``DIGEST_WINDOW`` has
+        passed, coalescing other episodes of the same season queued in the
+        meantime. Without a running task the queue is flushed right away.
 
         Args:
             notification: The notification data to send.
@@ -105,15 +164,185 @@ class NotificationManager:
         # Fetch poster if needed
         await self._get_poster(notification)
 
-        async def send_one(provider: "NotificationProvider"):
-            await provider.send(notification)
-            logger.debug(
-                "Sent notification via %s: %s",
-                provider.__class__.__name__,
-                notification.official_title,
+        now = self._clock()
+        rows = [
+            QueuedNotification(
+                provider=provider.key,
+                official_title=notification.official_title,
+                season=notification.season,
+                episode=notification.episode,
+                poster_path=notification.poster_path,
+                not_before=now + DIGEST_WINDOW,
+                created_at=now,
             )
+            for provider in self.providers
+        ]
+        async with Database() as db:
+            await db.notification_queue.enqueue(rows)
 
-        await self._broadcast("notification", send_one)
+        if self._task is not None and self._task.running:
+            self._task.wake()
+        else:
+            await self.deliver_due(flush=True)
+
+    async def deliver_due(self, flush: bool = False) -> int:
+        """Deliver queued notifications whose digest window has passed.
+
+        Rows are grouped per provider and (title, season); each group goes
+        out as one message, subject to the provider's rate limit. Failed
+        groups are retried with exponential backoff and dropped after
+        ``MAX_ATTEMPTS``. Rows of providers that are no longer configured
+        are discarded.
+
+        Args:
+            flush: Ignore the digest window (rate limits still apply).
+
+        Returns:
+            The number of queued rows delivered.
+        """
+        async with self._delivery_lock:
+            providers = {provider.key: provider for provider in self.providers}
+            async with Database() as db:
+                discarded = await db.notification_queue.discard_except(providers)
+                if discarded:
+                    logger.debug(
+                        "Discarded %s notification(s) of removed providers.",
+                        discarded,
+                    )
+                rows = await db.notification_queue.pending()
+                media = await db.notification_queue.media(providers)
+
+            batches: dict[str, dict[tuple[str, int], list[QueuedNotification]]] = {}
+            for row in rows:
+                by_season = batches.setdefault(row.provider, {})
+                by_season.setdefault((row.official_title, row.season), []).append(row)
+
+            now = self._clock()
+            keys = list(batches)
+            outcomes = await asyncio.gather(
+                *[
+                    self._deliver_to(
+                        providers[key],
+                        list(batches[key].values()),
+                        media.get(key, {}),
+                        now,
+                        flush,
+                    )
+                    for key in keys
+                ]
+            )
+
+            delivered = 0
+            next_due: float | None = None
+            async with Database() as db:
+                for key, outcome in zip(keys, outcomes):
+                    await db.notification_queue.delete(outcome.done)
+                    for ids, not_before, error in outcome.retries:
+                        await db.notification_queue.retry(ids, not_before, error)
+                    await db.notification_queue.save_media(key, outcome.media)
+                    delivered += outcome.sent
+                    if outcome.next_due is not None and (
+                        next_due is None or outcome.next_due < next_due
+                    ):
+                        next_due = outcome.next_due
+            self._next_due = next_due
+            return delivered
+
+    async def _deliver_to(
+        self,
+        provider: "NotificationProvider",
+        batches: list[list[QueuedNotification]],
+        media: dict[str, str],
+        now: float,
+        flush: bool,
+    ) -> _Outcome:
+        outcome = _Outcome()
+        due: list[list[QueuedNotification]] = []
+        for batch in batches:
+            ready = min(row.not_before for row in batch)
+            if not (flush or ready <= now):
+                outcome.wait_until(ready)
+            elif provider.DIGEST:
+                due.append(batch)
+            else:
+                # 逐集发送、逐集结算：失败重试时不会重发已送达的集数
+                due.extend([row] for row in sorted(batch, key=lambda r: r.episode))
+        if not due:
+            return outcome
+
+        bucket = self._buckets.get(provider.key)
+        if bucket is None:
+            bucket = TokenBucket(
+                provider.RATE_LIMIT, provider.RATE_BURST, clock=self._clock
+            )
+            self._buckets[provider.key] = bucket
+        provider.media = dict(media)
+        name = provider.__class__.__name__
+        remaining = list(due)
+        try:
+            async with provider:
+                while remaining:
+                    if not bucket.try_acquire():
+                        outcome.wait_until(now + bucket.wait_time())
+                        remaining.clear()
+                        break
+                    batch = remaining.pop(0)
+                    batch.sort(key=lambda row: row.episode)
+                    try:
+                        ok = await provider.send_batch(
+                            [_as_notification(row) for row in batch]
+                        )
+                        error = "" if ok else "provider reported failure"
+                    except Exception as e:
+                        ok, error = False, str(e)
+                    self._settle(outcome, name, batch, ok, error, now)
+        except Exception as e:
+            # 打开/关闭 provider 的连接失败：还没发的批次按失败处理
+            logger.warning(f"Notification provider {name} unavailable: {e}")
+            for batch in remaining:
+                self._settle(outcome, name, batch, False, str(e), now)
+        outcome.media = {
+            key: ref for key, ref in provider.media.items() if media.get(key) != ref
+        }
+        return outcome
+
+    @staticmethod
+    def _settle(
+        outcome: _Outcome,
+        name: str,
+        batch: list[QueuedNotification],
+        ok: bool,
+        error: str,
+        now: float,
+    ) -> None:
+        ids = [row.id for row in batch]
+        title = batch[0].official_title
+        if ok:
+            logger.debug("Sent %s notification(s) via %s: %s", len(ids), name, title)
+            outcome.sent += len(ids)
+            outcome.done.extend(ids)
+            return
+        attempts = max(row.attempts for row in batch) + 1
+        if attempts >= MAX_ATTEMPTS:
+            logger.warning(
+                "Dropping notification for %s via %s after %s attempts: %s",
+                title,
+                name,
+                attempts,
+                error,
+            )
+            outcome.done.extend(ids)
+            return
+        logger.warning(f"Failed to send notification via {name}: {error}")
+        retry_at = now + retry_delay(attempts)
+        outcome.retries.append((ids, retry_at, error))
+        outcome.wait_until(retry_at)
+
+    def next_delivery_in(self) -> float:
+        """Seconds until the queue next has something to deliver."""
+        if self._next_due is None:
+            return IDLE_INTERVAL
+        return min(max(self._next_due - self._clock(), MIN_INTERVAL), IDLE_INTERVAL)
 
     async def send_event(self, event: SystemEvent):
         """Persist a system event to the in-app inbox, then broadcast it.
@@ -15,6 +15,10 @@ logger = logging.getLogger(__name__)
 class DiscordProvider(NotificationProvider):
     """Discord webhook notification provider."""
 
+    # Webhook：每个频道每分钟 30 条
+    RATE_LIMIT = 0.5
+    RATE_BURST = 5
+
     def __init__(self, config: "ProviderConfig"):
         super().__init__(config)
         self.webhook_url = config.webhook_url
@@ -50,6 +54,16 @@ class DiscordProvider(NotificationProvider):
         logger.debug("Discord notification: %s", resp.status_code)
         return resp.status_code in (200, 204)
 
+    async def _send_digest(self, notifications: list[Notification]) -> bool:
+        """Send a multi-episode digest as one embed."""
+        title, body = self._format_digest(notifications)
+        embed = {"title": f"📺 {title}", "description": body, "color": 0x00BFFF}
+        poster_url = self._poster_url(notifications[0])
+        if poster_url:
+            embed["thumbnail"] = {"url": poster_url}
+        resp = await self._post_json(self.webhook_url, {"embeds": [embed]})
+        return resp.status_code in (200, 204)
+
     async def test(self) -> tuple[bool, str]:
         """Test Discord webhook by sending a test message."""
         embed = {
@@ -14,7 +14,15 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramProvider(NotificationProvider):
-    """Telegram Bot notification provider."""
+    """Telegram Bot notification provider.
+
+    A poster is uploaded once per bot and chat; later messages reuse the
+    ``file_id`` Telegram returned for it.
+    """
+
+    # Bot API：同一会话约每秒 1 条，群组每分钟 20 条
+    RATE_LIMIT = 1 / 3
+    RATE_BURST = 3
 
     def __init__(self, config: "ProviderConfig"):
         super().__init__(config)
@@ -26,6 +34,16 @@ class TelegramProvider(NotificationProvider):
     async def send(self, notification: Notification) -> bool:
         """Send notification via Telegram."""
         text = self._format_message(notification)
+        return await self._send_with_poster(text, notification.poster_path)
+
+    async def _send_digest(self, notifications: list[Notification]) -> bool:
+        """Send a multi-episode digest as one captioned poster."""
+        title, body = self._format_digest(notifications)
+        return await self._send_with_poster(
+            f"{title}\n{body}", notifications[0].poster_path
+        )
+
+    async def _send_with_poster(self, text: str, poster_path: str | None) -> bool:
         data = {
             "chat_id": self.chat_id,
             "caption": text,
@@ -33,12 +51,25 @@ class TelegramProvider(NotificationProvider):
             "disable_notification": True,
         }
 
-        photo = await load_image(notification.poster_path)
+        if poster_path and (file_id := self.media.get(poster_path)):
+            resp = await self.post_data(self.photo_url, {**data, "photo": file_id})
+            if resp is not None and resp.status_code == 200:
+                logger.debug("Telegram notification reused poster %s", poster_path)
+                return True
+            # file_id 失效（机器人换了、文件过期）时忘掉它，重新上传
+            self.media[poster_path] = None
+
+        photo = await load_image(poster_path)
         if photo:
             resp = await self.post_files(self.photo_url, data, files={"photo": photo})
+            uploaded = _photo_file_id(resp)
+            if uploaded and poster_path:
+                self.media[poster_path] = uploaded
         else:
             resp = await self.post_data(self.message_url, data)
 
+        if resp is None:
+            return False
         logger.debug("Telegram notification: %s", resp.status_code)
         return resp.status_code == 200
 
@@ -66,3 +97,20 @@ class TelegramProvider(NotificationProvider):
         }
         resp = await self.post_data(self.message_url, data)
         return resp.status_code == 200
+
+
+def _photo_file_id(resp) -> str | None:
+    """The largest photo size's ``file_id`` from a sendPhoto response."""
+    if resp is None or resp.status_code != 200:
+        return None
+    try:
+        payload = resp.json()
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    photos = (payload.get("result") or {}).get("photo")
+    if not isinstance(photos, list) or not photos:
+        return None
+    file_id = photos[-1].get("file_id") if isinstance(photos[-1], dict) else None
+    return file_id if isinstance(file_id, str) else None
@@ -28,6 +28,10 @@ DEFAULT_TEMPLATE = json.dumps(
 class WebhookProvider(NotificationProvider):
     """Generic webhook notification provider with customizable templates."""
 
+    # Webhook consumers are usually automations that parse the configured
+    # template, so each episode is its own payload: no free-text digest.
+    DIGEST = False
+
     def __init__(self, config: "ProviderConfig"):
         super().__init__(config)
         self.url = config.url
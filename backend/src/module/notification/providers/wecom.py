@@ -15,6 +15,10 @@ logger = logging.getLogger(__name__)
 class WecomProvider(NotificationProvider):
     """WeChat Work (企业微信) notification provider using news message format."""
 
+    # 群机器人：每分钟 20 条
+    RATE_LIMIT = 1 / 3
+    RATE_BURST = 5
+
     def __init__(self, config: "ProviderConfig"):
         super().__init__(config)
         # Support both webhook_url and legacy chat_id field
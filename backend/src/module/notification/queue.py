@@ -0,0 +1,79 @@
+"""发送队列用到的限流与重试工具。
+
+单集通知先写进 ``notification_queue``，由 notify 任务按 provider 投递：
+同一部番剧在 ``DIGEST_WINDOW`` 内的多集合并成一条摘要；每个 provider 有自己
+的令牌桶，避免一次导入整季时撞上 Telegram/Discord 的频率限制；失败按指数
+退避重试，超过 ``MAX_ATTEMPTS`` 次放弃。
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from module.models.config import NotificationProvider as ProviderConfig
+
+DIGEST_WINDOW = 30.0
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 30.0
+RETRY_MAX_DELAY = 30 * 60.0
+# 队列为空时 notify 任务的兜底间隔，以及两次 tick 的最短间隔
+IDLE_INTERVAL = 5 * 60.0
+MIN_INTERVAL = 1.0
+
+
+def provider_key(config: "ProviderConfig") -> str:
+    """Stable identity of a provider configuration.
+
+    Queued rows and uploaded-media references belong to the exact
+    destination they were made for: a different token or chat is a
+    different destination, while editing the template is not.
+    """
+    fields = config.model_dump(mode="json", exclude={"enabled", "template"})
+    raw = json.dumps(fields, sort_keys=True)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{config.type.lower()}:{digest}"
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next try after ``attempts`` failed ones."""
+    return min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+
+
+class TokenBucket:
+    """``rate`` sends per second on average, bursts of up to ``burst``."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def wait_time(self) -> float:
+        """Seconds until the next ``try_acquire`` can succeed."""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
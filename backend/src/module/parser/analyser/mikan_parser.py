@@ -5,8 +5,7 @@ from collections import OrderedDict
 from bs4 import BeautifulSoup
 from urllib3.util import parse_url
 
-from module.network import RequestContent
-from module.utils import save_image
+from module.network import RequestContent, SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +13,8 @@ logger = logging.getLogger(__name__)
 # URL, so it is bounded (LRU-ish, oldest-evicted) rather than unlimited.
 _MIKAN_CACHE_MAX = 512
 _mikan_cache: "OrderedDict[str, tuple[str, str]]" = OrderedDict()
+# 同一批种子常指向同一主页，缓存写入前的并发查询合并为一次
+_mikan_flight: SingleFlight[tuple[str, str]] = SingleFlight()
 
 
 def reset_cache() -> None:
@@ -22,6 +23,11 @@ def reset_cache() -> None:
     _mikan_cache.clear()
 
 
+def cached_posters() -> set[str]:
+    """本地海报路径中仍被主页解析缓存引用的部分，海报回收时需保留。"""
+    return {poster_link for poster_link, _ in _mikan_cache.values() if poster_link}
+
+
 def _cache_result(homepage: str, result: tuple[str, str]) -> tuple[str, str]:
     if len(_mikan_cache) >= _MIKAN_CACHE_MAX:
         _mikan_cache.popitem(last=False)
@@ -32,6 +38,10 @@ def _cache_result(homepage: str, result: tuple[str, str]) -> tuple[str, str]:
 async def mikan_parser(homepage: str):
     if homepage in _mikan_cache:
         return _mikan_cache[homepage]
+    return await _mikan_flight.do(homepage, lambda: _fetch_homepage(homepage))
+
+
+async def _fetch_homepage(homepage: str) -> tuple[str, str]:
     root_path = parse_url(homepage).host
     async with RequestContent() as req:
         content = await req.get_html(homepage)
@@ -54,10 +64,11 @@ async def mikan_parser(homepage: str):
             # (AttributeValueList); "style" is never multi-valued in practice.
             poster_path = poster_div.split("url('")[1].split("')")[0]  # type: ignore[union-attr]
             poster_path = poster_path.split("?")[0]
-            img = await req.get_content(f"https://{root_path}{poster_path}")
             suffix = poster_path.split(".")[-1]
-            # img can be None if the poster download failed; don't crash on it.
-            poster_link = (await save_image(img, suffix) or "") if img else ""
+            # None if the poster download failed; don't crash on it.
+            poster_link = (
+                await req.get_poster(f"https://{root_path}{poster_path}", suffix) or ""
+            )
             return _cache_result(homepage, (poster_link, official_title))
         return _cache_result(homepage, ("", official_title))
 
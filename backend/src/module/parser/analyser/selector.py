@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
@@ -23,6 +24,83 @@ _PARSER_ENGINE_SNAPSHOT: ContextVar[ParserEngine | None] = ContextVar(
 )
 
 
+# Bounded LRU of configured parses. One refresh parses the same title in the
+# matcher, the preference dedup and the offset scanner; ParsedRelease is
+# frozen, so the cached object is shared safely between callers.
+_PARSE_CACHE_MAX = 4096
+
+_ParseFunction = Callable[[str], ParsedRelease | None]
+
+
+@dataclass(frozen=True, slots=True)
+class ParseCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class _ParseCache:
+    """LRU keyed on (engine, parse implementation, raw title).
+
+    The parse function object stands in for the parser version: a reloaded or
+    patched implementation never sees entries produced by the previous one.
+    Switching the configured engine drops every entry of the old engine.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._engine: ParserEngine | None = None
+        self._entries: OrderedDict[
+            tuple[ParserEngine, _ParseFunction, str], ParsedRelease | None
+        ] = OrderedDict()
+
+    def parse(
+        self, engine: ParserEngine, parse: _ParseFunction, raw: str
+    ) -> ParsedRelease | None:
+        if engine != self._engine:
+            self._entries.clear()
+            self._engine = engine
+        key = (engine, parse, raw)
+        try:
+            result = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+        result = parse(raw)
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._engine = None
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> ParseCacheStats:
+        return ParseCacheStats(
+            hits=self.hits, misses=self.misses, size=len(self._entries)
+        )
+
+
+_parse_cache = _ParseCache(_PARSE_CACHE_MAX)
+
+
+def reset_cache() -> None:
+    """Drop every memoized parse and reset the hit/miss counters."""
+    _parse_cache.clear()
+
+
+def parse_cache_stats() -> ParseCacheStats:
+    return _parse_cache.stats()
+
+
 @dataclass(frozen=True, slots=True)
 class ConfiguredParseOutcome:
     """A configured parse result with diagnostics when the engine supports them."""
@@ -57,10 +135,12 @@ def parse_configured_release_title_outcome(raw: str) -> ConfiguredParseOutcome:
     """Parse *raw* and retain the engine selected for this invocation."""
     engine = _configured_engine()
     if engine == "classic":
-        result = classic.parse_release_title(raw)
+        parse = classic.parse_release_title
     else:
-        result = preview.parse_release_title(raw)
-    return ConfiguredParseOutcome(engine=engine, result=result)
+        parse = preview.parse_release_title
+    return ConfiguredParseOutcome(
+        engine=engine, result=_parse_cache.parse(engine, parse, raw)
+    )
 
 
 def parse_configured_release_title_with_trace(raw: str) -> ConfiguredParseOutcome:
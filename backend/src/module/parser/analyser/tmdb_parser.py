@@ -1,14 +1,15 @@
 import asyncio
+import json
 import logging
 import re
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from typing import cast
 from urllib.parse import urlencode
 
 from module.conf import TMDB_API, settings
-from module.network import RequestContent
-from module.utils import save_image
+from module.network import RequestContent, SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +28,137 @@ def _api_key() -> str:
 # In-memory cache for TMDB lookups to avoid repeated API calls
 _TMDB_CACHE_MAX = 512
 _tmdb_cache: OrderedDict[str, "TMDBInfo | None"] = OrderedDict()
+# 结果写入 _tmdb_cache 之前，同一 cache_key 的并发查询共用一次请求
+_tmdb_flight: "SingleFlight[TMDBInfo | None]" = SingleFlight()
 
 
 def reset_cache() -> None:
     """清空 TMDB 查询缓存。配置重载（如 tmdb_base_url 变更）后必须调用，否则会
-    继续返回旧接口地址下缓存的结果。"""
+    继续返回旧接口地址下缓存的结果。
+
+    原始响应缓存（``_responses``）不随之清空：镜像地址 / API key 变化不改变
+    TMDB 数据本身，清掉只会让重载后的第一轮扫描重新打满 TMDB API。
+    """
     _tmdb_cache.clear()
 
 
+def cached_posters() -> set[str]:
+    """本地海报路径中仍被查询缓存引用的部分，海报回收时需保留。"""
+    return {
+        info.poster_link for info in _tmdb_cache.values() if info and info.poster_link
+    }
+
+
+# ---------------------------------------------------------------------------
+# 原始响应缓存（跨重启）
+#
+# search/info/season 的 JSON 响应按 (kind, query, language) 缓存在内存 LRU 里，
+# 同时写穿到 tmdb_cache 表；启动时 warm_response_cache() 从磁盘预热，重启后
+# OffsetScanner / refresh_metadata 不必为每部番重跑全部请求。有效期见
+# _response_ttl()；请求失败（None）从不缓存。
+# ---------------------------------------------------------------------------
+_RESPONSE_CACHE_MAX = 8192
+_responses: OrderedDict[tuple[str, str, str], tuple[dict, float]] = OrderedDict()
+# 尚未落盘的条目；每次 tmdb_parser 调用结束时一次性写入
+_pending_writes: dict[tuple[str, str, str], tuple[dict, float]] = {}
+_ENDED_STATUSES = frozenset({"Ended", "Canceled"})
+
+
+def reset_response_cache() -> None:
+    """清空内存中的原始响应缓存（不动磁盘；测试与预热前使用）。"""
+    _responses.clear()
+    _pending_writes.clear()
+
+
+def _remember(key: tuple[str, str, str], payload: dict, expires_at: float) -> None:
+    _responses[key] = (payload, expires_at)
+    _responses.move_to_end(key)
+    while len(_responses) > _RESPONSE_CACHE_MAX:
+        _responses.popitem(last=False)
+
+
+def _series_status(tv_id: str, language: str) -> str | None:
+    cached = _responses.get(("info", tv_id, language))
+    return cached[0].get("status") if cached else None
+
+
+def _response_ttl(kind: str, query: str, language: str, payload: dict) -> float:
+    network = settings.network
+    if kind.startswith("search") and not payload.get("results"):
+        return network.tmdb_cache_negative_minutes * 60
+    if kind == "info":
+        status = payload.get("status")
+    elif kind == "season":
+        status = _series_status(query.split("/", 1)[0], language)
+    else:
+        # 标题 -> 条目的搜索结果与剧集状态无关，按连载中的较短有效期处理
+        status = None
+    if status in _ENDED_STATUSES:
+        return network.tmdb_cache_ended_days * 86400
+    return network.tmdb_cache_airing_hours * 3600
+
+
+async def _cached_json(
+    req: RequestContent, kind: str, query, language: str, url: str
+) -> dict | None:
+    key = (kind, str(query), language)
+    now = time.time()
+    cached = _responses.get(key)
+    if cached is not None and cached[1] > now:
+        _responses.move_to_end(key)
+        return cached[0]
+    payload = await req.get_json(url)
+    if not payload or not isinstance(payload, dict):
+        return payload
+    expires_at = now + _response_ttl(kind, key[1], language, payload)
+    _remember(key, payload, expires_at)
+    _pending_writes[key] = (payload, expires_at)
+    return payload
+
+
+async def _flush_responses() -> None:
+    """把本次新拿到的响应写入磁盘；失败只记日志（缓存不影响正确性）。"""
+    if not _pending_writes:
+        return
+    rows = [
+        {
+            "kind": kind,
+            "query": query,
+            "language": language,
+            "payload": json.dumps(payload, ensure_ascii=False),
+            "expires_at": expires_at,
+        }
+        for (kind, query, language), (payload, expires_at) in _pending_writes.items()
+    ]
+    _pending_writes.clear()
+    # 延迟导入打破 database ↔ parser 循环（database 经 llm_credential 导入
+    # parser 包，而 parser 包导入本模块）。
+    from module.database import Database
+
+    try:
+        async with Database() as db:
+            await db.tmdb_cache.upsert_many(rows)
+    except Exception as e:
+        logger.debug("Failed to persist TMDB responses: %s", e)
+
+
+async def warm_response_cache() -> int:
+    """启动时从磁盘加载未过期的响应并清理过期行；返回加载条数。"""
+    from module.database import Database
+
+    async with Database() as db:
+        await db.tmdb_cache.purge_expired()
+        rows = await db.tmdb_cache.load_fresh(_RESPONSE_CACHE_MAX)
+    # load_fresh 按过期时间倒序返回；倒着放入让最晚过期的处于 LRU 尾部
+    for row in reversed(rows):
+        try:
+            payload = json.loads(row.payload)
+        except ValueError:
+            continue
+        _remember((row.kind, row.query, row.language), payload, row.expires_at)
+    return len(rows)
+
+
 @dataclass
 class TMDBInfo:
     id: int
@@ -100,7 +224,7 @@ def season_url(tv_id, season_number, key):
 
 async def is_animation(tv_id, language, req: RequestContent) -> bool:
     url_info = info_url(tv_id, language)
-    type_id = await req.get_json(url_info)
+    type_id = await _cached_json(req, "info", tv_id, language, url_info)
     if type_id:
         for type in type_id.get("genres", []):
             if type.get("id") == 16:
@@ -119,7 +243,9 @@ async def get_season_episode_air_dates(
     import datetime
 
     url = season_url(tv_id, season_number, language)
-    season_data = await req.get_json(url)
+    season_data = await _cached_json(
+        req, "season", f"{tv_id}/{season_number}", language, url
+    )
     if not season_data:
         return []
 
@@ -192,7 +318,9 @@ async def get_aired_episode_count(
     import datetime
 
     url = season_url(tv_id, season_number, language)
-    season_data = await req.get_json(url)
+    season_data = await _cached_json(
+        req, "season", f"{tv_id}/{season_number}", language, url
+    )
     if not season_data:
         return 0
 
@@ -245,11 +373,12 @@ async def _search_movie(
     电影没有季度概念，因此不复用剧集的季度/集数聚合逻辑，仅返回标题、原名、
     年份与海报等基本信息。"""
     url = search_movie_url(title, language)
-    contents = await req.get_json(url)
+    contents = await _cached_json(req, "search_movie", title, language, url)
     results = (contents or {}).get("results") or []
     if not results:
-        url = search_movie_url(title.replace(" ", ""), language)
-        contents = await req.get_json(url)
+        compact = title.replace(" ", "")
+        url = search_movie_url(compact, language)
+        contents = await _cached_json(req, "search_movie", compact, language, url)
         results = (contents or {}).get("results") or []
     if not results:
         return None
@@ -281,7 +410,24 @@ async def tmdb_parser(
     cache_key = f"{title}:{language}:{test}:{is_movie}"
     if cache_key in _tmdb_cache:
         return _tmdb_cache[cache_key]
+    return await _tmdb_flight.do(
+        cache_key,
+        lambda: _tmdb_lookup_and_flush(title, language, cache_key, test, is_movie),
+    )
+
+
+async def _tmdb_lookup_and_flush(
+    title, language, cache_key: str, test: bool, is_movie: bool
+) -> TMDBInfo | None:
+    try:
+        return await _tmdb_lookup(title, language, cache_key, test, is_movie)
+    finally:
+        await _flush_responses()
 
+
+async def _tmdb_lookup(
+    title, language, cache_key: str, test: bool, is_movie: bool
+) -> TMDBInfo | None:
     async with RequestContent() as req:
         if is_movie:
             # 已知是电影/剧场版，直接查询 search/movie，跳过剧集搜索
@@ -289,23 +435,26 @@ async def tmdb_parser(
             _tmdb_cache[cache_key] = result
             return result
         url = search_url(title, language)
-        contents = await req.get_json(url)
-        if not contents:
+        search = await _cached_json(req, "search_tv", title, language, url)
+        if not search:
             return await _search_movie(title, language, req)
-        contents = (contents or {}).get("results") or []
-        if not contents:
-            url = search_url(title.replace(" ", ""), language)
-            contents_resp = await req.get_json(url)
-            if not contents_resp:
+        results: list[dict] = search.get("results") or []
+        if not results:
+            compact = title.replace(" ", "")
+            url = search_url(compact, language)
+            compact_search = await _cached_json(
+                req, "search_tv", compact, language, url
+            )
+            if not compact_search:
                 return await _search_movie(title, language, req)
-            contents = (contents_resp or {}).get("results") or []
-            if not contents:
+            results = compact_search.get("results") or []
+            if not results:
                 # search/tv 无结果：回退到 search/movie (剧场版等)
                 return await _search_movie(title, language, req)
         # 判断动画
-        if contents:
+        if results:
             matched_id = None
-            for content in contents:
+            for content in results:
                 cid = content["id"]
                 if await is_animation(cid, language, req):
                     matched_id = cid
@@ -316,14 +465,18 @@ async def tmdb_parser(
                 # TMDB hiccup shouldn't poison this title for the process lifetime.
                 return await _search_movie(title, language, req)
             url_info = info_url(matched_id, language)
-            info_content = await req.get_json(url_info)
+            info_content = await _cached_json(
+                req, "info", matched_id, language, url_info
+            )
+            # is_animation 刚拉取并缓存过同一份详情
+            assert info_content is not None
             season = [
                 {
                     "season": s.get("name"),
                     "air_date": s.get("air_date"),
                     "poster_path": s.get("poster_path"),
                 }
-                for s in info_content.get("seasons")
+                for s in cast(list[dict], info_content.get("seasons"))
             ]
             last_season, poster_path = get_season(season)
             # Extract series status (e.g., "Ended", "Returning Series")
@@ -369,16 +522,15 @@ async def tmdb_parser(
                     season_episode_counts[season_num] = total_eps
             if poster_path is None:
                 poster_path = info_content.get("poster_path")
-            original_title = info_content.get("original_name")
-            official_title = info_content.get("name")
+            original_title = cast(str, info_content.get("original_name"))
+            official_title = cast(str, info_content.get("name"))
             year_number = (info_content.get("first_air_date") or "").split("-")[0]
             if poster_path:
                 if not test:
-                    img = await req.get_content(
-                        f"https://image.tmdb.org/t/p/w780{poster_path}"
+                    # None if the poster download failed; don't crash on it.
+                    poster_link = await req.get_poster(
+                        f"https://image.tmdb.org/t/p/w780{poster_path}", "jpg"
                     )
-                    # img is None if the poster download failed; don't crash on it.
-                    poster_link = await save_image(img, "jpg") if img else None
                 else:
                     poster_link = "https://image.tmdb.org/t/p/w780" + poster_path
             else:
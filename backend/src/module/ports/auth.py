@@ -58,7 +58,7 @@ class SessionTokenRepository(Protocol):
         self, raw_token: str, *, scope: str
     ) -> tuple[User, int] | None: ...
 
-    async def touch_api_token(self, token_id: int) -> None: ...
+    async def touch_api_tokens(self, usage: dict[int, datetime]) -> None: ...
 
     async def list_api_tokens(self) -> list[ApiToken]: ...
 
@@ -1,2 +1,3 @@
 from .analyser import RSSAnalyser
 from .engine import RSSEngine
+from .snapshot import FeedSnapshot
@@ -8,6 +8,7 @@ from module.parser import TitleParser
 from module.parser.analyser.selector import parser_engine_snapshot
 
 from .engine import RSSEngine
+from .snapshot import FeedSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -168,13 +169,21 @@ class RSSAnalyser:
         return None
 
     async def rss_to_data(
-        self, rss: RSSItem, engine: RSSEngine, full_parse: bool = True
+        self,
+        rss: RSSItem,
+        engine: RSSEngine,
+        full_parse: bool = True,
+        snapshot: FeedSnapshot | None = None,
     ) -> list[Bangumi]:
         # One RSS workflow can cross several await boundaries and parse the
         # same resource during Movie match, Bangumi match, and persistence.
         # Keep those stages on the engine selected when the workflow started.
         with parser_engine_snapshot():
-            rss_torrents = await self.get_rss_torrents(rss.url, full_parse)
+            if snapshot is not None and full_parse:
+                # 与本轮 RSSEngine.refresh_rss 共用同一次下载与解析
+                rss_torrents = await snapshot.torrents(rss)
+            else:
+                rss_torrents = await self.get_rss_torrents(rss.url, full_parse)
             # Filter out already-known movies first
             torrents_after_movies = await engine.db.movie.match_list(
                 rss_torrents, rss.url
@@ -8,10 +8,22 @@ from urllib.parse import urlparse
 
 from module.conf import settings
 from module.database import Database
-from module.database.bangumi import _groups_are_similar, match_bangumi_in_list
+from module.database.bangumi import (
+    BangumiMatcher,
+    _groups_are_similar,
+    match_bangumi_in_list,
+)
+from module.database.episode_index import entry_identity
 from module.downloader import AddResult, DownloadClient
-from module.models import Bangumi, Movie, ResponseModel, RSSItem, Torrent
-from module.network import RequestContent
+from module.models import (
+    Bangumi,
+    EpisodeIndex,
+    Movie,
+    ResponseModel,
+    RSSItem,
+    Torrent,
+)
+from module.network import FeedFetch, RequestContent
 from module.notification.events import (
     DownloadFailureEvent,
     RssFailureEvent,
@@ -21,17 +33,12 @@ from module.parser.analyser.selector import (
     parse_configured_release_title,
     parser_engine_snapshot,
 )
-from module.parser.analyser.tokenizer import (
-    MediaType,
-    ParsedRelease,
-)
+from module.parser.analyser.tokenizer import MediaType
 from module.parser.release_policy import preference_identity, preference_revision
 
-logger = logging.getLogger(__name__)
+from .snapshot import RSS_PER_HOST_DELAY, FeedSnapshot
 
-# Delay between consecutive requests to the same host. Firing all feeds of one
-# site at once gets the whole batch rate-limited with HTTP 429 (#1026).
-RSS_PER_HOST_DELAY = 2.0
+logger = logging.getLogger(__name__)
 
 _PreferenceKey = tuple[int, MediaType, int, int | float]
 _PreferenceRank = tuple[int, int]
@@ -46,15 +53,15 @@ def _resolution_matches(candidate: str | None, preferred: str | None) -> bool:
     return normalized_candidate == normalized_preferred
 
 
-def _preference_score(release: ParsedRelease, bangumi: Bangumi) -> int:
+def _preference_score(
+    group: str | None, resolution: str | None, bangumi: Bangumi
+) -> int:
     """候选版本相对番剧发布组/分辨率偏好的匹配得分：每命中一项 +1。"""
     score = 0
-    if bangumi.preferred_group and _groups_are_similar(
-        release.group, bangumi.preferred_group
-    ):
+    if bangumi.preferred_group and _groups_are_similar(group, bangumi.preferred_group):
         score += 1
     if bangumi.preferred_resolution and _resolution_matches(
-        release.resolution, bangumi.preferred_resolution
+        resolution, bangumi.preferred_resolution
     ):
         score += 1
     return score
@@ -65,15 +72,37 @@ class RSSEngine:
         self.db = db
         self._to_refresh = False
         self._filter_cache: dict[str, re.Pattern] = {}
+        # 本轮 refresh 使用的订阅源快照；校验值要等该源处理完才落库
+        self._snapshot: FeedSnapshot | None = None
+
+    async def _get_torrents(self, rss: RSSItem) -> list[Torrent] | None:
+        """Fetch a feed conditionally; ``None`` means unchanged since last tick."""
+        if self._snapshot is None:
+            self._snapshot = FeedSnapshot()
+        fetched = await self._snapshot.fetch(rss)
+        if fetched.not_modified:
+            return None
+        # Add RSS ID
+        for torrent in fetched.torrents:
+            torrent.rss_id = rss.id
+        return fetched.torrents
 
     @staticmethod
-    async def _get_torrents(rss: RSSItem) -> list[Torrent]:
-        async with RequestContent() as req:
-            torrents = await req.get_torrents(rss.url)
-            # Add RSS ID
-            for torrent in torrents:
-                torrent.rss_id = rss.id
-        return torrents
+    def _store_validators(rss_item: RSSItem, fetched: FeedFetch, complete: bool):
+        """记录本轮响应的校验值，供下一轮发送条件请求。
+
+        ``complete`` 为假（有种子投递失败待重试，或未匹配种子没有入库）时
+        清空校验值：下一轮必须重新完整拉取，否则 304 会让这些种子再也不被
+        处理。拉取失败（没有拿到正文）时保留原值。
+        """
+        if not complete:
+            rss_item.etag = None
+            rss_item.last_modified = None
+            rss_item.content_hash = None
+        elif fetched.not_modified or fetched.content_hash:
+            rss_item.etag = fetched.etag
+            rss_item.last_modified = fetched.last_modified
+            rss_item.content_hash = fetched.content_hash
 
     async def get_rss_torrents(self, rss_id: int) -> list[Torrent]:
         rss = await self.db.rss.search_id(rss_id)
@@ -145,6 +174,9 @@ class RSSEngine:
 
     async def pull_rss(self, rss_item: RSSItem) -> list[Torrent]:
         torrents = await self._get_torrents(rss_item)
+        if torrents is None:
+            # 304 / 正文未变：上一轮已完整处理过同一份内容
+            return []
         new_torrents = await self.db.torrent.check_new(torrents)
         return new_torrents
 
@@ -176,9 +208,12 @@ class RSSEngine:
         return self._filter_cache[filter_str]
 
     def match_torrent(
-        self, torrent: Torrent, bangumi_list: list[Bangumi]
+        self, torrent: Torrent, bangumi_list: list[Bangumi] | BangumiMatcher
     ) -> Optional[Bangumi]:
-        matched = match_bangumi_in_list(torrent.name, bangumi_list)
+        if isinstance(bangumi_list, BangumiMatcher):
+            matched = bangumi_list.match(torrent.name)
+        else:
+            matched = match_bangumi_in_list(torrent.name, bangumi_list)
         if matched:
             # 只有通过排除过滤的种子才关联 bangumi_id：被过滤掉的种子
             # 不能挂在番剧名下，否则 OffsetScanner 会用用户明确排除的
@@ -196,7 +231,7 @@ class RSSEngine:
     def _select_preference_skips(
         matched: list[tuple[Torrent, Bangumi]],
         preference_bangumi: dict[int, Bangumi],
-        existing_downloaded: dict[int, list[Torrent]],
+        existing_downloaded: dict[int, list[EpisodeIndex]],
     ) -> set[int]:
         """按番剧的发布组/分辨率偏好去重：同一集只保留最匹配偏好的版本。
 
@@ -206,6 +241,8 @@ class RSSEngine:
         规则：
         - 内容身份包含媒体类型、规范化季度和集数，防止正片、跨季及特典互相
           冲突。
+        - 已下载版本来自剧集索引（``episode_index``），不再重新解析种子名；
+          偏好得分按索引里的发布组/分辨率和番剧当前偏好现算。
         - 该内容已有下载版本时，新到版本只有偏好得分更高，或偏好得分相同但
           修订号更高时才保留；偏好匹配始终优先于修订号。
         - 同一批次内同一内容出现多个候选时，只保留排序最高的一个。
@@ -219,21 +256,18 @@ class RSSEngine:
 
         # 已下载版本：按完整内容身份记录当前最高 (偏好得分, 修订号)。
         existing_best: dict[_PreferenceKey, _PreferenceRank] = {}
-        for bangumi_id, torrents in existing_downloaded.items():
+        for bangumi_id, entries in existing_downloaded.items():
             bangumi = preference_bangumi.get(bangumi_id)
             if not bangumi:
                 continue
-            for torrent in torrents:
-                release = parse_configured_release_title(torrent.name)
-                if release is None:
-                    continue
-                identity = preference_identity(release, default_season=bangumi.season)
+            for entry in entries:
+                identity = entry_identity(entry, default_season=bangumi.season)
                 if identity is None:
                     continue
                 key = (bangumi_id, identity[0], identity[1], identity[2])
                 rank = (
-                    _preference_score(release, bangumi),
-                    preference_revision(release),
+                    _preference_score(entry.group_name, entry.resolution, bangumi),
+                    entry.revision,
                 )
                 previous = existing_best.get(key)
                 if previous is None or rank > previous:
@@ -254,7 +288,7 @@ class RSSEngine:
                 continue
             key = (bangumi.id, identity[0], identity[1], identity[2])
             rank = (
-                _preference_score(release, bangumi),
+                _preference_score(release.group, release.resolution, bangumi),
                 preference_revision(release),
             )
             batch_groups[key].append((torrent, rank))
@@ -272,9 +306,18 @@ class RSSEngine:
         return skip_ids
 
     async def refresh_rss(
-        self, client: DownloadClient, rss_id: Optional[int] = None
+        self,
+        client: DownloadClient,
+        rss_id: Optional[int] = None,
+        snapshot: FeedSnapshot | None = None,
     ) -> list[SystemEvent]:
-        """Refresh feeds with one parser engine for the complete workflow."""
+        """Refresh feeds with one parser engine for the complete workflow.
+
+        ``snapshot`` lets the caller share feeds already fetched in this tick
+        (e.g. by ``RSSAnalyser.rss_to_data``); without one every feed is
+        fetched afresh.
+        """
+        self._snapshot = snapshot or FeedSnapshot()
         with parser_engine_snapshot():
             return await self._refresh_rss(client, rss_id)
 
@@ -288,15 +331,15 @@ class RSSEngine:
             rss_item = await self.db.rss.search_id(rss_id)
             rss_items = [rss_item] if rss_item else []
         # From RSS Items, fetch all torrents: parallel across hosts, serial
-        # (with a delay) within one host so the site never sees a burst (#1026).
+        # within one host so the site never sees a burst (#1026). The snapshot
+        # spaces real requests to one host by RSS_PER_HOST_DELAY and serves
+        # feeds already fetched this tick without touching the network.
         logger.debug("Get %s RSS items", len(rss_items))
         semaphore = asyncio.Semaphore(5)
 
         async def _pull_host_group(items: list[RSSItem]):
             group_results = []
-            for i, item in enumerate(items):
-                if i and RSS_PER_HOST_DELAY:
-                    await asyncio.sleep(RSS_PER_HOST_DELAY)
+            for item in items:
                 async with semaphore:
                     group_results.append(await self._pull_rss_with_status(item))
             return group_results
@@ -327,12 +370,10 @@ class RSSEngine:
             for b in bangumi_list
             if b.id is not None and (b.preferred_group or b.preferred_resolution)
         }
-        existing_downloaded: dict[int, list[Torrent]] = {}
+        existing_downloaded: dict[int, list[EpisodeIndex]] = {}
         if preference_bangumi:
-            existing_downloaded = (
-                await self.db.torrent.search_downloaded_by_bangumi_ids(
-                    list(preference_bangumi)
-                )
+            existing_downloaded = await self.db.episode_index.downloaded(
+                list(preference_bangumi)
             )
 
         # First pass: match every torrent against the bangumi list (this also
@@ -342,8 +383,9 @@ class RSSEngine:
         item_matches: list[
             tuple[RSSItem, list[Torrent], Optional[str], list[Optional[Bangumi]]]
         ] = []
+        matcher = BangumiMatcher(bangumi_list)
         for rss_item, (new_torrents, error) in item_results:
-            matches = [self.match_torrent(t, bangumi_list) for t in new_torrents]
+            matches = [self.match_torrent(t, matcher) for t in new_torrents]
             item_matches.append((rss_item, new_torrents, error, matches))
 
         skip_ids = self._select_preference_skips(
@@ -414,6 +456,13 @@ class RSSEngine:
                 # 中重新匹配（廉价），后补规则能立即接住仍在源里的旧集
                 to_persist = [t for t in to_persist if t.bangumi_id is not None]
             await self.db.torrent.add_all(to_persist)
+            snapshot = self._snapshot
+            fetched = snapshot.get(rss_item.url) if snapshot else None
+            if snapshot and fetched is not None and not error:
+                complete = len(to_persist) == len(new_torrents)
+                self._store_validators(
+                    rss_item, fetched, complete and snapshot.is_complete(rss_item.url)
+                )
         await self.db.commit()
         return events
 
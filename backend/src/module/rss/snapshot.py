@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from collections import defaultdict
+from urllib.parse import urlparse
+
+from module.models import RSSItem, Torrent
+from module.network import FeedFetch, RequestContent
+
+logger = logging.getLogger(__name__)
+
+# Delay between consecutive requests to the same host. Firing all feeds of one
+# site at once gets the whole batch rate-limited with HTTP 429 (#1026).
+RSS_PER_HOST_DELAY = 2.0
+
+
+class FeedSnapshot:
+    """一轮 RSS tick 内共享的订阅源快照。
+
+    聚合源先被 ``RSSAnalyser.rss_to_data`` 用来发现新番剧，随后又被
+    ``RSSEngine.refresh_rss`` 用来匹配下载；两者通过同一个快照取数据，每个
+    地址每轮只下载、解析一次，拿到的是同一份 ``list[Torrent]``。
+
+    同一站点的请求串行执行，且相邻两次真正发出的请求至少间隔
+    ``RSS_PER_HOST_DELAY``；命中快照的读取不发请求，也不等待。
+    """
+
+    def __init__(self, per_host_delay: float | None = None):
+        self._per_host_delay = per_host_delay
+        self._fetches: dict[str, FeedFetch] = {}
+        self._incomplete: set[str] = set()
+        self._url_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_last_request: dict[str, float] = {}
+
+    @property
+    def delay(self) -> float:
+        if self._per_host_delay is None:
+            return RSS_PER_HOST_DELAY
+        return self._per_host_delay
+
+    def get(self, url: str) -> FeedFetch | None:
+        """已拉取过的结果；本轮尚未拉取时返回 ``None``。"""
+        return self._fetches.get(url)
+
+    async def fetch(self, rss: RSSItem) -> FeedFetch:
+        async with self._url_locks[rss.url]:
+            cached = self._fetches.get(rss.url)
+            if cached is not None:
+                return cached
+            host = urlparse(rss.url).netloc
+            async with self._host_locks[host]:
+                loop = asyncio.get_running_loop()
+                last = self._host_last_request.get(host)
+                if last is not None and self.delay:
+                    wait = last + self.delay - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                try:
+                    async with RequestContent() as req:
+                        fetched = await req.get_feed(
+                            rss.url,
+                            etag=rss.etag,
+                            last_modified=rss.last_modified,
+                            content_hash=rss.content_hash,
+                        )
+                finally:
+                    self._host_last_request[host] = loop.time()
+            self._fetches[rss.url] = fetched
+            return fetched
+
+    async def torrents(self, rss: RSSItem) -> list[Torrent]:
+        """该源本轮的种子列表；源未变化（304 / 正文相同）时为空。"""
+        return (await self.fetch(rss)).torrents
+
+    def mark_incomplete(self, url: str) -> None:
+        """本轮对该源的处理没有完成（例如分析出错），不要记录条件请求校验值。"""
+        self._incomplete.add(url)
+
+    def is_complete(self, url: str) -> bool:
+        return url not in self._incomplete
@@ -5,7 +5,7 @@ from typing import TypeAlias
 
 from module.conf import settings
 from module.models import Bangumi, Movie, RSSItem, Torrent
-from module.network import RequestContent
+from module.network import RequestContent, SingleFlight
 from module.parser.analyser.tmdb_parser import tmdb_parser
 from module.rss import RSSAnalyser
 
@@ -32,6 +32,8 @@ _POSTER_CACHE_MAX = 512
 _poster_cache: "OrderedDict[str, dict[str, tuple[str | None, str | None]]]" = (
     OrderedDict()
 )
+# 多个搜索会话同时预览同一标题时只查一次 TMDB
+_preview_flight: "SingleFlight[tuple[str | None, str | None]]" = SingleFlight()
 
 
 def reset_cache() -> None:
@@ -40,6 +42,16 @@ def reset_cache() -> None:
     _poster_cache.clear()
 
 
+def cached_posters() -> set[str]:
+    """本地海报路径中仍被预览缓存引用的部分，海报回收时需保留。"""
+    return {
+        poster_link
+        for previews in _poster_cache.values()
+        for _, poster_link in previews.values()
+        if poster_link
+    }
+
+
 class SearchTorrent:
     def __init__(self):
         self.analyser = RSSAnalyser()
@@ -54,7 +66,14 @@ class SearchTorrent:
         if title in _poster_cache and language in _poster_cache[title]:
             _poster_cache.move_to_end(title)
             return _poster_cache[title][language]
+        return await _preview_flight.do(
+            (title, language), lambda: self._lookup_tmdb_preview(title, language)
+        )
 
+    @staticmethod
+    async def _lookup_tmdb_preview(
+        title: str, language: str
+    ) -> tuple[str | None, str | None]:
         localized_title = None
         poster_link = None
         try:
@@ -194,6 +194,7 @@ async def update_user_info(user_data: UserUpdate, current_user):
     try:
         async with Database() as db:
             await db.user.update_user(current_user, user_data)
+        auth_service.revoke_cached_principals()
         return True
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
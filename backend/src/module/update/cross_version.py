@@ -6,7 +6,6 @@ from urllib3.util import parse_url
 from module.database import Database
 from module.network import RequestContent
 from module.rss import RSSEngine
-from module.utils import save_image
 
 logger = logging.getLogger(__name__)
 
@@ -61,9 +60,8 @@ async def cache_image():
                     # not abort the whole migration for every other bangumi.
                     try:
                         # Hash local path
-                        img = await req.get_content(bangumi.poster_link)
                         suffix = bangumi.poster_link.split(".")[-1]
-                        img_path = await save_image(img, suffix)
+                        img_path = await req.get_poster(bangumi.poster_link, suffix)
                         if img_path:
                             bangumi.poster_link = img_path
                     except Exception as e:
@@ -0,0 +1,224 @@
+"""增量下载：用上一次留存的 bundle.zip 拼出新 bundle，只下载变化的成员。
+
+签名覆盖的是整个 zip 的字节，boot_overlay 每次启动也只认完整的已验签 zip，
+因此增量不能只落地变化的文件——这里逐字节重建新的 ``bundle.zip``：
+
+1. 用 ``Range: bytes=-N`` 取远端 zip 尾部，解析中央目录，得到每个成员的
+   ``[本地文件头, 下一个成员)`` 区间；
+2. 同名成员在两边 manifest 的 ``files`` 哈希相同（旧 bundle 没有 ``files``
+   时退回 CRC32/大小）、区间等长时，直接复制本地留存 zip 里的对应字节；
+3. 其余区间用 Range 请求下载，相邻区间合并以减少请求数。
+
+CI 以固定 mtime、``zip -X`` 打包，内容不变的成员字节也不变。拼出的结果照常
+走 sha256 + 验签；万一不一致（例如打包工具升级改变了压缩输出），调用方退回
+完整下载，安全边界不变。只处理非 zip64 的 bundle。
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD = struct.Struct("<4s4H2LH")
+_CENTRAL = struct.Struct("<4s6H3L5H2L")
+_LOCAL = struct.Struct("<4s5H3L2H")
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+
+# 首次探测取的尾部长度：EOCD 加上常见大小的中央目录
+TAIL_PROBE = 256 * 1024
+# 两个待下载区间之间可复用的字节少于此值时合并成一个请求
+MERGE_GAP = 64 * 1024
+# 需要下载的字节超过此比例时，增量不划算，直接完整下载
+MAX_DELTA_RATIO = 0.8
+
+
+class DeltaUnavailable(Exception):
+    """Remote or local bundle cannot be used for a delta download."""
+
+
+@dataclass(frozen=True)
+class ZipMember:
+    name: str
+    offset: int
+    crc: int
+    compress_size: int
+    file_size: int
+    method: int
+
+
+@dataclass(frozen=True)
+class ZipLayout:
+    """Member byte spans of one zip archive, keyed by member name."""
+
+    members: dict[str, ZipMember]
+    spans: dict[str, tuple[int, int]]
+    cd_offset: int
+    size: int
+
+
+def find_central_directory(tail: bytes, size: int) -> tuple[int, int]:
+    """``(offset, length)`` of the central directory from the archive tail."""
+    index = tail.rfind(EOCD_SIGNATURE)
+    if index < 0 or len(tail) - index < _EOCD.size:
+        raise DeltaUnavailable("end of central directory not found")
+    _, _, _, _, total, cd_size, cd_offset, _ = _EOCD.unpack_from(tail, index)
+    if total == 0xFFFF or cd_offset == 0xFFFFFFFF or cd_size == 0xFFFFFFFF:
+        raise DeltaUnavailable("zip64 bundles are not supported")
+    if cd_offset + cd_size > size:
+        raise DeltaUnavailable("central directory out of range")
+    return cd_offset, cd_size
+
+
+def parse_layout(central: bytes, cd_offset: int, size: int) -> ZipLayout:
+    """Parse a central directory into member spans."""
+    members: dict[str, ZipMember] = {}
+    pos = 0
+    while pos + _CENTRAL.size <= len(central):
+        fields = _CENTRAL.unpack_from(central, pos)
+        if fields[0] != _CENTRAL_SIGNATURE:
+            break
+        flags, method = fields[3], fields[4]
+        crc, compress_size, file_size = fields[7], fields[8], fields[9]
+        name_len, extra_len, comment_len = fields[10], fields[11], fields[12]
+        offset = fields[16]
+        start = pos + _CENTRAL.size
+        raw_name = central[start : start + name_len]
+        name = raw_name.decode("utf-8" if flags & 0x800 else "cp437")
+        members[name] = ZipMember(name, offset, crc, compress_size, file_size, method)
+        pos = start + name_len + extra_len + comment_len
+    ordered = sorted(members.values(), key=lambda m: m.offset)
+    spans: dict[str, tuple[int, int]] = {}
+    for member, following in zip(ordered, ordered[1:] + [None]):
+        end = following.offset if following is not None else cd_offset
+        spans[member.name] = (member.offset, end)
+    return ZipLayout(members=members, spans=spans, cd_offset=cd_offset, size=size)
+
+
+def read_layout(path: Path) -> ZipLayout:
+    """Layout of a local zip file."""
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        f.seek(max(0, size - TAIL_PROBE))
+        tail = f.read()
+        cd_offset, cd_size = find_central_directory(tail, size)
+        f.seek(cd_offset)
+        central = f.read(cd_size)
+    return parse_layout(central, cd_offset, size)
+
+
+def member_data(span: bytes, member: ZipMember) -> bytes:
+    """Decompress one member from the bytes of its span."""
+    fields = _LOCAL.unpack_from(span, 0)
+    if fields[0] != _LOCAL_SIGNATURE:
+        raise DeltaUnavailable(f"bad local header for {member.name}")
+    start = _LOCAL.size + fields[9] + fields[10]
+    raw = span[start : start + member.compress_size]
+    if member.method == 0:
+        return raw
+    if member.method == 8:
+        return zlib.decompress(raw, -15)
+    raise DeltaUnavailable(f"unsupported compression for {member.name}")
+
+
+def manifest_files(data: bytes | None) -> dict[str, str]:
+    """The per-file ``sha256`` map of a manifest, empty for older bundles."""
+    if not data:
+        return {}
+    try:
+        files = json.loads(data).get("files")
+    except (ValueError, AttributeError):
+        return {}
+    return files if isinstance(files, dict) else {}
+
+
+def reusable_members(
+    remote: ZipLayout,
+    local: ZipLayout,
+    remote_files: dict[str, str],
+    local_files: dict[str, str],
+) -> set[str]:
+    """Remote members whose bytes can be copied from the local archive."""
+    reusable = set()
+    for name, member in remote.members.items():
+        if name == "manifest.json":
+            continue
+        old = local.members.get(name)
+        if old is None:
+            continue
+        if (old.crc, old.compress_size, old.file_size, old.method) != (
+            member.crc,
+            member.compress_size,
+            member.file_size,
+            member.method,
+        ):
+            continue
+        if name in remote_files and remote_files[name] != local_files.get(name):
+            continue
+        start, end = remote.spans[name]
+        old_start, old_end = local.spans[name]
+        if end - start == old_end - old_start:
+            reusable.add(name)
+    return reusable
+
+
+Segment = tuple[str, int, int]
+
+
+def plan_segments(
+    remote: ZipLayout, local: ZipLayout, reusable: set[str]
+) -> list[Segment]:
+    """Ordered ``(source, start, end)`` pieces that rebuild the remote archive.
+
+    ``source`` is ``"local"`` (offsets into the local zip) or ``"remote"``
+    (offsets into the remote zip). The central directory is not included; the
+    caller already holds it from probing the tail.
+    """
+    segments: list[Segment] = []
+
+    def add(source: str, start: int, end: int) -> None:
+        if start >= end:
+            return
+        if segments:
+            last_source, last_start, last_end = segments[-1]
+            if last_source == source and last_end == start:
+                segments[-1] = (source, last_start, end)
+                return
+        segments.append((source, start, end))
+
+    position = 0
+    for name, (start, end) in sorted(remote.spans.items(), key=lambda s: s[1][0]):
+        add("remote", position, start)
+        if name in reusable:
+            old_start, old_end = local.spans[name]
+            add("local", old_start, old_end)
+        else:
+            add("remote", start, end)
+        position = end
+    add("remote", position, remote.cd_offset)
+    return _merge_small_gaps(segments)
+
+
+def _merge_small_gaps(segments: list[Segment]) -> list[Segment]:
+    """Fold short local runs between two remote ranges into one request."""
+    merged: list[Segment] = []
+    for segment in segments:
+        merged.append(segment)
+        if len(merged) < 3:
+            continue
+        first, middle, last = merged[-3:]
+        if (
+            first[0] == "remote"
+            and middle[0] == "local"
+            and last[0] == "remote"
+            and middle[2] - middle[1] < MERGE_GAP
+            and first[2] + (middle[2] - middle[1]) == last[1]
+        ):
+            merged[-3:] = [("remote", first[1], last[2])]
+    return merged
+
+
+def remote_bytes(segments: list[Segment]) -> int:
+    return sum(end - start for source, start, end in segments if source == "remote")
@@ -6,8 +6,9 @@
   不接受任意 URL。
 - ``check_update`` 查询 Release 列表，按 channel（stable / 含预发布的 beta）用
   semver 选出最新版本并与当前运行版本比较，结果缓存约 15 分钟。
-- ``apply_update`` 下载 bundle → 校验 sha256 → 解包读取 manifest → 检查
-  ``min_image_version`` 兼容性 → 原子地把 staging 提升为 current（旧 current
+- ``apply_update`` 下载 bundle（有留存的旧 bundle 时只下载变化的成员，见
+  ``module.update.delta``；中断的下载按 Range 续传）→ 校验 sha256 → 解包
+  读取 manifest → 检查 ``min_image_version`` 兼容性 → 原子地把 staging 提升为 current（旧 current
   移到 backup）→ 写入 applied.json。真正的“重启以生效”由 API 层触发（进程退出，
   交给 Docker 的 restart 策略重跑 entrypoint 的覆盖层逻辑）。
 - ``rollback`` 把 backup 换回 current（无 backup 则清除覆盖层回退到镜像版本）。
@@ -25,6 +26,7 @@ import sqlite3
 import subprocess
 import time
 import zipfile
+import zlib
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Callable, Optional
@@ -36,6 +38,7 @@ from pydantic import BaseModel
 from module.conf import IMAGE_VERSION, VERSION
 from module.database.migrations import CURRENT_SCHEMA_VERSION
 from module.network.request_url import get_shared_client
+from module.update import delta
 from module.update.signing import DEFAULT_PUBKEY_PATH, verify_bundle_signature
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,8 @@ _CACHE_TTL = 15 * 60
 DEFAULT_UPDATES_ROOT = Path("config") / "updates"
 
 _DL_HEADERS = {"User-Agent": "AutoBangumi-Updater"}
+# 单次 apply 内下载中断后按 Range 续传的次数
+_DOWNLOAD_ATTEMPTS = 3
 _API_HEADERS = {
     "Accept": "application/vnd.github+json",
     "X-GitHub-Api-Version": "2022-11-28",
@@ -131,6 +136,28 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+def _content_range_start(headers: httpx.Headers) -> Optional[int]:
+    """``Content-Range: bytes 100-199/1000`` 中的起点。"""
+    value = headers.get("content-range", "")
+    unit, _, spec = value.partition(" ")
+    first = spec.split("-", 1)[0]
+    return int(first) if unit == "bytes" and first.isdigit() else None
+
+
+def _content_range_total(headers: httpx.Headers) -> Optional[int]:
+    """``Content-Range`` 中的总长度（``*`` 或缺失时为 None）。"""
+    total = headers.get("content-range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _zip_manifest_files(path: Path) -> dict[str, str]:
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return delta.manifest_files(zf.read("manifest.json"))
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return {}
+
+
 def _reset_dir(path: Path) -> None:
     """清空并重建目录（用于 staging 暂存区）。"""
     if path.exists():
@@ -229,23 +256,160 @@ class Updater:
         resp.raise_for_status()
         return resp.text
 
-    async def _download_file(self, url: str, dest: Path) -> None:
+    async def _download_file(
+        self, url: str, dest: Path, partial: Optional[Path] = None
+    ) -> None:
+        """下载到 ``partial``（默认 ``dest.part``），完成后改名为 ``dest``。
+
+        已有的部分文件用 ``Range: bytes=<已下载>-`` 续传；服务器不支持 Range
+        （返回 200）时从头下载。传输中断在本次调用内最多重试
+        ``_DOWNLOAD_ATTEMPTS`` 次，之后抛出，部分文件留给下一次 apply。
+        """
         client = await self._get_client()
+        part = partial if partial is not None else dest.with_name(dest.name + ".part")
+        part.parent.mkdir(parents=True, exist_ok=True)
         dest.parent.mkdir(parents=True, exist_ok=True)
-        async with client.stream("GET", url, headers=_DL_HEADERS) as resp:
-            resp.raise_for_status()
-            total = int(resp.headers.get("content-length", 0) or 0)
-            done = 0
-            with open(dest, "wb") as f:
-                async for chunk in resp.aiter_bytes(1 << 16):
-                    f.write(chunk)
-                    done += len(chunk)
-                    if total:
-                        self._set_progress(
-                            phase="downloading",
-                            percent=min(100, int(done * 100 / total)),
-                            message="downloading bundle",
-                        )
+        for attempt in range(1, _DOWNLOAD_ATTEMPTS + 1):
+            offset = part.stat().st_size if part.exists() else 0
+            headers = dict(_DL_HEADERS)
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            try:
+                async with client.stream("GET", url, headers=headers) as resp:
+                    if resp.status_code == 416 and offset:
+                        # 部分文件已完整，或者比远端还长（不是同一个文件）
+                        if _content_range_total(resp.headers) == offset:
+                            break
+                        part.unlink()
+                        continue
+                    resp.raise_for_status()
+                    if offset and (
+                        resp.status_code != 206
+                        or _content_range_start(resp.headers) != offset
+                    ):
+                        offset = 0
+                    if offset:
+                        logger.info("Resuming bundle download at byte %d.", offset)
+                    total = offset + int(resp.headers.get("content-length", 0) or 0)
+                    done = offset
+                    with open(part, "ab" if offset else "wb") as f:
+                        # 不按固定块缓冲：断线前收到的字节都要落盘供续传
+                        async for chunk in resp.aiter_bytes():
+                            f.write(chunk)
+                            done += len(chunk)
+                            if total:
+                                self._set_progress(
+                                    phase="downloading",
+                                    percent=min(100, int(done * 100 / total)),
+                                    message="downloading bundle",
+                                )
+                break
+            except httpx.TransportError as exc:
+                if attempt == _DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning("Bundle download interrupted (%s); resuming.", exc)
+        else:
+            raise RuntimeError("bundle download did not complete")
+        os.replace(part, dest)
+
+    async def _download_range(
+        self, url: str, start: Optional[int], end: int
+    ) -> tuple[bytes, int]:
+        """``[start, end)`` 字节及远端总大小；``start`` 为 None 时取末尾 ``end`` 字节。"""
+        client = await self._get_client()
+        spec = f"bytes=-{end}" if start is None else f"bytes={start}-{end - 1}"
+        resp = await client.get(url, headers={**_DL_HEADERS, "Range": spec})
+        resp.raise_for_status()
+        total = _content_range_total(resp.headers)
+        if resp.status_code != 206 or total is None:
+            raise delta.DeltaUnavailable("server does not support range requests")
+        expected = min(end, total) if start is None else end - start
+        if len(resp.content) != expected:
+            raise delta.DeltaUnavailable("short range response")
+        return resp.content, total
+
+    async def _download_delta(self, url: str, base: Path, dest: Path) -> bool:
+        """用留存的 ``base`` zip 拼出远端 bundle，只下载变化部分。
+
+        返回 False 表示增量不划算（调用方改为完整下载）；远端或本地 zip
+        不可用时抛 ``DeltaUnavailable``。
+        """
+        tail, size = await self._download_range(url, None, delta.TAIL_PROBE)
+        tail_start = size - len(tail)
+        cd_offset, cd_size = delta.find_central_directory(tail, size)
+        if cd_offset < tail_start:
+            tail, _ = await self._download_range(url, cd_offset, size)
+            tail_start = cd_offset
+        central = tail[cd_offset - tail_start : cd_offset - tail_start + cd_size]
+        remote = delta.parse_layout(central, cd_offset, size)
+        local = await asyncio.to_thread(delta.read_layout, base)
+
+        remote_files: dict[str, str] = {}
+        manifest = remote.members.get("manifest.json")
+        if manifest is not None:
+            span, _ = await self._download_range(url, *remote.spans["manifest.json"])
+            remote_files = delta.manifest_files(delta.member_data(span, manifest))
+        local_files = await asyncio.to_thread(_zip_manifest_files, base)
+
+        reusable = delta.reusable_members(remote, local, remote_files, local_files)
+        segments = delta.plan_segments(remote, local, reusable)
+        needed = delta.remote_bytes(segments) + (size - cd_offset)
+        if needed > size * delta.MAX_DELTA_RATIO:
+            return False
+        logger.info(
+            "Delta update: reusing %d of %d files, downloading %d of %d bytes.",
+            len(reusable),
+            len(remote.members),
+            needed,
+            size,
+        )
+
+        part = dest.with_name(dest.name + ".part")
+        done = 0
+        with open(part, "wb") as out, open(base, "rb") as old:
+            for source, start, end in segments:
+                if source == "local":
+                    old.seek(start)
+                    out.write(old.read(end - start))
+                    continue
+                data, _ = await self._download_range(url, start, end)
+                out.write(data)
+                done += end - start
+                self._set_progress(
+                    phase="downloading",
+                    percent=min(100, int(done * 100 / needed)),
+                    message="downloading changed files",
+                )
+            out.write(tail[cd_offset - tail_start :])
+        os.replace(part, dest)
+        return True
+
+    async def _fetch_bundle(self, url: str, dest: Path, expected_hash: str) -> None:
+        """取得新 bundle：优先增量，失败或结果不符时回退到可续传的完整下载。"""
+        base = self.root / "bundle.zip"
+        if base.exists():
+            try:
+                if await self._download_delta(url, base, dest):
+                    actual = await asyncio.to_thread(_sha256_file, dest)
+                    if actual.lower() == expected_hash:
+                        return
+                    logger.info("Delta-built bundle does not match; full download.")
+            except (
+                delta.DeltaUnavailable,
+                httpx.HTTPError,
+                OSError,
+                ValueError,
+                zlib.error,
+            ) as exc:
+                logger.info("Delta update unavailable (%s); full download.", exc)
+        # 部分文件按目标哈希命名，换了版本就不会续上别的文件
+        downloads = self.root / "downloads"
+        partial = downloads / f"{expected_hash}.part"
+        if downloads.exists():
+            for stale in downloads.glob("*.part"):
+                if stale != partial:
+                    stale.unlink(missing_ok=True)
+        await self._download_file(url, dest, partial)
 
     # -------------------------------------------------------------- 检查
 
@@ -537,7 +701,7 @@ class Updater:
                 signature_b64 = await self._download_text(result.signature_url)
 
                 zip_path = staging / "bundle.zip"
-                await self._download_file(result.bundle_url, zip_path)
+                await self._fetch_bundle(result.bundle_url, zip_path, expected_hash)
 
                 self._set_progress(
                     phase="verifying", percent=100, message="verifying checksum"
@@ -1,23 +1,122 @@
+"""本地海报缓存。
+
+海报按内容的 sha256 命名（``posters/<sha256>.<suffix>``），同一张图只存一份，
+文件名变了内容就变了，因此可以对浏览器声明 ``immutable``。保存时在同一个
+线程里顺带生成两个 WebP 变体：海报墙用的缩略图 ``<hash>.thumb.webp`` 和全尺寸
+的 ``<hash>.full.webp``。旧版本以 md5 前 8 位命名的海报照常可读，变体在首次
+请求时补生成。
+
+Pillow 不可用或图片无法解码时不生成变体，调用方回退到原图。
+"""
+
 import asyncio
 import hashlib
+import logging
+import os
+import re
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+POSTER_DIR = "data/posters"
+THUMB_WIDTH = 320
+WEBP_QUALITY = 80
+VARIANT_SUFFIXES = {"thumb": ".thumb.webp", "webp": ".full.webp"}
+# 刚写入、还没来得及关联到番剧的海报（如搜索结果里的）一天内不回收
+GC_MIN_AGE = 24 * 60 * 60
+
+_CONTENT_HASH = re.compile(r"^[0-9a-f]{64}$")
+
+
+def poster_stem(name: str) -> str:
+    """``<hash>`` part shared by a poster and all of its variants."""
+    return name.split(".", 1)[0]
+
+
+def is_content_addressed(name: str) -> bool:
+    return bool(_CONTENT_HASH.match(poster_stem(name)))
+
+
+def variant_path(original: Path, variant: str) -> Path:
+    return original.with_name(poster_stem(original.name) + VARIANT_SUFFIXES[variant])
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def make_variants(original: Path) -> bool:
+    """Write every missing WebP variant of ``original``. Blocking.
+
+    Returns False when Pillow is missing or the image cannot be decoded.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.debug("Pillow unavailable; serving original posters only")
+        return False
+
+    targets = {
+        variant: variant_path(original, variant)
+        for variant in VARIANT_SUFFIXES
+        if not variant_path(original, variant).exists()
+    }
+    if not targets:
+        return True
+    try:
+        with Image.open(original) as opened:
+            opened.load()
+            image: Image.Image = opened
+            if image.mode not in ("RGB", "RGBA"):
+                image = opened.convert("RGBA" if "A" in opened.getbands() else "RGB")
+            for variant, target in targets.items():
+                out = image.copy()
+                if variant == "thumb" and out.width > THUMB_WIDTH:
+                    height = round(out.height * THUMB_WIDTH / out.width)
+                    out = out.resize((THUMB_WIDTH, height), Image.Resampling.LANCZOS)
+                tmp = target.with_name(f".{target.name}.tmp")
+                out.save(tmp, format="WEBP", quality=WEBP_QUALITY, method=4)
+                os.replace(tmp, target)
+    except Exception as e:
+        logger.debug("Cannot build poster variants for %s: %s", original.name, e)
+        return False
+    return True
+
+
+def ensure_variant(original: Path, variant: str) -> Path | None:
+    """The variant file for ``original``, generating it if needed. Blocking."""
+    target = variant_path(original, variant)
+    if target.exists():
+        return target
+    if make_variants(original) and target.exists():
+        return target
+    return None
 
 
 async def save_image(img: bytes | None, suffix: str) -> str | None:
-    """保存图片到本地缓存。文件写入是同步阻塞的，放到线程池中执行，避免
-    在 RSS/通知等异步热路径上阻塞事件循环。"""
+    """保存图片到本地缓存并生成 WebP 变体。文件写入和图片缩放是同步阻塞的，
+    放到线程池中执行，避免在 RSS/通知等异步热路径上阻塞事件循环。"""
     if img is None:
         # Fetching the poster failed upstream; skip caching instead of
-        # crashing on hashlib.md5(None).
+        # crashing on hashing None.
         return None
-    img_hash = hashlib.md5(img).hexdigest()[0:8]
-    image_path = f"data/posters/{img_hash}.{suffix}"
+    name = f"{hashlib.sha256(img).hexdigest()}.{suffix}"
+    image_path = Path(POSTER_DIR) / name
 
     def _write() -> None:
-        with open(image_path, "wb") as f:
-            f.write(img)
+        if image_path.exists():
+            # 再次用到的海报刷新 mtime，回收时按最近一次使用计龄
+            os.utime(image_path)
+        else:
+            _write_atomic(image_path, img)
+        make_variants(image_path)
 
     await asyncio.to_thread(_write)
-    return f"posters/{img_hash}.{suffix}"
+    return f"posters/{name}"
 
 
 async def load_image(img_path: str | None) -> bytes | None:
@@ -30,3 +129,33 @@ async def load_image(img_path: str | None) -> bytes | None:
             return f.read()
 
     return await asyncio.to_thread(_read)
+
+
+def collect_posters(links: Iterable[str | None], min_age: float = GC_MIN_AGE) -> int:
+    """Delete cached posters (and variants) no ``links`` entry points at. Blocking.
+
+    ``links`` are ``poster_link`` values; remote URLs are ignored. Files
+    younger than ``min_age`` seconds are kept so a poster saved just before
+    its bangumi row is committed survives. Returns the number of files removed.
+    """
+    referenced = {
+        poster_stem(link.removeprefix("posters/"))
+        for link in links
+        if link and link.startswith("posters/")
+    }
+    base = Path(POSTER_DIR)
+    if not base.is_dir():
+        return 0
+    cutoff = time.time() - min_age
+    removed = 0
+    for path in base.iterdir():
+        if not path.is_file() or poster_stem(path.name) in referenced:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.debug("Cannot remove poster %s: %s", path.name, e)
+    return removed
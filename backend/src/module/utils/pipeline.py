@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import TypeVar
+
+from module.conf import settings
+from module.network import HostRateLimiter, host_rate_limit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class PipelineProgress:
+    """一次批量任务的进度快照，供 ``/bangumi/refresh/progress`` 查询。
+
+    ``stages`` 是调用方按阶段累计的耗时（秒），多个 worker 的耗时相加。
+    """
+
+    name: str
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    running: bool = False
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    stages: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# 每种任务只保留最近一次的进度
+_progress: dict[str, PipelineProgress] = {}
+
+
+def get_progress() -> list[PipelineProgress]:
+    return list(_progress.values())
+
+
+def reset_progress() -> None:
+    _progress.clear()
+
+
+async def run_pipeline(
+    name: str,
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    *,
+    concurrency: int | None = None,
+    host_rate: float | None = None,
+    stages: dict[str, float] | None = None,
+    verbose: bool = True,
+) -> list[R | None]:
+    """用固定数量的 worker 并发处理 ``items``，结果按输入顺序返回。
+
+    worker 抛出的异常只记日志并计入 ``failed``，对应位置的结果为 ``None``，
+    不影响其它条目。期间所有经 ``RequestURL`` 发出的 GET 请求按主机限速。
+    未指定时并发数与限速取自 ``settings.network``。
+
+    ``stages`` 原样挂到进度快照上，调用方在 worker 里累加即可实时可见。
+    周期任务传 ``verbose=False``，进度日志降为 DEBUG。
+    """
+    network = settings.network
+    if concurrency is None:
+        concurrency = network.metadata_concurrency
+    if host_rate is None:
+        host_rate = network.metadata_host_rate
+    queue = list(items)
+    results: list[R | None] = [None] * len(queue)
+    progress = PipelineProgress(name=name, total=len(queue), running=True)
+    if stages is not None:
+        progress.stages = stages
+    log_level = logging.INFO if verbose else logging.DEBUG
+    _progress[name] = progress
+    # 大约每完成 10% 记一行进度日志
+    log_step = max(1, len(queue) // 10)
+    pending = iter(enumerate(queue))
+
+    async def drain() -> None:
+        # 共享迭代器在两次 await 之间取值，worker 之间不会拿到同一条目
+        for index, item in pending:
+            try:
+                results[index] = await worker(item)
+            except Exception as e:
+                progress.failed += 1
+                logger.warning(f"[{name}] Item {index} failed: {e}")
+            progress.done += 1
+            if progress.done % log_step == 0 and progress.done < progress.total:
+                logger.log(log_level, f"[{name}] {progress.done}/{progress.total} done")
+
+    try:
+        with host_rate_limit(HostRateLimiter(host_rate)):
+            workers = min(max(1, concurrency), len(queue))
+            await asyncio.gather(*(drain() for _ in range(workers)))
+    finally:
+        progress.running = False
+        progress.finished_at = time.time()
+    logger.log(
+        log_level,
+        f"[{name}] Finished {progress.done}/{progress.total}, "
+        f"{progress.failed} failed, in {progress.finished_at - progress.started_at:.1f}s",
+    )
+    return results
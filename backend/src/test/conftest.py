@@ -40,6 +40,31 @@ def _reset_downloader_client_cache():
     _reset_client_cache()
 
 
+@pytest.fixture(autouse=True)
+def _reset_tmdb_response_cache():
+    """Clear the module-level TMDB response cache between tests.
+
+    Responses are cached per (kind, query, language) regardless of which mock
+    produced them, so one test's fixture data would otherwise answer the next
+    test's lookups.
+    """
+    from module.parser.analyser.tmdb_parser import reset_response_cache
+
+    reset_response_cache()
+    yield
+    reset_response_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_torrent_cache(tmp_path, monkeypatch):
+    """Give every test an empty .torrent cache under its own temp dir."""
+    from module.downloader.torrent_cache import TorrentCache
+
+    monkeypatch.setattr(
+        "module.downloader.torrent_cache._cache", TorrentCache(tmp_path / "torrents")
+    )
+
+
 # ---------------------------------------------------------------------------
 # Database Fixtures
 # ---------------------------------------------------------------------------
@@ -134,6 +159,12 @@ def mock_qb_client():
     client.torrents_info.return_value = []
     client.torrent_exists.return_value = False
     client.torrents_files.return_value = []
+
+    async def _files_many(torrent_hashes):
+        # 逐个委托给 torrents_files，测试里对它设置的返回值/side_effect 照常生效
+        return {h: await client.torrents_files(torrent_hash=h) for h in torrent_hashes}
+
+    client.torrents_files_many.side_effect = _files_many
     client.torrents_rename_file.return_value = RenameResult(RenameOutcome.RENAMED)
     client.add_torrents.return_value = AddResult.ADDED
     client.torrents_delete.return_value = None
@@ -89,13 +89,76 @@ class TestGetBangumi:
     def test_get_all(self, authed_client, mock_db):
         """GET /bangumi/get/all returns list of Bangumi."""
         mock_bangumi = [make_bangumi(id=1), make_bangumi(id=2, title_raw="Other")]
-        mock_db.bangumi.search_all = AsyncMock(return_value=mock_bangumi)
+        mock_db.bangumi.search_page = AsyncMock(return_value=(mock_bangumi, None))
 
         response = authed_client.get("/api/v1/bangumi/get/all")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_get_all_paginates_and_projects(self, authed_client, mock_db):
+        """limit/fields/sort are passed through; the next cursor is a header."""
+        page = [make_bangumi(id=3, official_title="Alpha")]
+        mock_db.bangumi.search_page = AsyncMock(return_value=(page, ["Alpha", 3]))
+
+        response = authed_client.get(
+            "/api/v1/bangumi/get/all",
+            params={
+                "limit": 1,
+                "sort": "-official_title",
+                "fields": "id,official_title",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": 3, "official_title": "Alpha"}]
+        kwargs = mock_db.bangumi.search_page.call_args.kwargs
+        assert kwargs["sort"] == "official_title"
+        assert kwargs["descending"] is True
+        assert kwargs["limit"] == 1
+
+        cursor = response.headers["X-Next-Cursor"]
+        authed_client.get("/api/v1/bangumi/get/all", params={"cursor": cursor})
+        assert mock_db.bangumi.search_page.call_args.kwargs["after"] == ["Alpha", 3]
+
+    def test_get_all_rejects_unknown_sort_and_fields(self, authed_client, mock_db):
+        mock_db.bangumi.search_page = AsyncMock(return_value=([], None))
+
+        assert (
+            authed_client.get("/api/v1/bangumi/get/all?sort=poster_link").status_code
+            == 422
+        )
+        assert (
+            authed_client.get("/api/v1/bangumi/get/all?fields=nope").status_code == 422
+        )
+        assert (
+            authed_client.get("/api/v1/bangumi/get/all?cursor=%%%").status_code == 400
+        )
+
+    def test_get_all_not_modified(self, authed_client, mock_db):
+        """A matching If-None-Match skips the query and returns 304."""
+        mock_db.bangumi.search_page = AsyncMock(
+            return_value=([make_bangumi(id=1)], None)
+        )
+
+        first = authed_client.get("/api/v1/bangumi/get/all")
+        etag = first.headers["ETag"]
+        mock_db.bangumi.search_page.reset_mock()
+
+        second = authed_client.get(
+            "/api/v1/bangumi/get/all", headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        mock_db.bangumi.search_page.assert_not_called()
+        # 查询参数不同则 ETag 不同
+        other = authed_client.get(
+            "/api/v1/bangumi/get/all?archived=true", headers={"If-None-Match": etag}
+        )
+        assert other.status_code == 200
 
     def test_get_by_id(self, authed_client):
         """GET /bangumi/get/{id} returns single Bangumi."""
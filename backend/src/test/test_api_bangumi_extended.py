@@ -140,6 +140,19 @@ class TestRefreshBangumi:
 
         assert response.status_code == 200
 
+    def test_refresh_progress(self, authed_client):
+        """GET /bangumi/refresh/progress reports the latest pipeline runs."""
+        from module.utils.pipeline import PipelineProgress
+
+        progress = PipelineProgress(name="refresh_metadata", total=10, done=4)
+        with patch("module.api.bangumi.get_progress", return_value=[progress]):
+            response = authed_client.get("/api/v1/bangumi/refresh/progress")
+
+        assert response.status_code == 200
+        [item] = response.json()
+        assert item["name"] == "refresh_metadata"
+        assert (item["total"], item["done"], item["failed"]) == (10, 4, 0)
+
 
 # ---------------------------------------------------------------------------
 # Offset endpoints
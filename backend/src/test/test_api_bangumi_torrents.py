@@ -88,6 +88,57 @@ class TestAuthRequired:
         assert response.status_code == 401
 
 
+# ---------------------------------------------------------------------------
+# Torrent history stats
+# ---------------------------------------------------------------------------
+
+
+class TestTorrentStats:
+    def test_stats_merge_counts_storage_and_limits(self, authed_client, mock_db):
+        mock_db.torrent.stats = AsyncMock(
+            return_value={
+                "total": 5,
+                "downloaded": 2,
+                "orphans": 1,
+                "fingerprints": 40,
+                "per_feed": {1: 5},
+            }
+        )
+        mock_db.storage_stats = AsyncMock(
+            return_value={"db_bytes": 4096, "free_bytes": 0}
+        )
+        with patch("module.api.bangumi.settings") as mock_settings:
+            mock_settings.bangumi_manage.torrent_retention_days = 30
+            mock_settings.bangumi_manage.torrent_retention_count = 100
+            response = authed_client.get("/api/v1/bangumi/torrents/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["fingerprints"] == 40
+        assert data["per_feed"] == {"1": 5}
+        assert data["db_bytes"] == 4096
+        assert data["retention_days"] == 30
+
+    def test_stats_unauthorized(self, unauthed_client):
+        response = unauthed_client.get("/api/v1/bangumi/torrents/stats")
+        assert response.status_code == 401
+
+
+class TestEpisodeIndexRebuild:
+    def test_rebuild_reports_count(self, authed_client, mock_db):
+        mock_db.episode_index.rebuild = AsyncMock(return_value=12)
+        response = authed_client.post("/api/v1/bangumi/torrents/episode-index/rebuild")
+        assert response.status_code == 200
+        assert "12" in response.json()["msg_en"]
+        mock_db.episode_index.rebuild.assert_awaited_once()
+
+    def test_rebuild_unauthorized(self, unauthed_client):
+        response = unauthed_client.post(
+            "/api/v1/bangumi/torrents/episode-index/rebuild"
+        )
+        assert response.status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # Orphan torrents
 # ---------------------------------------------------------------------------
@@ -7,6 +7,8 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from module.api import v1
+from module.api.listing import encode_cursor
+from module.core.completion import CompletionQueue
 from module.models import RenameOperation
 from module.security.api import get_current_user
 
@@ -20,6 +22,8 @@ def app():
     """Create a FastAPI app with v1 routes for testing."""
     app = FastAPI()
     app.include_router(v1, prefix="/api")
+    app.state.ctx = MagicMock()
+    app.state.ctx.completions = CompletionQueue()
     return app
 
 
@@ -63,6 +67,7 @@ def mock_download_client():
     client.pause_torrent.return_value = None
     client.resume_torrent.return_value = None
     client.delete_torrent.return_value = True
+    client.apply_mutations.return_value = True
     return client
 
 
@@ -173,6 +178,74 @@ class TestOtherAuthRequired:
         )
         assert response.status_code == 401
 
+    @patch("module.security.api.DEV_AUTH_BYPASS", False)
+    def test_completed_hook_unauthorized(self, unauthed_client):
+        response = unauthed_client.post(
+            "/api/v1/downloader/completed", params={"hash": "a" * 40}
+        )
+        assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# POST /downloader/completed
+# ---------------------------------------------------------------------------
+
+
+class TestCompletedHook:
+    def test_queues_hash(self, app, authed_client):
+        response = authed_client.post(
+            "/api/v1/downloader/completed", params={"hash": "AB" * 20}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] is True
+        assert app.state.ctx.completions.drain() == ["ab" * 20]
+
+    def test_rejects_malformed_hash(self, app, authed_client):
+        response = authed_client.post(
+            "/api/v1/downloader/completed", params={"hash": "%I"}
+        )
+
+        assert response.status_code == 400
+        assert len(app.state.ctx.completions) == 0
+
+
+# ---------------------------------------------------------------------------
+# POST /downloader/torrents/rename
+# ---------------------------------------------------------------------------
+
+
+class TestRenameTorrents:
+    def test_renames_requested_hashes(self, authed_client, mock_download_client):
+        renamer = MagicMock()
+        renamed = [MagicMock(), MagicMock()]
+        renamer.rename_hashes = AsyncMock(return_value=renamed)
+        renamer.events = [MagicMock()]
+        with (
+            patch("module.api.downloader.DownloadClient") as MockClient,
+            patch("module.api.downloader.Renamer", return_value=renamer) as MockRenamer,
+            patch(
+                "module.api.downloader.notify_renames", new_callable=AsyncMock
+            ) as notify,
+        ):
+            MockClient.return_value.__aenter__ = AsyncMock(
+                return_value=mock_download_client
+            )
+            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            response = authed_client.post(
+                "/api/v1/downloader/torrents/rename",
+                json={"hashes": ["abc123", "def456"]},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["renamed"] == 2
+        MockRenamer.assert_called_once_with(mock_download_client)
+        renamer.rename_hashes.assert_awaited_once_with(["abc123", "def456"])
+        # 手动重命名与周期任务一样上报冲突和剧集通知
+        notify.assert_awaited_once_with(
+            authed_client.app.state.ctx.notifier, renamer.events, renamed
+        )
+
 
 # ---------------------------------------------------------------------------
 # GET /downloader/torrents
@@ -209,6 +282,58 @@ class TestGetTorrents:
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_get_torrents_paginates_by_name(self, authed_client, mock_download_client):
+        """limit + cursor walk the list in sort order; If-None-Match gives 304."""
+        with patch("module.api.downloader.DownloadClient") as MockClient:
+            MockClient.return_value.__aenter__ = AsyncMock(
+                return_value=mock_download_client
+            )
+            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+
+            first = authed_client.get(
+                "/api/v1/downloader/torrents",
+                params={"sort": "-name", "limit": 1, "fields": "hash"},
+            )
+            cursor = first.headers["X-Next-Cursor"]
+            second = authed_client.get(
+                "/api/v1/downloader/torrents",
+                params={"sort": "-name", "limit": 1, "cursor": cursor},
+            )
+            cached = authed_client.get(
+                "/api/v1/downloader/torrents",
+                params={"sort": "-name", "limit": 1, "fields": "hash"},
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+            bad = authed_client.get("/api/v1/downloader/torrents?sort=progress")
+
+        assert first.json() == [{"hash": "def456"}]
+        assert [t["hash"] for t in second.json()] == ["abc123"]
+        assert "X-Next-Cursor" not in second.headers
+        assert cached.status_code == 304
+        assert bad.status_code == 422
+
+    def test_get_torrents_rejects_cursor_of_another_sort(
+        self, authed_client, mock_download_client
+    ):
+        """A cursor made for sort=added_on is a 400 under sort=name, not a 500."""
+        with patch("module.api.downloader.DownloadClient") as MockClient:
+            MockClient.return_value.__aenter__ = AsyncMock(
+                return_value=mock_download_client
+            )
+            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+
+            response = authed_client.get(
+                "/api/v1/downloader/torrents",
+                params={
+                    "sort": "name",
+                    "limit": 1,
+                    "cursor": encode_cursor([123, "abc123"]),
+                },
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
 
 # ---------------------------------------------------------------------------
 # POST /downloader/torrents/pause
@@ -483,10 +608,9 @@ class TestAutoTagTorrents:
         assert data["tagged_count"] == 2
         # The untagged torrent and the ab:renamed-only torrent get linked;
         # the ab:456 one is skipped
-        assert mock_download_client.add_tag.call_args_list == [
-            (("abc123", "ab:123"),),
-            (("ghi789", "ab:123"),),
-        ]
+        mock_download_client.add_tag.assert_not_called()
+        batch = mock_download_client.apply_mutations.await_args.args[0]
+        assert batch.tags == {"ab:123": ["abc123", "ghi789"]}
 
     def test_auto_tag_no_matches(self, authed_client, mock_download_client):
         """POST /downloader/torrents/tag/auto handles unmatched torrents."""
@@ -520,6 +644,8 @@ class TestAutoTagTorrents:
         assert data["unmatched_count"] == 1
         assert len(data["unmatched"]) == 1
         mock_download_client.add_tag.assert_not_called()
+        batch = mock_download_client.apply_mutations.await_args.args[0]
+        assert len(batch) == 0
 
 
 class TestDeleteTorrentsFailure:
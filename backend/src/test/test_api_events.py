@@ -151,7 +151,7 @@ class TestEventGeneratorNonBlocking:
         """With an unreachable downloader, the stream still yields the status
         event promptly and emits an explicit null downloader payload instead
         of stalling the whole connection."""
-        from module.api.events import _event_generator
+        from module.api.events import EventHub, _event_generator
 
         request = AsyncMock()
         request.is_disconnected = AsyncMock(return_value=False)
@@ -163,22 +163,27 @@ class TestEventGeneratorNonBlocking:
         mock_client = _make_hung_client(cancelled)
 
         with (
+            patch("module.api.events._hub", EventHub()),
             patch("module.api.events.DownloadClient", return_value=mock_client),
             patch("module.api.events._DOWNLOADER_TIMEOUT_SECONDS", 0.05),
             patch("module.api.events.LOG_PATH", tmp_path / "missing.log"),
+            patch(
+                "module.api.events._notification_payload",
+                new=AsyncMock(side_effect=RuntimeError("no db")),
+            ),
         ):
             gen = _event_generator(request, ctx)
             try:
-                # 第一个 tick 内 status 与 downloader 事件都应在超时上限内到达
-                status_event = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
-                downloader_event = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
+                # status 与 downloader 事件都应在超时上限内到达
+                first = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
+                second = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
             finally:
                 await gen.aclose()
 
-        assert status_event["event"] == "status"
-        assert json.loads(status_event["data"])["status"] is True
-        assert downloader_event["event"] == "downloader"
-        assert json.loads(downloader_event["data"]) is None
+        by_name = {e["event"]: e for e in (first, second)}
+        assert first["event"] == "status"
+        assert json.loads(by_name["status"]["data"])["status"] is True
+        assert json.loads(by_name["downloader"]["data"]) is None
 
 
 class TestLogPayload:
@@ -191,9 +196,9 @@ class TestLogPayload:
         assert result is None
 
     async def test_log_payload_reads_tail(self, tmp_path):
-        """_log_payload decodes the tail bytes read via _read_log_tail.
+        """Without a cursor _log_payload returns the whole tail as a reset.
 
-        _read_log_tail (imported from module.api.log) resolves LOG_PATH via
+        _read_log_since (imported from module.api.log) resolves LOG_PATH via
         its own module binding, so both names must be patched together.
         """
         log_file = tmp_path / "app.log"
@@ -205,84 +210,224 @@ class TestLogPayload:
         ):
             result = await _log_payload()
 
-        assert result == "hello world\n"
+        assert result is not None
+        assert result.data == b"hello world\n"
+        assert result.reset is True
+
+
+class TestLogDeltas:
+    async def test_appended_lines_are_pushed_as_deltas(self, tmp_path):
+        from module.api.events import EventHub
+
+        log_file = tmp_path / "app.log"
+        log_file.write_text("first\n")
+        hub = EventHub()
+        with (
+            patch("module.api.events.LOG_PATH", log_file),
+            patch("module.api.log.LOG_PATH", log_file),
+        ):
+            queue: asyncio.Queue[dict] = asyncio.Queue()
+            hub._subscribers.add(queue)
+            await hub._produce_log()
+            await hub._produce_log()  # 无新内容：不推送
+            with log_file.open("a") as f:
+                f.write("second\n")
+            await hub._produce_log()
+
+            late = hub.subscribe(_ctx())
+            replayed = late.get_nowait()
+            await hub.stop()
+
+        frames = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert frames == [
+            {"event": "log", "data": "first\n"},
+            {"event": "log_append", "data": "second\n"},
+        ]
+        assert replayed == {"event": "log", "data": "first\nsecond\n"}
+
+    async def test_dropped_delta_resyncs_with_full_log(self):
+        from module.api.events import EventHub
+
+        hub = EventHub()
+        queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=1)
+        hub._subscribers.add(queue)
+        hub._log_text = "a\nb\n"
+        hub._publish_log_append("b\n")
+        hub.publish("status", "{}")  # 挤掉未读的 log_append
+
+        queue.get_nowait()
+        hub._log_text = "a\nb\nc\n"
+        hub._publish_log_append("c\n")
+
+        assert queue.get_nowait() == {"event": "log", "data": "a\nb\nc\n"}
+
+    async def test_dropped_snapshot_resyncs_with_full_log(self):
+        from module.api.events import EventHub
+
+        hub = EventHub()
+        queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=1)
+        hub._subscribers.add(queue)
+        hub._log_text = "a\n"
+        hub._put(queue, {"event": "log", "data": "a\n"})
+        hub.publish("status", "{}")  # 挤掉未读的完整快照
+
+        queue.get_nowait()
+        hub._log_text = "a\nb\n"
+        hub._publish_log_append("b\n")
+
+        assert queue.get_nowait() == {"event": "log", "data": "a\nb\n"}
 
 
 # ---------------------------------------------------------------------------
-# notification event（通知中心未读数推送）
+# EventHub（所有连接共享一组生产者）
 # ---------------------------------------------------------------------------
 
 
-class TestNotificationEvent:
-    def _generator(self, tmp_path):
-        from module.api.events import _event_generator
+def _ctx():
+    ctx = MagicMock()
+    ctx.is_running = True
+    ctx.first_run = False
+    return ctx
 
-        request = AsyncMock()
-        request.is_disconnected = AsyncMock(return_value=False)
-        ctx = MagicMock()
-        ctx.is_running = True
-        ctx.first_run = False
-        patches = (
-            patch(
-                "module.api.events._downloader_payload",
-                new=AsyncMock(return_value=None),
-            ),
-            patch("module.api.events.LOG_PATH", tmp_path / "missing.log"),
-            patch(
-                "module.api.events._notification_payload",
-                new=AsyncMock(return_value={"unread_count": 2, "latest_id": 9}),
-            ),
-            patch("module.api.events.asyncio.sleep", new=AsyncMock()),
-        )
-        return _event_generator(request, ctx), patches
 
-    async def _collect(self, gen, n):
-        events = []
-        for _ in range(n):
-            events.append(await asyncio.wait_for(gen.__anext__(), timeout=1.0))
-        return events
+async def _drain(queue, n):
+    return [await asyncio.wait_for(queue.get(), timeout=1.0) for _ in range(n)]
+
+
+@pytest.fixture
+def hub_patches(tmp_path):
+    """快节拍 + 可计数的负载函数；返回 (downloader, notification) 两个 mock。"""
+    downloader = AsyncMock(return_value=[{"hash": "a"}])
+    notification = AsyncMock(return_value={"unread_count": 2, "latest_id": 9})
+    with (
+        patch("module.api.events._TICK_SECONDS", 0.01),
+        patch("module.api.events._downloader_payload", new=downloader),
+        patch("module.api.events._notification_payload", new=notification),
+        patch("module.api.events.LOG_PATH", tmp_path / "missing.log"),
+    ):
+        yield downloader, notification
 
-    async def test_first_tick_emits_notification_frame(self, tmp_path):
-        from module.notification.inbox import inbox_revision
 
-        gen, patches = self._generator(tmp_path)
-        with patches[0], patches[1], patches[2], patches[3]:
+class TestEventHub:
+    async def test_payloads_computed_once_for_all_subscribers(self, hub_patches):
+        from module.api.events import EventHub
+
+        downloader, _ = hub_patches
+        hub = EventHub()
+        with patch("module.api.events._DOWNLOADER_EVERY", 10_000):
+            first = hub.subscribe(_ctx())
+            second = hub.subscribe(_ctx())
             try:
-                events = await self._collect(gen, 3)
+                events_a = {e["event"] for e in await _drain(first, 3)}
+                events_b = {e["event"] for e in await _drain(second, 3)}
+                assert hub.subscriber_count == 2
             finally:
-                await gen.aclose()
+                await hub.unsubscribe(first)
+                await hub.unsubscribe(second)
+
+        assert events_a == events_b == {"status", "downloader", "notification"}
+        assert downloader.await_count == 1
+
+    async def test_late_subscriber_receives_latest_frames(self, hub_patches):
+        from module.api.events import EventHub
+
+        hub = EventHub()
+        with (
+            patch("module.api.events._STATUS_EVERY", 10_000),
+            patch("module.api.events._DOWNLOADER_EVERY", 10_000),
+        ):
+            first = hub.subscribe(_ctx())
+            try:
+                await _drain(first, 3)
+                late = hub.subscribe(_ctx())
+                replayed = {e["event"] for e in await _drain(late, 3)}
+                await hub.unsubscribe(late)
+            finally:
+                await hub.unsubscribe(first)
+
+        assert replayed == {"status", "downloader", "notification"}
+
+    async def test_slow_consumer_drops_oldest_frames(self):
+        from module.api.events import _SUBSCRIBER_QUEUE_SIZE, EventHub
+
+        hub = EventHub()
+        queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        hub._subscribers.add(queue)
+
+        for i in range(_SUBSCRIBER_QUEUE_SIZE + 5):
+            hub.publish("status", str(i))
+
+        frames = [queue.get_nowait()["data"] for _ in range(queue.qsize())]
+        assert frames[0] == "5"
+        assert frames[-1] == str(_SUBSCRIBER_QUEUE_SIZE + 4)
+        assert hub.dropped_frames == 5
+
+    async def test_producers_stop_with_last_subscriber(self, hub_patches):
+        from module.api.events import EventHub
+
+        hub = EventHub()
+        queue = hub.subscribe(_ctx())
+        tasks = list(hub._tasks)
+        await hub.unsubscribe(queue)
+
+        assert hub.subscriber_count == 0
+        assert hub._tasks == []
+        assert all(t.done() for t in tasks)
+
+    async def test_stats_endpoint_reports_subscribers(self, app):
+        from module.api.events import EventHub
+        from module.security.api import get_current_user
+
+        hub = EventHub()
+        hub._subscribers.add(asyncio.Queue())
+        app.dependency_overrides[get_current_user] = lambda: "admin"
+        with patch("module.api.events._hub", hub):
+            response = TestClient(app).get("/api/v1/events/stats")
+
+        assert response.json() == {"subscribers": 1, "dropped_frames": 0}
+
+
+# ---------------------------------------------------------------------------
+# notification event（通知中心未读数推送）
+# ---------------------------------------------------------------------------
+
+
+class TestNotificationEvent:
+    async def test_first_frame_carries_revision(self, hub_patches):
+        from module.api.events import EventHub
+        from module.notification.inbox import inbox_revision
+
+        hub = EventHub()
+        queue = hub.subscribe(_ctx())
+        try:
+            events = await _drain(queue, 3)
+        finally:
+            await hub.unsubscribe(queue)
 
         by_name = {e["event"]: e for e in events}
-        assert set(by_name) == {"status", "downloader", "notification"}
         data = json.loads(by_name["notification"]["data"])
         assert data["unread_count"] == 2
         assert data["latest_id"] == 9
         assert data["revision"] == inbox_revision()
 
-    async def test_no_frame_when_revision_unchanged(self, tmp_path):
-        gen, patches = self._generator(tmp_path)
-        with patches[0], patches[1], patches[2], patches[3]:
-            try:
-                await self._collect(gen, 3)  # 第一个 tick
-                # tick3 status、tick5 downloader —— 中间不应再有 notification
-                more = await self._collect(gen, 2)
-            finally:
-                await gen.aclose()
-
-        assert [e["event"] for e in more] == ["status", "downloader"]
-
-    async def test_frame_emitted_after_revision_bump(self, tmp_path):
+    async def test_inbox_queried_only_on_revision_change(self, hub_patches):
+        from module.api.events import EventHub
         from module.notification.inbox import bump_inbox_revision, inbox_revision
 
-        gen, patches = self._generator(tmp_path)
-        with patches[0], patches[1], patches[2], patches[3]:
-            try:
-                await self._collect(gen, 3)  # 第一个 tick
-                bump_inbox_revision()
-                # tick3：status + notification（修订号变了）
-                more = await self._collect(gen, 2)
-            finally:
-                await gen.aclose()
-
-        assert [e["event"] for e in more] == ["status", "notification"]
-        assert json.loads(more[1]["data"])["revision"] == inbox_revision()
+        _, notification = hub_patches
+        hub = EventHub()
+        queue = hub.subscribe(_ctx())
+        try:
+            await _drain(queue, 3)
+            await asyncio.sleep(0.1)  # 多个通知节拍，修订号未变
+            assert notification.await_count == 1
+            bump_inbox_revision()
+            while True:
+                frame = await asyncio.wait_for(queue.get(), timeout=1.0)
+                if frame["event"] == "notification":
+                    break
+        finally:
+            await hub.unsubscribe(queue)
+
+        assert notification.await_count == 2
+        assert json.loads(frame["data"])["revision"] == inbox_revision()
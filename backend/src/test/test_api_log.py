@@ -152,6 +152,68 @@ class TestGetLog:
         assert _read_file_tail(missing, 100) == (b"", False)
 
 
+class TestLogCursor:
+    def _get(self, client, log_path, since=None):
+        params = {"since": since} if since else None
+        with patch("module.api.log.LOG_PATH", log_path):
+            return client.get("/api/v1/log", params=params)
+
+    def test_since_returns_only_new_lines(self, authed_client, temp_log_file):
+        first = self._get(authed_client, temp_log_file)
+        assert first.headers["X-Log-Reset"] == "1"
+        with temp_log_file.open("a") as f:
+            f.write("2024-01-01 12:00:01 INFO Second entry\n")
+
+        second = self._get(authed_client, temp_log_file, first.headers["X-Log-Cursor"])
+        third = self._get(authed_client, temp_log_file, second.headers["X-Log-Cursor"])
+
+        assert second.headers["X-Log-Reset"] == "0"
+        assert second.text == "2024-01-01 12:00:01 INFO Second entry\n"
+        assert third.text == ""
+
+    def test_partial_line_is_held_back(self, authed_client, temp_log_file):
+        cursor = self._get(authed_client, temp_log_file).headers["X-Log-Cursor"]
+        with temp_log_file.open("a") as f:
+            f.write("half a li")
+
+        partial = self._get(authed_client, temp_log_file, cursor)
+        with temp_log_file.open("a") as f:
+            f.write("ne\n")
+        rest = self._get(authed_client, temp_log_file, partial.headers["X-Log-Cursor"])
+
+        assert partial.text == ""
+        assert rest.text == "half a line\n"
+
+    def test_rotation_continues_from_backup(self, authed_client, temp_log_file):
+        cursor = self._get(authed_client, temp_log_file).headers["X-Log-Cursor"]
+        with temp_log_file.open("a") as f:
+            f.write("written before rotation\n")
+        temp_log_file.rename(temp_log_file.with_name(temp_log_file.name + ".1"))
+        temp_log_file.write_text("written after rotation\n")
+
+        response = self._get(authed_client, temp_log_file, cursor)
+
+        assert response.headers["X-Log-Reset"] == "0"
+        assert response.text == "written before rotation\nwritten after rotation\n"
+
+    def test_cleared_log_resets(self, authed_client, temp_log_file):
+        cursor = self._get(authed_client, temp_log_file).headers["X-Log-Cursor"]
+        temp_log_file.write_text("")
+        with temp_log_file.open("a") as f:
+            f.write("new\n")
+
+        response = self._get(authed_client, temp_log_file, cursor)
+
+        assert response.headers["X-Log-Reset"] == "1"
+        assert response.text == "new\n"
+
+    def test_invalid_cursor_falls_back_to_tail(self, authed_client, temp_log_file):
+        response = self._get(authed_client, temp_log_file, "not-a-cursor")
+
+        assert response.headers["X-Log-Reset"] == "1"
+        assert "Test log entry" in response.text
+
+
 # ---------------------------------------------------------------------------
 # POST /log/clear
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""Tests for the unauthenticated /posters route: variants, cache headers, 304s."""
+
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from module.api.posters import IMMUTABLE_CACHE, LEGACY_CACHE
+from module.api.posters import router as posters_router
+
+HASHED = "a" * 64 + ".png"
+
+
+@pytest.fixture
+def posters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    directory = tmp_path / "data" / "posters"
+    directory.mkdir(parents=True)
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 960), (10, 120, 200)).save(buffer, format="PNG")
+    (directory / HASHED).write_bytes(buffer.getvalue())
+    (directory / "1a2b3c4d.png").write_bytes(buffer.getvalue())
+    return directory
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(posters_router)
+    return TestClient(app)
+
+
+class TestPosters:
+    def test_content_addressed_poster_is_immutable(self, posters, client):
+        response = client.get(f"/posters/{HASHED}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE
+        assert response.headers["etag"] == f'"{HASHED}"'
+
+    def test_legacy_poster_is_revalidated_daily(self, posters, client):
+        response = client.get("/posters/1a2b3c4d.png")
+
+        assert response.headers["cache-control"] == LEGACY_CACHE
+
+    def test_thumbnail_is_generated_on_first_request(self, posters, client):
+        response = client.get(f"/posters/{HASHED}", params={"size": "thumb"})
+
+        assert response.headers["content-type"] == "image/webp"
+        with Image.open(io.BytesIO(response.content)) as thumb:
+            assert thumb.width == 320
+        assert (posters / ("a" * 64 + ".thumb.webp")).exists()
+
+    def test_webp_is_negotiated_from_accept(self, posters, client):
+        response = client.get(
+            f"/posters/{HASHED}", headers={"Accept": "image/avif,image/webp,*/*"}
+        )
+
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["vary"] == "Accept"
+
+    def test_matching_etag_returns_304(self, posters, client):
+        etag = client.get(f"/posters/{HASHED}").headers["etag"]
+
+        response = client.get(f"/posters/{HASHED}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE
+
+    def test_missing_and_escaping_paths(self, posters, client):
+        assert client.get("/posters/missing.png").status_code == 404
+        assert client.get("/posters/..%2F..%2Fsecret").status_code in (403, 404)
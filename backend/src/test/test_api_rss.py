@@ -272,19 +272,45 @@ class TestRefreshRss:
 
 
 class TestGetRssTorrents:
-    def test_get_torrents(self, authed_client):
+    def test_get_torrents(self, authed_client, mock_db):
         """GET /rss/torrent/{id} returns torrents for that feed."""
         torrents = [make_torrent(id=1, rss_id=1), make_torrent(id=2, rss_id=1)]
-        with patch("module.api.rss.RSSEngine") as MockEngine:
-            mock_eng = MockEngine.return_value
-            mock_eng.get_rss_torrents = AsyncMock(return_value=torrents)
+        mock_db.rss.search_id = AsyncMock(return_value=make_rss_item(id=1))
+        mock_db.torrent.search_rss_page = AsyncMock(return_value=(torrents, None))
 
-            response = authed_client.get("/api/v1/rss/torrent/1")
+        response = authed_client.get("/api/v1/rss/torrent/1")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
+    def test_get_torrents_filters_and_pages(self, authed_client, mock_db):
+        torrents = [make_torrent(id=5, rss_id=1, name="B")]
+        mock_db.rss.search_id = AsyncMock(return_value=make_rss_item(id=1))
+        mock_db.torrent.search_rss_page = AsyncMock(return_value=(torrents, ["B", 5]))
+
+        response = authed_client.get(
+            "/api/v1/rss/torrent/1",
+            params={"downloaded": "false", "q": "1080", "sort": "name", "limit": 1},
+        )
+
+        assert response.status_code == 200
+        assert "X-Next-Cursor" in response.headers
+        kwargs = mock_db.torrent.search_rss_page.call_args.kwargs
+        assert kwargs["downloaded"] is False
+        assert kwargs["query"] == "1080"
+        assert kwargs["sort"] == "name"
+
+    def test_get_torrents_unknown_feed(self, authed_client, mock_db):
+        mock_db.rss.search_id = AsyncMock(return_value=None)
+        mock_db.torrent.search_rss_page = AsyncMock()
+
+        response = authed_client.get("/api/v1/rss/torrent/99")
+
+        assert response.status_code == 200
+        assert response.json() == []
+        mock_db.torrent.search_rss_page.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # POST /rss/analysis
@@ -3,19 +3,21 @@
 Mirrors test_qb_downloader.py's approach: low-level RPC behaviour is verified
 by patching ``self._client`` directly (mock JSON-RPC transport); higher-level
 business logic (dedup, gid<->bangumi association, filesystem rename/move) is
-verified by patching ``Aria2Downloader._call`` and letting the real logic
+verified by patching ``Aria2Downloader._call`` (and ``_multicall``, routed
+through the same stub by ``_patch_rpc``) and letting the real logic
 (including the real, per-test temp-file DB from conftest's autouse
 ``_bind_bare_database`` fixture) run.
 """
 
 import os
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from module.database import Database
-from module.database.aria2 import Aria2RenameIntent
+from module.database.aria2 import Aria2GidDatabase, Aria2RenameIntent
 from module.downloader import AddResult, RenameOutcome
 from module.downloader.client.aria2_downloader import (
     Aria2ConnectionError,
@@ -40,6 +42,31 @@ def _rename_intent(old_path: str, new_path: str, source) -> Aria2RenameIntent:
     )
 
 
+@contextmanager
+def _patch_rpc(aria2: Aria2Downloader, call_mock: AsyncMock):
+    """Stub ``_call`` and route every ``_multicall`` sub-call through it too.
+
+    A sub-call rejected by aria2 comes back as an ``Aria2RpcError`` entry, a
+    transport failure fails the whole batch -- the same split as the real
+    ``system.multicall``.
+    """
+
+    async def multicall(calls, timeout=10.0):
+        results = []
+        for method, params in calls:
+            try:
+                results.append(await call_mock(method, params))
+            except Aria2RpcError as e:
+                results.append(e)
+        return results
+
+    with (
+        patch.object(aria2, "_call", call_mock),
+        patch.object(aria2, "_multicall", AsyncMock(side_effect=multicall)),
+    ):
+        yield call_mock
+
+
 def _rpc_response(result=None, error=None):
     resp = MagicMock()
     body: dict = {"jsonrpc": "2.0", "id": 1}
@@ -138,6 +165,56 @@ class TestCallRpcLayer:
         with pytest.raises(AssertionError):
             await aria2._call("getVersion")
 
+    async def test_multicall_sends_one_request_with_token_per_call(self):
+        aria2 = _aria2()
+        aria2._client = AsyncMock()
+        aria2._client.post = AsyncMock(
+            return_value=_rpc_response(result=[[["a"]], [{"dir": "/d"}]])
+        )
+
+        results = await aria2._multicall(
+            [("tellActive", [["gid"]]), ("tellStatus", ["g1", ["dir"]])]
+        )
+
+        aria2._client.post.assert_awaited_once()
+        payload = aria2._client.post.call_args.kwargs["json"]
+        assert payload["method"] == "system.multicall"
+        assert payload["params"] == [
+            [
+                {
+                    "methodName": "aria2.tellActive",
+                    "params": ["token:secret-token", ["gid"]],
+                },
+                {
+                    "methodName": "aria2.tellStatus",
+                    "params": ["token:secret-token", "g1", ["dir"]],
+                },
+            ]
+        ]
+        assert results == [["a"], {"dir": "/d"}]
+
+    async def test_multicall_returns_per_call_faults_in_place(self):
+        aria2 = _aria2()
+        aria2._client = AsyncMock()
+        aria2._client.post = AsyncMock(
+            return_value=_rpc_response(
+                result=[{"code": 1, "message": "GID g2 is not found"}, [[]]]
+            )
+        )
+
+        fault, ok = await aria2._multicall([("getFiles", ["g2"]), ("getFiles", ["g3"])])
+
+        assert isinstance(fault, Aria2RpcError)
+        assert fault.message == "GID g2 is not found"
+        assert ok == []
+
+    async def test_multicall_without_calls_sends_nothing(self):
+        aria2 = _aria2()
+        aria2._client = AsyncMock()
+
+        assert await aria2._multicall([]) == []
+        aria2._client.post.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # auth()
@@ -147,7 +224,7 @@ class TestCallRpcLayer:
 class TestAuth:
     async def test_auth_returns_true_on_success(self):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(return_value={"version": "1.0"})):
+        with _patch_rpc(aria2, AsyncMock(return_value={"version": "1.0"})):
             result = await aria2.auth()
         assert result is True
         assert aria2._authed is True
@@ -155,7 +232,7 @@ class TestAuth:
     async def test_auth_reuses_already_authed_client(self):
         aria2 = _aria2()
         call_mock = AsyncMock(return_value={"version": "1.0"})
-        with patch.object(aria2, "_call", call_mock):
+        with _patch_rpc(aria2, call_mock):
             await aria2.auth()
             await aria2.auth()
         assert call_mock.call_count == 1
@@ -163,9 +240,7 @@ class TestAuth:
     async def test_auth_retries_and_returns_false_on_persistent_rpc_error(self):
         aria2 = _aria2()
         with (
-            patch.object(
-                aria2, "_call", AsyncMock(side_effect=Aria2RpcError(1, "bad token"))
-            ),
+            _patch_rpc(aria2, AsyncMock(side_effect=Aria2RpcError(1, "bad token"))),
             patch(
                 "module.downloader.client.aria2_downloader.asyncio.sleep",
                 new_callable=AsyncMock,
@@ -181,7 +256,7 @@ class TestAuth:
             side_effect=[Aria2ConnectionError("refused"), {"version": "1.0"}]
         )
         with (
-            patch.object(aria2, "_call", call_mock),
+            _patch_rpc(aria2, call_mock),
             patch(
                 "module.downloader.client.aria2_downloader.asyncio.sleep",
                 new_callable=AsyncMock,
@@ -193,7 +268,7 @@ class TestAuth:
 
     async def test_logout_clears_client_and_authed_flag(self):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(return_value={"version": "1.0"})):
+        with _patch_rpc(aria2, AsyncMock(return_value={"version": "1.0"})):
             await aria2.auth()
         await aria2.logout()
         assert aria2._client is None
@@ -208,7 +283,7 @@ class TestAuth:
 class TestAddTorrents:
     async def test_new_url_returns_true_and_persists_gid(self):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(return_value="gid001")):
+        with _patch_rpc(aria2, AsyncMock(return_value="gid001")):
             result = await aria2.add_torrents(
                 torrent_urls="magnet:?xt=urn:btih:abc",
                 torrent_files=None,
@@ -233,7 +308,7 @@ class TestAddTorrents:
                 return {"followedBy": ["payload-gid"]}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls="magnet:?xt=urn:btih:abc",
                 torrent_files=None,
@@ -263,7 +338,7 @@ class TestAddTorrents:
                 return {"status": "active"}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             await aria2.add_torrents(
                 torrent_urls="magnet:?xt=urn:btih:abc",
                 torrent_files=None,
@@ -294,7 +369,7 @@ class TestAddTorrents:
                 return {"status": "active"}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             await aria2.add_torrents(
                 torrent_urls=["magnet:?xt=urn:btih:aaa"],
                 torrent_files=None,
@@ -322,7 +397,7 @@ class TestAddTorrents:
                 return {"status": "active"}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             await aria2.add_torrents(
                 torrent_urls=["magnet:?xt=urn:btih:aaa"],
                 torrent_files=None,
@@ -341,9 +416,8 @@ class TestAddTorrents:
 
     async def test_rpc_duplicate_error_treated_as_already_added(self):
         aria2 = _aria2()
-        with patch.object(
+        with _patch_rpc(
             aria2,
-            "_call",
             AsyncMock(side_effect=Aria2RpcError(1, "GID already exists")),
         ):
             result = await aria2.add_torrents(
@@ -361,9 +435,7 @@ class TestAddTorrents:
 
     async def test_rpc_non_duplicate_error_returns_false_for_that_item(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2RpcError(3, "Disk full"))
-        ):
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2RpcError(3, "Disk full"))):
             result = await aria2.add_torrents(
                 torrent_urls="magnet:?xt=urn:btih:zzz",
                 torrent_files=None,
@@ -385,7 +457,7 @@ class TestAddTorrents:
                 return {"status": "active"}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             first = await aria2.add_torrents(
                 torrent_urls=None,
                 torrent_files=payload,
@@ -420,7 +492,7 @@ class TestAddTorrents:
                 return "gid-fresh"
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls=url,
                 torrent_files=None,
@@ -448,7 +520,7 @@ class TestAddTorrents:
                 return "gid-fresh"
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls=url,
                 torrent_files=None,
@@ -475,7 +547,7 @@ class TestAddTorrents:
                 raise AssertionError("addUri must not be called for a live duplicate")
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls=url,
                 torrent_files=None,
@@ -501,7 +573,7 @@ class TestAddTorrents:
                 raise AssertionError("addUri must not be called when unverifiable")
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls=url,
                 torrent_files=None,
@@ -530,7 +602,7 @@ class TestAddTorrents:
                 return "gid-fresh-file"
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.add_torrents(
                 torrent_urls=None,
                 torrent_files=payload,
@@ -545,7 +617,7 @@ class TestAddTorrents:
 
     async def test_no_tags_leaves_bangumi_id_unset(self):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(return_value="gid-no-tag")):
+        with _patch_rpc(aria2, AsyncMock(return_value="gid-no-tag")):
             await aria2.add_torrents(
                 torrent_urls="magnet:?xt=urn:btih:notag",
                 torrent_files=None,
@@ -579,6 +651,43 @@ def _download(gid, status="complete", dir_="/downloads/Show/Season 1", name=None
 
 
 class TestTorrentsInfo:
+    async def test_snapshot_is_one_multicall_with_projected_keys(self):
+        aria2 = _aria2()
+        aria2._client = AsyncMock()
+        aria2._client.post = AsyncMock(
+            return_value=_rpc_response(
+                result=[[[_download("gidA", status="active")]], [[]], [[]]]
+            )
+        )
+
+        result = await aria2.torrents_info(status_filter=None, category=None)
+
+        assert [r["hash"] for r in result] == ["gidA"]
+        aria2._client.post.assert_awaited_once()
+        calls = aria2._client.post.call_args.kwargs["json"]["params"][0]
+        assert [c["methodName"] for c in calls] == [
+            "aria2.tellActive",
+            "aria2.tellWaiting",
+            "aria2.tellStopped",
+        ]
+        for call in calls:
+            keys = call["params"][-1]
+            assert "dir" in keys and "status" in keys
+            # announceList 等大字段不随每次轮询返回
+            assert "bittorrent" not in keys
+
+    async def test_rejected_sub_call_fails_the_query(self):
+        aria2 = _aria2()
+
+        async def fake_call(method, params=None, timeout=10.0):
+            if method == "tellStopped":
+                raise Aria2RpcError(1, "Unauthorized")
+            return []
+
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
+            with pytest.raises(Aria2RpcError):
+                await aria2.torrents_info(status_filter=None, category=None)
+
     async def test_maps_fields_to_qb_shape(self):
         aria2 = _aria2()
 
@@ -587,7 +696,7 @@ class TestTorrentsInfo:
                 return [_download("gidA", status="active")]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             async with Database() as db:
                 await db.aria2.upsert("gidA", bangumi_id=5, category="Bangumi")
             result = await aria2.torrents_info(status_filter=None, category=None)
@@ -601,6 +710,25 @@ class TestTorrentsInfo:
         assert info["state"] == "downloading"  # active + 未完成 → qB 词汇
         assert info["name"] == "gidA.mkv"
 
+    async def test_multi_file_name_is_the_torrent_folder(self):
+        """多文件种子的显示名取 dir 下第一层目录，即 bittorrent.info.name。"""
+        aria2 = _aria2()
+        download = _download("gidA", status="active", dir_="/downloads/Show")
+        download["files"] = [
+            {"path": "/downloads/Show/[Sub] Show S01/01.mkv"},
+            {"path": "/downloads/Show/[Sub] Show S01/02.mkv"},
+        ]
+
+        async def fake_call(method, params=None, timeout=10.0):
+            if method == "tellActive":
+                return [download]
+            return []
+
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
+            result = await aria2.torrents_info(status_filter=None, category=None)
+
+        assert result[0]["name"] == "[Sub] Show S01"
+
     async def test_status_filter_completed_excludes_active(self):
         aria2 = _aria2()
 
@@ -611,7 +739,7 @@ class TestTorrentsInfo:
                 return [_download("gidDone", status="complete")]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter="completed", category=None)
 
         assert [r["hash"] for r in result] == ["gidDone"]
@@ -626,7 +754,7 @@ class TestTorrentsInfo:
                 return [_download("gidDone", status="complete")]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         assert {r["hash"] for r in result} == {"gidActive", "gidDone"}
@@ -639,7 +767,7 @@ class TestTorrentsInfo:
                 return [_download("gidA"), _download("gidB")]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             async with Database() as db:
                 await db.aria2.upsert("gidA", category="Bangumi")
                 await db.aria2.upsert("gidB", category="Other")
@@ -655,7 +783,7 @@ class TestTorrentsInfo:
                 return [_download("gidUntracked")]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         assert result[0]["tags"] == ""
@@ -663,33 +791,26 @@ class TestTorrentsInfo:
 
     async def test_connection_query_failure_is_raised(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2ConnectionError("down"))
-        ):
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2ConnectionError("down"))):
             with pytest.raises(Aria2ConnectionError, match="down"):
                 await aria2.torrents_info(status_filter=None, category=None)
 
     async def test_rpc_query_failure_is_raised(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2RpcError(1, "failed"))
-        ):
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2RpcError(1, "failed"))):
             with pytest.raises(Aria2RpcError, match="failed"):
                 await aria2.torrents_info(status_filter=None, category=None)
 
     async def test_torrent_exists_returns_true_for_known_gid(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(return_value={"status": "complete"})
-        ) as call:
+        with _patch_rpc(aria2, AsyncMock(return_value={"status": "complete"})) as call:
             assert await aria2.torrent_exists("gidA") is True
         call.assert_awaited_once_with("tellStatus", ["gidA", ["status"]])
 
     async def test_torrent_exists_returns_false_only_for_explicit_not_found(self):
         aria2 = _aria2()
-        with patch.object(
+        with _patch_rpc(
             aria2,
-            "_call",
             AsyncMock(side_effect=Aria2RpcError(1, "GID#gidA is not found")),
         ):
             assert await aria2.torrent_exists("gidA") is False
@@ -700,7 +821,7 @@ class TestTorrentsInfo:
     )
     async def test_torrent_exists_returns_none_when_presence_is_unknown(self, error):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(side_effect=error)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=error)):
             assert await aria2.torrent_exists("gidA") is None
 
     async def test_torrents_info_zero_total_length_progress_is_zero(self):
@@ -723,7 +844,7 @@ class TestTorrentsInfo:
                 return [download]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         assert len(result) == 1
@@ -744,7 +865,7 @@ class TestTorrentsInfo:
                 return [download]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         info = result[0]
@@ -763,7 +884,7 @@ class TestTorrentsInfo:
                 return [download]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         assert result[0]["eta"] == 8640000
@@ -792,7 +913,7 @@ class TestTorrentsInfo:
                 return downloads
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         by_gid = {info["hash"]: info["state"] for info in result}
@@ -811,7 +932,7 @@ class TestTorrentsInfo:
                 return [download]
             return []
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category=None)
 
         info = result[0]
@@ -836,7 +957,7 @@ class TestTorrentsInfo:
         async with Database() as db:
             await db.aria2.upsert("metadata-gid", bangumi_id=5, category="Bangumi")
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_info(status_filter=None, category="Bangumi")
 
         # 元数据 stub 必须被跳过，只报告真实下载（follower gid），否则 stub
@@ -929,7 +1050,7 @@ class TestTorrentsFiles:
                 return {"dir": "/downloads/Show/Season 1"}
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             files = await aria2.torrents_files("gidA")
 
         assert files == [
@@ -950,16 +1071,54 @@ class TestTorrentsFiles:
         async with Database() as db:
             await db.aria2.set_renamed_path("gidA", "ep01.mkv", "Show - 01.mkv")
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             files = await aria2.torrents_files("gidA")
 
         assert files == [{"name": "Show - 01.mkv", "size": 100}]
 
-    async def test_query_failure_returns_empty_list(self):
+    async def test_many_gids_share_one_multicall_and_one_db_query(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2ConnectionError("down"))
+        aria2._client = AsyncMock()
+        aria2._client.post = AsyncMock(
+            return_value=_rpc_response(
+                result=[
+                    [[{"path": "/d/A/ep01.mkv", "length": "10"}]],
+                    [{"dir": "/d/A"}],
+                    {"code": 1, "message": "GID gidB is not found"},
+                    [{"dir": "/d/B"}],
+                    [[{"path": "/d/C/ep03.mkv", "length": "30"}]],
+                    {"code": 1, "message": "boom"},
+                ]
+            )
+        )
+        async with Database() as db:
+            await db.aria2.set_renamed_path("gidA", "ep01.mkv", "Show - 01.mkv")
+
+        with (
+            patch.object(
+                Aria2GidDatabase,
+                "get_renamed_paths_many",
+                autospec=True,
+                side_effect=Aria2GidDatabase.get_renamed_paths_many,
+            ) as renamed_many,
+            patch.object(Aria2GidDatabase, "get_renamed_paths") as renamed_one,
         ):
+            files = await aria2.torrents_files_many(["gidA", "gidB", "gidC"])
+
+        aria2._client.post.assert_awaited_once()
+        renamed_many.assert_awaited_once()
+        renamed_one.assert_not_called()
+        assert files == {
+            "gidA": [{"name": "Show - 01.mkv", "size": 10}],
+            # getFiles 被拒：该 gid 为空，其余照常
+            "gidB": [],
+            # 只是 dir 取不到：退化为 aria2 的原始路径
+            "gidC": [{"name": "/d/C/ep03.mkv", "size": 30}],
+        }
+
+    async def test_query_failure_returns_empty_list(self):
+        aria2 = _aria2()
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2ConnectionError("down"))):
             files = await aria2.torrents_files("gidA")
         assert files == []
 
@@ -977,7 +1136,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
 
         assert result.outcome is RenameOutcome.RENAMED
@@ -994,7 +1153,7 @@ class TestTorrentsRenameFile:
                 return [{"path": str(old_file), "length": "4"}]
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
             assert result.outcome is RenameOutcome.RENAMED
             files = await aria2.torrents_files("gidA")
@@ -1011,7 +1170,7 @@ class TestTorrentsRenameFile:
                 return [{"path": str(old_file), "length": "4"}]
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             first = await aria2.torrents_rename_file("gidA", "old.mkv", "mid.mkv")
             second = await aria2.torrents_rename_file("gidA", "mid.mkv", "new.mkv")
             assert first.outcome is RenameOutcome.RENAMED
@@ -1027,7 +1186,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file(
                 "gidA", "old.mkv", os.path.join("Season 01", "new.mkv")
             )
@@ -1041,7 +1200,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "missing.mkv", "new.mkv")
 
         assert result.outcome is RenameOutcome.RETRYABLE_FAILURE
@@ -1061,7 +1220,7 @@ class TestTorrentsRenameFile:
                 return [{"path": str(tmp_path / "old.mkv"), "length": "4"}]
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
             files = await aria2.torrents_files("gidA")
 
@@ -1082,7 +1241,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
 
         assert result.outcome is RenameOutcome.DESTINATION_EXISTS
@@ -1105,7 +1264,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
 
         assert result.outcome is RenameOutcome.DESTINATION_EXISTS
@@ -1123,7 +1282,7 @@ class TestTorrentsRenameFile:
             return {"dir": str(tmp_path)}
 
         with (
-            patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)),
+            _patch_rpc(aria2, AsyncMock(side_effect=fake_call)),
             patch.object(aria2, "_move_file", side_effect=OSError("move failed")),
         ):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
@@ -1145,7 +1304,7 @@ class TestTorrentsRenameFile:
         async def fake_call(method, params=None, timeout=10.0):
             return {"dir": str(tmp_path)}
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
 
         assert result.outcome is RenameOutcome.DESTINATION_EXISTS
@@ -1155,9 +1314,7 @@ class TestTorrentsRenameFile:
 
     async def test_returns_false_when_status_lookup_fails(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2ConnectionError("down"))
-        ):
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2ConnectionError("down"))):
             result = await aria2.torrents_rename_file("gidA", "old.mkv", "new.mkv")
         assert result.outcome is RenameOutcome.RETRYABLE_FAILURE
 
@@ -1190,7 +1347,7 @@ class TestTorrentsDelete:
         async with Database() as db:
             await db.aria2.upsert("gidA", bangumi_id=1)
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=True)
 
         assert result is True
@@ -1219,7 +1376,7 @@ class TestTorrentsDelete:
                 "gidA", bangumi_id=1, renamed_paths='{"old.mkv": "staged.mkv"}'
             )
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=False)
 
         assert result is False
@@ -1250,7 +1407,7 @@ class TestTorrentsDelete:
             await db.aria2.upsert("gidA", bangumi_id=1)
             await db.aria2.set_renamed_path("gidA", original.name, staged.name)
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=True)
 
         assert result is True
@@ -1278,7 +1435,7 @@ class TestTorrentsDelete:
                 "gidA", bangumi_id=1, renamed_paths='{"old.mkv": "staged.mkv"}'
             )
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=True)
 
         assert result is False
@@ -1298,7 +1455,7 @@ class TestTorrentsDelete:
                 raise Aria2RpcError(1, "GID#gidA is not found")
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=False)
 
         assert result is True
@@ -1316,7 +1473,7 @@ class TestTorrentsDelete:
                 "gidA", bangumi_id=1, renamed_paths='{"old.mkv": "staged.mkv"}'
             )
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             result = await aria2.torrents_delete("gidA", delete_files=True)
 
         assert result is True
@@ -1337,7 +1494,7 @@ class TestTorrentsDelete:
                 return params[0]
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             await aria2.torrents_delete("gidA|gidB", delete_files=False)
 
         assert seen_gids == ["gidA", "gidB"]
@@ -1352,7 +1509,7 @@ class TestPauseResume:
     async def test_pause_calls_force_pause_per_gid(self):
         aria2 = _aria2()
         call_mock = AsyncMock(return_value=None)
-        with patch.object(aria2, "_call", call_mock):
+        with _patch_rpc(aria2, call_mock):
             await aria2.torrents_pause(["gidA", "gidB"])
         methods = [c.args[0] for c in call_mock.call_args_list]
         assert methods == ["forcePause", "forcePause"]
@@ -1360,16 +1517,14 @@ class TestPauseResume:
     async def test_resume_calls_unpause_per_gid(self):
         aria2 = _aria2()
         call_mock = AsyncMock(return_value=None)
-        with patch.object(aria2, "_call", call_mock):
+        with _patch_rpc(aria2, call_mock):
             await aria2.torrents_resume("gidA|gidB")
         methods = [c.args[0] for c in call_mock.call_args_list]
         assert methods == ["unpause", "unpause"]
 
     async def test_pause_failure_is_logged_not_raised(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(side_effect=Aria2ConnectionError("down"))
-        ):
+        with _patch_rpc(aria2, AsyncMock(side_effect=Aria2ConnectionError("down"))):
             await aria2.torrents_pause("gidA")  # must not raise
 
 
@@ -1399,7 +1554,7 @@ class TestMoveTorrent:
                 return "OK"
             return None
 
-        with patch.object(aria2, "_call", AsyncMock(side_effect=fake_call)):
+        with _patch_rpc(aria2, AsyncMock(side_effect=fake_call)):
             await aria2.move_torrent("gidA", str(new_dir))
 
         assert not file_path.exists()
@@ -1409,7 +1564,7 @@ class TestMoveTorrent:
     async def test_skips_when_new_location_equals_current_dir(self, tmp_path):
         aria2 = _aria2()
         call_mock = AsyncMock(return_value={"dir": str(tmp_path)})
-        with patch.object(aria2, "_call", call_mock):
+        with _patch_rpc(aria2, call_mock):
             await aria2.move_torrent("gidA", str(tmp_path))
         # Only the tellStatus lookup ran -- no getFiles/changeOption follow-up.
         assert call_mock.call_args_list[-1].args[0] == "tellStatus"
@@ -1438,6 +1593,18 @@ class TestSetCategoryAddTag:
         assert record is not None
         assert record.bangumi_id == 99
 
+    async def test_add_tag_and_category_accept_hash_lists(self):
+        aria2 = _aria2()
+        await aria2.add_tag(["gidA", "gidB"], "ab:7")
+        await aria2.set_category(["gidB", "gidC"], "BangumiCollection")
+        async with Database() as db:
+            records = await db.aria2.get_many(["gidA", "gidB", "gidC"])
+        assert records["gidA"].bangumi_id == 7
+        assert records["gidA"].category is None
+        assert records["gidB"].bangumi_id == 7
+        assert records["gidB"].category == "BangumiCollection"
+        assert records["gidC"].bangumi_id is None
+
     async def test_add_tag_ignores_unsupported_tag(self):
         aria2 = _aria2()
         await aria2.add_tag("gidA", "some-other-tag")
@@ -1454,14 +1621,12 @@ class TestSetCategoryAddTag:
 class TestCheckConnection:
     async def test_returns_version_string(self):
         aria2 = _aria2()
-        with patch.object(
-            aria2, "_call", AsyncMock(return_value={"version": "1.36.0"})
-        ):
+        with _patch_rpc(aria2, AsyncMock(return_value={"version": "1.36.0"})):
             result = await aria2.check_connection()
         assert result == "1.36.0"
 
     async def test_missing_version_field_returns_unknown(self):
         aria2 = _aria2()
-        with patch.object(aria2, "_call", AsyncMock(return_value={})):
+        with _patch_rpc(aria2, AsyncMock(return_value={})):
             result = await aria2.check_connection()
         assert result == "unknown"
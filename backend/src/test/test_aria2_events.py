@@ -0,0 +1,98 @@
+"""Tests for the aria2 WebSocket completion listener."""
+
+import asyncio
+import json
+import logging
+
+import pytest
+from websockets.asyncio.server import serve
+
+from module.downloader.client import aria2_events
+from module.downloader.client.aria2_events import listen, parse_completion, ws_url
+
+
+def _notification(method: str, *gids: str) -> str:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": method, "params": [{"gid": g} for g in gids]}
+    )
+
+
+class TestWsUrl:
+    @pytest.mark.parametrize(
+        "host, expected",
+        [
+            ("http://localhost:6800", "ws://localhost:6800/jsonrpc"),
+            ("https://aria2.example.com", "wss://aria2.example.com/jsonrpc"),
+            ("192.168.1.2:6800", "ws://192.168.1.2:6800/jsonrpc"),
+            ("http://localhost:6800/", "ws://localhost:6800/jsonrpc"),
+            ("https://example.com/aria2", "wss://example.com/aria2/jsonrpc"),
+        ],
+    )
+    def test_maps_rpc_host(self, host, expected):
+        assert ws_url(host) == expected
+
+
+class TestParseCompletion:
+    def test_download_complete(self):
+        message = _notification("aria2.onDownloadComplete", "2089b05ecca3d829")
+        assert parse_completion(message) == ["2089b05ecca3d829"]
+
+    def test_bt_download_complete_with_several_gids(self):
+        message = _notification("aria2.onBtDownloadComplete", "aaa", "bbb")
+        assert parse_completion(message) == ["aaa", "bbb"]
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            _notification("aria2.onDownloadStart", "aaa"),
+            json.dumps({"jsonrpc": "2.0", "id": 1, "result": "OK"}),
+            json.dumps({"method": "aria2.onDownloadComplete", "params": "aaa"}),
+            "not json",
+            "[]",
+        ],
+    )
+    def test_ignores_other_messages(self, message):
+        assert parse_completion(message) == []
+
+
+class TestListen:
+    async def test_reports_completions_until_connection_closes(self):
+        async def handler(ws):
+            await ws.send(_notification("aria2.onDownloadStart", "aaa"))
+            await ws.send(_notification("aria2.onBtDownloadComplete", "bbb"))
+            await ws.send(_notification("aria2.onDownloadComplete", "ccc"))
+            await ws.close()
+
+        completed: list[str] = []
+        events: list[str] = []
+        async with serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            await asyncio.wait_for(
+                listen(
+                    f"http://127.0.0.1:{port}",
+                    completed.append,
+                    on_connect=lambda: events.append("connect"),
+                    on_disconnect=lambda: events.append("disconnect"),
+                ),
+                5,
+            )
+
+        assert completed == ["bbb", "ccc"]
+        assert events == ["connect", "disconnect"]
+
+    async def test_unreachable_host_returns_without_raising(self):
+        completed: list[str] = []
+        # 端口 1 上没有服务，连接立即被拒绝
+        await asyncio.wait_for(listen("http://127.0.0.1:1", completed.append), 5)
+        assert completed == []
+
+    async def test_repeated_failures_warn_once(self, caplog):
+        """只开 RPC 的部署每次重连都会失败，只在第一次告警。"""
+        url = "http://127.0.0.1:1"
+        aria2_events._unavailable.discard(ws_url(url))
+        with caplog.at_level(logging.DEBUG, logger=aria2_events.__name__):
+            for _ in range(3):
+                await asyncio.wait_for(listen(url, lambda gid: None), 5)
+
+        levels = [r.levelno for r in caplog.records]
+        assert levels == [logging.WARNING, logging.DEBUG, logging.DEBUG]
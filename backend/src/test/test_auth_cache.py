@@ -0,0 +1,131 @@
+"""Principal cache and write-behind token usage for authentication."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import select
+
+from module.application.auth import AuthenticationService
+from module.application.auth_cache import PrincipalCache, TokenUsageBuffer
+from module.database import Database
+from module.database.auth import AuthDatabase
+from module.models.auth import ApiToken
+from module.models.user import User, UserCreate, UserUpdate
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_principal_cache_expires_entries():
+    clock = FakeClock()
+    cache = PrincipalCache(ttl=30, clock=clock)
+    cache.put("k", User(username="u"), None, cache.generation)
+
+    assert cache.get("k") is not None
+    clock.now += 30
+    assert cache.get("k") is None
+
+
+def test_principal_cache_drops_results_that_raced_a_revocation():
+    cache = PrincipalCache()
+    generation = cache.generation
+    cache.revoke()
+    cache.put("k", User(username="u"), None, generation)
+
+    assert cache.get("k") is None
+
+
+def test_principal_cache_evicts_oldest_over_capacity():
+    cache = PrincipalCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, User(username=key), None, cache.generation)
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+
+def test_token_usage_buffer_coalesces_until_interval():
+    clock = FakeClock()
+    buffer = TokenUsageBuffer(interval=60, clock=clock)
+    first = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert buffer.record(1, first) is False
+    assert buffer.record(1, first + timedelta(seconds=5)) is False
+    clock.now += 60
+    assert buffer.record(2, first) is True
+    assert buffer.record(2, first) is False
+    assert buffer.drain() == {1: first + timedelta(seconds=5), 2: first}
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_session_skips_database_until_logout(db_engine):
+    service = AuthenticationService(lambda: Database(db_engine))
+    await service.create_user(UserCreate(username="cache_user", password="pw-123456"))
+    _user, token = await service.login("cache_user", "pw-123456")
+
+    assert await service.authenticate_session(token) is not None
+    with patch.object(
+        AuthDatabase, "authenticate_session", side_effect=AssertionError("db hit")
+    ):
+        cached = await service.authenticate_session(token)
+    assert cached is not None
+    assert cached.username == "cache_user"
+
+    await service.logout(token)
+    assert await service.authenticate_session(token) is None
+
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cached_sessions(db_engine):
+    service = AuthenticationService(lambda: Database(db_engine))
+    await service.create_user(UserCreate(username="keep_user", password="pw-123456"))
+    user = await service.create_user(
+        UserCreate(username="gone_user", password="pw-123456")
+    )
+    _user, token = await service.login("gone_user", "pw-123456")
+    assert await service.authenticate_session(token) is not None
+    assert user.id is not None
+
+    await service.update_user(user.id, UserUpdate(enabled=False))
+
+    assert await service.authenticate_session(token) is None
+
+
+@pytest.mark.asyncio
+async def test_api_token_usage_is_written_behind_in_batches(db_engine):
+    clock = FakeClock()
+    service = AuthenticationService(
+        lambda: Database(db_engine),
+        token_usage=TokenUsageBuffer(interval=60, clock=clock),
+    )
+    user = await service.create_user(
+        UserCreate(username="token_user", password="pw-123456")
+    )
+    assert user.id is not None
+    _token, raw = await service.create_api_token_for_user_id(
+        user.id, name="ha", scope="api"
+    )
+
+    async def last_used():
+        async with Database(db_engine) as db:
+            result = await db.session.execute(select(ApiToken.last_used_at))
+            return result.scalar_one()
+
+    for _ in range(3):
+        assert await service.authenticate_api_token(raw) is not None
+    assert await last_used() is None
+
+    clock.now += 60
+    assert await service.authenticate_api_token(raw) is not None
+    assert await last_used() is not None
+
+    assert _token.id is not None
+    await service.revoke_api_token(_token.id)
+    assert await service.authenticate_api_token(raw) is None
@@ -105,7 +105,7 @@ async def test_api_tokens_are_hashed_scoped_and_revocable(db_engine):
             await db.auth.authenticate_api_token(raw_token, scope="mcp", now=now)
             is None
         )
-        await db.auth.touch_api_token(matched_token_id, now=now + timedelta(seconds=1))
+        await db.auth.touch_api_tokens({matched_token_id: now + timedelta(seconds=1)})
         await db.session.refresh(persisted)
         assert persisted.last_used_at is not None
         await db.auth.revoke_api_token(stored.id)
@@ -165,11 +165,14 @@ async def test_legacy_config_tokens_preserve_scopes_without_leaking_prefix(db_en
         assert shared_api_match[1] != mcp_match[1]
 
         touched_at = datetime.now(timezone.utc)
-        await db.auth.touch_api_token(shared_api_match[1], now=touched_at)
+        await db.auth.touch_api_tokens({shared_api_match[1]: touched_at})
+        # touch_api_tokens 是 Core 写入，已加载的对象需要重新读取
         result = await db.session.execute(
-            select(ApiToken).where(
+            select(ApiToken)
+            .where(
                 ApiToken.token_hash == hashlib.sha256(shared_token.encode()).hexdigest()
             )
+            .execution_options(populate_existing=True)
         )
         by_scope = {token.scope: token for token in result.scalars().all()}
         assert by_scope["api"].last_used_at is not None
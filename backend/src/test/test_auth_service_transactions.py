@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from module.application.auth import AuthenticationError, AuthenticationService
+from module.application.auth_cache import TokenUsageBuffer
 from module.database import Database
 from module.models.passkey import Passkey
 from module.models.user import UserCreate, UserUpdate
@@ -109,7 +110,10 @@ async def test_delete_rolls_back_credential_purge_if_user_delete_fails(db_engine
 
 @pytest.mark.asyncio
 async def test_api_authentication_survives_audit_write_failure(db_engine):
-    service = AuthenticationService(lambda: Database(db_engine))
+    # interval=0: the first request already flushes the usage buffer
+    service = AuthenticationService(
+        lambda: Database(db_engine), token_usage=TokenUsageBuffer(interval=0)
+    )
     user = await service.create_user(
         UserCreate(username="audit_user", password="audit-password")
     )
@@ -118,12 +122,11 @@ async def test_api_authentication_survives_audit_write_failure(db_engine):
         user.id, name="automation", scope="api"
     )
 
-    with patch(
-        "module.database.auth.AuthDatabase.touch_api_token",
-        new=AsyncMock(side_effect=RuntimeError("audit database is busy")),
-    ):
+    touch = AsyncMock(side_effect=RuntimeError("audit database is busy"))
+    with patch("module.database.auth.AuthDatabase.touch_api_tokens", new=touch):
         authenticated = await service.authenticate_api_token(raw_token)
 
+    touch.assert_awaited_once()
     assert authenticated is not None
     assert authenticated.username == "audit_user"
 
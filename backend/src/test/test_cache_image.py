@@ -6,8 +6,18 @@ tmp_path so they never touch the real backend/data/ directory.
 """
 
 import asyncio
+import os
+import time
 
-from module.utils.cache_image import load_image, save_image
+from module.utils.cache_image import (
+    GC_MIN_AGE,
+    THUMB_WIDTH,
+    collect_posters,
+    ensure_variant,
+    is_content_addressed,
+    load_image,
+    save_image,
+)
 
 
 class TestSaveImage:
@@ -86,3 +96,73 @@ class TestLoadImage:
         await load_image("posters/abc123.jpg")
 
         assert len(calls) == 1
+
+
+def _png(width: int = 600, height: int = 900) -> bytes:
+    import io
+
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestPosterVariants:
+    async def test_save_image_names_by_full_hash_and_builds_variants(
+        self, tmp_path, monkeypatch
+    ):
+        from PIL import Image
+
+        monkeypatch.chdir(tmp_path)
+        posters = tmp_path / "data" / "posters"
+        posters.mkdir(parents=True)
+
+        result = await save_image(_png(), "png")
+
+        assert result is not None
+        stem = result.removeprefix("posters/").removesuffix(".png")
+        assert is_content_addressed(result.removeprefix("posters/"))
+        with Image.open(posters / f"{stem}.thumb.webp") as thumb:
+            assert thumb.format == "WEBP"
+            assert thumb.size == (THUMB_WIDTH, 480)
+        assert (posters / f"{stem}.full.webp").exists()
+
+    async def test_undecodable_image_is_kept_without_variants(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        posters = tmp_path / "data" / "posters"
+        posters.mkdir(parents=True)
+
+        result = await save_image(b"not an image", "jpg")
+
+        assert result is not None
+        assert sorted(p.name for p in posters.iterdir()) == [
+            result.removeprefix("posters/")
+        ]
+        assert ensure_variant(tmp_path / "data" / result, "thumb") is None
+
+
+class TestCollectPosters:
+    def test_removes_only_old_unreferenced_posters_and_variants(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        posters = tmp_path / "data" / "posters"
+        posters.mkdir(parents=True)
+        for name in ("kept.jpg", "kept.thumb.webp", "gone.jpg", "gone.full.webp"):
+            (posters / name).write_bytes(b"x")
+        (posters / "fresh.jpg").write_bytes(b"x")
+        old = time.time() - GC_MIN_AGE - 10
+        for name in ("kept.jpg", "kept.thumb.webp", "gone.jpg", "gone.full.webp"):
+            os.utime(posters / name, (old, old))
+
+        removed = collect_posters(["posters/kept.jpg", "https://mikanani.me/x.jpg"])
+
+        assert removed == 2
+        assert sorted(p.name for p in posters.iterdir()) == [
+            "fresh.jpg",
+            "kept.jpg",
+            "kept.thumb.webp",
+        ]
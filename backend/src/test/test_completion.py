@@ -0,0 +1,94 @@
+"""Tests for the download-completion queue that drives event-triggered renames."""
+
+from unittest.mock import MagicMock, patch
+
+from module.core.completion import (
+    HOOK_ACTIVE_WINDOW,
+    RENAME_SAFETY_NET_INTERVAL,
+    CompletionQueue,
+)
+
+
+class TestCompletionQueue:
+    def test_put_dedupes_and_keeps_arrival_order(self):
+        queue = CompletionQueue()
+        queue.put("bbbb", "hook")
+        queue.put("AAAA", "aria2")
+        queue.put("bbbb", "aria2")
+
+        assert len(queue) == 2
+        assert queue.drain() == ["bbbb", "aaaa"]
+        assert queue.drain() == []
+
+    def test_empty_hash_is_rejected(self):
+        queue = CompletionQueue()
+        task = MagicMock()
+        queue.bind(task)
+
+        assert queue.put("  ", "hook") is False
+        assert len(queue) == 0
+        task.wake.assert_not_called()
+
+    def test_put_wakes_bound_task(self):
+        queue = CompletionQueue()
+        task = MagicMock()
+        queue.bind(task)
+
+        assert queue.put("abc", "aria2") is True
+        task.wake.assert_called_once()
+
+    def test_put_without_bound_task(self):
+        queue = CompletionQueue()
+        assert queue.put("abc", "hook") is True
+
+
+class TestSweepDue:
+    def test_due_before_first_sweep(self):
+        assert CompletionQueue().sweep_due(60) is True
+
+    def test_not_due_until_interval_elapsed(self):
+        queue = CompletionQueue()
+        with patch("module.core.completion.time.monotonic", return_value=100.0):
+            queue.mark_swept()
+        with patch("module.core.completion.time.monotonic", return_value=159.0):
+            assert queue.sweep_due(60) is False
+        with patch("module.core.completion.time.monotonic", return_value=160.0):
+            assert queue.sweep_due(60) is True
+
+
+class TestRenameInterval:
+    def test_polls_at_configured_rate_without_event_source(self):
+        queue = CompletionQueue()
+        assert queue.event_driven is False
+        assert queue.rename_interval(60) == 60
+
+    def test_connected_listener_slows_polling(self):
+        queue = CompletionQueue()
+        queue.listener_connected()
+
+        assert queue.rename_interval(60) == RENAME_SAFETY_NET_INTERVAL
+        # 用户本来就设得更长时保持不变
+        assert queue.rename_interval(7200) == 7200
+
+        queue.listener_disconnected()
+        assert queue.rename_interval(60) == 60
+
+    def test_hook_counts_as_event_source_within_window(self):
+        queue = CompletionQueue()
+        with patch("module.core.completion.time.monotonic", return_value=1000.0):
+            queue.put("abc", "hook")
+        with patch(
+            "module.core.completion.time.monotonic",
+            return_value=1000.0 + HOOK_ACTIVE_WINDOW - 1,
+        ):
+            assert queue.event_driven is True
+        with patch(
+            "module.core.completion.time.monotonic",
+            return_value=1000.0 + HOOK_ACTIVE_WINDOW + 1,
+        ):
+            assert queue.event_driven is False
+
+    def test_aria2_events_do_not_mark_hook(self):
+        queue = CompletionQueue()
+        queue.put("abc", "aria2")
+        assert queue.event_driven is False
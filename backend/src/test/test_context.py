@@ -44,10 +44,42 @@ def ctx():
 
 
 class TestBuild:
-    def test_build_registers_five_named_tasks(self):
+    def test_build_registers_named_tasks(self):
         built = AppContext.build(real_settings)
         names = [t.name for t in built.scheduler.tasks]
-        assert names == ["rss", "rename", "offset_scan", "calendar", "update_check"]
+        assert names == [
+            "rss",
+            "rename",
+            "notify",
+            "aria2_events",
+            "offset_scan",
+            "calendar",
+            "retention",
+            "update_check",
+        ]
+
+    def test_completion_wakes_rename_task(self):
+        built = AppContext.build(real_settings)
+        rename = built.scheduler.get("rename")
+        with patch.object(rename, "wake") as wake:
+            built.completions.put("ABCDEF0123456789", "hook")
+        wake.assert_called_once()
+        assert built.completions.drain() == ["abcdef0123456789"]
+
+    def test_aria2_listener_only_enabled_for_aria2(self):
+        built = AppContext.build(real_settings)
+        listener = built.scheduler.get("aria2_events")
+        assert listener is not None
+        with (
+            patch("module.core.context.Checker.check_renamer", return_value=True),
+            patch.object(real_settings.downloader, "type", "qbittorrent"),
+        ):
+            assert listener.enabled is False
+        with (
+            patch("module.core.context.Checker.check_renamer", return_value=True),
+            patch.object(real_settings.downloader, "type", "aria2"),
+        ):
+            assert listener.enabled is True
 
     def test_build_does_no_io(self):
         """build() is pure wiring: not running, startup not done."""
@@ -3,11 +3,18 @@ import json
 import pytest
 
 from module.conf import settings
-from module.database.bangumi import BangumiDatabase, match_bangumi_in_list
+from module.database.bangumi import (
+    BangumiDatabase,
+    BangumiMatcher,
+    _PatternAutomaton,
+    match_bangumi_in_list,
+)
+from module.database.episode_index import EpisodeIndexDatabase, entry_identity
 from module.database.movie import MovieDatabase
 from module.database.rss import RSSDatabase
 from module.database.torrent import TorrentDatabase
-from module.models import Bangumi, Movie, RSSItem, Torrent
+from module.models import Bangumi, EpisodeIndex, Movie, RSSItem, Torrent
+from module.parser.analyser.tokenizer import MediaType
 
 
 async def _ensure_bangumi(session, bangumi_id: int):
@@ -112,6 +119,223 @@ async def test_rss_database(db_session):
     assert result.url == rss_url
 
 
+# ---------------------------------------------------------------------------
+# Keyset pagination / table revisions
+# ---------------------------------------------------------------------------
+
+
+async def test_bangumi_search_page_walks_cursor(db_session):
+    for i, title in enumerate(["Cc", "Aa", "Bb", "Aa"], start=1):
+        db_session.add(
+            Bangumi(
+                id=i,
+                official_title=title,
+                title_raw=f"raw {i}",
+                rss_link=f"link_{i}",
+                archived=i == 3,
+            )
+        )
+    await db_session.commit()
+    db = BangumiDatabase(db_session)
+
+    seen: list[int | None] = []
+    after = None
+    while True:
+        rows, after = await db.search_page(sort="official_title", after=after, limit=1)
+        seen.extend(r.id for r in rows)
+        if after is None:
+            break
+    # 同值按 id 续排，不重复也不遗漏
+    assert seen == [2, 4, 3, 1]
+
+    rows, after = await db.search_page(descending=True, limit=2)
+    assert [r.id for r in rows] == [4, 3] and after == [3, 3]
+    rows, _ = await db.search_page(archived=False, query="Aa")
+    assert [r.id for r in rows] == [2, 4]
+
+
+async def test_torrent_search_rss_page_filters(db_session):
+    db_session.add(RSSItem(id=1, url="https://test.com/a.xml", name="Feed"))
+    for i in range(1, 5):
+        db_session.add(
+            Torrent(
+                name=f"[Sub] Show - 0{i} [1080p_%]" if i % 2 else f"Show 0{i}",
+                url=f"https://test.com/{i}.torrent",
+                rss_id=1,
+                downloaded=i > 2,
+            )
+        )
+    await db_session.commit()
+    db = TorrentDatabase(db_session)
+
+    rows, after = await db.search_rss_page(1, downloaded=False, limit=1)
+    assert [r.id for r in rows] == [1] and after == [1, 1]
+    rows, after = await db.search_rss_page(1, downloaded=False, after=after, limit=1)
+    assert [r.id for r in rows] == [2] and after is None
+    # LIKE 通配符按字面匹配
+    rows, _ = await db.search_rss_page(1, query="_%")
+    assert [r.id for r in rows] == [1, 3]
+    rows, _ = await db.search_rss_page(2)
+    assert rows == []
+
+
+async def test_table_revision_bumps_on_commit_only(db_session):
+    from sqlmodel import update
+
+    from module.database.revision import table_revision
+
+    before = table_revision("torrent")
+    db_session.add(Torrent(name="a", url="https://test.com/a.torrent"))
+    await db_session.flush()
+    assert table_revision("torrent") == before
+    await db_session.commit()
+    assert table_revision("torrent") == before + 1
+
+    await db_session.execute(update(Torrent).values(downloaded=True))
+    await db_session.rollback()
+    assert table_revision("torrent") == before + 1
+
+    await db_session.execute(update(Torrent).values(downloaded=True))
+    await db_session.commit()
+    assert table_revision("torrent") == before + 2
+
+
+# ---------------------------------------------------------------------------
+# bangumi_rss link table
+# ---------------------------------------------------------------------------
+
+
+async def test_bangumi_rss_links_follow_rss_link_writes(db_session):
+    db = BangumiDatabase(db_session)
+    db_session.add(Bangumi(id=1, official_title="A", title_raw="A", rss_link="rss1"))
+    db_session.add(
+        Bangumi(id=2, official_title="B", title_raw="B", rss_link="rss10, rss2")
+    )
+    await db_session.commit()
+
+    # 精确匹配整条链接："rss1" 不会命中 "rss10"
+    assert [b.id for b in await db.search_rss("rss1")] == [1]
+    assert [b.id for b in await db.search_rss("rss2")] == [2]
+
+    bangumi = await db.search_id(1)
+    assert bangumi is not None
+    bangumi.rss_link = "rss1,rss2"
+    await db.update(bangumi)
+    assert {b.id for b in await db.search_rss("rss2")} == {1, 2}
+    assert await db.referenced_rss(["rss1", "rss3"]) == {"rss1"}
+
+    await db.delete_one(1)
+    assert await db.linked_ids("rss2") == {2}
+    assert await db.referenced_rss(["rss1"]) == set()
+
+
+async def test_bangumi_match_list_links_feed_once(db_session):
+    db = BangumiDatabase(db_session)
+    db_session.add(
+        Bangumi(
+            id=1,
+            official_title="Test Anime",
+            title_raw="Test Anime",
+            rss_link="rss10",
+            filter="",
+        )
+    )
+    await db_session.commit()
+    torrents = [
+        Torrent(name="[Sub] Test Anime - 01 [1080p].mkv", url="u1"),
+        Torrent(name="[Sub] Test Anime - 02 [1080p].mkv", url="u2"),
+    ]
+
+    assert await db.match_list(torrents, "rss1") == []
+    assert await db.match_list(torrents, "rss1") == []
+
+    bangumi = await db.search_id(1)
+    assert bangumi is not None
+    assert bangumi.rss_link == "rss10,rss1"
+    assert await db.linked_ids("rss1") == {1}
+
+
+# ---------------------------------------------------------------------------
+# Torrent retention
+# ---------------------------------------------------------------------------
+
+
+async def test_torrent_prune_keeps_downloaded_and_fingerprints(db_session):
+    from datetime import datetime, timedelta, timezone
+
+    db_session.add(RSSItem(id=1, url="https://test.com/a.xml", name="Feed"))
+    old = datetime.now(timezone.utc) - timedelta(days=100)
+    for i in range(1, 7):
+        db_session.add(
+            Torrent(
+                id=i,
+                name=f"t{i}",
+                url=f"https://test.com/{i}.torrent",
+                rss_id=1,
+                downloaded=i == 1,
+                created_at=old if i <= 2 else None,
+            )
+        )
+    await db_session.commit()
+    db = TorrentDatabase(db_session)
+
+    # 1 已下载不清理；2 超龄；3 超出每源 3 条上限（保留 4/5/6）
+    assert await db.prune(90, 3, batch_size=1) == 2
+    remaining = [t.id for t in await db.search_all()]
+    assert remaining == [1, 4, 5, 6]
+
+    incoming = [
+        Torrent(name=f"t{i}", url=f"https://test.com/{i}.torrent") for i in (2, 3, 7)
+    ]
+    assert [t.url for t in await db.check_new(incoming)] == [
+        "https://test.com/7.torrent"
+    ]
+    stats = await db.stats()
+    assert stats["total"] == 4 and stats["downloaded"] == 1
+    assert stats["fingerprints"] == 2 and stats["per_feed"] == {1: 4}
+
+    # 删除订阅源时一并清掉它的指纹，重新订阅会重新处理
+    assert await RSSDatabase(db_session).delete(1)
+    assert len(await db.check_new(incoming)) == 3
+
+
+async def test_torrent_prune_disabled_limits(db_session):
+    db_session.add(Torrent(name="a", url="https://test.com/a.torrent"))
+    await db_session.commit()
+    assert await TorrentDatabase(db_session).prune(0, 0) == 0
+
+
+async def test_database_compact_runs_analyze(db_engine):
+    from module.database import Database
+
+    async with Database(engine=db_engine) as db:
+        stats = await db.storage_stats()
+        assert stats["db_bytes"] > 0
+        # 空闲页远低于阈值，只做 ANALYZE
+        assert await db.compact() is False
+
+
+async def test_database_compact_vacuums_past_threshold(db_engine, monkeypatch):
+    from module.database import Database, combine
+
+    monkeypatch.setattr(combine, "COMPACT_FREE_RATIO", 0)
+    monkeypatch.setattr(combine, "COMPACT_MIN_FREE_BYTES", 0)
+    async with Database(engine=db_engine) as db:
+        assert await db.compact() is True
+
+
+async def test_database_poster_links_include_queued_notifications(db_engine):
+    from module.database import Database
+    from module.models import QueuedNotification
+
+    async with Database(engine=db_engine) as db:
+        db.session.add(Bangumi(official_title="A", poster_link="posters/a.jpg"))
+        db.session.add(QueuedNotification(provider="p", poster_path="posters/q.jpg"))
+        await db.session.commit()
+        # 等待发送的通知还要上传这张海报
+        assert await db.poster_links() == {"posters/a.jpg", "posters/q.jpg"}
+
+
 # ---------------------------------------------------------------------------
 # TorrentDatabase qb_hash methods
 # ---------------------------------------------------------------------------
@@ -574,6 +798,113 @@ def test_bangumi_matching_follows_selected_parser_engine(monkeypatch) -> None:
     assert preview_match is None
 
 
+def _matcher_fixture() -> list[Bangumi]:
+    return [
+        Bangumi(
+            id=1,
+            official_title="Kusuriya",
+            title_raw="Kusuriya no Hitorigoto",
+            group_name="LoliHouse",
+            rss_link="rss",
+            season=1,
+        ),
+        Bangumi(
+            id=2,
+            official_title="Kusuriya S2",
+            title_raw="Kusuriya no Hitorigoto",
+            group_name="Other",
+            rss_link="rss",
+            season=2,
+        ),
+        Bangumi(
+            id=3,
+            official_title="Short",
+            title_raw="Kusuriya",
+            group_name="LoliHouse",
+            rss_link="rss",
+            season=1,
+        ),
+        Bangumi(
+            id=4,
+            official_title="Aliased",
+            title_raw="Frieren",
+            title_aliases=json.dumps(["Sousou no Frieren", "葬送的芙莉莲"]),
+            group_name="SweetSub",
+            rss_link="rss",
+            season=1,
+        ),
+        Bangumi(
+            id=5,
+            official_title="Tie A",
+            title_raw="Dandadan",
+            group_name="GroupA",
+            rss_link="rss",
+            season=1,
+        ),
+        Bangumi(
+            id=6,
+            official_title="Tie B",
+            title_raw="Dandadan",
+            group_name="GroupA",
+            rss_link="rss",
+            season=1,
+        ),
+        Bangumi(
+            id=7,
+            official_title="Deleted",
+            title_raw="Sousou no Frieren Deleted",
+            group_name="SweetSub",
+            rss_link="rss",
+            season=1,
+            deleted=True,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("engine", ["classic", "tokenizer"])
+@pytest.mark.parametrize(
+    "raw",
+    (
+        "[LoliHouse] Kusuriya no Hitorigoto - 05 [1080p]",
+        "[LoliHouse] Kusuriya no Hitorigoto S2 - 05 [1080p]",
+        "[Other] Kusuriya - 05 [1080p]",
+        "[SweetSub] Sousou no Frieren - 12 [1080p]",
+        "[SweetSub][葬送的芙莉莲][12][1080p]",
+        "[SweetSub] Sousou no Frieren Deleted - 12 [1080p]",
+        "[GroupA] Dandadan - 03 [1080p]",
+        "[Nobody] Unknown Show - 01 [1080p]",
+    ),
+)
+def test_bangumi_matcher_agrees_with_linear_scan(raw: str, engine: str, monkeypatch):
+    monkeypatch.setattr(settings.rss_parser, "engine", engine)
+    bangumi_list = _matcher_fixture()
+
+    assert BangumiMatcher(bangumi_list).match(raw) is match_bangumi_in_list(
+        raw, bangumi_list
+    )
+
+
+def test_bangumi_matcher_prefers_longest_pattern_and_first_on_tie(monkeypatch):
+    monkeypatch.setattr(settings.rss_parser, "engine", "classic")
+    matcher = BangumiMatcher(_matcher_fixture())
+
+    longest = matcher.match("[LoliHouse] Kusuriya no Hitorigoto - 05 [1080p]")
+    tie = matcher.match("[GroupA] Dandadan - 03 [1080p]")
+    alias = matcher.match("[SweetSub] Sousou no Frieren Deleted - 12 [1080p]")
+
+    assert longest is not None and longest.id == 1
+    assert tie is not None and tie.id == 5
+    # The deleted bangumi's longer pattern is ignored; the alias still wins.
+    assert alias is not None and alias.id == 4
+
+
+def test_bangumi_matcher_overlapping_patterns():
+    automaton = _PatternAutomaton(["he", "she", "his", "hers"])
+
+    assert automaton.find("ushers") == {"she", "he", "hers"}
+    assert automaton.find("") == set()
+
+
 def test_preview_parse_failure_is_fail_closed_but_classic_stays_permissive(
     monkeypatch,
 ) -> None:
@@ -1359,3 +1690,73 @@ class TestOrphanTorrents:
 
         await db.delete_obj(torrent)
         assert await db.search_all() == []
+
+
+class TestEpisodeIndex:
+    """Tests for EpisodeIndexDatabase."""
+
+    @pytest.fixture(autouse=True)
+    def use_classic_engine(self, monkeypatch):
+        monkeypatch.setattr(settings.rss_parser, "engine", "classic")
+
+    async def _add(self, db_session, name: str, downloaded: bool = False):
+        await _ensure_bangumi(db_session, 61)
+        await TorrentDatabase(db_session).add(
+            Torrent(
+                name=name,
+                url=f"https://example.com/{name}",
+                bangumi_id=61,
+                downloaded=downloaded,
+            )
+        )
+
+    async def test_sync_parses_each_torrent_once(self, db_session):
+        db = EpisodeIndexDatabase(db_session)
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 05 [1080p].mkv")
+
+        assert await db.sync([61]) == 1
+        assert await db.sync([61]) == 0
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 06 [1080p].mkv")
+        assert await db.sync([61]) == 1
+
+    async def test_downloaded_returns_stored_identity(self, db_session):
+        db = EpisodeIndexDatabase(db_session)
+        await self._add(
+            db_session, "[GroupA] Mushoku Tensei - 05v2 [1080p].mkv", downloaded=True
+        )
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 06 [1080p].mkv")
+
+        entries = (await db.downloaded([61]))[61]
+
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry.group_name == "GroupA"
+        assert entry.revision == 2
+        assert entry.season is None
+        assert entry_identity(entry, default_season=2) == (MediaType.EPISODE, 2, 5)
+
+    async def test_latest_episodes_uses_offset_signals(self, db_session):
+        db = EpisodeIndexDatabase(db_session)
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 05 [1080p].mkv")
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 07 [1080p].mkv")
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 07.5 [1080p].mkv")
+
+        assert await db.latest_episodes([61, 62]) == {61: 7}
+
+    async def test_engine_switch_reindexes(self, db_session, monkeypatch):
+        db = EpisodeIndexDatabase(db_session)
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 05 [1080p].mkv")
+        await db.sync([61])
+
+        monkeypatch.setattr(settings.rss_parser, "engine", "tokenizer")
+        assert await db.sync([61]) == 1
+        assert (await db_session.get(EpisodeIndex, 1)).parser == "tokenizer"
+
+    async def test_rebuild_reparses_everything(self, db_session):
+        db = EpisodeIndexDatabase(db_session)
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 05 [1080p].mkv")
+        await self._add(db_session, "[GroupA] Mushoku Tensei - 06 [1080p].mkv")
+        await db.sync([61])
+
+        assert await db.rebuild() == 2
+        assert await db.latest_episodes([61]) == {61: 6}
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from module.downloader.base import RenameOutcome, RenameResult
+from module.downloader.base import MutationBatch, RenameOutcome, RenameResult
 from module.downloader.download_client import (
     TORRENT_FETCH_PER_HOST_DELAY,
     AddResult,
@@ -24,6 +24,7 @@ def download_client(mock_qb_client):
         mock_settings.downloader.username = "admin"
         mock_settings.downloader.password = "admin"
         mock_settings.downloader.ssl = False
+        mock_settings.downloader.max_concurrency = 10
         mock_settings.downloader.path = "/downloads/Bangumi"
         mock_settings.bangumi_manage.group_tag = False
         with patch(
@@ -140,6 +141,43 @@ class TestAddTorrent:
         call_kwargs = mock_qb_client.add_torrents.call_args[1]
         assert len(call_kwargs["torrent_files"]) == 3
 
+    async def test_cached_torrent_files_skip_network_and_delay(
+        self, download_client, mock_qb_client
+    ):
+        """重试/重复收集时命中本地缓存：不再下载，也不等同主机间隔。"""
+        torrents = [
+            make_torrent(url=f"https://nyaa.si/download/{i}.torrent")
+            for i in range(1, 4)
+        ]
+        bangumi = make_bangumi()
+        files = [f"d4:infod4:name4:ep0{i}ee".encode() for i in range(1, 4)]
+
+        with (
+            patch("module.downloader.download_client.RequestContent") as MockReq,
+            patch(
+                "module.downloader.download_client.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            mock_req = AsyncMock()
+            mock_req.get_content = AsyncMock(side_effect=files)
+            MockReq.return_value.__aenter__ = AsyncMock(return_value=mock_req)
+            MockReq.return_value.__aexit__ = AsyncMock(return_value=False)
+
+            await download_client.add_torrent(torrents, bangumi)
+            mock_sleep.reset_mock()
+            result = await download_client.add_torrent(torrents, bangumi)
+            single = await download_client.add_torrent(torrents[0], bangumi)
+
+        assert result is AddResult.ADDED
+        assert single is AddResult.ADDED
+        assert mock_req.get_content.await_count == 3
+        mock_sleep.assert_not_awaited()
+        assert (
+            mock_qb_client.add_torrents.call_args_list[1][1]["torrent_files"] == files
+        )
+        assert mock_qb_client.add_torrents.call_args[1]["torrent_files"] == files[0]
+
     async def test_add_torrent_different_hosts_no_delay(
         self, download_client, mock_qb_client
     ):
@@ -336,6 +374,24 @@ class TestClientDelegation:
         )
         assert len(result) == 1
 
+    async def test_get_torrent_files_many(self, download_client, mock_qb_client):
+        """get_torrent_files_many hands the whole batch to the backend at once."""
+        mock_qb_client.torrents_files_many.side_effect = None
+        mock_qb_client.torrents_files_many.return_value = {"a": [], "b": []}
+
+        result = await download_client.get_torrent_files_many(["a", "b"])
+
+        assert result == {"a": [], "b": []}
+        mock_qb_client.torrents_files_many.assert_awaited_once_with(
+            torrent_hashes=["a", "b"]
+        )
+
+    async def test_get_torrent_files_many_empty_batch_skips_backend(
+        self, download_client, mock_qb_client
+    ):
+        assert await download_client.get_torrent_files_many([]) == {}
+        mock_qb_client.torrents_files_many.assert_not_called()
+
     async def test_torrent_exists_preserves_unknown_state(
         self, download_client, mock_qb_client
     ):
@@ -409,6 +465,60 @@ class TestAddTag:
         await download_client.add_tag("abc", "ab:1")
 
 
+# ---------------------------------------------------------------------------
+# apply_mutations
+# ---------------------------------------------------------------------------
+
+
+class TestApplyMutations:
+    async def test_one_call_per_tag_and_category(self, download_client, mock_qb_client):
+        batch = MutationBatch()
+        for h in ("h1", "h2", "h3"):
+            batch.add_tag(h, "ab:renamed")
+        batch.add_tag("h4", "ab:7")
+        batch.set_category("h1", "BangumiCollection")
+        batch.set_category("h2", "BangumiCollection")
+
+        assert await download_client.apply_mutations(batch) is True
+
+        assert mock_qb_client.add_tag.await_args_list == [
+            ((["h1", "h2", "h3"], "ab:renamed"),),
+            ((["h4"], "ab:7"),),
+        ]
+        mock_qb_client.set_category.assert_awaited_once_with(
+            ["h1", "h2"], "BangumiCollection"
+        )
+
+    async def test_failed_group_does_not_stop_the_rest(
+        self, download_client, mock_qb_client
+    ):
+        mock_qb_client.add_tag.side_effect = [RuntimeError("qB down"), None]
+        batch = MutationBatch()
+        batch.add_tag("h1", "ab:1")
+        batch.add_tag("h2", "ab:2")
+        batch.set_category("h1", "BangumiCollection")
+
+        assert await download_client.apply_mutations(batch) is False
+        assert mock_qb_client.add_tag.await_count == 2
+        mock_qb_client.set_category.assert_awaited_once()
+
+    async def test_empty_batch_makes_no_calls(self, download_client, mock_qb_client):
+        assert await download_client.apply_mutations(MutationBatch()) is True
+        mock_qb_client.add_tag.assert_not_called()
+        mock_qb_client.set_category.assert_not_called()
+
+    def test_batch_dedupes_and_last_category_wins(self):
+        batch = MutationBatch()
+        batch.add_tag("h1", "ab:renamed")
+        batch.add_tag("h1", "ab:renamed")
+        batch.set_category("h1", "Bangumi")
+        batch.set_category("h1", "BangumiCollection")
+
+        assert batch.tags == {"ab:renamed": ["h1"]}
+        assert batch.categories == {"Bangumi": [], "BangumiCollection": ["h1"]}
+        assert len(batch) == 2
+
+
 # ---------------------------------------------------------------------------
 # Context manager: ConnectionError on failed auth
 # ---------------------------------------------------------------------------
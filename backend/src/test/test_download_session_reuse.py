@@ -20,6 +20,7 @@ def _patch_qb_settings(mock_settings, host="localhost:8080"):
     mock_settings.downloader.username = "admin"
     mock_settings.downloader.password = "admin"
     mock_settings.downloader.ssl = False
+    mock_settings.downloader.max_concurrency = 10
 
 
 class _FakeHTTP:
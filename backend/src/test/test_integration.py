@@ -177,6 +177,7 @@ class TestRenameFlow:
             mock_settings.downloader.username = "admin"
             mock_settings.downloader.password = "admin"
             mock_settings.downloader.ssl = False
+            mock_settings.downloader.max_concurrency = 10
             mock_settings.downloader.path = "/downloads/Bangumi"
             mock_settings.bangumi_manage.group_tag = False
             with patch(
@@ -211,6 +212,8 @@ class TestRenameFlow:
         with patch.object(renamer._parser, "torrent_parser", return_value=ep):
             with patch("module.manager.renamer.settings") as mock_mgr_settings:
                 mock_mgr_settings.bangumi_manage.rename_method = "pn"
+                mock_mgr_settings.bangumi_manage.rename_concurrency = 4
+                mock_mgr_settings.downloader.max_concurrency = 10
                 mock_mgr_settings.bangumi_manage.remove_bad_torrent = False
                 with patch("module.downloader.path.settings") as mock_path_settings:
                     mock_path_settings.downloader.path = "/downloads/Bangumi"
@@ -237,6 +240,7 @@ class TestRenameFlow:
             mock_settings.downloader.username = "admin"
             mock_settings.downloader.password = "admin"
             mock_settings.downloader.ssl = False
+            mock_settings.downloader.max_concurrency = 10
             mock_settings.downloader.path = "/downloads/Bangumi"
             mock_settings.bangumi_manage.group_tag = False
             with patch(
@@ -274,6 +278,8 @@ class TestRenameFlow:
         with patch.object(renamer._parser, "torrent_parser", side_effect=mock_parser):
             with patch("module.manager.renamer.settings") as mock_mgr_settings:
                 mock_mgr_settings.bangumi_manage.rename_method = "pn"
+                mock_mgr_settings.bangumi_manage.rename_concurrency = 4
+                mock_mgr_settings.downloader.max_concurrency = 10
                 mock_mgr_settings.bangumi_manage.remove_bad_torrent = False
                 with patch("module.downloader.path.settings") as mock_path_settings:
                     mock_path_settings.downloader.path = "/downloads/Bangumi"
@@ -283,7 +289,7 @@ class TestRenameFlow:
         assert mock_qb_client.torrents_rename_file.call_count == 3
         # Verify: category set to BangumiCollection
         mock_qb_client.set_category.assert_called_once_with(
-            "batch_hash", "BangumiCollection"
+            ["batch_hash"], "BangumiCollection"
         )
 
 
@@ -12,9 +12,12 @@ import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from module.core.completion import CompletionQueue
 from module.core.loops import (
+    aria2_event_tick,
     offset_scan_tick,
     rename_tick,
+    retention_tick,
     rss_tick,
     update_check_tick,
 )
@@ -25,6 +28,8 @@ from module.notification.events import (
     RssFailureEvent,
     UpdateAvailableEvent,
 )
+from module.rss import FeedSnapshot
+from test.factories import make_rss_item
 
 # ---------------------------------------------------------------------------
 # offset_scan_tick
@@ -138,6 +143,60 @@ class TestRssTick:
 
         notifier.send_event.assert_awaited_once_with(events[0])
 
+    async def test_analyser_and_engine_share_one_feed_snapshot(self):
+        """聚合源只拉取一次：分析与刷新拿到同一个快照。"""
+        rss = make_rss_item()
+        notifier = AsyncMock()
+        analyser = AsyncMock()
+        mock_db = AsyncMock()
+        mock_db.rss.search_aggregate = AsyncMock(return_value=[rss])
+        mock_engine = AsyncMock()
+        mock_engine.refresh_rss = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "module.core.loops.DownloadClient",
+                return_value=_async_cm(AsyncMock()),
+            ),
+            patch("module.core.loops.Database", return_value=_async_cm(mock_db)),
+            patch("module.core.loops.RSSEngine", return_value=mock_engine),
+            patch("module.core.loops.settings") as mock_settings,
+        ):
+            mock_settings.bangumi_manage.eps_complete = False
+            await rss_tick(analyser, notifier)
+
+        analyser_snapshot = analyser.rss_to_data.await_args.kwargs["snapshot"]
+        engine_snapshot = mock_engine.refresh_rss.await_args.kwargs["snapshot"]
+        assert isinstance(analyser_snapshot, FeedSnapshot)
+        assert analyser_snapshot is engine_snapshot
+        assert analyser_snapshot.is_complete(rss.url)
+
+    async def test_analyser_failure_marks_feed_incomplete(self):
+        rss = make_rss_item()
+        notifier = AsyncMock()
+        analyser = AsyncMock()
+        analyser.rss_to_data = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_db = AsyncMock()
+        mock_db.rss.search_aggregate = AsyncMock(return_value=[rss])
+        mock_db.rss.search_id = AsyncMock(return_value=rss)
+        mock_engine = AsyncMock()
+        mock_engine.refresh_rss = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "module.core.loops.DownloadClient",
+                return_value=_async_cm(AsyncMock()),
+            ),
+            patch("module.core.loops.Database", return_value=_async_cm(mock_db)),
+            patch("module.core.loops.RSSEngine", return_value=mock_engine),
+            patch("module.core.loops.settings") as mock_settings,
+        ):
+            mock_settings.bangumi_manage.eps_complete = False
+            await rss_tick(analyser, notifier)
+
+        snapshot = mock_engine.refresh_rss.await_args.kwargs["snapshot"]
+        assert not snapshot.is_complete(rss.url)
+
 
 # ---------------------------------------------------------------------------
 # rename_tick
@@ -249,6 +308,93 @@ class TestRenameTick:
         # under 2x a single call's latency.
         assert elapsed < 0.15
 
+    async def test_first_tick_is_full_pass(self):
+        """Without a previous sweep the tick renames everything."""
+        completions = CompletionQueue()
+        completions.put("abc123", "hook")
+        mock_renamer = AsyncMock()
+        mock_renamer.rename = AsyncMock(return_value=[])
+        mock_renamer.events = []
+
+        with (
+            patch(
+                "module.core.loops.DownloadClient",
+                return_value=_async_cm(AsyncMock()),
+            ),
+            patch("module.core.loops.Renamer", return_value=mock_renamer),
+        ):
+            await rename_tick(AsyncMock(), completions)
+
+        assert len(completions) == 0
+        mock_renamer.rename.assert_awaited_once()
+        mock_renamer.rename_hashes.assert_not_awaited()
+
+    async def test_event_tick_renames_only_queued_hashes(self):
+        """A tick woken between sweeps takes the targeted path."""
+        completions = CompletionQueue()
+        completions.mark_swept()
+        completions.put("abc123", "hook")
+        notify = Notification(official_title="Test Anime", season=1, episode=1)
+        notifier = AsyncMock()
+        mock_renamer = AsyncMock()
+        mock_renamer.rename_hashes = AsyncMock(return_value=[notify])
+        mock_renamer.events = []
+
+        with (
+            patch(
+                "module.core.loops.DownloadClient",
+                return_value=_async_cm(AsyncMock()),
+            ),
+            patch("module.core.loops.Renamer", return_value=mock_renamer),
+            patch("module.core.loops.settings") as mock_settings,
+        ):
+            mock_settings.program.rename_time = 60
+            mock_settings.notification.enable = True
+            await rename_tick(notifier, completions)
+
+        mock_renamer.rename_hashes.assert_awaited_once_with(["abc123"])
+        mock_renamer.rename.assert_not_awaited()
+        notifier.send_all.assert_awaited_once_with(notify)
+
+    async def test_spurious_wake_between_sweeps_skips_downloader(self):
+        completions = CompletionQueue()
+        completions.mark_swept()
+
+        with (
+            patch("module.core.loops.DownloadClient") as mock_client,
+            patch("module.core.loops.settings") as mock_settings,
+        ):
+            mock_settings.program.rename_time = 60
+            await rename_tick(AsyncMock(), completions)
+
+        mock_client.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# aria2_event_tick
+# ---------------------------------------------------------------------------
+
+
+class TestAria2EventTick:
+    async def test_routes_listener_callbacks_into_queue(self):
+        completions = CompletionQueue()
+
+        async def fake_listen(host, on_complete, on_connect, on_disconnect):
+            on_connect()
+            assert completions.event_driven is True
+            on_complete("2089b05ecca3d829")
+            on_disconnect()
+
+        with (
+            patch("module.core.loops.aria2_events.listen", side_effect=fake_listen),
+            patch("module.core.loops.settings") as mock_settings,
+        ):
+            mock_settings.downloader.host = "http://aria2:6800"
+            await aria2_event_tick(completions)
+
+        assert completions.drain() == ["2089b05ecca3d829"]
+        assert completions.event_driven is False
+
 
 # ---------------------------------------------------------------------------
 # update_check_tick
@@ -316,3 +462,57 @@ class TestUpdateCheckTick:
             await update_check_tick(notifier)
 
         notifier.send_event.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# retention_tick
+# ---------------------------------------------------------------------------
+
+
+class TestRetentionTick:
+    async def test_prunes_with_configured_limits_then_compacts(self):
+        db = MagicMock()
+        db.torrent.prune = AsyncMock(return_value=3)
+        db.compact = AsyncMock(return_value=False)
+        db.poster_links = AsyncMock(return_value={"posters/kept.jpg"})
+        db.__aenter__ = AsyncMock(return_value=db)
+        db.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch("module.core.loops.Database", return_value=db),
+            patch("module.core.loops.settings") as mock_settings,
+            patch("module.core.loops.collect_posters", return_value=0) as collect,
+            patch("module.core.loops.mikan_posters", return_value=set()),
+            patch("module.core.loops.tmdb_posters", return_value=set()),
+            patch("module.core.loops.preview_posters", return_value=set()),
+        ):
+            mock_settings.bangumi_manage.torrent_retention_days = 30
+            mock_settings.bangumi_manage.torrent_retention_count = 200
+            await retention_tick()
+
+        db.torrent.prune.assert_awaited_once_with(30, 200)
+        db.compact.assert_awaited_once()
+        collect.assert_called_once_with({"posters/kept.jpg"})
+
+    async def test_keeps_posters_held_by_lookup_caches(self):
+        """A cached lookup can still hand its poster to a new bangumi."""
+        db = MagicMock()
+        db.torrent.prune = AsyncMock(return_value=0)
+        db.compact = AsyncMock(return_value=False)
+        db.poster_links = AsyncMock(return_value={"posters/db.jpg"})
+        db.__aenter__ = AsyncMock(return_value=db)
+        db.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch("module.core.loops.Database", return_value=db),
+            patch("module.core.loops.settings"),
+            patch("module.core.loops.collect_posters", return_value=0) as collect,
+            patch("module.core.loops.mikan_posters", return_value={"posters/m.jpg"}),
+            patch("module.core.loops.tmdb_posters", return_value={"posters/t.jpg"}),
+            patch("module.core.loops.preview_posters", return_value={"posters/s.jpg"}),
+        ):
+            await retention_tick()
+
+        collect.assert_called_once_with(
+            {"posters/db.jpg", "posters/m.jpg", "posters/t.jpg", "posters/s.jpg"}
+        )
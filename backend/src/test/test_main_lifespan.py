@@ -23,7 +23,16 @@ class TestCreateApp:
         app = main.create_app()
         assert isinstance(app.state.ctx, AppContext)
         names = [t.name for t in app.state.ctx.scheduler.tasks]
-        assert names == ["rss", "rename", "offset_scan", "calendar", "update_check"]
+        assert names == [
+            "rss",
+            "rename",
+            "notify",
+            "aria2_events",
+            "offset_scan",
+            "calendar",
+            "retention",
+            "update_check",
+        ]
 
 
 class TestLifespan:
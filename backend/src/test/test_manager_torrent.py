@@ -5,7 +5,7 @@
 去重记录）；聚合订阅与仍被其他番剧引用的订阅不受影响。
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from module.database import Database
 from module.manager import TorrentManager
@@ -153,3 +153,44 @@ class TestTorrentMatching:
             hashes = await match_torrents_list(bangumi)
 
         assert hashes == ["matched"]
+
+
+class TestRefreshMetadata:
+    async def test_refresh_runs_through_pipeline_and_updates_rows(self, db_engine):
+        ended = MagicMock(series_status="Ended", poster_link="posters/ended.jpg")
+        airing = MagicMock(series_status="Returning Series", poster_link=None)
+        infos = {"Ended Show": ended, "Airing Show": airing}
+
+        async with Database(engine=db_engine) as db:
+            await _seed(
+                db,
+                bangumi=[
+                    make_bangumi(
+                        id=1,
+                        official_title="Ended Show",
+                        title_raw="Ended",
+                        poster_link=None,
+                    ),
+                    make_bangumi(
+                        id=2, official_title="Airing Show", title_raw="Airing"
+                    ),
+                    make_bangumi(
+                        id=3, official_title="Gone Show", title_raw="Gone", deleted=True
+                    ),
+                ],
+            )
+            lookup = AsyncMock(side_effect=lambda title, _lang: infos.get(title))
+            with patch("module.manager.torrent.tmdb_parser", new=lookup):
+                resp = await TorrentManager(db).refresh_metadata()
+
+            assert resp.status is True
+            # 已删除的番剧不查询
+            assert sorted(c.args[0] for c in lookup.await_args_list) == [
+                "Airing Show",
+                "Ended Show",
+            ]
+            ended_row = await db.bangumi.search_id(1)
+            assert ended_row.archived is True
+            assert ended_row.poster_link == "posters/ended.jpg"
+            assert (await db.bangumi.search_id(2)).archived is False
+            assert "Archived 1" in resp.msg_en
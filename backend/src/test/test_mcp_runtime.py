@@ -1,8 +1,11 @@
 """Tests for MCP runtime context wiring (module.mcp.runtime)."""
 
-from unittest.mock import MagicMock
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from module.mcp import create_mcp_app
+from module.mcp import LazyMcpApp, create_mcp_app
 from module.mcp.runtime import get_context, set_context
 from module.mcp.tools import _get_program_status
 
@@ -16,6 +19,19 @@ class TestRuntimeContext:
         finally:
             set_context(None)
 
+    async def test_lazy_app_builds_on_first_request(self):
+        built = AsyncMock()
+        app = LazyMcpApp("ctx")
+        with patch(
+            "module.mcp.server.create_mcp_starlette_app", return_value=built
+        ) as factory:
+            assert not app.loaded
+            await app({"type": "http"}, None, None)
+            await app({"type": "http"}, None, None)
+
+        factory.assert_called_once_with("ctx")
+        assert built.await_count == 2
+
     def test_get_context_defaults_to_none(self):
         set_context(None)
         assert get_context() is None
@@ -39,3 +55,22 @@ class TestProgramStatusReadsContext:
         result = _get_program_status()
         assert result["running"] is False
         assert result["first_run"] is True
+
+
+def test_importing_main_skips_optional_subsystems(tmp_path):
+    """MCP and passkey SDKs load on first use, not at boot."""
+    src = Path(__file__).resolve().parent.parent
+    probe = (
+        "import sys, main; "
+        "print(','.join(m for m in ('mcp', 'webauthn') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(src), "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    assert result.stdout.strip() == ""
@@ -197,6 +197,7 @@ class TestToolsDefinitions:
             "subscribe_anime",
             "unsubscribe_anime",
             "list_downloads",
+            "rename_downloads",
             "list_rss_feeds",
             "get_program_status",
             "refresh_feeds",
@@ -447,6 +448,7 @@ class TestDispatch:
             result = await _dispatch("list_downloads", {})
 
         expected_keys = {
+            "hash",
             "name",
             "size",
             "progress",
@@ -457,6 +459,55 @@ class TestDispatch:
         }
         assert set(result[0].keys()) == expected_keys
 
+    # --- rename_downloads ---
+
+    async def test_dispatch_rename_downloads_targets_hashes(self):
+        """rename_downloads runs the targeted renamer for the given hashes."""
+        from module.models import Notification
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_renamer = MagicMock()
+        mock_renamer.rename_hashes = AsyncMock(
+            return_value=[Notification(official_title="Anime", season=1, episode=3)]
+        )
+
+        with (
+            patch("module.mcp.tools.DownloadClient", return_value=mock_client),
+            patch("module.mcp.tools.Renamer", return_value=mock_renamer),
+        ):
+            result = await _dispatch("rename_downloads", {"hashes": ["h1"]})
+
+        mock_renamer.rename_hashes.assert_awaited_once_with(["h1"])
+        assert result == {
+            "status": True,
+            "renamed": [{"official_title": "Anime", "season": 1, "episode": 3}],
+        }
+
+    async def test_dispatch_rename_downloads_notifies_like_the_tick(self):
+        """rename_downloads hands conflicts and episodes to the live notifier."""
+        from module.models import Notification
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        renamed = [Notification(official_title="Anime", season=1, episode=3)]
+        mock_renamer = MagicMock()
+        mock_renamer.rename_hashes = AsyncMock(return_value=renamed)
+        mock_renamer.events = [MagicMock()]
+        ctx = MagicMock()
+
+        with (
+            patch("module.mcp.tools.DownloadClient", return_value=mock_client),
+            patch("module.mcp.tools.Renamer", return_value=mock_renamer),
+            patch("module.mcp.tools.get_context", return_value=ctx),
+            patch("module.mcp.tools.notify_renames", new_callable=AsyncMock) as notify,
+        ):
+            await _dispatch("rename_downloads", {"hashes": ["h1"]})
+
+        notify.assert_awaited_once_with(ctx.notifier, mock_renamer.events, renamed)
+
     # --- list_rss_feeds ---
 
     async def test_dispatch_list_rss_feeds(self):
@@ -383,6 +383,87 @@ class TestRunMigrations:
         aria2_cols = _columns(engine, "aria2_gid")
         assert "rename_intent" in aria2_cols
 
+    def test_v27_backfills_torrent_created_at_and_seen_table(self):
+        """v27: retention ages rows by created_at; pre-v27 rows start now."""
+        engine = _make_v0_engine()
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO torrent (id, name, url) VALUES (1, 'a', 'u')")
+            )
+        run_migrations(engine)
+
+        with engine.connect() as conn:
+            created = conn.execute(
+                text("SELECT created_at FROM torrent WHERE id = 1")
+            ).scalar_one()
+        assert created is not None
+        seen_indexes = {
+            ix["name"] for ix in inspect(engine).get_indexes("torrent_seen")
+        }
+        assert "ix_torrent_seen_rss_id" in seen_indexes
+
+    def test_v28_splits_rss_link_into_link_table(self):
+        engine = _make_v0_engine()
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE bangumi ADD COLUMN rss_link TEXT"))
+            conn.execute(
+                text(
+                    "INSERT INTO bangumi (id, official_title, rss_link) VALUES "
+                    "(1, 'a', 'rss1, rss2,,rss1'), (2, 'b', ''), (3, 'c', 'rss2')"
+                )
+            )
+        run_migrations(engine)
+
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT bangumi_id, url FROM bangumi_rss ORDER BY 1, 2")
+            ).all()
+        assert [tuple(r) for r in rows] == [(1, "rss1"), (1, "rss2"), (3, "rss2")]
+
+    def test_v28_backfills_table_precreated_by_create_all(self):
+        """Upgrades run create_all first, which leaves an empty bangumi_rss."""
+        engine = _make_v0_engine()
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE bangumi ADD COLUMN rss_link TEXT"))
+            conn.execute(
+                text(
+                    "INSERT INTO bangumi (id, official_title, rss_link) VALUES (1, 'a', 'x')"
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE TABLE bangumi_rss (bangumi_id INTEGER NOT NULL, "
+                    "url VARCHAR NOT NULL, PRIMARY KEY (bangumi_id, url))"
+                )
+            )
+        run_migrations(engine)
+
+        with engine.connect() as conn:
+            assert conn.execute(
+                text("SELECT url FROM bangumi_rss")
+            ).scalars().all() == ["x"]
+
+    def test_v29_episode_index_cascades_torrent_deletes(self):
+        engine = _make_v0_engine()
+        run_migrations(engine)
+
+        with engine.begin() as conn:
+            conn.execute(text("PRAGMA foreign_keys=ON"))
+            conn.execute(
+                text("INSERT INTO torrent (id, name, url) VALUES (1, 'a', 'u')")
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO episode_index (torrent_id, parser) "
+                    "VALUES (1, 'classic')"
+                )
+            )
+            conn.execute(text("DELETE FROM torrent WHERE id = 1"))
+            remaining = conn.execute(
+                text("SELECT COUNT(*) FROM episode_index")
+            ).scalar_one()
+        assert remaining == 0
+
     def test_creates_inboxmessage_table(self):
         """v16 creates the in-app notification center table with its indexes."""
         engine = _make_v0_engine()
@@ -1,6 +1,8 @@
 """Tests for the Mikan homepage parser's module-level cache."""
 
+import asyncio
 import importlib
+from unittest.mock import AsyncMock, patch
 
 # `module.parser.analyser.__init__` re-exports the `mikan_parser` function under
 # the same name as this submodule, shadowing the submodule on the package
@@ -21,3 +23,56 @@ def test_reset_cache_clears_mikan_cache():
     mikan_parser_module.reset_cache()
 
     assert len(mikan_parser_module._mikan_cache) == 0
+
+
+def test_cached_posters_lists_local_poster_links():
+    """Poster retention keeps posters a cached homepage lookup still returns."""
+    mikan_parser_module.reset_cache()
+    mikan_parser_module._mikan_cache["https://mikanani.me/Home/Episode/a"] = (
+        "posters/a.jpg",
+        "A",
+    )
+    mikan_parser_module._mikan_cache["https://mikanani.me/Home/Episode/b"] = ("", "B")
+    try:
+        assert mikan_parser_module.cached_posters() == {"posters/a.jpg"}
+    finally:
+        mikan_parser_module.reset_cache()
+
+
+_HOMEPAGE_HTML = """
+<div class="bangumi-poster" style="background-image: url('/images/Bangumi/p.jpg?w=1');"></div>
+<p class="bangumi-title"><a href="/Home/Bangumi/1">葬送的芙莉莲 第二季</a></p>
+"""
+
+
+async def test_concurrent_lookups_of_same_homepage_are_coalesced():
+    """A batch of torrents pointing at one homepage fetches it only once."""
+    homepage = "https://mikanani.me/Home/Episode/coalesce"
+    mikan_parser_module.reset_cache()
+
+    async def get_html(url):
+        await asyncio.sleep(0)
+        return _HOMEPAGE_HTML
+
+    with (
+        patch.object(
+            mikan_parser_module.RequestContent,
+            "get_html",
+            AsyncMock(side_effect=get_html),
+        ) as mock_html,
+        patch.object(
+            mikan_parser_module.RequestContent,
+            "get_poster",
+            AsyncMock(return_value="posters/p.jpg"),
+        ) as mock_poster,
+    ):
+        results = await asyncio.gather(
+            *(mikan_parser_module.mikan_parser(homepage) for _ in range(3))
+        )
+
+    assert results == [("posters/p.jpg", "葬送的芙莉莲")] * 3
+    mock_html.assert_awaited_once()
+    mock_poster.assert_awaited_once_with(
+        "https://mikanani.me/images/Bangumi/p.jpg", "jpg"
+    )
+    mikan_parser_module.reset_cache()
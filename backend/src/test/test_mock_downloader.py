@@ -211,6 +211,12 @@ class TestMockDownloaderTorrentsFiles:
         result = await mock_dl.torrents_files(torrent_hash="nonexistent")
         assert result == []
 
+    async def test_files_many_is_keyed_by_hash(self, mock_dl):
+        files = [{"name": "ep01.mkv", "size": 1}]
+        h = mock_dl.add_mock_torrent("Anime", files=files)
+        result = await mock_dl.torrents_files_many([h, "nonexistent"])
+        assert result == {h: files, "nonexistent": []}
+
 
 class TestMockDownloaderDelete:
     async def test_delete_single_torrent(self, mock_dl):
@@ -0,0 +1,245 @@
+"""Queued episode notifications: digests, rate limits, retries, media reuse."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from module.database import Database
+from module.models.bangumi import Notification
+from module.models.config import NotificationProvider as ProviderConfig
+from module.notification import NotificationManager
+from module.notification.providers import TelegramProvider
+from module.notification.queue import (
+    DIGEST_WINDOW,
+    MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    TokenBucket,
+    provider_key,
+)
+
+TELEGRAM = ProviderConfig(type="telegram", enabled=True, token="t", chat_id="1")
+WEBHOOK = ProviderConfig(type="webhook", enabled=True, url="https://example.com/hook")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTask:
+    running = True
+
+    def __init__(self) -> None:
+        self.wakes = 0
+
+    def wake(self) -> None:
+        self.wakes += 1
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock):
+    with patch("module.notification.manager.settings") as mock_settings:
+        mock_settings.notification.providers = [TELEGRAM]
+        built = NotificationManager(clock=clock)
+    built.bind(FakeTask())  # type: ignore[arg-type]
+    provider = built.providers[0]
+    provider.send_batch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+    return built
+
+
+def _episode(episode, title="Frieren"):
+    return Notification(
+        official_title=title, season=1, episode=episode, poster_path="posters/a.jpg"
+    )
+
+
+async def _queued() -> int:
+    async with Database() as db:
+        return len(await db.notification_queue.pending())
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(rate=0.5, burst=2, clock=clock)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == pytest.approx(2.0)
+    clock.now += 2
+    assert bucket.try_acquire()
+
+
+def test_provider_key_ignores_template_but_not_destination():
+    retemplated = TELEGRAM.model_copy(update={"template": "{{title}}"})
+    other_chat = ProviderConfig(type="telegram", enabled=True, token="t", chat_id="2")
+
+    assert provider_key(retemplated) == provider_key(TELEGRAM)
+    assert provider_key(other_chat) != provider_key(TELEGRAM)
+
+
+async def test_episodes_within_window_are_sent_as_one_digest(manager, clock):
+    provider = manager.providers[0]
+    for episode in (3, 1, 2):
+        await manager.send_all(_episode(episode))
+
+    assert manager._task.wakes == 3
+    assert await manager.deliver_due() == 0
+    provider.send_batch.assert_not_awaited()
+    assert manager.next_delivery_in() == pytest.approx(DIGEST_WINDOW)
+
+    clock.now += DIGEST_WINDOW
+    assert await manager.deliver_due() == 3
+
+    provider.send_batch.assert_awaited_once()
+    assert provider.send_batch.await_args is not None
+    sent = provider.send_batch.await_args.args[0]
+    assert [n.episode for n in sent] == [1, 2, 3]
+    assert all(isinstance(n.episode, int) for n in sent)
+    assert await _queued() == 0
+
+
+async def test_failed_delivery_backs_off_then_gives_up(manager, clock):
+    provider = manager.providers[0]
+    provider.send_batch.return_value = False
+    await manager.send_all(_episode(1))
+    clock.now += DIGEST_WINDOW
+
+    await manager.deliver_due()
+    assert await _queued() == 1
+    assert manager.next_delivery_in() == pytest.approx(RETRY_BASE_DELAY)
+
+    for _ in range(MAX_ATTEMPTS - 1):
+        clock.now += 3600
+        await manager.deliver_due()
+    assert provider.send_batch.await_count == MAX_ATTEMPTS
+    assert await _queued() == 0
+
+
+async def test_webhook_episodes_are_sent_and_retried_one_by_one(clock):
+    """A failed webhook episode is retried alone; delivered ones are not resent."""
+    with patch("module.notification.manager.settings") as mock_settings:
+        mock_settings.notification.providers = [WEBHOOK]
+        manager = NotificationManager(clock=clock)
+    manager.bind(FakeTask())  # type: ignore[arg-type]
+    provider = manager.providers[0]
+    provider.send = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda n: n.episode != 2
+    )
+    for episode in (1, 2, 3):
+        await manager.send_all(_episode(episode))
+    clock.now += DIGEST_WINDOW
+
+    assert await manager.deliver_due() == 2
+    assert [c.args[0].episode for c in provider.send.await_args_list] == [1, 2, 3]
+    assert await _queued() == 1
+
+    provider.send.reset_mock()
+    clock.now += 3600
+    await manager.deliver_due()
+    assert [c.args[0].episode for c in provider.send.await_args_list] == [2]
+
+
+async def test_rate_limit_leaves_excess_queued(manager, clock):
+    provider = manager.providers[0]
+    for title in ("A", "B", "C", "D", "E"):
+        await manager.send_all(_episode(1, title=title))
+    clock.now += DIGEST_WINDOW
+
+    assert await manager.deliver_due() == provider.RATE_BURST
+    assert await _queued() == 5 - provider.RATE_BURST
+    assert manager.next_delivery_in() == pytest.approx(1 / provider.RATE_LIMIT)
+
+
+async def test_rows_of_removed_providers_are_discarded(manager, clock):
+    await manager.send_all(_episode(1))
+    manager.providers = []
+
+    await manager.deliver_due(flush=True)
+
+    assert await _queued() == 0
+
+
+async def test_send_all_without_running_task_delivers_immediately(manager):
+    manager.bind(None)  # type: ignore[arg-type]
+    provider = manager.providers[0]
+
+    await manager.send_all(_episode(1))
+
+    provider.send_batch.assert_awaited_once()
+    assert await _queued() == 0
+
+
+def _photo_response(file_id: str):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "ok": True,
+        "result": {"photo": [{"file_id": "small"}, {"file_id": file_id}]},
+    }
+    return response
+
+
+async def test_telegram_reuses_uploaded_poster():
+    provider = TelegramProvider(TELEGRAM)
+    with (
+        patch.object(
+            provider, "post_files", new=AsyncMock(return_value=_photo_response("F1"))
+        ) as upload,
+        patch.object(
+            provider,
+            "post_data",
+            new=AsyncMock(return_value=MagicMock(status_code=200)),
+        ) as post,
+        patch(
+            "module.notification.providers.telegram.load_image",
+            new=AsyncMock(return_value=b"img"),
+        ),
+    ):
+        assert await provider.send(_episode(1))
+        assert await provider.send(_episode(2))
+
+    upload.assert_awaited_once()
+    assert post.await_args is not None
+    assert post.await_args.args[1]["photo"] == "F1"
+    assert provider.media == {"posters/a.jpg": "F1"}
+
+
+async def test_telegram_reuploads_when_file_id_is_rejected():
+    provider = TelegramProvider(TELEGRAM)
+    provider.media = {"posters/a.jpg": "STALE"}
+    with (
+        patch.object(
+            provider, "post_files", new=AsyncMock(return_value=_photo_response("F2"))
+        ) as upload,
+        patch.object(provider, "post_data", new=AsyncMock(return_value=None)),
+        patch(
+            "module.notification.providers.telegram.load_image",
+            new=AsyncMock(return_value=b"img"),
+        ),
+    ):
+        assert await provider.send(_episode(1))
+
+    upload.assert_awaited_once()
+    assert provider.media == {"posters/a.jpg": "F2"}
+
+
+async def test_manager_persists_uploaded_media(manager):
+    manager.bind(None)  # type: ignore[arg-type]
+    provider = manager.providers[0]
+
+    async def upload(notifications):
+        provider.media["posters/a.jpg"] = "F1"
+        return True
+
+    provider.send_batch.side_effect = upload
+    await manager.send_all(_episode(1))
+
+    async with Database() as db:
+        refs = await db.notification_queue.media([provider.key])
+    assert refs == {provider.key: {"posters/a.jpg": "F1"}}
@@ -358,3 +358,83 @@ class TestCheckBangumiUsesRealSignal:
         assert updated.needs_review_reason is not None
         assert "13" in updated.needs_review_reason
         assert "12" in updated.needs_review_reason
+
+
+class TestScanAll:
+    """scan_all loads torrents in one batch and fans bangumi out to the pipeline."""
+
+    async def test_batched_scan_flags_and_skips_tmdb_without_signal(self):
+        async with Database() as db:
+            flagged = make_bangumi(
+                official_title="Flagged Anime",
+                title_raw="Flagged Anime Raw",
+                season=2,
+                season_offset=0,
+                episode_offset=0,
+            )
+            silent = make_bangumi(
+                official_title="Silent Anime",
+                title_raw="Silent Anime Raw",
+                season=2,
+                season_offset=0,
+                episode_offset=0,
+            )
+            await db.bangumi.add(flagged)
+            await db.bangumi.add(silent)
+            await db.torrent.add(
+                Torrent(
+                    name="[TestGroup] Flagged Anime Raw - 25 [1080p].mkv",
+                    url="https://example.com/flagged-25",
+                    bangumi_id=flagged.id,
+                )
+            )
+
+        fake_tmdb_info = MagicMock()
+        fake_tmdb_info.last_season = 1
+        fake_tmdb_info.season_episode_counts = {1: 24}
+        fake_tmdb_info.series_status = "Ended"
+        fake_tmdb_info.virtual_season_starts = None
+
+        scanner = OffsetScanner()
+        with (
+            patch(
+                "module.core.offset_scanner.tmdb_parser",
+                new=AsyncMock(return_value=fake_tmdb_info),
+            ) as mock_tmdb,
+            patch.object(
+                scanner, "_get_latest_parsed_episode", new_callable=AsyncMock
+            ) as per_bangumi_lookup,
+        ):
+            events = await scanner.scan_all()
+
+        assert [event.official_title for event in events] == ["Flagged Anime"]
+        # 无种子信号的番剧不再查 TMDB；种子记录来自批量查询
+        mock_tmdb.assert_awaited_once()
+        per_bangumi_lookup.assert_not_awaited()
+
+    async def test_error_in_one_bangumi_does_not_stop_scan(self):
+        async with Database() as db:
+            for index in range(3):
+                await db.bangumi.add(
+                    make_bangumi(
+                        official_title=f"Anime {index}",
+                        title_raw=f"Anime Raw {index}",
+                        season_offset=0,
+                        episode_offset=0,
+                    )
+                )
+
+        scanner = OffsetScanner()
+        calls: list[str] = []
+
+        async def check(bangumi, torrents=None):
+            calls.append(bangumi.official_title)
+            if bangumi.official_title == "Anime 1":
+                raise RuntimeError("boom")
+            return None
+
+        with patch.object(scanner, "_check_bangumi", side_effect=check):
+            events = await scanner.scan_all()
+
+        assert events == []
+        assert sorted(calls) == ["Anime 0", "Anime 1", "Anime 2"]
@@ -283,3 +283,57 @@ def test_legacy_episode_compatibility_entry_follows_selected_engine(
     assert classic is not None
     assert classic.episode == 2
     assert preview is None
+
+
+def test_repeated_parse_is_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_engine(monkeypatch, "classic")
+    calls: list[str] = []
+    expected = ParsedRelease(raw="cached", title_en="Cached")
+
+    def counting_parse(raw: str) -> ParsedRelease | None:
+        calls.append(raw)
+        return expected
+
+    monkeypatch.setattr(selector.classic, "parse_release_title", counting_parse)
+    selector.reset_cache()
+
+    assert parse_configured_release_title("resource") is expected
+    assert parse_configured_release_title("resource") is expected
+
+    assert calls == ["resource"]
+    stats = selector.parse_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_engine_switch_invalidates_parse_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    classic = ParsedRelease(raw="classic", title_en="Classic")
+    preview = ParsedRelease(raw="preview", title_en="Preview")
+    monkeypatch.setattr(selector.classic, "parse_release_title", lambda raw: classic)
+    monkeypatch.setattr(selector.preview, "parse_release_title", lambda raw: preview)
+    selector.reset_cache()
+
+    _use_engine(monkeypatch, "classic")
+    assert parse_configured_release_title("resource") is classic
+    _use_engine(monkeypatch, "tokenizer")
+    assert parse_configured_release_title("resource") is preview
+
+    stats = selector.parse_cache_stats()
+    assert stats.hits == 0
+    assert stats.size == 1
+
+
+def test_parse_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_engine(monkeypatch, "classic")
+    monkeypatch.setattr(selector.classic, "parse_release_title", lambda raw: None)
+    monkeypatch.setattr(selector._parse_cache, "maxsize", 2)
+    selector.reset_cache()
+
+    for raw in ("a", "b", "c"):
+        parse_configured_release_title(raw)
+    parse_configured_release_title("a")
+
+    stats = selector.parse_cache_stats()
+    assert stats.size == 2
+    assert stats.hits == 0
@@ -0,0 +1,158 @@
+"""Tests for the bounded metadata pipeline and per-host rate limiting."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from module.network import HostRateLimiter, host_rate_limit
+from module.network.rate_limit import throttle
+from module.utils.pipeline import get_progress, reset_progress, run_pipeline
+
+
+@pytest.fixture(autouse=True)
+def _clean_progress():
+    reset_progress()
+    yield
+    reset_progress()
+
+
+class TestRunPipeline:
+    async def test_results_keep_input_order(self):
+        async def worker(n: int) -> int:
+            # 让后面的条目先完成，结果仍按输入顺序
+            await asyncio.sleep((5 - n) * 0.001)
+            return n * 10
+
+        results = await run_pipeline("t", range(5), worker, concurrency=5)
+
+        assert results == [0, 10, 20, 30, 40]
+
+    async def test_concurrency_is_bounded(self):
+        running = 0
+        peak = 0
+
+        async def worker(_):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        await run_pipeline("t", range(20), worker, concurrency=3, host_rate=0)
+
+        assert peak == 3
+
+    async def test_failures_are_isolated_and_counted(self):
+        async def worker(n: int) -> int:
+            if n == 2:
+                raise RuntimeError("boom")
+            return n
+
+        results = await run_pipeline("job", range(4), worker, concurrency=2)
+
+        assert results == [0, 1, None, 3]
+        [progress] = get_progress()
+        assert progress.name == "job"
+        assert (progress.total, progress.done, progress.failed) == (4, 4, 1)
+        assert progress.running is False
+        assert progress.finished_at is not None
+
+    async def test_empty_input(self):
+        worker = AsyncMock()
+
+        assert await run_pipeline("t", [], worker) == []
+        worker.assert_not_awaited()
+
+    async def test_defaults_come_from_settings(self):
+        running = 0
+        peak = 0
+
+        async def worker(_):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        with patch("module.utils.pipeline.settings") as mock_settings:
+            mock_settings.network.metadata_concurrency = 2
+            mock_settings.network.metadata_host_rate = 0
+            await run_pipeline("t", range(6), worker)
+
+        assert peak == 2
+
+    async def test_stages_are_published_with_progress(self):
+        stages: dict[str, float] = {}
+
+        async def worker(n: int) -> None:
+            stages["work"] = stages.get("work", 0.0) + n
+
+        await run_pipeline("t", [1, 2], worker, host_rate=0, stages=stages)
+
+        [progress] = get_progress()
+        assert progress.stages == {"work": 3.0}
+        assert progress.to_dict()["stages"] == {"work": 3.0}
+
+    async def test_quiet_pipeline_logs_at_debug(self, caplog):
+        async def worker(_):
+            return None
+
+        with caplog.at_level("INFO", logger="module.utils.pipeline"):
+            await run_pipeline("t", range(3), worker, host_rate=0, verbose=False)
+
+        assert caplog.records == []
+
+    async def test_requests_inside_pipeline_are_throttled(self):
+        async def worker(_):
+            await throttle("https://api.themoviedb.org/3/search")
+
+        with patch.object(HostRateLimiter, "acquire", AsyncMock()) as acquire:
+            await run_pipeline("t", range(3), worker, host_rate=5)
+
+        assert acquire.await_count == 3
+        acquire.assert_awaited_with("https://api.themoviedb.org/3/search")
+
+
+class TestHostRateLimiter:
+    async def test_same_host_requests_are_spaced(self):
+        limiter = HostRateLimiter(rate=2)  # 0.5s 间隔
+        slept: list[float] = []
+
+        async def fake_sleep(delay):
+            slept.append(delay)
+
+        with patch("module.network.rate_limit.asyncio.sleep", new=fake_sleep):
+            for _ in range(3):
+                await limiter.acquire("https://api.themoviedb.org/3/a")
+
+        # 第一次立即放行，之后依次预订 0.5s、1.0s 之后的时间片
+        assert len(slept) == 2
+        assert slept[0] == pytest.approx(0.5, abs=0.05)
+        assert slept[1] == pytest.approx(1.0, abs=0.05)
+
+    async def test_different_hosts_do_not_wait_for_each_other(self):
+        limiter = HostRateLimiter(rate=1)
+        with patch("module.network.rate_limit.asyncio.sleep") as mock_sleep:
+            await limiter.acquire("https://api.themoviedb.org/3/a")
+            await limiter.acquire("https://api.bgm.tv/calendar")
+
+        mock_sleep.assert_not_called()
+
+    async def test_zero_rate_disables_limit(self):
+        limiter = HostRateLimiter(rate=0)
+        with patch("module.network.rate_limit.asyncio.sleep") as mock_sleep:
+            for _ in range(5):
+                await limiter.acquire("https://api.themoviedb.org/3/a")
+
+        mock_sleep.assert_not_called()
+
+    async def test_throttle_is_noop_outside_limited_context(self):
+        limiter = HostRateLimiter(rate=1)
+        with patch.object(limiter, "acquire", AsyncMock()) as acquire:
+            await throttle("https://example.com")
+            with host_rate_limit(limiter):
+                await throttle("https://example.com")
+            await throttle("https://example.com")
+
+        acquire.assert_awaited_once_with("https://example.com")
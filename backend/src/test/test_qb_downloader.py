@@ -5,6 +5,7 @@ from self.host, so SSL/HTTPS behaviour is validated by observing auth() side-eff
 (log messages) rather than reading an instance attribute directly.
 """
 
+import asyncio
 import json
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -1181,6 +1182,118 @@ class TestTorrentsInfoPausedFilter:
         assert sent_params["filter"] == "completed"
 
 
+# ---------------------------------------------------------------------------
+# sync/maindata mirror (rid deltas instead of full torrents/info lists)
+# ---------------------------------------------------------------------------
+
+
+def _maindata(rid, torrents=None, removed=None, full_update=False):
+    resp = MagicMock(status_code=200)
+    payload = {"rid": rid, "torrents": torrents or {}}
+    if removed:
+        payload["torrents_removed"] = removed
+    if full_update:
+        payload["full_update"] = True
+    resp.json.return_value = payload
+    return resp
+
+
+class TestTorrentsInfoMirror:
+    def _make_qb(self, *responses):
+        qb = QbDownloader(host="localhost:8080", username="u", password="p", ssl=False)
+        qb._client = AsyncMock()
+        qb._client.request = AsyncMock(side_effect=list(responses))
+        return qb
+
+    async def test_applies_rid_deltas_and_filters_locally(self):
+        qb = self._make_qb(
+            _maindata(
+                1,
+                {
+                    "a": {"name": "A", "state": "uploading", "category": "Bangumi"},
+                    "b": {"name": "B", "state": "downloading", "category": "Bangumi"},
+                    "c": {"name": "C", "state": "stalledUP", "category": "Other"},
+                },
+                full_update=True,
+            ),
+            _maindata(2, {"b": {"state": "stalledUP"}}, removed=["a"]),
+        )
+
+        first = await qb.torrents_info(status_filter="completed", category="Bangumi")
+        qb._synced_at = None
+        second = await qb.torrents_info(status_filter="completed", category="Bangumi")
+
+        assert [t["hash"] for t in first] == ["a"]
+        assert second == [
+            {"hash": "b", "name": "B", "state": "stalledUP", "category": "Bangumi"}
+        ]
+        params = [c.kwargs["params"] for c in qb._client.request.call_args_list]
+        assert params == [{"rid": 0}, {"rid": 1}]
+
+    async def test_fresh_mirror_serves_repeat_queries_without_request(self):
+        qb = self._make_qb(
+            _maindata(
+                1,
+                {"a": {"state": "pausedDL", "category": "Bangumi", "tags": "ab:1, x"}},
+                full_update=True,
+            )
+        )
+
+        everything = await qb.torrents_info(status_filter=None, category=None)
+        tagged = await qb.torrents_info(status_filter="paused", category=None, tag="x")
+
+        assert [t["hash"] for t in everything] == ["a"]
+        assert [t["hash"] for t in tagged] == ["a"]
+        assert qb._client.request.await_count == 1
+
+    async def test_torrent_mutation_expires_mirror(self):
+        qb = self._make_qb(
+            _maindata(1, {"a": {"state": "uploading"}}, full_update=True),
+            MagicMock(status_code=200),
+            _maindata(2, {"a": {"category": "Bangumi"}}),
+        )
+        await qb.torrents_info(status_filter=None, category="Bangumi")
+
+        await qb.set_category("a", "Bangumi")
+        result = await qb.torrents_info(status_filter=None, category="Bangumi")
+
+        assert [t["hash"] for t in result] == ["a"]
+        assert qb._client.request.call_args.kwargs["params"] == {"rid": 1}
+
+    async def test_add_tag_joins_hash_list(self):
+        qb = self._make_qb(MagicMock(status_code=200))
+
+        await qb.add_tag(["a", "b", "c"], "ab:renamed")
+
+        data = qb._client.request.call_args.kwargs["data"]
+        assert data == {"hashes": "a|b|c", "tags": "ab:renamed"}
+
+    async def test_falls_back_to_torrents_info_when_sync_missing(self):
+        info = MagicMock(status_code=200)
+        info.json.return_value = [{"hash": "a", "state": "uploading"}]
+        qb = self._make_qb(MagicMock(status_code=404), info, info)
+
+        await qb.torrents_info(status_filter="completed", category="Bangumi")
+        result = await qb.torrents_info(status_filter="completed", category="Bangumi")
+
+        assert result == [{"hash": "a", "state": "uploading"}]
+        urls = [c.args[1] for c in qb._client.request.call_args_list]
+        assert [u.rsplit("/api/v2/", 1)[1] for u in urls] == [
+            "sync/maindata",
+            "torrents/info",
+            "torrents/info",
+        ]
+
+    async def test_unmirrored_filter_goes_to_server(self):
+        info = MagicMock(status_code=200)
+        info.json.return_value = []
+        qb = self._make_qb(info)
+
+        await qb.torrents_info(status_filter="active", category="Bangumi")
+
+        assert qb._client.request.call_args.kwargs["params"]["filter"] == "active"
+
+
 class TestTorrentExists:
     async def test_queries_exact_hash_and_confirms_presence(self):
         qb = QbDownloader(host="localhost:8080", username="u", password="p", ssl=False)
@@ -1209,6 +1322,51 @@ class TestTorrentExists:
         assert await qb.torrent_exists("abc123") is None
 
 
+class TestTorrentsFilesMany:
+    async def test_fan_out_is_capped_by_max_concurrency(self):
+        qb = QbDownloader(
+            host="localhost:8080",
+            username="u",
+            password="p",
+            ssl=False,
+            max_concurrency=2,
+        )
+        running = 0
+        peak = 0
+
+        async def fake_files(torrent_hash):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return [{"name": f"{torrent_hash}.mkv"}]
+
+        qb.torrents_files = fake_files
+
+        files = await qb.torrents_files_many([f"h{i}" for i in range(6)])
+
+        assert peak == 2
+        assert files["h5"] == [{"name": "h5.mkv"}]
+
+    def test_connection_pool_follows_max_concurrency(self):
+        qb = QbDownloader(
+            host="localhost:8080",
+            username="u",
+            password="p",
+            ssl=False,
+            max_concurrency=3,
+        )
+        with (
+            patch("module.downloader.client.qb_downloader.httpx.Limits") as limits,
+            patch("module.downloader.client.qb_downloader.httpx.AsyncClient"),
+        ):
+            qb._new_client()
+
+        assert limits.call_args.kwargs["max_connections"] == 3
+        assert limits.call_args.kwargs["max_keepalive_connections"] == 3
+
+
 # ---------------------------------------------------------------------------
 # torrents_delete (#1046)
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Tests for Renamer: gen_path, rename_file, rename_collection, rename flow."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from module.conf import settings
 from module.downloader import DownloadClient, RenameOutcome, RenameResult
 from module.manager.renamer import PreparedMediaRename, Renamer
 from module.models import EpisodeFile, Notification, SubtitleFile
+from module.utils.pipeline import get_progress
 
 # ---------------------------------------------------------------------------
 # gen_path
@@ -894,6 +896,8 @@ class TestRenameFlow:
         with patch.object(renamer._parser, "torrent_parser", return_value=ep):
             with patch("module.manager.renamer.settings") as mock_settings:
                 mock_settings.bangumi_manage.rename_method = "pn"
+                mock_settings.bangumi_manage.rename_concurrency = 4
+                mock_settings.downloader.max_concurrency = 10
                 mock_settings.bangumi_manage.remove_bad_torrent = False
                 with patch("module.downloader.path.settings") as mock_path_settings:
                     mock_path_settings.downloader.path = "/downloads/Bangumi"
@@ -931,15 +935,59 @@ class TestRenameFlow:
         with patch.object(renamer._parser, "torrent_parser", side_effect=mock_parser):
             with patch("module.manager.renamer.settings") as mock_settings:
                 mock_settings.bangumi_manage.rename_method = "pn"
+                mock_settings.bangumi_manage.rename_concurrency = 4
+                mock_settings.downloader.max_concurrency = 10
                 mock_settings.bangumi_manage.remove_bad_torrent = False
                 with patch("module.downloader.path.settings") as mock_path_settings:
                     mock_path_settings.downloader.path = "/downloads/Bangumi"
                     await renamer.rename()
 
         renamer.client.client.set_category.assert_called_once_with(
-            "h1", "BangumiCollection"
+            ["h1"], "BangumiCollection"
         )
 
+    async def test_renamed_tags_are_flushed_in_one_call(self, renamer):
+        """一轮里完成的种子攒起来，用一次多 hash 请求打 ab:renamed。"""
+        renamer.client.client.torrents_info.return_value = [
+            {
+                "hash": f"h{n}",
+                "name": f"[Sub] Anime - 0{n}.mkv",
+                "save_path": f"/downloads/Bangumi/Anime{n} (2024)/Season 1",
+            }
+            for n in (1, 2)
+        ]
+
+        async def files(torrent_hash):
+            return [{"name": f"[Sub] Anime - 0{torrent_hash[1]}.mkv"}]
+
+        renamer.client.client.torrents_files.side_effect = files
+
+        def mock_parser(torrent_path, season, **kwargs):
+            return EpisodeFile(
+                media_path=torrent_path,
+                title="Anime",
+                season=season,
+                episode=int(torrent_path[-5]),
+                suffix=".mkv",
+            )
+
+        with patch.object(renamer._parser, "torrent_parser", side_effect=mock_parser):
+            with patch("module.manager.renamer.settings") as mock_settings:
+                mock_settings.bangumi_manage.rename_method = "pn"
+                mock_settings.bangumi_manage.rename_concurrency = 4
+                mock_settings.downloader.max_concurrency = 10
+                mock_settings.bangumi_manage.remove_bad_torrent = False
+                with patch("module.downloader.path.settings") as mock_path_settings:
+                    mock_path_settings.downloader.path = "/downloads/Bangumi"
+                    result = await renamer.rename()
+
+        assert len(result) == 2
+        renamer.client.client.add_tag.assert_awaited_once()
+        hashes, tag = renamer.client.client.add_tag.await_args.args
+        assert sorted(hashes) == ["h1", "h2"]
+        assert tag == "ab:renamed"
+        assert renamer._mutations is None
+
     async def test_rename_flow_movie_collection_uses_file_sizes(self, renamer):
         """多文件电影种子走完整 rename 流程时，按文件体积选出主文件，
         目标文件名互不相同。"""
@@ -963,6 +1011,8 @@ class TestRenameFlow:
         ):
             with patch("module.manager.renamer.settings") as mock_settings:
                 mock_settings.bangumi_manage.rename_method = "advance"
+                mock_settings.bangumi_manage.rename_concurrency = 4
+                mock_settings.downloader.max_concurrency = 10
                 mock_settings.bangumi_manage.remove_bad_torrent = False
                 with patch("module.downloader.path.settings") as mock_path_settings:
                     mock_path_settings.downloader.path = "/downloads/Bangumi"
@@ -988,6 +1038,8 @@ class TestRenameFlow:
         ]
         with patch("module.manager.renamer.settings") as mock_settings:
             mock_settings.bangumi_manage.rename_method = "pn"
+            mock_settings.bangumi_manage.rename_concurrency = 4
+            mock_settings.downloader.max_concurrency = 10
             with patch("module.downloader.path.settings") as mock_path_settings:
                 mock_path_settings.downloader.path = "/downloads/Bangumi"
                 result = await renamer.rename()
@@ -995,6 +1047,145 @@ class TestRenameFlow:
         assert result == []
         renamer.client.client.torrents_rename_file.assert_not_called()
 
+    async def test_rename_hashes_only_touches_requested_torrents(self, renamer):
+        """Targeted rename fetches files and renames only the given hashes."""
+        renamer.client.client.torrents_info.return_value = [
+            {
+                "hash": "h1",
+                "name": "[Sub] Anime - 01.mkv",
+                "save_path": "/downloads/Bangumi/Anime (2024)/Season 1",
+            },
+            {
+                "hash": "h2",
+                "name": "[Sub] Anime - 02.mkv",
+                "save_path": "/downloads/Bangumi/Anime (2024)/Season 1",
+            },
+        ]
+        renamer.client.client.torrents_files.return_value = [
+            {"name": "[Sub] Anime - 01.mkv"}
+        ]
+        renamer.client.client.torrents_rename_file.return_value = True
+        ep = EpisodeFile(
+            media_path="[Sub] Anime - 01.mkv",
+            title="Anime",
+            season=1,
+            episode=1,
+            suffix=".mkv",
+        )
+        with (
+            patch.object(renamer._parser, "torrent_parser", return_value=ep),
+            patch.object(
+                renamer,
+                "_batch_lookup_offsets",
+                AsyncMock(return_value={"h1": (0, 0, "episode")}),
+            ) as lookup,
+            patch("module.manager.renamer.settings") as mock_settings,
+            patch("module.downloader.path.settings") as mock_path_settings,
+        ):
+            mock_settings.bangumi_manage.rename_method = "pn"
+            mock_settings.bangumi_manage.rename_concurrency = 4
+            mock_settings.downloader.max_concurrency = 10
+            mock_settings.bangumi_manage.remove_bad_torrent = False
+            mock_path_settings.downloader.path = "/downloads/Bangumi"
+            result = await renamer.rename_hashes(["H1"])
+
+        assert [n.episode for n in result] == [1]
+        renamer.client.client.torrents_files_many.assert_awaited_once_with(
+            torrent_hashes=["h1"]
+        )
+        assert lookup.await_args is not None
+        [infos] = lookup.await_args.args
+        assert [info["hash"] for info in infos] == ["h1"]
+
+    async def test_rename_hashes_stops_early_when_nothing_is_ready(self, renamer):
+        """A hash that is not a completed Bangumi task costs one listing."""
+        renamer.client.client.torrents_info.return_value = []
+
+        result = await renamer.rename_hashes(["h1"])
+
+        assert result == []
+        renamer.client.client.torrents_info.assert_awaited_once()
+        renamer.client.client.torrents_files_many.assert_not_awaited()
+
+    async def test_rename_hashes_without_hashes_is_noop(self, renamer):
+        assert await renamer.rename_hashes([]) == []
+        renamer.client.client.torrents_info.assert_not_awaited()
+
+    async def test_same_save_path_runs_in_order_other_paths_in_parallel(self, renamer):
+        """Torrents sharing a save path never overlap; other paths do."""
+        season = "/downloads/Bangumi/Anime (2024)/Season 1"
+        other = "/downloads/Bangumi/Other (2024)/Season 1"
+        renamer.client.client.torrents_info.return_value = [
+            {"hash": "a1", "name": "A - 01", "save_path": season},
+            {"hash": "b1", "name": "B - 01", "save_path": other},
+            {"hash": "a2", "name": "A - 01v2", "save_path": season + "/"},
+        ]
+        active: dict[str, int] = {}
+        peak_per_path: dict[str, int] = {}
+        overall = 0
+        peak_overall = 0
+        order: list[str] = []
+
+        async def fake_rename_torrent(*, info, **kwargs):
+            nonlocal overall, peak_overall
+            path = info["save_path"].rstrip("/")
+            active[path] = active.get(path, 0) + 1
+            peak_per_path[path] = max(peak_per_path.get(path, 0), active[path])
+            overall += 1
+            peak_overall = max(peak_overall, overall)
+            order.append(info["hash"])
+            await asyncio.sleep(0.01)
+            active[path] -= 1
+            overall -= 1
+            return []
+
+        with (
+            patch.object(renamer, "_rename_torrent", side_effect=fake_rename_torrent),
+            patch.object(
+                renamer,
+                "_batch_lookup_offsets",
+                AsyncMock(return_value={}),
+            ),
+            patch("module.manager.renamer.settings") as mock_settings,
+        ):
+            mock_settings.bangumi_manage.rename_method = "pn"
+            mock_settings.bangumi_manage.rename_concurrency = 4
+            mock_settings.downloader.max_concurrency = 10
+            await renamer.rename()
+
+        assert peak_per_path == {season: 1, other: 1}
+        assert peak_overall == 2
+        assert order.index("a1") < order.index("a2")
+
+    async def test_workers_never_exceed_downloader_cap(self, renamer):
+        with patch("module.manager.renamer.settings") as mock_settings:
+            mock_settings.bangumi_manage.rename_concurrency = 8
+            mock_settings.downloader.max_concurrency = 3
+            assert renamer._worker_count() == 3
+
+    async def test_stage_timings_are_recorded(self, renamer):
+        renamer.client.client.torrents_info.return_value = [
+            {
+                "hash": "h1",
+                "name": "No Media",
+                "save_path": "/downloads/Bangumi/Anime/Season 1",
+            }
+        ]
+        renamer.client.client.torrents_files.return_value = [{"name": "readme.txt"}]
+        with (
+            patch("module.manager.renamer.settings") as mock_settings,
+            patch("module.downloader.path.settings") as mock_path_settings,
+        ):
+            mock_settings.bangumi_manage.rename_method = "pn"
+            mock_settings.bangumi_manage.rename_concurrency = 4
+            mock_settings.downloader.max_concurrency = 10
+            mock_path_settings.downloader.path = "/downloads/Bangumi"
+            await renamer.rename()
+
+        assert {"list", "files", "offsets"} <= set(renamer.timings)
+        [progress] = [p for p in get_progress() if p.name == "rename"]
+        assert progress.stages is renamer.timings
+
 
 class TestRevisionConflictFlow:
     V1 = "[ANi] 尼古喵喵 - 01 [1080P][Baha][WEB-DL][AAC AVC][CHT].mp4"
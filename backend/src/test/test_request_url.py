@@ -246,3 +246,72 @@ class TestRateLimit429:
         assert result is None
         assert calls == 1
         mock_sleep.assert_not_awaited()
+
+
+class TestConditionalGet:
+    """Conditional RSS polling: validators are sent and 304 is not an error."""
+
+    URL = "https://mikanani.me/RSS/Bangumi?bangumiId=1"
+    FEED = (
+        b"<rss><channel><title>t</title><item><title>[Grp] Show - 01</title>"
+        b"<link>https://mikanani.me/Home/Episode/1</link>"
+        b'<enclosure url="https://mikanani.me/1.torrent" /></item>'
+        b"</channel></rss>"
+    )
+
+    @staticmethod
+    async def _get_feed(response: httpx.Response, **validators):
+        sent_headers: dict = {}
+
+        async def mock_get(url, headers):
+            sent_headers.update(headers)
+            return response
+
+        with patch("module.network.request_url.get_shared_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.get = mock_get
+            mock_get_client.return_value = mock_client
+
+            from module.network import RequestContent
+
+            async with RequestContent() as req:
+                fetched = await req.get_feed(TestConditionalGet.URL, **validators)
+        return fetched, sent_headers
+
+    async def test_get_url_returns_304_response_without_error(self):
+        resp = httpx.Response(304, request=httpx.Request("GET", self.URL))
+        fetched, headers = await self._get_feed(
+            resp, etag='"abc"', last_modified="Wed, 21 Oct 2026 07:28:00 GMT"
+        )
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert fetched.not_modified is True
+        assert fetched.torrents == []
+        assert fetched.etag == '"abc"'
+
+    async def test_no_validators_sends_unconditional_request(self):
+        resp = httpx.Response(
+            200,
+            content=self.FEED,
+            headers={"ETag": '"v1"'},
+            request=httpx.Request("GET", self.URL),
+        )
+        fetched, headers = await self._get_feed(resp)
+        assert "If-None-Match" not in headers
+        assert "If-Modified-Since" not in headers
+        assert fetched.not_modified is False
+        assert [t.name for t in fetched.torrents] == ["[Grp] Show - 01"]
+        assert fetched.etag == '"v1"'
+        assert fetched.content_hash
+
+    async def test_identical_body_hash_is_not_modified(self):
+        import hashlib
+
+        resp = httpx.Response(
+            200, content=self.FEED, request=httpx.Request("GET", self.URL)
+        )
+        fetched, _ = await self._get_feed(
+            resp, content_hash=hashlib.sha256(self.FEED).hexdigest()
+        )
+        assert fetched.not_modified is True
+        assert fetched.torrents == []
@@ -8,8 +8,10 @@ import pytest_asyncio
 
 from module.conf import settings
 from module.database import Database
+from module.database.episode_index import index_release
 from module.downloader import AddResult
 from module.models import Torrent
+from module.network import FeedFetch
 from module.notification.events import DownloadFailureEvent, RssFailureEvent
 from module.parser.analyser.selector import parse_configured_release_title
 from module.parser.analyser.tokenizer import ReleaseKind
@@ -855,11 +857,115 @@ class TestRefreshRssPerHostThrottle:
             assert item.connection_status == "healthy"
 
 
+# ---------------------------------------------------------------------------
+# Conditional GET (ETag / Last-Modified / body hash)
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshRssConditionalGet:
+    @staticmethod
+    def _fetch(**kwargs) -> FeedFetch:
+        return FeedFetch(**kwargs)
+
+    async def test_validators_persisted_after_successful_refresh(self, rss_engine):
+        await rss_engine.db.rss.add(make_rss_item())
+        fetched = self._fetch(
+            torrents=[Torrent(name="a", url="https://example.com/a.torrent")],
+            etag='"v1"',
+            last_modified="Wed, 21 Oct 2026 07:28:00 GMT",
+            content_hash="h1",
+        )
+        with patch(
+            "module.rss.snapshot.RequestContent.get_feed",
+            new_callable=lambda: AsyncMock(return_value=fetched),
+        ):
+            await rss_engine.refresh_rss(AsyncMock())
+
+        item = await rss_engine.db.rss.search_id(1)
+        assert item.etag == '"v1"'
+        assert item.last_modified == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert item.content_hash == "h1"
+
+    async def test_stored_validators_sent_and_not_modified_skips_check_new(
+        self, rss_engine
+    ):
+        await rss_engine.db.rss.add(
+            make_rss_item(etag='"v1"', last_modified="lm", content_hash="h1")
+        )
+        get_feed = AsyncMock(
+            return_value=self._fetch(
+                not_modified=True, etag='"v1"', last_modified="lm", content_hash="h1"
+            )
+        )
+        with (
+            patch("module.rss.snapshot.RequestContent.get_feed", get_feed),
+            patch.object(
+                rss_engine.db.torrent, "check_new", new_callable=AsyncMock
+            ) as check_new,
+        ):
+            await rss_engine.refresh_rss(AsyncMock())
+
+        assert get_feed.await_args is not None
+        kwargs = get_feed.await_args.kwargs
+        assert kwargs["etag"] == '"v1"'
+        assert kwargs["last_modified"] == "lm"
+        assert kwargs["content_hash"] == "h1"
+        check_new.assert_not_awaited()
+        item = await rss_engine.db.rss.search_id(1)
+        assert item.connection_status == "healthy"
+        assert item.content_hash == "h1"
+
+    async def test_failed_add_clears_validators_for_retry(self, rss_engine):
+        await rss_engine.db.rss.add(make_rss_item(etag='"old"', content_hash="h0"))
+        await rss_engine.db.bangumi.add(
+            make_bangumi(title_raw="Mushoku Tensei", filter="")
+        )
+        fetched = self._fetch(
+            torrents=[
+                Torrent(
+                    name="[Sub] Mushoku Tensei - 12 [1080p].mkv",
+                    url="https://example.com/ep12.torrent",
+                )
+            ],
+            etag='"v2"',
+            content_hash="h2",
+        )
+        client = AsyncMock()
+        client.add_torrent = AsyncMock(return_value=AddResult.FAILED)
+        with patch(
+            "module.rss.snapshot.RequestContent.get_feed",
+            new_callable=lambda: AsyncMock(return_value=fetched),
+        ):
+            await rss_engine.refresh_rss(client)
+
+        item = await rss_engine.db.rss.search_id(1)
+        assert item.etag is None
+        assert item.content_hash is None
+
+    async def test_fetch_error_keeps_existing_validators(self, rss_engine):
+        await rss_engine.db.rss.add(make_rss_item(etag='"v1"', content_hash="h1"))
+        with patch(
+            "module.rss.snapshot.RequestContent.get_feed",
+            new_callable=lambda: AsyncMock(return_value=self._fetch()),
+        ):
+            await rss_engine.refresh_rss(AsyncMock())
+
+        item = await rss_engine.db.rss.search_id(1)
+        assert item.etag == '"v1"'
+        assert item.content_hash == "h1"
+
+
 # ---------------------------------------------------------------------------
 # Release-group / resolution preference dedup
 # ---------------------------------------------------------------------------
 
 
+def _indexed(torrent):
+    """The episode-index row refresh_rss would load for a downloaded torrent."""
+    release = parse_configured_release_title(torrent.name)
+    return index_release(torrent.id or 0, settings.rss_parser.engine, release)
+
+
 class TestPreferenceDedup:
     @pytest.fixture(autouse=True)
     def use_preview_engine(self):
@@ -935,7 +1041,7 @@ class TestPreferenceDedup:
         skips = RSSEngine._select_preference_skips(
             [(better_candidate, bangumi)],
             preference_bangumi={1: bangumi},
-            existing_downloaded={1: [already_downloaded]},
+            existing_downloaded={1: [_indexed(already_downloaded)]},
         )
 
         assert skips == set()
@@ -954,7 +1060,7 @@ class TestPreferenceDedup:
         skips = RSSEngine._select_preference_skips(
             [(worse_candidate, bangumi)],
             preference_bangumi={1: bangumi},
-            existing_downloaded={1: [already_downloaded]},
+            existing_downloaded={1: [_indexed(already_downloaded)]},
         )
 
         assert id(worse_candidate) in skips
@@ -1051,7 +1157,7 @@ class TestPreferenceDedup:
         skips = RSSEngine._select_preference_skips(
             [(implicit, bangumi)],
             preference_bangumi={1: bangumi},
-            existing_downloaded={1: [downloaded]},
+            existing_downloaded={1: [_indexed(downloaded)]},
         )
 
         assert id(implicit) in skips
@@ -1213,7 +1319,7 @@ class TestPreferenceDedup:
         skips = RSSEngine._select_preference_skips(
             [(candidate_v1, bangumi)],
             preference_bangumi={1: bangumi},
-            existing_downloaded={1: [downloaded_v2]},
+            existing_downloaded={1: [_indexed(downloaded_v2)]},
         )
 
         assert id(candidate_v1) in skips
@@ -1230,7 +1336,7 @@ class TestPreferenceDedup:
         skips = RSSEngine._select_preference_skips(
             [(candidate_v2, bangumi)],
             preference_bangumi={1: bangumi},
-            existing_downloaded={1: [downloaded_v1]},
+            existing_downloaded={1: [_indexed(downloaded_v1)]},
         )
 
         assert id(candidate_v2) not in skips
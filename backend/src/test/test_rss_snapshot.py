@@ -0,0 +1,99 @@
+"""Tests for rss/snapshot.py: one fetch per feed per tick, per-host spacing."""
+
+from unittest.mock import AsyncMock, patch
+
+from module.models import Torrent
+from module.network import FeedFetch
+from module.rss import FeedSnapshot, RSSAnalyser
+from test.factories import make_rss_item
+
+
+def _feed(*names: str) -> FeedFetch:
+    return FeedFetch(
+        torrents=[Torrent(name=n, url=f"https://example.com/{n}") for n in names],
+        content_hash="h",
+    )
+
+
+class TestFeedSnapshot:
+    async def test_same_url_fetched_once(self):
+        rss = make_rss_item(url="https://mikan.example/rss")
+        get_feed = AsyncMock(return_value=_feed("a"))
+        snapshot = FeedSnapshot(per_host_delay=0)
+        with patch("module.rss.snapshot.RequestContent.get_feed", get_feed):
+            first = await snapshot.torrents(rss)
+            second = await snapshot.torrents(rss)
+
+        get_feed.assert_awaited_once()
+        assert first is second
+
+    async def test_same_host_requests_are_spaced(self):
+        snapshot = FeedSnapshot(per_host_delay=2.0)
+        with (
+            patch(
+                "module.rss.snapshot.RequestContent.get_feed",
+                new_callable=lambda: AsyncMock(return_value=_feed()),
+            ),
+            patch("module.rss.snapshot.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            await snapshot.fetch(make_rss_item(url="https://nyaa.example/rss/1"))
+            await snapshot.fetch(make_rss_item(url="https://other.example/rss"))
+            sleep.assert_not_awaited()
+            await snapshot.fetch(make_rss_item(url="https://nyaa.example/rss/2"))
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args is not None
+        assert 0 < sleep.await_args.args[0] <= 2.0
+
+    async def test_cached_read_does_not_wait(self):
+        rss = make_rss_item(url="https://nyaa.example/rss/1")
+        snapshot = FeedSnapshot(per_host_delay=2.0)
+        with (
+            patch(
+                "module.rss.snapshot.RequestContent.get_feed",
+                new_callable=lambda: AsyncMock(return_value=_feed()),
+            ),
+            patch("module.rss.snapshot.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            await snapshot.fetch(rss)
+            await snapshot.fetch(rss)
+
+        sleep.assert_not_awaited()
+
+    async def test_failed_fetch_is_not_cached(self):
+        rss = make_rss_item(url="https://mikan.example/rss")
+        get_feed = AsyncMock(side_effect=[RuntimeError("boom"), _feed("a")])
+        snapshot = FeedSnapshot(per_host_delay=0)
+        with patch("module.rss.snapshot.RequestContent.get_feed", get_feed):
+            try:
+                await snapshot.fetch(rss)
+            except RuntimeError:
+                pass
+            fetched = await snapshot.fetch(rss)
+
+        assert [t.name for t in fetched.torrents] == ["a"]
+
+
+class TestAnalyserUsesSnapshot:
+    async def test_rss_to_data_reads_torrents_from_snapshot(self, db_engine):
+        from module.database import Database
+        from module.rss import RSSEngine
+
+        rss = make_rss_item(url="https://mikan.example/rss")
+        snapshot = FeedSnapshot(per_host_delay=0)
+        analyser = RSSAnalyser()
+        engine = RSSEngine(Database(engine=db_engine))
+        with (
+            patch(
+                "module.rss.snapshot.RequestContent.get_feed",
+                new_callable=lambda: AsyncMock(return_value=_feed()),
+            ) as get_feed,
+            patch.object(
+                RSSAnalyser, "get_rss_torrents", new_callable=AsyncMock
+            ) as direct_fetch,
+        ):
+            await analyser.rss_to_data(rss, engine, snapshot=snapshot)
+            await snapshot.fetch(rss)
+
+        direct_fetch.assert_not_awaited()
+        get_feed.assert_awaited_once()
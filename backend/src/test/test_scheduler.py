@@ -118,6 +118,52 @@ class TestPeriodicTask:
         flag["on"] = True
         assert task.enabled is True
 
+    async def test_wake_runs_next_tick_immediately(self):
+        """wake() cuts a long interval short without stopping the loop."""
+        ticked = asyncio.Event()
+        counter = {"n": 0}
+
+        async def body():
+            counter["n"] += 1
+            ticked.set()
+
+        task = PeriodicTask("t", run=body, interval=lambda: 60)
+        task.start()
+        await asyncio.wait_for(ticked.wait(), 1)
+        ticked.clear()
+
+        task.wake()
+        await asyncio.wait_for(ticked.wait(), 1)
+
+        assert counter["n"] == 2
+        assert task.running is True
+        await task.stop()
+
+    async def test_wake_during_tick_is_not_lost(self):
+        """A wake that lands mid-tick makes the following wait return at once."""
+        release = asyncio.Event()
+        counter = {"n": 0}
+
+        async def body():
+            counter["n"] += 1
+            if counter["n"] == 1:
+                await release.wait()
+
+        task = PeriodicTask("t", run=body, interval=lambda: 60)
+        task.start()
+        await asyncio.sleep(0)
+        task.wake()
+        release.set()
+        await asyncio.sleep(0.02)
+
+        assert counter["n"] == 2
+        await task.stop()
+
+    async def test_wake_when_stopped_is_noop(self):
+        task = PeriodicTask("t", run=lambda: asyncio.sleep(0), interval=lambda: 60)
+        task.wake()
+        assert task.running is False
+
 
 # ---------------------------------------------------------------------------
 # Scheduler
@@ -165,3 +211,9 @@ class TestScheduler:
     async def test_running_false_before_start(self):
         scheduler = Scheduler([])
         assert scheduler.running is False
+
+    def test_get_by_name(self):
+        task = PeriodicTask("rename", run=lambda: asyncio.sleep(0), interval=lambda: 1)
+        scheduler = Scheduler([task])
+        assert scheduler.get("rename") is task
+        assert scheduler.get("missing") is None
@@ -0,0 +1,123 @@
+"""Tests for SingleFlight request coalescing and coalesced poster downloads."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from module.network import RequestContent, SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flight.do("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [42] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    async def test_different_keys_run_independently(self):
+        flight: SingleFlight[str] = SingleFlight()
+        calls: list[str] = []
+
+        def fetcher(key: str):
+            async def fetch() -> str:
+                calls.append(key)
+                await asyncio.sleep(0)
+                return key
+
+            return fetch
+
+        results = await asyncio.gather(
+            flight.do("a", fetcher("a")), flight.do("b", fetcher("b"))
+        )
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_finished_call_is_not_reused(self):
+        flight: SingleFlight[int] = SingleFlight()
+        fetch = AsyncMock(side_effect=[1, 2])
+
+        assert await flight.do("k", fetch) == 1
+        assert await flight.do("k", fetch) == 2
+
+    async def test_exception_reaches_every_waiter(self):
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def fetch() -> int:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(flight) == 0
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight: SingleFlight[int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.create_task(flight.do("k", fetch))
+        second = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 7
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestGetPoster:
+    async def test_concurrent_downloads_of_same_url_are_coalesced(self):
+        async def get_content(url):
+            await asyncio.sleep(0)
+            return b"img"
+
+        with (
+            patch.object(
+                RequestContent, "get_content", AsyncMock(side_effect=get_content)
+            ) as mock_get,
+            patch(
+                "module.network.request_contents.save_image",
+                AsyncMock(return_value="posters/abc.jpg"),
+            ) as mock_save,
+        ):
+            async with RequestContent() as req:
+                links = await asyncio.gather(
+                    *(req.get_poster("https://img/p.jpg", "jpg") for _ in range(3))
+                )
+
+        assert links == ["posters/abc.jpg"] * 3
+        mock_get.assert_awaited_once()
+        mock_save.assert_awaited_once_with(b"img", "jpg")
+
+    async def test_failed_download_returns_none(self):
+        with (
+            patch.object(RequestContent, "get_content", AsyncMock(return_value=None)),
+            patch("module.network.request_contents.save_image") as mock_save,
+        ):
+            async with RequestContent() as req:
+                assert await req.get_poster("https://img/p.jpg", "jpg") is None
+
+        mock_save.assert_not_called()
@@ -6,8 +6,10 @@ deterministic and offline. A separate live test exercises the real TMDB API
 and is skipped unless explicitly opted into.
 """
 
+import asyncio
 import importlib
 import os
+import time
 from unittest.mock import patch
 from urllib.parse import parse_qs, urlsplit
 
@@ -118,10 +120,10 @@ async def test_tmdb_parser_movie_fallback_when_tv_search_misses(mocker):
     assert tmdb_info.original_title == "君の名は。"
     assert tmdb_info.year == "2016"
     assert tmdb_info.last_season == 0
+    # 标题不含空格：去空格重试与首次查询相同，直接命中响应缓存
     assert [
         (kind, query["query"], query["language"]) for kind, query in search_requests
     ] == [
-        ("tv", ["你的名字"], ["zh-CN"]),
         ("tv", ["你的名字"], ["zh-CN"]),
         ("movie", ["你的名字"], ["zh-CN"]),
     ]
@@ -300,6 +302,107 @@ def test_reset_cache_clears_tmdb_cache():
     assert len(tmdb_parser_module._tmdb_cache) == 0
 
 
+# ---------------------------------------------------------------------------
+# 原始响应缓存（内存 LRU + tmdb_cache 表）
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    def _patch(self, mocker, side_effect=_fake_get_json):
+        tmdb_parser_module._tmdb_cache.clear()
+        return mocker.patch.object(
+            tmdb_parser_module.RequestContent, "get_json", side_effect=side_effect
+        )
+
+    async def test_repeat_lookup_is_served_without_requests(self, mocker):
+        get_json = self._patch(mocker)
+        await tmdb_parser("海盗战记", "zh", test=True)
+        calls = get_json.await_count
+        tmdb_parser_module.reset_cache()
+
+        tmdb_info = await tmdb_parser("海盗战记", "zh", test=True)
+
+        assert tmdb_info is not None
+        assert tmdb_info.title == "冰海战记"
+        assert get_json.await_count == calls
+
+    async def test_responses_survive_restart_via_disk(self, mocker):
+        get_json = self._patch(mocker)
+        await tmdb_parser("海盗战记", "zh", test=True)
+        calls = get_json.await_count
+        # 模拟重启：进程内缓存全部丢失，只剩磁盘
+        tmdb_parser_module.reset_cache()
+        tmdb_parser_module.reset_response_cache()
+
+        loaded = await tmdb_parser_module.warm_response_cache()
+        tmdb_info = await tmdb_parser("海盗战记", "zh", test=True)
+
+        assert loaded == calls
+        assert tmdb_info is not None
+        assert tmdb_info.last_season == 2
+        assert get_json.await_count == calls
+
+    async def test_ttl_depends_on_series_status(self, mocker):
+        async def airing(url: str) -> dict:
+            if "/search/tv" in url:
+                return {"results": [{"id": 1}]}
+            if "/season/" in url:
+                return {"episodes": []}
+            return {**_SHOW_INFO, "status": "Returning Series"}
+
+        self._patch(mocker, airing)
+        await tmdb_parser("连载中", "zh", test=True)
+        self._patch(mocker)
+        await tmdb_parser("海盗战记", "zh", test=True)
+
+        responses = tmdb_parser_module._responses
+        now = time.time()
+        airing_left = responses[("season", "1/1", "zh")][1] - now
+        ended_left = responses[("season", "82684/1", "zh")][1] - now
+        assert 23 * 3600 < airing_left <= 24 * 3600
+        assert ended_left > 29 * 86400
+
+    async def test_empty_search_is_cached_briefly(self, mocker):
+        async def nothing(url: str) -> dict:
+            return {"results": []}
+
+        self._patch(mocker, nothing)
+        await tmdb_parser("不存在", "zh", test=True)
+
+        expires_at = tmdb_parser_module._responses[("search_tv", "不存在", "zh")][1]
+        assert expires_at - time.time() <= 3600
+
+    async def test_failed_requests_are_not_cached(self, mocker):
+        get_json = self._patch(mocker, lambda url: None)
+
+        await tmdb_parser("离线", "zh", test=True)
+        await tmdb_parser("离线", "zh", test=True)
+
+        assert tmdb_parser_module._responses == {}
+        assert get_json.await_count >= 2
+
+
+async def test_concurrent_lookups_share_one_request_chain(mocker):
+    """Torrents of the same show analysed together must not each hit TMDB."""
+
+    async def slow_get_json(url: str) -> dict:
+        await asyncio.sleep(0)
+        return await _fake_get_json(url)
+
+    get_json = mocker.patch.object(
+        tmdb_parser_module.RequestContent, "get_json", side_effect=slow_get_json
+    )
+    tmdb_parser_module._tmdb_cache.clear()
+
+    results = await asyncio.gather(
+        *(tmdb_parser("海盗战记", "zh", test=True) for _ in range(4))
+    )
+
+    assert {info.title if info else None for info in results} == {"冰海战记"}
+    searches = [c for c in get_json.await_args_list if "/search/tv" in c.args[0]]
+    assert len(searches) == 1
+
+
 @pytest.mark.live
 @pytest.mark.skipif(
     not os.environ.get("RUN_LIVE_TMDB_TESTS"),
@@ -0,0 +1,83 @@
+"""Tests for the on-disk .torrent file cache."""
+
+import hashlib
+import os
+
+from module.downloader.torrent_cache import TorrentCache
+
+
+def _torrent(name: str, pad: int = 0) -> bytes:
+    """Minimal bencoded torrent whose info dict carries ``name``."""
+    info = f"d4:name{len(name)}:{name}e".encode()
+    return b"d7:comment" + f"{pad}:".encode() + b"x" * pad + b"4:info" + info + b"e"
+
+
+def _infohash(name: str) -> str:
+    return hashlib.sha1(f"d4:name{len(name)}:{name}e".encode()).hexdigest()
+
+
+class TestTorrentCache:
+    def test_roundtrip_by_url_and_infohash(self, tmp_path):
+        cache = TorrentCache(tmp_path)
+        data = _torrent("ep01")
+
+        assert cache.put("https://nyaa.si/download/1.torrent", data) == _infohash(
+            "ep01"
+        )
+        assert cache.get("https://nyaa.si/download/1.torrent") == data
+        assert cache.get_by_infohash(_infohash("ep01").upper()) == data
+        assert cache.get("https://nyaa.si/download/2.torrent") is None
+
+    def test_same_content_from_two_urls_is_stored_once(self, tmp_path):
+        cache = TorrentCache(tmp_path)
+        cache.put("https://a/1.torrent", _torrent("ep01"))
+        cache.put("https://b/1.torrent", _torrent("ep01"))
+
+        assert len(list(tmp_path.glob("*.torrent"))) == 1
+        assert cache.get("https://b/1.torrent") == _torrent("ep01")
+
+    def test_non_torrent_content_is_not_cached(self, tmp_path):
+        root = tmp_path / "torrents"
+        cache = TorrentCache(root)
+        assert cache.put("https://a/1.torrent", b"<html>429</html>") is None
+        assert cache.get("https://a/1.torrent") is None
+        assert not root.exists()
+
+    def test_index_survives_restart(self, tmp_path):
+        TorrentCache(tmp_path).put("https://a/1.torrent", _torrent("ep01"))
+        assert TorrentCache(tmp_path).get("https://a/1.torrent") == _torrent("ep01")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        size = len(_torrent("ep01", pad=100))
+        cache = TorrentCache(tmp_path, max_bytes=size * 2)
+        cache.put("u1", _torrent("ep01", pad=100))
+        cache.put("u2", _torrent("ep02", pad=100))
+        # 读一次 ep01，让 ep02 变成最久未用
+        assert cache.get("u1") is not None
+        cache.put("u3", _torrent("ep03", pad=100))
+
+        assert cache.get("u2") is None
+        assert cache.get("u1") is not None
+        assert cache.get("u3") is not None
+        assert not (tmp_path / f"{_infohash('ep02')}.torrent").exists()
+
+    def test_restart_keeps_lru_order_from_mtime(self, tmp_path):
+        size = len(_torrent("ep01", pad=100))
+        cache = TorrentCache(tmp_path, max_bytes=size * 2)
+        cache.put("u1", _torrent("ep01", pad=100))
+        cache.put("u2", _torrent("ep02", pad=100))
+        os.utime(tmp_path / f"{_infohash('ep01')}.torrent", (0, 0))
+
+        restarted = TorrentCache(tmp_path, max_bytes=size * 2)
+        restarted.put("u3", _torrent("ep03", pad=100))
+
+        assert restarted.get("u1") is None
+        assert restarted.get("u2") is not None
+
+    def test_missing_blob_is_a_miss(self, tmp_path):
+        cache = TorrentCache(tmp_path)
+        cache.put("u1", _torrent("ep01"))
+        (tmp_path / f"{_infohash('ep01')}.torrent").unlink()
+
+        assert cache.get("u1") is None
+        assert cache.get_by_infohash(_infohash("ep01")) is None
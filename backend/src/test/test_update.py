@@ -10,6 +10,7 @@ import base64
 import hashlib
 import io
 import json
+import os
 import sqlite3
 import zipfile
 from pathlib import Path
@@ -24,6 +25,7 @@ from fastapi.testclient import TestClient
 
 from module.api import v1
 from module.security.api import get_current_user
+from module.update import delta
 from module.update.updater import Updater, _is_newer, _parse_semver
 
 # 测试用签名密钥对：私钥签 bundle，公钥写到 tmp 供 Updater 验签。
@@ -49,26 +51,70 @@ def _write_test_pubkey(dest_dir: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def _make_bundle(version: str, min_image_version: str = "3.3.0-beta.1") -> bytes:
-    """构造一个合法的 update bundle zip（内存字节）。"""
+def _make_bundle(
+    version: str,
+    min_image_version: str = "3.3.0-beta.1",
+    extra: dict[str, bytes] | None = None,
+    stamp: tuple[int, int, int, int, int, int] = (1980, 1, 2, 0, 0, 0),
+) -> bytes:
+    """构造一个合法的 update bundle zip（内存字节）。
+
+    与 CI 一样固定成员时间戳，内容相同的成员在不同版本的 zip 里字节也相同；
+    manifest 带逐文件 sha256。
+    """
     lock_content = f"# uv.lock for {version}\n".encode()
     lock_sha = hashlib.sha256(lock_content).hexdigest()
+    members = {
+        "backend/src/module/__marker__.txt": f"module {version}".encode(),
+        **(extra or {}),
+        "backend/pyproject.toml": b"[project]\nname='x'\n",
+        "backend/uv.lock": lock_content,
+        "webui-dist/index.html": f"<html>{version}</html>".encode(),
+    }
     manifest = {
         "version": version,
         "min_image_version": min_image_version,
         "lockfile_sha256": lock_sha,
         "notes": "test notes",
+        "files": {
+            name: hashlib.sha256(content).hexdigest()
+            for name, content in members.items()
+        },
     }
+    members["manifest.json"] = json.dumps(manifest).encode()
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w") as zf:
-        zf.writestr("backend/src/module/__marker__.txt", f"module {version}")
-        zf.writestr("backend/pyproject.toml", "[project]\nname='x'\n")
-        zf.writestr("backend/uv.lock", lock_content)
-        zf.writestr("webui-dist/index.html", f"<html>{version}</html>")
-        zf.writestr("manifest.json", json.dumps(manifest))
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in members.items():
+            zf.writestr(zipfile.ZipInfo(name, date_time=stamp), content)
     return buf.getvalue()
 
 
+def _range_response(data: bytes, request: httpx.Request) -> httpx.Response:
+    """按 ``Range`` 头返回 206 片段，模拟 GitHub 的下载 CDN。"""
+    spec = request.headers.get("range")
+    if not spec:
+        return httpx.Response(
+            200, content=data, headers={"content-length": str(len(data))}
+        )
+    first, _, last = spec.removeprefix("bytes=").partition("-")
+    if not first:
+        start, end = max(0, len(data) - int(last)), len(data)
+    else:
+        start = int(first)
+        end = int(last) + 1 if last else len(data)
+    if start >= len(data):
+        return httpx.Response(416, headers={"content-range": f"bytes */{len(data)}"})
+    body = data[start:end]
+    return httpx.Response(
+        206,
+        content=body,
+        headers={
+            "content-range": f"bytes {start}-{start + len(body) - 1}/{len(data)}",
+            "content-length": str(len(body)),
+        },
+    )
+
+
 def _releases_payload(bundle_bytes: bytes, sha_text: str) -> list[dict]:
     """模拟 GitHub /releases 列表：一个 stable 与一个更高的 beta 预发布。"""
     stable_assets = [
@@ -442,6 +488,171 @@ class TestApplyUpdate:
         assert (tmp_path / "u" / "current" / "manifest.json").exists()
 
 
+class _BrokenStream(httpx.AsyncByteStream):
+    """先吐出一段数据再断开连接。"""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    async def __aiter__(self):
+        yield self.data
+        raise httpx.ReadError("connection reset")
+
+
+def _bundle_handler(bundle_handler, data: bytes, sha: str):
+    """bundle.zip 交给 ``bundle_handler``，其余走默认路由。"""
+    default = _default_handler(data, sha)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url).endswith("bundle.zip"):
+            return bundle_handler(request)
+        return default(request)
+
+    return handler
+
+
+def _updater_with_handler(tmp_path, handler) -> Updater:
+    return Updater(
+        root=tmp_path / "u",
+        current_version="3.1.0",
+        image_version="3.3.0-beta.1",
+        dependency_syncer=lambda unpacked: None,
+        client=_make_client(handler),
+        pubkey_path=_write_test_pubkey(tmp_path),
+    )
+
+
+class TestResumableDownload:
+    @pytest.mark.asyncio
+    async def test_interrupted_download_resumes_with_range(self, tmp_path, bundle):
+        data, sha = bundle
+        ranges = []
+
+        def serve(request):
+            if "range" not in request.headers:
+                return httpx.Response(
+                    200,
+                    stream=_BrokenStream(data[:300]),
+                    headers={"content-length": str(len(data))},
+                )
+            ranges.append(request.headers["range"])
+            return _range_response(data, request)
+
+        up = _updater_with_handler(tmp_path, _bundle_handler(serve, data, sha))
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert ranges == ["bytes=300-"]
+        assert (tmp_path / "u" / "bundle.zip").read_bytes() == data
+
+    @pytest.mark.asyncio
+    async def test_partial_from_failed_apply_is_resumed(self, tmp_path, bundle):
+        data, sha = bundle
+        partial = tmp_path / "u" / "downloads" / f"{sha}.part"
+        partial.parent.mkdir(parents=True)
+        partial.write_bytes(data[:200])
+        stale = partial.with_name("0" * 64 + ".part")
+        stale.write_bytes(b"old release")
+        ranges = []
+
+        def serve(request):
+            ranges.append(request.headers.get("range"))
+            return _range_response(data, request)
+
+        up = _updater_with_handler(tmp_path, _bundle_handler(serve, data, sha))
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert ranges == ["bytes=200-"]
+        assert not partial.exists()
+        assert not stale.exists()
+
+    @pytest.mark.asyncio
+    async def test_server_ignoring_range_restarts_from_zero(self, tmp_path, bundle):
+        data, sha = bundle
+        partial = tmp_path / "u" / "downloads" / f"{sha}.part"
+        partial.parent.mkdir(parents=True)
+        partial.write_bytes(b"garbage")
+
+        up = _updater_for_apply(tmp_path, data, sha)
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert (tmp_path / "u" / "bundle.zip").read_bytes() == data
+
+
+class TestDeltaUpdate:
+    _BIG = {"backend/src/module/big.bin": bytes(range(256)) * 256 + os.urandom(4096)}
+
+    def _seed_base(self, tmp_path, base: bytes) -> None:
+        root = tmp_path / "u"
+        root.mkdir(parents=True, exist_ok=True)
+        (root / "bundle.zip").write_bytes(base)
+        (root / "bundle.zip.sig").write_text(_sign_bytes(base))
+
+    @pytest.fixture
+    def small_probe(self, monkeypatch):
+        monkeypatch.setattr(delta, "TAIL_PROBE", 1024)
+
+    @pytest.mark.asyncio
+    async def test_downloads_only_changed_members(self, tmp_path, small_probe):
+        base = _make_bundle("3.3.0-beta.1", extra=self._BIG)
+        data = _make_bundle("3.3.0-beta.2", extra=self._BIG)
+        sha = hashlib.sha256(data).hexdigest()
+        self._seed_base(tmp_path, base)
+        served = []
+
+        def serve(request):
+            response = _range_response(data, request)
+            served.append((request.headers.get("range"), len(response.content)))
+            return response
+
+        up = _updater_with_handler(tmp_path, _bundle_handler(serve, data, sha))
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert (tmp_path / "u" / "bundle.zip").read_bytes() == data
+        assert (tmp_path / "u" / "bundle-backup.zip").read_bytes() == base
+        assert all(spec is not None for spec, _ in served)
+        assert sum(size for _, size in served) < len(data) // 4
+
+    @pytest.mark.asyncio
+    async def test_mismatching_rebuild_falls_back_to_full(self, tmp_path, small_probe):
+        # 成员时间戳不同：CRC/大小相同但本地字节不同，拼出的 zip 哈希不符
+        base = _make_bundle(
+            "3.3.0-beta.1", extra=self._BIG, stamp=(2020, 1, 1, 0, 0, 0)
+        )
+        data = _make_bundle("3.3.0-beta.2", extra=self._BIG)
+        sha = hashlib.sha256(data).hexdigest()
+        self._seed_base(tmp_path, base)
+        full = []
+
+        def serve(request):
+            if "range" not in request.headers:
+                full.append(True)
+            return _range_response(data, request)
+
+        up = _updater_with_handler(tmp_path, _bundle_handler(serve, data, sha))
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert full == [True]
+        assert (tmp_path / "u" / "bundle.zip").read_bytes() == data
+
+    @pytest.mark.asyncio
+    async def test_server_without_range_support_gets_full_download(self, tmp_path):
+        base = _make_bundle("3.3.0-beta.1", extra=self._BIG)
+        data = _make_bundle("3.3.0-beta.2", extra=self._BIG)
+        sha = hashlib.sha256(data).hexdigest()
+        self._seed_base(tmp_path, base)
+
+        up = _updater_for_apply(tmp_path, data, sha)
+        res = await up.apply_update("beta")
+
+        assert res.success is True
+        assert (tmp_path / "u" / "bundle.zip").read_bytes() == data
+
+
 # ---------------------------------------------------------------------------
 # rollback
 # ---------------------------------------------------------------------------
@@ -819,6 +1030,58 @@ class TestBootOverlay:
         assert not (updates / "applied.json").exists()  # stale marker cleared
         assert not (updates / "bundle.zip").exists()
 
+    def _apply(self, app, updates, ivp, lock, pubkey):
+        import boot_overlay
+
+        return boot_overlay.apply_overlay(
+            app_root=app,
+            updates_root=updates,
+            image_version_path=ivp,
+            baseline_lock=lock,
+            pubkey_path=pubkey,
+        )
+
+    def test_installed_overlay_is_not_extracted_again(self, tmp_path, monkeypatch):
+        import boot_overlay
+
+        seeded = self._seed(tmp_path, "3.4.0")
+        assert self._apply(*seeded) is True
+        # 运行期字节码缓存不影响比对
+        (seeded[0] / "module" / "__pycache__").mkdir()
+        (seeded[0] / "module" / "__pycache__" / "x.pyc").write_bytes(b"pyc")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("overlay re-extracted")
+
+        monkeypatch.setattr(boot_overlay, "_safe_extract_zip", fail)
+        monkeypatch.setattr(boot_overlay, "_replace_tree", fail)
+
+        assert self._apply(*seeded) is True
+        assert (seeded[0] / "module" / "__marker__.txt").read_text() == "module 3.4.0"
+
+    def test_only_the_changed_tree_is_replaced(self, tmp_path, monkeypatch):
+        import boot_overlay
+
+        seeded = self._seed(tmp_path, "3.4.0")
+        app = seeded[0]
+        assert self._apply(*seeded) is True
+        (app / "module" / "__marker__.txt").write_text("tampered")
+        (app / "module" / "extra.py").write_text("print('x')")
+
+        replaced = []
+        real_replace = boot_overlay._replace_tree
+
+        def record(src, dst):
+            replaced.append(dst.name)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(boot_overlay, "_replace_tree", record)
+
+        assert self._apply(*seeded) is True
+        assert replaced == ["module"]
+        assert (app / "module" / "__marker__.txt").read_text() == "module 3.4.0"
+        assert not (app / "module" / "extra.py").exists()
+
     def test_no_applied_json_is_noop(self, tmp_path):
         import boot_overlay
 
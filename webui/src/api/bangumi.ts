@@ -7,7 +7,7 @@ import type {
   OffsetSuggestion,
 } from '#/bangumi';
 import type { ApiSuccess } from '#/api';
-import type { Torrent } from '#/torrent';
+import type { Torrent, TorrentStats } from '#/torrent';
 
 export const apiBangumi = {
   /**
@@ -242,6 +242,26 @@ export const apiBangumi = {
     return data;
   },
 
+  /**
+   * 获取种子记录统计（行数、数据库大小、保留策略）
+   */
+  async getTorrentStats() {
+    const { data } = await axios.get<TorrentStats>(
+      'api/v1/bangumi/torrents/stats'
+    );
+    return data;
+  },
+
+  /**
+   * 重新解析全部种子，重建剧集索引
+   */
+  async rebuildEpisodeIndex() {
+    const { data } = await axios.post<ApiSuccess>(
+      'api/v1/bangumi/torrents/episode-index/rebuild'
+    );
+    return data;
+  },
+
   /**
    * 获取所有孤儿种子（未关联番剧的种子记录）
    */
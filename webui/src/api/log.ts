@@ -1,9 +1,20 @@
 import type { ApiSuccess } from '#/api';
 
 export const apiLog = {
-  async getLog() {
-    const { data } = await axios.get<string>('api/v1/log', { silent: true });
-    return data;
+  /**
+   * 不带 since 时返回完整尾部；带上次的 cursor 时只返回新增行。
+   * reset 为 true 表示 text 是完整尾部，应替换而非追加。
+   */
+  async getLog(since?: string) {
+    const { data, headers } = await axios.get<string>('api/v1/log', {
+      params: since ? { since } : undefined,
+      silent: true,
+    });
+    return {
+      text: data,
+      cursor: headers['x-log-cursor'] as string | undefined,
+      reset: headers['x-log-reset'] !== '0',
+    };
   },
 
   async clearLog() {
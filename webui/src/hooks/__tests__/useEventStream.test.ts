@@ -122,6 +122,21 @@ describe('useEventStream', () => {
     expect(result.logData.value).toBe('line one\nline two\n');
   });
 
+  it('should append log_append deltas to the last full log frame', async () => {
+    isLoggedIn.value = true;
+    const useEventStream = await freshEventStream();
+
+    const result = withSetup(() => useEventStream());
+    const es = MockEventSource.instances.at(-1)!;
+
+    es.emit('log', 'line one\n');
+    es.emit('log_append', 'line two\n');
+    expect(result.logData.value).toBe('line one\nline two\n');
+
+    es.emit('log', 'fresh\n');
+    expect(result.logData.value).toBe('fresh\n');
+  });
+
   it('should close the connection and reset connected on error', async () => {
     isLoggedIn.value = true;
     const useEventStream = await freshEventStream();
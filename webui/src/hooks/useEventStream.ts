@@ -16,6 +16,15 @@ export interface NotificationStreamPayload {
 
 const RECONNECT_BASE_DELAY_MS = 1000;
 const RECONNECT_MAX_DELAY_MS = 15000;
+// 与后端 GET /log 的尾部预算（512 KB）一致，增量拼接后保留的最大长度。
+const LOG_MAX_CHARS = 512 * 1024;
+
+function appendLog(current: string | null, delta: string): string {
+  const text = (current ?? '') + delta;
+  if (text.length <= LOG_MAX_CHARS) return text;
+  const tail = text.slice(-LOG_MAX_CHARS);
+  return tail.slice(tail.indexOf('\n') + 1);
+}
 
 /**
  * 单一 SSE 连接（api/v1/events/stream），推送 status/downloader/log 更新，
@@ -87,10 +96,15 @@ export const useEventStream = createSharedComposable(() => {
       }
     });
 
+    // log 是完整尾部（连接建立或服务端游标重置时），log_append 只含新增行。
     es.addEventListener('log', (e) => {
       logData.value = (e as MessageEvent).data;
     });
 
+    es.addEventListener('log_append', (e) => {
+      logData.value = appendLog(logData.value, (e as MessageEvent).data);
+    });
+
     es.addEventListener('update', (e) => {
       try {
         updateData.value = JSON.parse((e as MessageEvent).data);
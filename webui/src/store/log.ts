@@ -7,11 +7,15 @@ export const useLogStore = defineStore('log', () => {
   const { connected: sseConnected, logData } = useEventStream();
 
   const log = ref('');
+  // 轮询回退时的增量游标（GET /log 的 X-Log-Cursor）；未设置时拉完整尾部。
+  let cursor: string | undefined;
 
   // SSE 已连接时使用推送数据；否则回退到轮询。
   watch(logData, (data) => {
     if (data === null) return;
     log.value = data;
+    // 推送内容与轮询游标不再对应：回退轮询时先拉一次完整尾部
+    cursor = undefined;
   });
 
   function getLog(force = false) {
@@ -21,9 +25,10 @@ export const useLogStore = defineStore('log', () => {
     if (!force && (sseConnected.value || document.hidden)) return;
     if (isLoggedIn.value) {
       apiLog
-        .getLog()
+        .getLog(force ? undefined : cursor)
         .then((res) => {
-          log.value = res;
+          log.value = res.reset ? res.text : log.value + res.text;
+          cursor = res.cursor;
         })
         .catch(() => {
           // Silent poll — keep the last log content on a transient failure.
@@ -35,6 +40,7 @@ export const useLogStore = defineStore('log', () => {
     showMessage: true,
     onSuccess() {
       log.value = '';
+      cursor = undefined;
     },
   });
 
@@ -124,6 +124,7 @@ export const mockConfig = {
     password: 'adminadmin',
     path: '/downloads/Bangumi',
     ssl: false,
+    max_concurrency: 10,
   },
   rss_parser: {
     enable: true,
@@ -139,6 +140,9 @@ export const mockConfig = {
     group_tag: false,
     remove_bad_torrent: false,
     track_orphans: true,
+    rename_concurrency: 4,
+    torrent_retention_days: 90,
+    torrent_retention_count: 1000,
   },
   log: {
     debug_enable: false,
@@ -155,6 +159,11 @@ export const mockConfig = {
     tmdb_base_url: 'https://api.themoviedb.org',
     tmdb_api_key: '',
     bgm_base_url: 'https://api.bgm.tv',
+    tmdb_cache_ended_days: 30,
+    tmdb_cache_airing_hours: 24,
+    tmdb_cache_negative_minutes: 60,
+    metadata_concurrency: 4,
+    metadata_host_rate: 8,
   },
   notification: {
     enable: false,
@@ -0,0 +1,24 @@
+/**
+ * 海报地址：本地海报加 size 参数取缩略图，远程地址原样返回。
+ */
+import { describe, expect, it } from 'vitest';
+import { resolvePosterUrl } from '../poster';
+
+describe('resolvePosterUrl', () => {
+  it('should return an empty string for a missing link', () => {
+    expect(resolvePosterUrl(null)).toBe('');
+    expect(resolvePosterUrl(undefined, 'thumb')).toBe('');
+  });
+
+  it('should request the thumbnail variant of a local poster', () => {
+    expect(resolvePosterUrl('posters/abc.jpg')).toBe('/posters/abc.jpg');
+    expect(resolvePosterUrl('posters/abc.jpg', 'thumb')).toBe(
+      '/posters/abc.jpg?size=thumb'
+    );
+  });
+
+  it('should leave remote posters untouched', () => {
+    const remote = 'https://mikanani.me/images/Bangumi/a.jpg';
+    expect(resolvePosterUrl(remote, 'thumb')).toBe(remote);
+  });
+});
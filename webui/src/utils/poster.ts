@@ -1,5 +1,12 @@
-export function resolvePosterUrl(link: string | null | undefined): string {
+/**
+ * 海报地址。本地缓存的海报传 `size: 'thumb'` 时取 WebP 缩略图（海报墙、列表用），
+ * 否则由后端按浏览器 Accept 返回 WebP 或原图。
+ */
+export function resolvePosterUrl(
+  link: string | null | undefined,
+  size?: 'thumb'
+): string {
   if (!link) return '';
   if (link.startsWith('http://') || link.startsWith('https://')) return link;
-  return `/${link}`;
+  return size ? `/${link}?size=${size}` : `/${link}`;
 }
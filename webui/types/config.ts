@@ -51,6 +51,7 @@ export interface Downloader {
   password: string;
   path: string;
   ssl: boolean;
+  max_concurrency: number;
 }
 export interface RssParser {
   enable: boolean;
@@ -66,6 +67,9 @@ export interface BangumiManage {
   group_tag: boolean;
   remove_bad_torrent: boolean;
   track_orphans: boolean;
+  rename_concurrency: number;
+  torrent_retention_days: number;
+  torrent_retention_count: number;
 }
 export interface Log {
   debug_enable: boolean;
@@ -84,6 +88,12 @@ export interface Network {
   /** 留空回退到内置共享 key */
   tmdb_api_key: string;
   bgm_base_url: string;
+  /** TMDB 响应磁盘缓存有效期：完结番（天）/ 连载中（小时）/ 查无结果（分钟） */
+  tmdb_cache_ended_days: number;
+  tmdb_cache_airing_hours: number;
+  tmdb_cache_negative_minutes: number;
+  metadata_concurrency: number;
+  metadata_host_rate: number;
 }
 /** Notification provider configuration */
 export interface NotificationProviderConfig {
@@ -192,6 +202,7 @@ export const initConfig: Config = {
     password: '',
     path: '',
     ssl: false,
+    max_concurrency: 10,
   },
   rss_parser: {
     enable: true,
@@ -207,6 +218,9 @@ export const initConfig: Config = {
     group_tag: true,
     remove_bad_torrent: true,
     track_orphans: true,
+    rename_concurrency: 4,
+    torrent_retention_days: 90,
+    torrent_retention_count: 1000,
   },
   log: {
     debug_enable: false,
@@ -224,6 +238,11 @@ export const initConfig: Config = {
     tmdb_base_url: 'https://api.themoviedb.org',
     tmdb_api_key: '',
     bgm_base_url: 'https://api.bgm.tv',
+    tmdb_cache_ended_days: 30,
+    tmdb_cache_airing_hours: 24,
+    tmdb_cache_negative_minutes: 60,
+    metadata_concurrency: 4,
+    metadata_host_rate: 8,
   },
   notification: {
     enable: false,
@@ -7,4 +7,17 @@ export interface Torrent {
   bangumi_id: number | null;
   rss_id: number | null;
   qb_hash: string | null;
+  created_at: string | null;
+}
+
+export interface TorrentStats {
+  total: number;
+  downloaded: number;
+  orphans: number;
+  fingerprints: number;
+  per_feed: Record<number, number>;
+  db_bytes: number;
+  free_bytes: number;
+  retention_days: number;
+  retention_count: number;
 }